@@ -0,0 +1,99 @@
+"""Benchmark: ActionQueue enqueue/process throughput under cascading triggers.
+
+Simulates a trigger-heavy board: the queue holds a backlog of pending actions
+and every processed action fans out into further triggered actions at mixed
+priorities (HIGH/NORMAL/LOW, occasional IMMEDIATE and CLEANUP) until a cascade
+depth is reached. Enqueue cost should not grow with the backlog, so throughput
+is measured for a small and a large backlog.
+
+Target: >= 100000 actions/sec (enqueue + process) with the large backlog, and
+the large backlog costing <= 1.5x the small one.
+The script exits non-zero when either target is missed.
+
+Usage:
+    python benchmarks/bench_action_queue.py [--backlogs 10 1000] [--cascades 200] [--target 100000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from lorcana_sim.engine.action_queue import ActionPriority, ActionQueue
+from lorcana_sim.engine.event_system import GameEventManager
+from lorcana_sim.models.abilities.composable.effects import Effect
+from lorcana_sim.utils.history import HistoryRetention
+
+TARGET_ACTIONS_PER_SEC = 100000.0
+MAX_RATIO = 1.5
+FAN_OUT = 3
+DEPTH = 4
+PRIORITIES = [ActionPriority.HIGH, ActionPriority.NORMAL, ActionPriority.LOW] * 6 + \
+    [ActionPriority.IMMEDIATE, ActionPriority.CLEANUP]
+
+
+class CascadeEffect(Effect):
+    """Effect that triggers ``FAN_OUT`` more effects until ``DEPTH`` is reached."""
+
+    def __init__(self, queue: ActionQueue, rng: random.Random, depth: int):
+        self.queue = queue
+        self.rng = rng
+        self.depth = depth
+
+    def apply(self, target, context):
+        if self.depth < DEPTH:
+            for _ in range(FAN_OUT):
+                child = CascadeEffect(self.queue, self.rng, self.depth + 1)
+                self.queue.enqueue(child, target, context, self.rng.choice(PRIORITIES), "cascade")
+        return target
+
+
+class IdleEffect(Effect):
+    """Backlog effect that does nothing when it eventually runs."""
+
+    def apply(self, target, context):
+        return target
+
+
+def run(backlog: int, cascades: int, seed: int = 0) -> float:
+    """Actions per second for ``cascades`` cascades on top of a ``backlog``-sized queue."""
+    rng = random.Random(seed)
+    queue = ActionQueue(GameEventManager(None), HistoryRetention.off())
+    idle = IdleEffect()
+    for _ in range(backlog):
+        queue.enqueue(idle, None, {}, ActionPriority.CLEANUP)
+
+    actions = 0
+    start = time.perf_counter()
+    for _ in range(cascades):
+        queue.enqueue(CascadeEffect(queue, rng, 0), None, {}, ActionPriority.NORMAL)
+        # Process the cascade; the CLEANUP backlog stays queued behind it
+        while queue.get_pending_count() > backlog:
+            queue.process_next_action()
+            actions += 2  # Each processed action was also enqueued once
+    elapsed = time.perf_counter() - start
+    return actions / elapsed if elapsed else float('inf')
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--backlogs', type=int, nargs=2, default=[10, 1000])
+    parser.add_argument('--cascades', type=int, default=200)
+    parser.add_argument('--target', type=float, default=TARGET_ACTIONS_PER_SEC)
+    parser.add_argument('--max-ratio', type=float, default=MAX_RATIO)
+    args = parser.parse_args()
+
+    run(args.backlogs[0], 10)  # Warm up
+    small, large = (run(backlog, args.cascades) for backlog in args.backlogs)
+    ratio = small / large
+    print(f"backlog {args.backlogs[0]:>5}:  {small:.0f} actions/sec")
+    print(f"backlog {args.backlogs[1]:>5}:  {large:.0f} actions/sec (target {args.target:.0f})")
+    print(f"cost ratio:     {ratio:.2f}x (max {args.max_ratio:.2f}x)")
+    return 0 if large >= args.target and ratio <= args.max_ratio else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""Benchmark: playing games by stepping message by message versus advancing to decisions.
+
+Plays the same seeded games twice with a greedy policy on lean engines: once
+calling ``next_message`` for every step, building a StepExecutedMessage per
+executed effect, and once calling ``advance_until_decision``, which runs the
+steps between decisions internally. Both play identical games; throughput is
+engine steps (``next_message_calls``) per second, best of several alternating runs.
+
+Target: advancing >= 1.1x the steps/sec of stepping.
+The script exits non-zero when the target is missed.
+
+Usage:
+    python benchmarks/bench_advance_until_decision.py [--games 20] [--repeats 5] [--target 1.1]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from lorcana_sim.engine.game_engine import GameEngine
+from lorcana_sim.engine.game_messages import ActionRequiredMessage, ChoiceRequiredMessage, GameOverMessage
+from lorcana_sim.models.cards.base_card import CardColor, Rarity
+from lorcana_sim.models.cards.character_card import CharacterCard
+from lorcana_sim.models.game.game_state import GameState
+from lorcana_sim.models.game.player import Player
+from lorcana_sim.sim import GreedyPolicy
+
+TARGET_SPEEDUP = 1.1
+MAX_STEPS = 5000
+
+
+def make_deck(id_offset: int, size: int = 40):
+    return [CharacterCard(
+        id=id_offset + i, name=f"Bench {i % 8}", version="Bench", full_name=f"Bench {i % 8} - Bench",
+        cost=1 + i % 4, color=CardColor.AMBER, inkwell=True, rarity=Rarity.COMMON,
+        set_code="BENCH", number=i % 8, story="", strength=1 + i % 3, willpower=2 + i % 3,
+        lore=1 + i % 2
+    ) for i in range(size)]
+
+
+def new_engine(seed: int) -> GameEngine:
+    rng = random.Random(seed)
+    players = []
+    for index in range(2):
+        player = Player(f"Player {index + 1}")
+        player.deck = make_deck((index + 1) * 1000)
+        player.deck.shuffle(rng)
+        for _ in range(7):
+            player.hand.append(player.deck.pop(0))
+        players.append(player)
+    engine = GameEngine(GameState(players, seed=seed), lean=True)
+    engine.start_game()
+    return engine
+
+
+def play(engine: GameEngine, advance: bool, seed: int) -> None:
+    rng, policy, move = random.Random(seed), GreedyPolicy(), None
+    while engine.message_engine.next_message_calls < MAX_STEPS:
+        if advance:
+            message = engine.advance_until_decision(move, max_steps=MAX_STEPS)
+        else:
+            message = engine.next_message(move)
+        move = None
+        if isinstance(message, GameOverMessage):
+            return
+        elif isinstance(message, ActionRequiredMessage):
+            move = policy.choose_action(message, rng)
+        elif isinstance(message, ChoiceRequiredMessage):
+            move = policy.choose_option(message, rng)
+
+
+def steps_per_second(advance: bool, games: int) -> float:
+    steps, elapsed = 0, 0.0
+    for seed in range(games):
+        engine = new_engine(seed)
+        start = time.perf_counter()
+        play(engine, advance, seed)
+        elapsed += time.perf_counter() - start
+        steps += engine.message_engine.next_message_calls
+    return steps / elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--games', type=int, default=20)
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--target', type=float, default=TARGET_SPEEDUP)
+    args = parser.parse_args()
+
+    steps_per_second(True, 2)  # Warm up
+    stepping = advancing = 0.0
+    for _ in range(args.repeats):
+        stepping = max(stepping, steps_per_second(False, args.games))
+        advancing = max(advancing, steps_per_second(True, args.games))
+    speedup = advancing / stepping
+    print(f"stepping:   {stepping:.0f} steps/sec")
+    print(f"advancing:  {advancing:.0f} steps/sec")
+    print(f"speedup:    {speedup:.2f}x (target {args.target:.2f}x)")
+    return 0 if speedup >= args.target else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""Benchmark: cold vs warm CardDatabase loads.
+
+Writes a synthetic allCards-style JSON file (the real database is not shipped
+with the repo), then times a cold load (JSON parse and indexing), a warm load
+from the on-disk cache in a fresh process state, and ``CardDatabase.shared``
+once the database is already loaded.
+
+Target: warm loads from the disk cache <= 50 ms for 2500 cards.
+The script exits non-zero when the target is missed.
+
+Usage:
+    python benchmarks/bench_card_database.py [--cards 2500] [--target 50]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from lorcana_sim.loaders import json_cache
+from lorcana_sim.loaders.card_database import CardDatabase
+
+TARGET_WARM_MS = 50.0
+COLORS = ['Amber', 'Amethyst', 'Emerald', 'Ruby', 'Sapphire', 'Steel']
+KEYWORDS = ['Evasive', 'Rush', 'Ward', 'Bodyguard', 'Challenger', 'Shift']
+
+
+def synthetic_card(card_id: int) -> dict:
+    return {
+        'id': card_id, 'name': f"Card {card_id % 900}", 'version': f"Version {card_id}",
+        'fullName': f"Card {card_id % 900} - Version {card_id}", 'cost': 1 + card_id % 9,
+        'color': COLORS[card_id % 6], 'rarity': 'Common', 'type': 'Character', 'inkwell': True,
+        'setCode': str(1 + card_id // 200), 'number': card_id % 200, 'story': "Bench",
+        'strength': 1 + card_id % 5, 'willpower': 1 + card_id % 7, 'lore': 1 + card_id % 3,
+        'subtypes': ['Storyborn', 'Hero'],
+        'abilities': [{'type': 'keyword', 'keyword': KEYWORDS[card_id % 6], 'fullText': "x" * 80},
+                      {'type': 'triggered', 'name': f"ABILITY {card_id}", 'effect': "y" * 200}],
+        'images': {'full': f"https://example.invalid/{card_id}.png"},
+    }
+
+
+def timed_ms(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1e3
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--cards', type=int, default=2500)
+    parser.add_argument('--target', type=float, default=TARGET_WARM_MS)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ[json_cache.CACHE_DIR_ENV_VAR] = os.path.join(tmp, 'cache')
+        path = os.path.join(tmp, 'allCards.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'cards': [synthetic_card(i) for i in range(args.cards)]}, f)
+
+        cold = timed_ms(lambda: CardDatabase(path))
+        warm = []
+        for _ in range(5):
+            json_cache.clear_memo()
+            warm.append(timed_ms(lambda: CardDatabase(path)))
+        CardDatabase.shared(path)
+        shared = timed_ms(lambda: CardDatabase.shared(path))
+
+    print(f"cold load:    {cold:.1f} ms ({args.cards} cards)")
+    print(f"warm load:    {min(warm):.1f} ms from the disk cache (target {args.target:.1f})")
+    print(f"shared:       {shared:.3f} ms")
+    return 0 if min(warm) <= args.target else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
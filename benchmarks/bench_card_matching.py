@@ -0,0 +1,116 @@
+"""Benchmark: resolving the 2025-07-15 collection CSV against the card database.
+
+Resolves every row of data/collection/2025-07-15-collection.csv with
+``CardDatabase.find_card`` (with the row's set/number hints), then times the
+ranked fuzzy matcher alone on a noisy copy of every name (punctuation dropped,
+version truncated, one letter swapped) next to the linear substring scan that
+find_card used to fall back to.
+
+Uses data/all-cards/allCards.json when present; otherwise (the database is
+not shipped with the repo) a database is synthesized from the CSV rows.
+
+Target: mean fuzzy match <= 0.5 ms per query.
+The script exits non-zero when the target is missed.
+
+Usage:
+    python benchmarks/bench_card_matching.py [--cards-json PATH] [--target 0.5]
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+from lorcana_sim.loaders import json_cache
+from lorcana_sim.loaders.card_database import CardDatabase
+
+TARGET_MS_PER_QUERY = 0.5
+COLLECTION_CSV = os.path.join(ROOT, 'data', 'collection', '2025-07-15-collection.csv')
+CARDS_JSON = os.path.join(ROOT, 'data', 'all-cards', 'allCards.json')
+
+
+def read_rows():
+    with open(COLLECTION_CSV, 'r', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def synthesize_database(rows, path):
+    cards = []
+    for card_id, row in enumerate(rows, 1):
+        name, _, version = row['Name'].partition(' - ')
+        number = int(row['Card Number']) if row['Card Number'].isdigit() else 0
+        cards.append({
+            'id': card_id, 'name': name, 'version': version, 'fullName': row['Name'],
+            'cost': 1, 'color': row['Color'] or 'Amber', 'rarity': row['Rarity'], 'type': 'Character',
+            'setCode': row['Set'].lstrip('0') or '0', 'number': number, 'abilities': [],
+        })
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'cards': cards}, f)
+
+
+def noisy(name: str, seed: int) -> str:
+    base, _, version = name.partition(' - ')
+    text = f"{base} {version[:max(len(version) // 2, 1)]}" if version else base
+    text = ''.join(ch for ch in text if ch.isalnum() or ch == ' ')
+    if len(text) > 4:
+        i = 1 + seed % (len(text) - 2)
+        text = text[:i] + text[i + 1] + text[i] + text[i + 2:]
+    return text
+
+
+def linear_partial_scan(db, query):
+    normalized = db._normalize_name(query)
+    for full_name, card in db.cards_by_full_name.items():
+        if normalized in full_name or full_name in normalized:
+            return card
+    return None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--cards-json', default=CARDS_JSON)
+    parser.add_argument('--target', type=float, default=TARGET_MS_PER_QUERY)
+    args = parser.parse_args()
+
+    rows = read_rows()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ[json_cache.CACHE_DIR_ENV_VAR] = 'off'
+        cards_json = args.cards_json
+        if not os.path.exists(cards_json):
+            cards_json = os.path.join(tmp, 'allCards.json')
+            synthesize_database(rows, cards_json)
+        db = CardDatabase(cards_json)
+
+    start = time.perf_counter()
+    resolved = sum(1 for row in rows if db.find_card(row['Name'], row['Set'], row['Card Number']))
+    resolve_ms = (time.perf_counter() - start) * 1e3
+
+    queries = [noisy(row['Name'], i) for i, row in enumerate(rows)]
+    start = time.perf_counter()
+    fuzzy_results = [db.match_cards(query, limit=3) for query in queries]
+    fuzzy_ms = (time.perf_counter() - start) * 1e3 / len(queries)
+
+    start = time.perf_counter()
+    linear_results = [linear_partial_scan(db, query) for query in queries]
+    linear_ms = (time.perf_counter() - start) * 1e3 / len(queries)
+
+    fuzzy_hits = sum(1 for row, matches in zip(rows, fuzzy_results)
+                     if matches and matches[0].card.full_name == row['Name'])
+    linear_hits = sum(1 for row, card in zip(rows, linear_results)
+                      if card is not None and card.full_name == row['Name'])
+
+    print(f"collection:   {resolved}/{len(rows)} rows resolved in {resolve_ms:.1f} ms ({len(db.cards)} cards)")
+    print(f"fuzzy:        {fuzzy_ms:.3f} ms/query, {fuzzy_hits}/{len(queries)} noisy names matched correctly "
+          f"(target {args.target:.3f})")
+    print(f"linear scan:  {linear_ms:.3f} ms/query, {linear_hits}/{len(queries)} noisy names matched correctly")
+    return 0 if fuzzy_ms <= args.target else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""Benchmark: cost lookups with cost reducers on the board, indexed versus linear.
+
+Registers 24 modifiers scoped to a controller, a card type or a subtype (most
+of them active) and repeatedly asks for the modified cost of every card in a
+7-card hand, as an affordability check does. Every 20 checks a card moves
+between zones, which drops the cached costs. The baseline is the previous
+linear lookup: every modifier's ``is_applicable_to_card``, then sort and fold.
+
+Target: indexed >= 5x the lookups/sec of the linear walk.
+The script exits non-zero when the target is missed.
+
+Usage:
+    python benchmarks/bench_cost_modification.py [--checks 20000] [--target 5]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from lorcana_sim.models.abilities.composable.cost_modification import (
+    CostModificationType, create_ink_reduction_modifier
+)
+from lorcana_sim.models.cards.base_card import CardColor, Rarity
+from lorcana_sim.models.cards.character_card import CharacterCard
+from lorcana_sim.models.game.game_state import GameState
+from lorcana_sim.models.game.player import Player
+
+TARGET_SPEEDUP = 5.0
+SUBTYPES = ["Hero", "Villain", "Princess", "Ally", "Pirate", "Sorcerer"]
+CHECKS_PER_ZONE_CHANGE = 20
+
+
+def make_character(card_id: int, rng: random.Random) -> CharacterCard:
+    return CharacterCard(
+        id=card_id, name=f"Bench {card_id}", version="Bench", full_name=f"Bench {card_id} - Bench",
+        cost=rng.randint(1, 7), color=CardColor.AMBER, inkwell=True, rarity=Rarity.COMMON,
+        set_code="BENCH", number=card_id, story="", strength=2, willpower=3, lore=1,
+        subtypes=rng.sample(SUBTYPES, 2)
+    )
+
+
+def setup():
+    rng = random.Random(0)
+    players = [Player("Alice"), Player("Bob")]
+    game_state = GameState(players, seed=0)
+    source = make_character(1, rng)
+    players[0].characters_in_play.append(source)
+    players[0].hand.extend(make_character(10 + i, rng) for i in range(7))
+    players[0].deck.extend(make_character(100 + i, rng) for i in range(40))
+
+    for i in range(24):
+        scope = i % 3
+        modifier = create_ink_reduction_modifier(
+            f"bench{i}", source, 1, lambda card, gs: True,
+            controller=rng.choice(players) if scope == 0 else None,
+            card_type="Action" if scope == 1 and i % 2 else ("Character" if scope == 1 else None),
+            subtypes=(rng.choice(SUBTYPES),) if scope == 2 else ())
+        # Scoped modifiers also filter by scope, so both lookups see the same modifiers
+        modifier.applies_to_filter = (lambda m: lambda card, gs: m.in_scope(card, players[0]))(modifier)
+        if i % 4:
+            modifier.activate()
+        game_state.register_cost_modifier(modifier)
+    return game_state, players
+
+
+def linear_cost(manager, card, game_state) -> int:
+    """The lookup this replaced: every registered modifier, sorted and folded."""
+    applicable = [m for m in manager.all_modifiers if m.is_applicable_to_card(card, game_state)]
+    applicable.sort(key=lambda m: m.priority, reverse=True)
+    cost, reductions = card.cost, 0
+    for modifier in applicable:
+        if modifier.modification_type == CostModificationType.INK_COST_REDUCTION:
+            if modifier.stacks_with_others or reductions == 0:
+                cost, reductions = max(0, cost - modifier.amount), reductions + 1
+    return max(0, cost)
+
+
+def lookups_per_second(indexed: bool, checks: int) -> Tuple[float, int]:
+    game_state, players = setup()
+    manager = game_state.cost_modification_manager
+    player = players[0]
+    total = 0
+    start = time.perf_counter()
+    for check in range(checks):
+        if check % CHECKS_PER_ZONE_CHANGE == 0:
+            player.deck.append(player.hand.pop(0))
+            player.hand.append(player.deck.pop(0))
+        for card in player.hand:
+            if indexed:
+                total += manager.get_modified_cost(card, game_state)
+            else:
+                total += linear_cost(manager, card, game_state)
+    elapsed = time.perf_counter() - start
+    return checks * len(player.hand) / elapsed, total
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--checks', type=int, default=20000)
+    parser.add_argument('--target', type=float, default=TARGET_SPEEDUP)
+    args = parser.parse_args()
+
+    linear, linear_total = lookups_per_second(False, args.checks)
+    indexed, indexed_total = lookups_per_second(True, args.checks)
+    if linear_total != indexed_total:
+        print("indexed and linear lookups disagree")
+        return 1
+    speedup = indexed / linear
+    print(f"linear:   {linear:.0f} lookups/sec")
+    print(f"indexed:  {indexed:.0f} lookups/sec")
+    print(f"speedup:  {speedup:.2f}x (target {args.target:.2f}x)")
+    return 0 if speedup >= args.target else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""Benchmark: cost of a draw as the deck grows.
+
+Shuffles a deck with a seeded RNG and draws every card into the hand, for a
+60-card deck and for a much larger one. The deck is a deque-backed zone, so a
+draw from the top costs the same whatever the deck size; with a list each
+``pop(0)`` shifted the rest of the deck. At 60 cards the zone-index
+bookkeeping dominates either way; the large deck shows the difference.
+
+Target: large-deck draws cost <= 1.8x small-deck draws (~2.0x when the deck
+was a list, at 50000 cards). The script exits non-zero when the target is missed.
+
+Usage:
+    python benchmarks/bench_deck_draw.py [--large 50000] [--target 1.8]
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from lorcana_sim.models.cards.base_card import CardColor, Rarity
+from lorcana_sim.models.cards.character_card import CharacterCard
+from lorcana_sim.models.game.player import Player
+
+TARGET_RATIO = 1.8
+
+
+def make_card(card_id: int) -> CharacterCard:
+    return CharacterCard(
+        id=card_id, name=f"Card {card_id}", version="Bench", full_name=f"Card {card_id} - Bench",
+        cost=1 + card_id % 7, color=list(CardColor)[card_id % 6], inkwell=True, rarity=Rarity.COMMON,
+        set_code="BENCH", number=1, story="", strength=1, willpower=1, lore=1
+    )
+
+
+def us_per_draw(size: int, rounds: int) -> float:
+    player = Player("Bench")
+    player.deck = [make_card(i) for i in range(size)]
+    rng = random.Random(0)
+
+    def round_trip():
+        player.deck.shuffle(rng)
+        while player.draw_card() is not None:
+            pass
+        player.deck.extend(player.hand)
+        player.hand.clear()
+
+    seconds = min(timeit.repeat(round_trip, number=rounds, repeat=5))
+    return seconds / rounds / size * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--large', type=int, default=50000)
+    parser.add_argument('--target', type=float, default=TARGET_RATIO)
+    args = parser.parse_args()
+
+    small = us_per_draw(60, 300)
+    large = us_per_draw(args.large, 1)
+    ratio = large / small
+    print(f"60 cards:     {small:.2f} us per draw")
+    print(f"{args.large} cards:  {large:.2f} us per draw")
+    print(f"ratio:        {ratio:.2f} (target {args.target:.2f})")
+    return 0 if ratio <= args.target else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
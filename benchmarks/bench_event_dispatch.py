@@ -0,0 +1,105 @@
+"""Benchmark: event dispatch cost versus deck size.
+
+Builds games where every card carries a named ability, keeps a fixed board of
+characters in play and grows the decks. With the zone-partitioned listener
+registry, abilities of cards sitting in the deck are never visited, so the cost
+of ``trigger_event`` should stay flat as decks grow. The legacy linear scan
+(zone check per registered ability) is timed alongside for comparison.
+
+Target: dispatch at the largest deck size costs <= 1.5x dispatch at the smallest.
+The script exits non-zero when the ratio exceeds --max-ratio.
+
+Usage:
+    python benchmarks/bench_event_dispatch.py [--sizes 20 60 200] [--dispatches 20000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from lorcana_sim.engine.event_system import EventContext, GameEvent
+from lorcana_sim.engine.game_engine import GameEngine
+from lorcana_sim.models.abilities.composable.named_abilities import NamedAbilityRegistry
+from lorcana_sim.models.cards.character_card import CharacterCard
+from lorcana_sim.models.cards.base_card import CardColor, Rarity
+from lorcana_sim.models.game.game_state import GameState
+from lorcana_sim.models.game.player import Player
+
+MAX_RATIO = 1.5
+IN_PLAY = 6
+EVENTS = [GameEvent.TURN_BEGINS, GameEvent.TURN_ENDS, GameEvent.CARD_DRAWN, GameEvent.INK_PLAYED]
+
+
+def ability_character(card_id: int, ability_name: str) -> CharacterCard:
+    character = CharacterCard(
+        id=card_id, name=f"Bench {card_id}", version="Bench", full_name=f"Bench {card_id} - Bench",
+        cost=2, color=CardColor.AMBER, inkwell=True, rarity=Rarity.COMMON,
+        set_code="BENCH", number=1, story="", strength=2, willpower=3, lore=1
+    )
+    ability = NamedAbilityRegistry.create_ability(ability_name, character, {'name': ability_name})
+    if ability is not None and hasattr(ability, 'activation_zones'):
+        character.composable_abilities.append(ability)
+    return character
+
+
+def build_engine(deck_size: int, seed: int = 0) -> GameEngine:
+    rng = random.Random(seed)
+    names = sorted(NamedAbilityRegistry.get_registered_abilities())
+    players = [Player("Alice"), Player("Bob")]
+    card_id = 0
+    for player in players:
+        for i in range(deck_size):
+            card_id += 1
+            card = ability_character(card_id, rng.choice(names))
+            zone = player.characters_in_play if i < IN_PLAY else player.deck
+            zone.append(card)
+            card.controller = player
+    return GameEngine(GameState(players))
+
+
+def time_dispatch(engine: GameEngine, dispatches: int) -> float:
+    """Seconds per trigger_event call, clearing any queued effects as we go."""
+    event_manager = engine.event_manager
+    game_state = engine.game_state
+    action_queue = engine.execution_engine.action_queue
+    player = game_state.players[0]
+    start = time.perf_counter()
+    for i in range(dispatches):
+        context = EventContext(event_type=EVENTS[i % len(EVENTS)], player=player, game_state=game_state)
+        event_manager.trigger_event(context)
+        if i % 64 == 0:
+            action_queue.clear()
+    return (time.perf_counter() - start) / dispatches
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[20, 60, 200])
+    parser.add_argument('--dispatches', type=int, default=20000)
+    parser.add_argument('--max-ratio', type=float, default=MAX_RATIO)
+    args = parser.parse_args()
+
+    registry_costs = []
+    print(f"{'deck':>6} {'registered':>11} {'registry us':>12} {'linear us':>10}")
+    for size in args.sizes:
+        engine = build_engine(size)
+        registered = len(engine.event_manager._registered_abilities)
+        registry_cost = time_dispatch(engine, args.dispatches)
+
+        engine.event_manager._zone_tracking = False  # Legacy per-ability zone check
+        linear_cost = time_dispatch(engine, args.dispatches)
+
+        registry_costs.append(registry_cost)
+        print(f"{size:>6} {registered:>11} {registry_cost * 1e6:>12.2f} {linear_cost * 1e6:>10.2f}")
+
+    ratio = registry_costs[-1] / registry_costs[0]
+    print(f"largest/smallest deck dispatch cost: {ratio:.2f}x (max {args.max_ratio:.2f}x)")
+    return 0 if ratio <= args.max_ratio else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
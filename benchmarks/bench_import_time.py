@@ -0,0 +1,61 @@
+"""Benchmark: import time of the package and of what a simulation worker imports.
+
+Each import is timed in a fresh interpreter (interpreter startup excluded),
+best of several runs: ``import lorcana_sim`` on its own, and
+``import lorcana_sim.sim``, which is what a MatchFarm worker needs before it can
+play (the engine, models and runner, but no named ability modules, loaders or
+logging setup).
+
+Target: lorcana_sim <= 20 ms and lorcana_sim.sim <= 100 ms.
+The script exits non-zero when a budget is exceeded.
+
+Usage:
+    python benchmarks/bench_import_time.py [--runs 7] [--package-budget 20] [--sim-budget 100]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+PACKAGE_BUDGET_MS = 20.0
+SIM_BUDGET_MS = 100.0
+
+TIMER = (
+    "import time\n"
+    "start = time.perf_counter()\n"
+    "import {module}\n"
+    "print(time.perf_counter() - start)\n"
+)
+
+
+def import_ms(module: str, runs: int) -> float:
+    """Best wall time of importing ``module`` in a fresh interpreter, in ms."""
+    env = dict(os.environ, PYTHONPATH=SRC)
+    best = float('inf')
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', TIMER.format(module=module)],
+                                env=env, check=True, capture_output=True, text=True).stdout
+        best = min(best, float(output.strip().splitlines()[-1]) * 1000)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=7)
+    parser.add_argument('--package-budget', type=float, default=PACKAGE_BUDGET_MS)
+    parser.add_argument('--sim-budget', type=float, default=SIM_BUDGET_MS)
+    args = parser.parse_args()
+
+    import_ms('lorcana_sim.sim', 1)  # Warm up (writes bytecode caches)
+    package = import_ms('lorcana_sim', args.runs)
+    sim = import_ms('lorcana_sim.sim', args.runs)
+    print(f"import lorcana_sim:      {package:.1f} ms (budget {args.package_budget:.0f} ms)")
+    print(f"import lorcana_sim.sim:  {sim:.1f} ms (budget {args.sim_budget:.0f} ms)")
+    return 0 if package <= args.package_budget and sim <= args.sim_budget else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
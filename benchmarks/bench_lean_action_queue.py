@@ -0,0 +1,118 @@
+"""Benchmark: per-effect throughput of the action queue, full versus lean mode.
+
+Builds a game whose characters carry "whenever this character quests" and
+"whenever this character is exerted" abilities, then processes a stream of
+effects that each declare a few events (a quest, a draw, a lore gain), most of
+which nothing listens to. Quests trigger abilities, which queue their own
+trigger and targeted effects. Every processed action counts as one effect.
+
+The full mode records execution history and ``choice_events``, builds action
+descriptions and dispatches every declared event; lean mode skips all of that
+and only dispatches events something observes, executing the same effects.
+
+Target: lean mode >= 1.4x the effects/sec of full mode.
+The script exits non-zero when the target is missed.
+
+Usage:
+    python benchmarks/bench_lean_action_queue.py [--effects 20000] [--target 1.4]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from lorcana_sim.engine.action_queue import ActionPriority
+from lorcana_sim.engine.event_system import GameEvent
+from lorcana_sim.engine.game_engine import GameEngine
+from lorcana_sim.models.abilities.composable.composable_ability import quick_ability
+from lorcana_sim.models.abilities.composable.effects import Effect, NoEffect
+from lorcana_sim.models.abilities.composable.target_selectors import SELF
+from lorcana_sim.models.abilities.composable.triggers import when_character_exerts, when_quests
+from lorcana_sim.models.cards.base_card import CardColor, Rarity
+from lorcana_sim.models.cards.character_card import CharacterCard
+from lorcana_sim.models.game.game_state import GameState
+from lorcana_sim.models.game.player import Player
+
+TARGET_SPEEDUP = 1.4
+BOARD = 8
+
+
+class DeclareEventsEffect(Effect):
+    """Effect that changes nothing and declares a quest, a draw and a lore gain."""
+
+    def apply(self, target, context):
+        return target
+
+    def get_events(self, target, context, result):
+        return [
+            {'type': GameEvent.CHARACTER_QUESTS, 'source': target, 'player': target.controller},
+            {'type': GameEvent.CARD_DRAWN.value, 'player': target.controller},
+            {'type': GameEvent.LORE_GAINED, 'source': target, 'player': target.controller,
+             'additional_data': {'amount': 1}},
+        ]
+
+
+def make_character(card_id: int) -> CharacterCard:
+    character = CharacterCard(
+        id=card_id, name=f"Bench {card_id}", version="Bench", full_name=f"Bench {card_id} - Bench",
+        cost=2, color=CardColor.AMBER, inkwell=True, rarity=Rarity.COMMON,
+        set_code="BENCH", number=1, story="", strength=2, willpower=3, lore=1
+    )
+    character.composable_abilities.append(
+        quick_ability("QUEST BENCH", character, when_quests(character), SELF, NoEffect()))
+    character.composable_abilities.append(
+        quick_ability("EXERT BENCH", character, when_character_exerts(character), SELF, NoEffect()))
+    return character
+
+
+def effects_per_second(lean: bool, effects: int) -> float:
+    players = [Player("Alice"), Player("Bob")]
+    card_id = 0
+    for player in players:
+        for _ in range(BOARD):
+            card_id += 1
+            card = make_character(card_id)
+            card.controller = player
+            player.characters_in_play.append(card)
+    game_state = GameState(players, seed=0)
+    engine = GameEngine(game_state, lean=lean)
+    queue = engine.execution_engine.action_queue
+    rng = random.Random(0)
+    cards = [card for player in players for card in player.characters_in_play]
+    effect = DeclareEventsEffect()
+    context = {'game_state': game_state, 'action_queue': queue, 'choice_manager': engine.choice_manager}
+    game_state.choice_events = []
+
+    processed = 0
+    start = time.perf_counter()
+    while processed < effects:
+        queue.enqueue(effect, rng.choice(cards), dict(context), ActionPriority.NORMAL,
+                      "Bench effect" if queue.describe else "")
+        while queue.process_next_action() is not None:
+            processed += 1
+    elapsed = time.perf_counter() - start
+    return processed / elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--effects', type=int, default=20000)
+    parser.add_argument('--target', type=float, default=TARGET_SPEEDUP)
+    args = parser.parse_args()
+
+    effects_per_second(True, 1000)  # Warm up
+    full = effects_per_second(False, args.effects)
+    lean = effects_per_second(True, args.effects)
+    speedup = lean / full
+    print(f"full mode:  {full:.0f} effects/sec")
+    print(f"lean mode:  {lean:.0f} effects/sec")
+    print(f"speedup:    {speedup:.2f}x (target {args.target:.2f}x)")
+    return 0 if speedup >= args.target else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
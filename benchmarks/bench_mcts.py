@@ -0,0 +1,57 @@
+"""Benchmark: MCTS playouts per second, and how the search player fares against greedy.
+
+Plays seeded games between two 60-card vanilla decks, MCTSPolicy (deck A,
+fixed time per decision) against GreedyPolicy, and reports the search's
+playout rate and the games won.
+
+Target: >= 50 playouts/sec on one core (60-card vanilla decks, greedy rollouts
+to the end of the game). With --workers N the search uses root parallelism
+and the target applies to the aggregate rate.
+The script exits non-zero when the rate falls below --target.
+
+Usage:
+    python benchmarks/bench_mcts.py [--games 2] [--time-limit 0.25] [--workers 1] [--target 50]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from lorcana_sim.search import MCTSPolicy
+from lorcana_sim.sim import BatchRunner, GreedyPolicy
+
+from bench_sim_runner import vanilla_deck
+
+TARGET_PLAYOUTS_PER_SEC = 50.0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--games', type=int, default=2)
+    parser.add_argument('--start-seed', type=int, default=0)
+    parser.add_argument('--time-limit', type=float, default=0.25, help="seconds of search per decision")
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--target', type=float, default=TARGET_PLAYOUTS_PER_SEC)
+    args = parser.parse_args()
+
+    policy = MCTSPolicy(time_limit=args.time_limit, workers=args.workers)
+    runner = BatchRunner(vanilla_deck, vanilla_deck, policy, GreedyPolicy())
+    start = time.perf_counter()
+    with policy:
+        summary = runner.run_games(args.games, start_seed=args.start_seed)
+    elapsed = time.perf_counter() - start
+
+    stats = policy.stats
+    rate = stats.playouts_per_second
+    print(f"games:      {summary.games} in {elapsed:.1f}s, MCTS won {summary.wins[0]}, greedy won {summary.wins[1]}")
+    print(f"decisions:  {stats.decisions} searched, {stats.playouts / max(1, stats.decisions):.0f} playouts each, "
+          f"{stats.reused_visits} visits reused")
+    print(f"playouts:   {rate:.0f}/sec with {args.workers} worker(s) (target {args.target:.0f}/sec)")
+    return 0 if rate >= args.target else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""Benchmark: headless games per second through the batch runner.
+
+Plays seeded games between two 60-card vanilla decks with the greedy policy on
+a single core and reports throughput.
+
+Target: >= 25 games/sec on one core (60-card vanilla decks, greedy vs greedy).
+The script exits non-zero when throughput falls below --target.
+
+With --workers N the games are sharded across a MatchFarm process pool; the
+target then applies to the aggregate rate.
+
+Usage:
+    python benchmarks/bench_sim_runner.py [--games 200] [--target 25] [--workers 0]
+"""
+
+import argparse
+import os
+import sys
+import time
+from functools import partial
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from lorcana_sim.models.cards.character_card import CharacterCard
+from lorcana_sim.models.cards.base_card import CardColor, Rarity
+from lorcana_sim.sim import BatchRunner, GreedyPolicy, MatchFarm
+
+TARGET_GAMES_PER_SEC = 25.0
+
+
+def vanilla_deck(id_offset: int, size: int = 60):
+    """Deck factory building 60 vanilla characters across the cost curve."""
+    return [
+        CharacterCard(
+            id=id_offset + i, name=f"Vanilla {i % 10}", version="Bench",
+            full_name=f"Vanilla {i % 10} - Bench", cost=1 + i % 6,
+            color=CardColor.AMBER, inkwell=i % 5 != 0, rarity=Rarity.COMMON,
+            set_code="BENCH", number=i % 10, story="",
+            strength=1 + i % 4, willpower=2 + i % 4, lore=1 + i % 3
+        )
+        for i in range(size)
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--games', type=int, default=200)
+    parser.add_argument('--start-seed', type=int, default=0)
+    parser.add_argument('--target', type=float, default=TARGET_GAMES_PER_SEC)
+    parser.add_argument('--workers', type=int, default=0,
+                        help="worker processes (0 = single process)")
+    args = parser.parse_args()
+
+    runner_factory = partial(BatchRunner, vanilla_deck, vanilla_deck, GreedyPolicy(), GreedyPolicy())
+    seeds = range(args.start_seed, args.start_seed + args.games)
+
+    start = time.perf_counter()
+    if args.workers > 0:
+        summary = MatchFarm(runner_factory, workers=args.workers, chunk_size=8).run(seeds)
+    else:
+        summary = runner_factory().run(seeds)
+    elapsed = time.perf_counter() - start
+
+    games_per_sec = summary.games / elapsed if elapsed else float('inf')
+    print(f"workers:        {args.workers}")
+    print(f"games:          {summary.games}")
+    print(f"elapsed:        {elapsed:.2f}s")
+    print(f"games/sec:      {games_per_sec:.1f} (target {args.target:.1f})")
+    print(f"messages/game:  {summary.total_messages / summary.games:.0f}")
+    print(f"mean turns:     {summary.mean_game_length:.1f}")
+    print(f"win rates:      {summary.win_rate(0):.3f} / {summary.win_rate(1):.3f}")
+    return 0 if games_per_sec >= args.target else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,111 @@
+"""Benchmark: engine forks per second via snapshot/restore.
+
+Plays a seeded game between two 60-card decks into the midgame, then measures
+how many snapshot + restore cycles ("forks") per second the engine sustains,
+which bounds how many branches a search AI can explore. ``copy.deepcopy`` of
+the GameState is timed alongside for comparison.
+
+Target: >= 2000 forks/sec on one core.
+The script exits non-zero when throughput falls below --target.
+
+Usage:
+    python benchmarks/bench_snapshot.py [--forks 5000] [--warmup-messages 300] [--target 2000]
+"""
+
+import argparse
+import copy
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from lorcana_sim.engine.game_engine import GameEngine
+from lorcana_sim.engine.game_messages import ActionRequiredMessage, ChoiceRequiredMessage, GameOverMessage
+from lorcana_sim.models.cards.character_card import CharacterCard
+from lorcana_sim.models.cards.base_card import CardColor, Rarity
+from lorcana_sim.models.game.game_state import GameState
+from lorcana_sim.models.game.player import Player
+from lorcana_sim.sim import GreedyPolicy
+
+TARGET_FORKS_PER_SEC = 2000.0
+
+
+def vanilla_deck(id_offset: int, size: int = 60):
+    return [
+        CharacterCard(
+            id=id_offset + i, name=f"Vanilla {i % 10}", version="Bench",
+            full_name=f"Vanilla {i % 10} - Bench", cost=1 + i % 6,
+            color=CardColor.AMBER, inkwell=i % 5 != 0, rarity=Rarity.COMMON,
+            set_code="BENCH", number=i % 10, story="",
+            strength=1 + i % 4, willpower=2 + i % 4, lore=1 + i % 3
+        )
+        for i in range(size)
+    ]
+
+
+def midgame_engine(warmup_messages: int, seed: int = 0):
+    """Engine advanced ``warmup_messages`` messages into a greedy-vs-greedy game."""
+    rng = random.Random(seed)
+    players = []
+    for index in range(2):
+        player = Player(f"Player {index + 1}")
+        cards = vanilla_deck((index + 1) * 100000)
+        rng.shuffle(cards)
+        player.deck = cards
+        for _ in range(7):
+            player.hand.append(player.deck.pop(0))
+        players.append(player)
+
+    engine = GameEngine(GameState(players))
+    engine.start_game()
+    policy = GreedyPolicy()
+    move = None
+    for _ in range(warmup_messages):
+        message = engine.next_message(move)
+        move = None
+        if isinstance(message, GameOverMessage):
+            break
+        elif isinstance(message, ActionRequiredMessage):
+            move = policy.choose_action(message, rng)
+        elif isinstance(message, ChoiceRequiredMessage):
+            move = policy.choose_option(message, rng)
+    return engine
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--forks', type=int, default=5000)
+    parser.add_argument('--warmup-messages', type=int, default=300)
+    parser.add_argument('--target', type=float, default=TARGET_FORKS_PER_SEC)
+    args = parser.parse_args()
+
+    engine = midgame_engine(args.warmup_messages)
+    game_state = engine.game_state
+
+    start = time.perf_counter()
+    for _ in range(args.forks):
+        snapshot = engine.snapshot()
+        engine.restore(snapshot)
+    elapsed = time.perf_counter() - start
+    forks_per_sec = args.forks / elapsed if elapsed else float('inf')
+
+    deepcopies = max(1, args.forks // 50)
+    start = time.perf_counter()
+    for _ in range(deepcopies):
+        copy.deepcopy(game_state)
+    deepcopy_per_sec = deepcopies / (time.perf_counter() - start)
+
+    cards = sum(len(zone) for player in game_state.players
+                for zone in (player.hand, player.deck, player.discard_pile, player.inkwell,
+                             player.characters_in_play, player.items_in_play))
+    print(f"turn:              {game_state.turn_number}")
+    print(f"cards tracked:     {cards}")
+    print(f"forks/sec:         {forks_per_sec:.0f} (target {args.target:.0f})")
+    print(f"deepcopy/sec:      {deepcopy_per_sec:.0f}")
+    return 0 if forks_per_sec >= args.target else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
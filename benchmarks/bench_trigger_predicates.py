@@ -0,0 +1,116 @@
+"""Benchmark: dispatching self-triggers with trigger predicates.
+
+Fills both boards with characters whose abilities fire on their own quests,
+challenges, exerts or readies ("whenever this character quests..."), then
+dispatches those events from random characters. Trigger predicates key each
+such ability on its card, so dispatch consults only the acting character's
+abilities instead of calling every listed ability's condition. Dispatch that
+consults every active ability is timed alongside for comparison. Both include
+running the one ability that does trigger.
+
+Target: keyed dispatch costs <= 0.8x dispatch consulting every active ability
+(~0.7x with 24 characters in play).
+The script exits non-zero when the target is missed.
+
+Usage:
+    python benchmarks/bench_trigger_predicates.py [--board 12] [--dispatches 20000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from lorcana_sim.engine.event_system import EventContext, GameEvent
+from lorcana_sim.engine.game_engine import GameEngine
+from lorcana_sim.models.abilities.composable.effects import NoEffect
+from lorcana_sim.models.abilities.composable.composable_ability import quick_ability
+from lorcana_sim.models.abilities.composable.target_selectors import SELF
+from lorcana_sim.models.abilities.composable.triggers import (
+    when_challenges, when_character_exerts, when_character_readies, when_quests
+)
+from lorcana_sim.models.cards.base_card import CardColor, Rarity
+from lorcana_sim.models.cards.character_card import CharacterCard
+from lorcana_sim.models.game.game_state import GameState
+from lorcana_sim.models.game.player import Player
+
+TARGET_RATIO = 0.8
+TRIGGERS = {
+    GameEvent.CHARACTER_QUESTS: when_quests,
+    GameEvent.CHARACTER_CHALLENGES: when_challenges,
+    GameEvent.CHARACTER_EXERTS: when_character_exerts,
+    GameEvent.CHARACTER_READIED: when_character_readies,
+}
+
+
+def make_character(card_id: int) -> CharacterCard:
+    character = CharacterCard(
+        id=card_id, name=f"Bench {card_id}", version="Bench", full_name=f"Bench {card_id} - Bench",
+        cost=2, color=CardColor.AMBER, inkwell=True, rarity=Rarity.COMMON,
+        set_code="BENCH", number=1, story="", strength=2, willpower=3, lore=1
+    )
+    for event, trigger in TRIGGERS.items():
+        character.composable_abilities.append(
+            quick_ability(f"On {event.value}", character, trigger(character), SELF, NoEffect()))
+    return character
+
+
+def build_engine(board: int):
+    players = [Player("Alice"), Player("Bob")]
+    card_id = 0
+    for player in players:
+        for _ in range(board):
+            card_id += 1
+            card = make_character(card_id)
+            card.controller = player
+            player.characters_in_play.append(card)
+    return GameEngine(GameState(players))
+
+
+def time_dispatch(engine: GameEngine, dispatches: int) -> float:
+    """Seconds per trigger_event call for self-trigger events from random characters."""
+    rng = random.Random(0)
+    game_state = engine.game_state
+    event_manager = engine.event_manager
+    action_queue = engine.execution_engine.action_queue
+    cards = [card for player in game_state.players for card in player.characters_in_play]
+    events = list(TRIGGERS)
+    contexts = [EventContext(event_type=rng.choice(events), source=card, player=card.controller,
+                             game_state=game_state)
+                for card in (rng.choice(cards) for _ in range(256))]
+    start = time.perf_counter()
+    for i in range(dispatches):
+        event_manager.trigger_event(contexts[i % len(contexts)])
+        if i % 64 == 0:
+            action_queue.clear()
+    return (time.perf_counter() - start) / dispatches
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--board', type=int, default=12)
+    parser.add_argument('--dispatches', type=int, default=20000)
+    parser.add_argument('--target', type=float, default=TARGET_RATIO)
+    args = parser.parse_args()
+
+    engine = build_engine(args.board)
+    event_manager = engine.event_manager
+    keyed = time_dispatch(engine, args.dispatches)
+
+    # Consult every active ability, as dispatch did before trigger predicates
+    event_manager.get_candidate_listeners = lambda context: event_manager.get_active_listeners(context.event_type)
+    unkeyed = time_dispatch(engine, args.dispatches)
+
+    ratio = keyed / unkeyed
+    print(f"{2 * args.board} characters, {len(TRIGGERS)} self-triggers each")
+    print(f"keyed dispatch:        {keyed * 1e6:.2f} us")
+    print(f"consult-all dispatch:  {unkeyed * 1e6:.2f} us")
+    print(f"ratio:                 {ratio:.2f} (target {args.target:.2f})")
+    return 0 if ratio <= args.target else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
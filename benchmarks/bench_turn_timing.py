@@ -0,0 +1,96 @@
+"""Benchmark: temporary-effect expiry checks over a long game, heap versus linear scan.
+
+Plays 400 turns through a TurnTimingComponent. Every turn registers 6
+"this turn" effects (Challenger grants, stat buffs), 2 effects lasting 3 turns
+and one effect with no timed expiry ("while" effects stay tracked for the rest
+of the game), records a few events and checks for expired effects 40 times, as
+an engine does after every action. The baseline is the previous check: every
+tracked effect through ``_should_expire`` on each call.
+
+Target: heap >= 5x the checks/sec of the linear scan, and the heap's checks in
+the last 50 turns no more than 1.5x slower than in the first 50.
+The script exits non-zero when a target is missed.
+
+Usage:
+    python benchmarks/bench_turn_timing.py [--turns 400] [--target 5] [--slowdown 1.5]
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from lorcana_sim.engine.turn_timing import TurnTimingComponent
+
+TARGET_SPEEDUP = 5.0
+MAX_SLOWDOWN = 1.5
+CHECKS_PER_TURN = 40
+WINDOW = 50
+PHASES = ['ready', 'set', 'draw', 'play']
+
+
+def linear_check(timing: TurnTimingComponent) -> list:
+    """The check this replaced: _should_expire on every tracked effect."""
+    current_turn, current_phase = timing.get_turn_count(), timing._get_current_phase()
+    tracking = timing.duration_tracking
+    expired = [effect_id for effect_id, info in tracking.items()
+               if timing._should_expire(info, current_turn, current_phase)]
+    return [tracking.pop(effect_id).effect for effect_id in expired]
+
+
+def play(heap: bool, turns: int) -> Tuple[List[float], int]:
+    """Seconds spent checking in each turn, and the number of effects expired."""
+    timing = TurnTimingComponent()
+    per_turn, expired = [], 0
+    for turn in range(1, turns + 1):
+        timing.start_turn(turn, "Alice" if turn % 2 else "Bob")
+        for phase in PHASES:
+            timing.start_phase(phase)
+            timing.end_phase(phase)
+        timing.start_phase('play')
+        for _ in range(6):
+            timing.register_temporary_effect(object(), 'until_end_of_turn', 1)
+        for _ in range(2):
+            timing.register_temporary_effect(object(), 'turns', 3)
+        timing.register_temporary_effect(object(), 'while_condition', None)
+
+        start = time.perf_counter()
+        for check in range(CHECKS_PER_TURN):
+            if check % 8 == 0:
+                timing.record_event('action', {'check': check})
+            expired += len(timing.get_expired_effects() if heap else linear_check(timing))
+        per_turn.append(time.perf_counter() - start)
+    return per_turn, expired
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--turns', type=int, default=400)
+    parser.add_argument('--target', type=float, default=TARGET_SPEEDUP)
+    parser.add_argument('--slowdown', type=float, default=MAX_SLOWDOWN)
+    args = parser.parse_args()
+
+    linear_times, linear_expired = play(False, args.turns)
+    heap_times, heap_expired = min((play(True, args.turns) for _ in range(3)),
+                                   key=lambda result: sum(result[0]))
+    if linear_expired != heap_expired:
+        print("heap and linear checks disagree")
+        return 1
+
+    checks = args.turns * CHECKS_PER_TURN
+    linear, heap = checks / sum(linear_times), checks / sum(heap_times)
+    speedup = heap / linear
+    window = min(WINDOW, args.turns // 2)
+    growth = [sum(times[-window:]) / sum(times[:window]) for times in (linear_times, heap_times)]
+    print(f"linear:   {linear:.0f} checks/sec (last/first {window} turns: {growth[0]:.2f}x)")
+    print(f"heap:     {heap:.0f} checks/sec (last/first {window} turns: {growth[1]:.2f}x, "
+          f"limit {args.slowdown:.2f}x)")
+    print(f"speedup:  {speedup:.2f}x (target {args.target:.2f}x)")
+    return 0 if speedup >= args.target and growth[1] <= args.slowdown else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""Benchmark: VecGameEnv steps per second with random legal actions.
+
+Steps 64 games between two 60-card vanilla decks in lockstep, the agent
+picking uniformly among the legal actions of each game (greedy opponent,
+finished games auto-reset). One step of one game is one agent decision,
+including the opponent's replies and the observation and mask encoding.
+
+Target: >= 1000 game-steps/sec on one core. With --workers N the games are
+spread over N processes with shared-memory buffers and the target applies to
+the aggregate rate.
+The script exits non-zero when the rate falls below --target.
+
+Usage:
+    python benchmarks/bench_vec_env.py [--envs 64] [--steps 300] [--workers 0] [--target 1000]
+"""
+
+import argparse
+import os
+import sys
+import time
+from functools import partial
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from lorcana_sim.rl import VecGameEnv
+from lorcana_sim.sim import BatchRunner
+
+from bench_sim_runner import vanilla_deck
+
+TARGET_STEPS_PER_SEC = 1000.0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--envs', type=int, default=64)
+    parser.add_argument('--steps', type=int, default=300)
+    parser.add_argument('--workers', type=int, default=0, help="worker processes (0 = in process)")
+    parser.add_argument('--target', type=float, default=TARGET_STEPS_PER_SEC)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    with VecGameEnv(partial(BatchRunner, vanilla_deck, vanilla_deck), args.envs,
+                    workers=args.workers) as env:
+        _, masks = env.reset()
+        games = 0
+        start = time.perf_counter()
+        for _ in range(args.steps):
+            scores = rng.random(masks.shape)
+            scores[~masks] = -1.0
+            _, _, dones, masks = env.step(scores.argmax(axis=1))
+            games += int(dones.sum())
+        elapsed = time.perf_counter() - start
+
+    rate = args.envs * args.steps / elapsed
+    print(f"envs:     {args.envs} x {args.steps} steps in {elapsed:.2f}s, {games} games finished")
+    print(f"rate:     {rate:.0f} game-steps/sec with {args.workers} worker(s) "
+          f"(target {args.target:.0f}/sec)")
+    return 0 if rate >= args.target else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -27,6 +27,7 @@ from src.lorcana_sim.engine.game_moves import (
 )
 from src.lorcana_sim.loaders.deck_loader import DeckLoader
 from src.lorcana_sim.models.abilities.composable.conditional_effects import ActivationZone
+from src.lorcana_sim.utils.logging_config import setup_logging
 
 
 def setup_game():
@@ -1057,6 +1058,7 @@ def simulate_random_game():
 
 
 if __name__ == "__main__":
+    setup_logging()
     # Set random seed for reproducible results (remove for true randomness)
     #random.seed()
     simulate_random_game()
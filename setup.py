@@ -1,6 +1,26 @@
 """Setup file for lorcana-sim package."""
 
+import importlib.util
+from pathlib import Path
+
 from setuptools import setup
+from setuptools.command.build_py import build_py
+
+NAMED_ABILITIES_DIR = (Path(__file__).resolve().parent / "src" / "lorcana_sim" / "models"
+                       / "abilities" / "composable" / "named_abilities")
+
+
+class BuildPy(build_py):
+    """Regenerate the named ability manifest before building the package."""
+
+    def run(self):
+        spec = importlib.util.spec_from_file_location(
+            "build_manifest", NAMED_ABILITIES_DIR / "build_manifest.py")
+        build_manifest = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(build_manifest)
+        build_manifest.write_manifest(NAMED_ABILITIES_DIR)
+        super().run()
+
 
-# All configuration is in pyproject.toml
-setup()
\ No newline at end of file
+# All other configuration is in pyproject.toml
+setup(cmdclass={"build_py": BuildPy})
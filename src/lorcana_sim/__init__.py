@@ -1,18 +1,20 @@
-"""Lorcana simulation package."""
+"""Lorcana simulation package.
 
-__version__ = "0.1.0"
+Subpackages are imported on first access, so ``import lorcana_sim`` stays
+cheap for processes (such as simulation workers) that only need part of it.
+Importing the package does not configure logging; applications call
+``lorcana_sim.utils.logging_config.setup_logging()`` themselves (its level
+defaults to ``$LORCANA_LOG_LEVEL``, else INFO).
+"""
+
+from importlib import import_module
 
-# Set up logging configuration on import
-import os
-from .utils.logging_config import setup_logging
+__version__ = "0.1.0"
 
-# Default to INFO level, but allow override via environment variable
-log_level = os.getenv('LORCANA_LOG_LEVEL', 'INFO')
-setup_logging(level=log_level)
+__all__ = ["models", "loaders", "utils", "engine", "search"]
 
-from . import models
-from . import loaders
-from . import utils
-from . import engine
 
-__all__ = ["models", "loaders", "utils", "engine"]
\ No newline at end of file
+def __getattr__(name):
+    if name in __all__:
+        return import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,17 +1,28 @@
 """Action queue system for executing effects and emitting events atomically."""
 
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Tuple
 from dataclasses import dataclass, field
 from collections import deque
 from enum import Enum
-import uuid
+from heapq import heappush, heappop, heapify
+import itertools
 
-from ..models.abilities.composable.effects import Effect
+from ..models.abilities.composable.effects import CompositeEffect, Effect, TargetedEffect
 from .event_system import GameEvent, EventContext, GameEventManager
 from ..utils.logging_config import get_game_logger
+from ..utils.history import ExecutionHistory, HistoryRetention
 
 logger = get_game_logger(__name__)
 
+# Action ids are increasing integers; within a priority they also give the
+# FIFO order of the queue.
+_action_ids = itertools.count(1)
+
+
+def next_action_id() -> int:
+    """Return a new unique action id."""
+    return next(_action_ids)
+
 class ActionPriority(Enum):
     """Priority levels for action execution."""
     IMMEDIATE = 0  # Must execute before anything else (e.g., replacement effects)
@@ -24,7 +35,7 @@ class ActionPriority(Enum):
 @dataclass
 class QueuedAction:
     """Represents a single action in the queue."""
-    action_id: str
+    action_id: int
     effect: Effect
     target: Any
     context: Dict[str, Any]
@@ -34,13 +45,13 @@ class QueuedAction:
     
     def __post_init__(self):
         if not self.action_id:
-            self.action_id = str(uuid.uuid4())
+            self.action_id = next_action_id()
 
 
 @dataclass
 class ConditionalQueuedAction:
     """Represents an action that waits for a specific event and condition."""
-    action_id: str
+    action_id: int
     effect: Effect
     target: Any
     context: Dict[str, Any]
@@ -51,13 +62,13 @@ class ConditionalQueuedAction:
     
     def __post_init__(self):
         if not self.action_id:
-            self.action_id = str(uuid.uuid4())
+            self.action_id = next_action_id()
 
 
 @dataclass
 class ActionResult:
     """Result of executing an action."""
-    action_id: str
+    action_id: int
     success: bool
     result: Any
     events_emitted: List[Dict[str, Any]]
@@ -66,13 +77,31 @@ class ActionResult:
 
 
 class ActionQueue:
-    """Manages the queue of pending actions and their execution."""
+    """Manages the queue of pending actions and their execution.
+    
+    Args:
+        event_manager: Event manager that applied effects' events go to
+        history_retention: How much execution history to keep (default: everything)
+        lean: Headless mode: executed actions are not recorded in the history
+              or in ``game_state.choice_events``, callers skip building action
+              descriptions (see ``describe``), and events nothing listens to are
+              not dispatched. Effects run in the same order with the same outcomes.
+    """
     
-    def __init__(self, event_manager: GameEventManager):
+    def __init__(self, event_manager: GameEventManager,
+                 history_retention: Optional[HistoryRetention] = None,
+                 lean: bool = False):
         self.event_manager = event_manager
-        self._queue: deque[QueuedAction] = deque()
+        self.lean = lean
+        # Pending actions: ``_front`` holds actions that run before the heap
+        # (IMMEDIATE priority, resumed and split actions), newest first, plus
+        # any action enqueued ahead of one of them by priority; everything else
+        # sits in ``_heap`` ordered by (priority, action id), i.e. FIFO within
+        # a priority.
+        self._front: deque = deque()
+        self._heap: List[Tuple[int, int, QueuedAction]] = []
         self._paused = False
-        self._execution_history: List[ActionResult] = []
+        self._execution_history = ExecutionHistory(history_retention, self._summarize_result)
         self._current_action: Optional[QueuedAction] = None
         self._waiting_actions: Dict[str, QueuedAction] = {}  # Actions waiting for choice resolution
         
@@ -82,10 +111,15 @@ class ActionQueue:
         
         # Legacy phase-scheduled effects (deprecated, kept for backward compatibility)
         self._phase_effects: Dict[str, Dict[Any, List[QueuedAction]]] = defaultdict(lambda: defaultdict(list))
+    
+    @property
+    def describe(self) -> bool:
+        """Whether enqueued actions should carry human-readable descriptions."""
+        return not self.lean
         
     def enqueue(self, effect: Effect, target: Any, context: Dict[str, Any], 
                 priority: ActionPriority = ActionPriority.NORMAL,
-                source_description: str = "") -> str:
+                source_description: str = "") -> int:
         """
         Add an action to the queue.
         
@@ -93,7 +127,7 @@ class ActionQueue:
             The action ID for tracking
         """
         action = QueuedAction(
-            action_id=str(uuid.uuid4()),
+            action_id=next_action_id(),
             effect=effect,
             target=target,
             context=context,
@@ -101,32 +135,24 @@ class ActionQueue:
             source_description=source_description
         )
         
-        from ..models.abilities.composable.effects import AbilityTriggerEffect
-        
         # Insert based on priority
         if priority == ActionPriority.IMMEDIATE:
-            self._queue.appendleft(action)
+            self._front.appendleft(action)
         elif priority == ActionPriority.CLEANUP:
-            self._queue.append(action)
+            heappush(self._heap, (priority.value, action.action_id, action))
         else:
-            # For HIGH, NORMAL, LOW - insert in order
-            inserted = False
-            for i, existing in enumerate(self._queue):
+            # For HIGH, NORMAL, LOW - insert before the first action with a
+            # lower priority, which may be one put back at the front
+            for i, existing in enumerate(self._front):
                 if existing.priority.value > priority.value:
-                    # Insert before first lower priority item
-                    # Convert deque to list, insert, convert back
-                    queue_list = list(self._queue)
-                    queue_list.insert(i, action)
-                    self._queue = deque(queue_list)
-                    inserted = True
+                    self._front.insert(i, action)
                     break
-            
-            if not inserted:
-                self._queue.append(action)
+            else:
+                heappush(self._heap, (priority.value, action.action_id, action))
         
         return action.action_id
     
-    def enqueue_multiple(self, actions: List[tuple]) -> List[str]:
+    def enqueue_multiple(self, actions: List[tuple]) -> List[int]:
         """
         Enqueue multiple actions at once.
         
@@ -150,7 +176,7 @@ class ActionQueue:
     def enqueue_for_event(self, effect: Effect, target: Any, context: Dict[str, Any],
                           trigger_event: Any, condition: Optional[Callable] = None,
                           priority: ActionPriority = ActionPriority.NORMAL,
-                          source_description: str = "") -> str:
+                          source_description: str = "") -> int:
         """
         Schedule an effect to execute when a specific event occurs, optionally with a condition.
         
@@ -167,7 +193,7 @@ class ActionQueue:
             The action ID for tracking
         """
         conditional_action = ConditionalQueuedAction(
-            action_id=str(uuid.uuid4()),
+            action_id=next_action_id(),
             effect=effect,
             target=target,
             context=context,
@@ -181,7 +207,7 @@ class ActionQueue:
         
         return conditional_action.action_id
     
-    def process_event_triggers(self, event_context) -> List[str]:
+    def process_event_triggers(self, event_context) -> List[int]:
         """
         Process all effects that should be triggered by this event.
         
@@ -220,7 +246,8 @@ class ActionQueue:
                     target=conditional_action.target,
                     context=conditional_action.context,
                     priority=conditional_action.priority,
-                    source_description=f"[Event Triggered] {conditional_action.source_description}"
+                    source_description=(f"[Event Triggered] {conditional_action.source_description}"
+                                        if not self.lean else "")
                 )
                 triggered_action_ids.append(action_id)
                 actions_to_remove.append(i)
@@ -234,7 +261,7 @@ class ActionQueue:
     def enqueue_for_phase(self, effect: Effect, target: Any, context: Dict[str, Any],
                          phase: str, player: Any,
                          priority: ActionPriority = ActionPriority.CLEANUP,
-                         source_description: str = "") -> str:
+                         source_description: str = "") -> int:
         """
         Schedule an effect to execute during a specific phase for a specific player.
         
@@ -251,7 +278,7 @@ class ActionQueue:
             The action ID for tracking
         """
         action = QueuedAction(
-            action_id=str(uuid.uuid4()),
+            action_id=next_action_id(),
             effect=effect,
             target=target,
             context=context,
@@ -265,7 +292,7 @@ class ActionQueue:
         
         return action.action_id
     
-    def execute_phase_effects(self, phase: str, player: Any) -> List[str]:
+    def execute_phase_effects(self, phase: str, player: Any) -> List[int]:
         """
         Execute all effects scheduled for a specific phase and player.
         
@@ -308,13 +335,24 @@ class ActionQueue:
         
         return action_ids
     
+    def has_event_triggers(self, event_type: Any) -> bool:
+        """Whether any effect is waiting for this event (see ``enqueue_for_event``)."""
+        return bool(self._event_triggered_effects.get(event_type))
+    
     def has_pending_actions(self) -> bool:
         """Check if there are actions waiting to be executed."""
-        return len(self._queue) > 0
+        return bool(self._front or self._heap)
     
     def peek_next_action(self) -> Optional[QueuedAction]:
         """Look at the next action without removing it from the queue."""
-        return self._queue[0] if self._queue else None
+        if self._front:
+            return self._front[0]
+        return self._heap[0][-1] if self._heap else None
+    
+    def _pop_next_action(self) -> QueuedAction:
+        if self._front:
+            return self._front.popleft()
+        return heappop(self._heap)[-1]
     
     def process_next_action(self, apply_effect: bool = True) -> Optional[ActionResult]:
         """
@@ -326,12 +364,15 @@ class ActionQueue:
         Returns:
             ActionResult if an action was processed, None if queue is empty
         """
-        if self._paused or not self._queue:
+        if self._paused or not (self._front or self._heap):
             return None
         
-        action = self._queue.popleft()
+        action = self._pop_next_action()
         self._current_action = action
         
+        if self.lean and apply_effect:
+            return self._process_action_lean(action)
+        
         # Check if this is a composite effect that needs splitting
         if not apply_effect and self._is_composite_effect(action.effect):
             return self._process_composite_effect(action)
@@ -342,13 +383,12 @@ class ActionQueue:
             result = action.effect.apply(action.target, action.context)
             
             # Check if this is a TargetedEffect that returned unchanged target (choice pending)
-            from ..models.abilities.composable.effects import TargetedEffect
             if isinstance(action.effect, TargetedEffect) and result == action.target:
                 # Choice might be pending - check if choice manager has pending choices
                 choice_manager = action.context.get('choice_manager')
                 if choice_manager and choice_manager.is_game_paused():
                     # Put the action back at the front of the queue for later processing
-                    self._queue.appendleft(action)
+                    self._front.appendleft(action)
                     self._current_action = None
                     # Pause the queue
                     self._paused = True
@@ -409,6 +449,53 @@ class ActionQueue:
             
         return action_result
     
+    def _process_action_lean(self, action: QueuedAction) -> Optional[ActionResult]:
+        """``process_next_action`` for lean mode: same effects, events and pausing,
+        without history, ``choice_events`` or dispatching unobserved events."""
+        context = action.context
+        target = action.target
+        effect = action.effect
+        result = effect.apply(target, context)
+        
+        # A TargetedEffect that returned its target unchanged may be waiting for a choice
+        if isinstance(effect, TargetedEffect) and result == target:
+            choice_manager = context.get('choice_manager')
+            if choice_manager and choice_manager.is_game_paused():
+                self._front.appendleft(action)
+                self._current_action = None
+                self._paused = True
+                return None
+        
+        get_events = getattr(effect, 'get_events', None)
+        events = get_events(target, context, result) if get_events is not None else []
+        if events:
+            event_manager = self.event_manager
+            game_state = context.get('game_state')
+            for event_data in events:
+                event_type = event_data.get('type')
+                if isinstance(event_type, str):
+                    event_type = GameEvent(event_type)
+                # Nothing would run for this event: skip building its context
+                if not event_manager.is_event_observed(event_type, game_state):
+                    continue
+                event_manager.trigger_event(EventContext(
+                    event_type=event_type,
+                    source=event_data.get('source', target),
+                    target=event_data.get('target'),
+                    player=event_data.get('player'),
+                    game_state=game_state,
+                    additional_data=event_data.get('additional_data', {})
+                ))
+        
+        self._current_action = None
+        return ActionResult(
+            action_id=action.action_id,
+            success=True,
+            result=result,
+            events_emitted=events,
+            queued_action=action
+        )
+    
     def process_all_actions(self) -> List[ActionResult]:
         """
         Process all pending actions in order.
@@ -443,21 +530,20 @@ class ActionQueue:
     
     def clear(self):
         """Clear all pending actions."""
-        self._queue.clear()
+        self._front.clear()
+        self._heap.clear()
         self._current_action = None
     
     def get_pending_count(self) -> int:
         """Get the number of pending actions."""
-        return len(self._queue)
+        return len(self._front) + len(self._heap)
     
     def get_pending_actions(self) -> List[QueuedAction]:
-        """Get a copy of all pending actions."""
-        return list(self._queue)
+        """Get a copy of all pending actions, in execution order."""
+        return list(self._front) + [entry[-1] for entry in sorted(self._heap)]
     
     def _is_composite_effect(self, effect) -> bool:
         """Check if an effect is a composite effect."""
-        from ..models.abilities.composable.effects import CompositeEffect
-        
         # Check if it's directly a composite effect
         if isinstance(effect, CompositeEffect):
             return True
@@ -468,8 +554,6 @@ class ActionQueue:
     
     def _process_composite_effect(self, composite_action: QueuedAction) -> Optional[ActionResult]:
         """Process a composite effect by splitting it into individual actions."""
-        from ..models.abilities.composable.effects import CompositeEffect
-        
         # Extract the actual composite effect
         composite_effect = composite_action.effect
         if isinstance(composite_effect, CompositeEffect):
@@ -483,7 +567,7 @@ class ActionQueue:
         sub_actions = []
         for sub_effect in actual_composite.effects:
             sub_action = QueuedAction(
-                action_id=f"{composite_action.action_id}_sub_{len(sub_actions)}",
+                action_id=next_action_id(),
                 effect=sub_effect,
                 target=composite_action.target,
                 context=composite_action.context.copy(),
@@ -495,7 +579,7 @@ class ActionQueue:
         
         # Insert sub-actions at the front of the queue (in reverse order so they execute in correct order)
         for sub_action in reversed(sub_actions):
-            self._queue.appendleft(sub_action)
+            self._front.appendleft(sub_action)
         
         # Process the first sub-action immediately
         if sub_actions:
@@ -505,18 +589,32 @@ class ActionQueue:
     
     def get_execution_history(self, limit: int = 10) -> List[ActionResult]:
         """Get recent execution history."""
-        return self._execution_history[-limit:]
+        return self._execution_history.recent(limit)
     
-    def remove_action(self, action_id: str) -> bool:
+    def set_history_retention(self, retention: HistoryRetention) -> None:
+        """Change how much execution history is kept; already recorded entries are dropped."""
+        self._execution_history.close()
+        self._execution_history = ExecutionHistory(retention, self._summarize_result)
+    
+    def _summarize_result(self, result: ActionResult) -> Dict[str, Any]:
+        return self.create_message_for_action(result.queued_action, result)
+    
+    def remove_action(self, action_id: int) -> bool:
         """
         Remove a specific action from the queue.
         
         Returns:
             True if action was found and removed
         """
-        for i, action in enumerate(self._queue):
+        for i, action in enumerate(self._front):
             if action.action_id == action_id:
-                del self._queue[i]
+                del self._front[i]
+                return True
+        for i, entry in enumerate(self._heap):
+            if entry[-1].action_id == action_id:
+                self._heap[i] = self._heap[-1]
+                self._heap.pop()
+                heapify(self._heap)
                 return True
         return False
     
@@ -539,7 +637,7 @@ class ActionQueue:
     
     def enqueue_waiting_for_choice(self, effect: Effect, choice_id: str, target: Any, 
                                    context: Dict[str, Any], priority: ActionPriority = ActionPriority.NORMAL,
-                                   source_description: str = "") -> str:
+                                   source_description: str = "") -> int:
         """
         Queue an effect that waits for a specific choice to be resolved.
         
@@ -555,7 +653,7 @@ class ActionQueue:
             The action ID for tracking
         """
         action = QueuedAction(
-            action_id=str(uuid.uuid4()),
+            action_id=next_action_id(),
             effect=effect,
             target=target,
             context=context,
@@ -569,7 +667,7 @@ class ActionQueue:
         
         return action.action_id
     
-    def resolve_choice_and_continue(self, choice_id: str, selected_targets: List[Any]) -> Optional[str]:
+    def resolve_choice_and_continue(self, choice_id: str, selected_targets: List[Any]) -> Optional[int]:
         """
         Find waiting action and provide it with resolved targets, then queue it for execution.
         
@@ -589,7 +687,7 @@ class ActionQueue:
             action.waiting_for_choice = None  # Clear the waiting state
             
             # Queue the action for immediate execution
-            self._queue.appendleft(action)  # Use appendleft for immediate priority
+            self._front.appendleft(action)  # Back at the front of the queue
             logger.debug("ActionQueue.resolve_choice_and_continue - queued action {action.action_id} for execution")
             
             return action.action_id
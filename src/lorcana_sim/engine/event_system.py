@@ -1,7 +1,7 @@
 """Event system for triggered abilities and game state changes."""
 
 from enum import Enum
-from typing import Dict, Any, List, Set, TYPE_CHECKING, Optional, Callable
+from typing import Dict, Any, List, NamedTuple, Set, TYPE_CHECKING, Optional, Callable, Tuple
 from dataclasses import dataclass
 
 if TYPE_CHECKING:
@@ -11,14 +11,37 @@ if TYPE_CHECKING:
     # NOTE: StepProgressionEngine removed in Phase 4
 
 from ..models.abilities.composable.activation_zones import ActivationZone
+from ..utils import logging_config
 from ..utils.logging_config import get_game_logger
 
 logger = get_game_logger(__name__)
 
 
+# Player zone attributes that correspond to an ability activation zone
+_ZONE_ATTRIBUTE_TO_ACTIVATION_ZONE = {
+    'hand': ActivationZone.HAND,
+    'characters_in_play': ActivationZone.PLAY,
+    'deck': ActivationZone.DECK,
+    'discard_pile': ActivationZone.DISCARD,
+    'inkwell': ActivationZone.INK_WELL,
+}
+
+
 def get_card_current_zone(card: Any, game_state: 'GameState') -> Optional['ActivationZone']:
-    """Determine which zone a card is currently in."""
+    """Determine which zone a card is currently in.
+    
+    Uses each player's card -> zone index, so this is O(1) per player.
+    """
     for player in game_state.players:
+        if hasattr(player, 'get_card_zone'):
+            zone_name = player.get_card_zone(card)
+            if zone_name is not None:
+                zone = _ZONE_ATTRIBUTE_TO_ACTIVATION_ZONE.get(zone_name)
+                if zone is not None:
+                    return zone
+            continue
+        
+        # Fallback for player objects without a zone index
         if card in player.hand:
             return ActivationZone.HAND
         elif card in player.characters_in_play:
@@ -157,6 +180,44 @@ class EventContext:
             self.additional_data = {}
 
 
+# ('source' | 'target', id(card)): an ability consulted only for that card's events
+DispatchKey = Tuple[str, int]
+
+
+def ability_dispatch_keys(ability: Any, events: Set['GameEvent']) -> Dict['GameEvent', DispatchKey]:
+    """Events for which an ability can only fire on one card's events.
+    
+    Read from the listeners' trigger predicates (see ``TriggerPredicate``): if
+    every listener that can fire on an event requires the same event source
+    (or target), the ability is keyed on that card for the event. Events
+    missing from the result need the ability consulted on every occurrence,
+    as does any ability with a listener whose condition has no predicate.
+    """
+    predicates = []
+    for listener in getattr(ability, 'listeners', ()):
+        predicate = getattr(getattr(listener, 'trigger_condition', None), 'predicate', None)
+        if predicate is None:
+            return {}
+        predicates.append(predicate)
+    
+    keys = {}
+    for event in events:
+        event_keys = {predicate.dispatch_key() for predicate in predicates if predicate.event is event}
+        if len(event_keys) != 1:
+            continue
+        key = event_keys.pop()
+        if key is not None:
+            keys[event] = key
+    return keys
+
+
+class _Dispatch(NamedTuple):
+    """Active abilities for one event, split by whose events they care about."""
+    abilities: List[Any]  # Every active ability, in registration order
+    unkeyed: List[Any]  # Abilities consulted on every occurrence of the event
+    keyed: Dict[DispatchKey, List[Any]]  # Abilities consulted only for one card's events
+
+
 class GameEventManager:
     """Manages game events and composable abilities."""
     
@@ -167,6 +228,26 @@ class GameEventManager:
         # NOTE: step_engine removed in Phase 4
         self.event_interceptors: List[Callable[[EventContext], bool]] = []
         self._paused_events: List[EventContext] = []
+        
+        # Active listener registry partitioned by (event, zone of the source card).
+        # Only abilities whose card currently sits in one of their activation zones
+        # are present, so dispatch never walks dormant abilities (e.g. the deck).
+        # Abilities without a source card live under the None zone.
+        self._active_listeners: Dict[GameEvent, Dict[Optional[ActivationZone], Dict[Any, int]]] = {}
+        self._dispatch_cache: Dict[GameEvent, _Dispatch] = {}
+        self._ability_seq: Dict[Any, int] = {}  # Registration order, preserved by dispatch
+        self._ability_events: Dict[Any, Set[GameEvent]] = {}
+        self._ability_keys: Dict[Any, Dict[GameEvent, DispatchKey]] = {}  # See ability_dispatch_keys
+        self._ability_zone: Dict[Any, Optional[ActivationZone]] = {}  # Current bucket of active abilities
+        self._abilities_by_card: Dict[int, List[Any]] = {}
+        self._next_seq = 0
+        
+        # Keep the registry current through the players' zone indexes
+        players = getattr(game_state, 'players', None) or []
+        self._zone_tracking = bool(players) and all(hasattr(p, 'add_zone_observer') for p in players)
+        if self._zone_tracking:
+            for player in players:
+                player.add_zone_observer(self.notify_card_zone_change)
     
     def register_composable_ability(self, ability: Any) -> None:
         """Register a composable ability with the event manager."""
@@ -202,6 +283,7 @@ class GameEventManager:
         
         # Mark ability as registered to prevent future duplicates
         self._registered_abilities.add(ability)
+        self._track_ability(ability, relevant_events)
     
     def register_all_abilities(self, clear_existing: bool = False) -> None:
         """Register all abilities from all cards in the game at initialization.
@@ -244,12 +326,159 @@ class GameEventManager:
         
         # Remove from registered tracking set
         self._registered_abilities.discard(ability)
+        self._untrack_ability(ability)
     
     def clear_all_registrations(self) -> None:
         """Clear all ability registrations. Useful for rebuilding the system."""
         self._composable_listeners.clear()
         self._registered_abilities.clear()
+        self._clear_active_listeners()
+    
+    # Zone-partitioned active listener registry
+    
+    def _track_ability(self, ability: Any, events: Set[GameEvent]) -> None:
+        """Add a newly registered ability to the zone-partitioned registry."""
+        self._ability_seq[ability] = self._next_seq
+        self._next_seq += 1
+        self._ability_events[ability] = set(events)
+        self._ability_keys[ability] = ability_dispatch_keys(ability, self._ability_events[ability])
+        
+        source_card = getattr(ability, 'character', None)
+        if source_card:
+            self._abilities_by_card.setdefault(id(source_card), []).append(ability)
+        self._place_ability(ability)
+    
+    def _untrack_ability(self, ability: Any) -> None:
+        """Remove an ability from the zone-partitioned registry."""
+        if ability not in self._ability_seq:
+            return
+        self._remove_from_bucket(ability)
+        source_card = getattr(ability, 'character', None)
+        if source_card:
+            card_abilities = self._abilities_by_card.get(id(source_card), [])
+            if ability in card_abilities:
+                card_abilities.remove(ability)
+            if not card_abilities:
+                self._abilities_by_card.pop(id(source_card), None)
+        del self._ability_seq[ability]
+        del self._ability_events[ability]
+        del self._ability_keys[ability]
+    
+    def _clear_active_listeners(self) -> None:
+        self._active_listeners.clear()
+        self._dispatch_cache.clear()
+        self._ability_seq.clear()
+        self._ability_events.clear()
+        self._ability_keys.clear()
+        self._ability_zone.clear()
+        self._abilities_by_card.clear()
+    
+    def _place_ability(self, ability: Any) -> None:
+        """Put an ability in the bucket matching its source card's current zone."""
+        source_card = getattr(ability, 'character', None)
+        if source_card:
+            zone = get_card_current_zone(source_card, self.game_state)
+            active = zone in ability.activation_zones
+        else:
+            zone, active = None, True
+        
+        if ability in self._ability_zone:
+            if active and self._ability_zone[ability] == zone:
+                return
+            self._remove_from_bucket(ability)
+        if not active:
+            return
+        
+        seq = self._ability_seq[ability]
+        for event in self._ability_events[ability]:
+            self._active_listeners.setdefault(event, {}).setdefault(zone, {})[ability] = seq
+            self._dispatch_cache.pop(event, None)
+        self._ability_zone[ability] = zone
+    
+    def _remove_from_bucket(self, ability: Any) -> None:
+        if ability not in self._ability_zone:
+            return
+        zone = self._ability_zone.pop(ability)
+        for event in self._ability_events[ability]:
+            zones = self._active_listeners.get(event)
+            if zones and zone in zones:
+                zones[zone].pop(ability, None)
+                if not zones[zone]:
+                    del zones[zone]
+            self._dispatch_cache.pop(event, None)
+    
+    def notify_card_zone_change(self, card: Any, from_zone: Optional[str] = None,
+                                to_zone: Optional[str] = None) -> None:
+        """Re-bucket a card's abilities after it moved between zones.
+        
+        Called by the players' zone observers on every zone change, so the
+        from/to names are informational only; the card's zone is read from the
+        zone index.
+        """
+        card_abilities = self._abilities_by_card.get(id(card))
+        if card_abilities:
+            for ability in card_abilities:
+                self._place_ability(ability)
+    
+    def _dispatch_for(self, event: GameEvent) -> _Dispatch:
+        cached = self._dispatch_cache.get(event)
+        if cached is None:
+            zones = self._active_listeners.get(event)
+            if not zones:
+                abilities = []
+            elif len(zones) == 1:
+                bucket = next(iter(zones.values()))
+                abilities = sorted(bucket, key=bucket.__getitem__)
+            else:
+                seq = self._ability_seq
+                abilities = sorted((a for bucket in zones.values() for a in bucket), key=seq.__getitem__)
+            unkeyed, keyed = [], {}
+            for ability in abilities:
+                key = self._ability_keys[ability].get(event)
+                if key is None:
+                    unkeyed.append(ability)
+                else:
+                    keyed.setdefault(key, []).append(ability)
+            cached = self._dispatch_cache[event] = _Dispatch(abilities, unkeyed, keyed)
+        return cached
+    
+    def get_active_listeners(self, event: GameEvent) -> List[Any]:
+        """Abilities that would be consulted for an event, in registration order."""
+        return self._dispatch_for(event).abilities
+    
+    def get_candidate_listeners(self, event_context: EventContext) -> List[Any]:
+        """Active abilities that could trigger on this event, in registration order.
+        
+        Like ``get_active_listeners``, minus abilities whose trigger predicates
+        tie them to another card's events (e.g. "whenever this character
+        quests" when a different character quests).
+        """
+        dispatch = self._dispatch_for(event_context.event_type)
+        if not dispatch.keyed:
+            return dispatch.unkeyed
+        hits = (dispatch.keyed.get(('source', id(event_context.source)), [])
+                + dispatch.keyed.get(('target', id(event_context.target)), []))
+        if not hits:
+            return dispatch.unkeyed
+        return sorted(dispatch.unkeyed + hits, key=self._ability_seq.__getitem__)
 
+    def is_event_observed(self, event_type: GameEvent, game_state: Any) -> bool:
+        """Whether triggering this event could do anything.
+        
+        False when no interceptor, passive ability, registered ability or
+        event-triggered queued effect could see it, so callers may skip
+        building and triggering the event.
+        """
+        if self.event_interceptors or getattr(self, 'passive_abilities', None):
+            return True
+        if self._zone_tracking and game_state is self.game_state:
+            if self._dispatch_for(event_type).abilities:
+                return True
+        elif self._composable_listeners.get(event_type):
+            return True
+        action_queue = getattr(getattr(self, 'execution_engine', None), 'action_queue', None)
+        return action_queue is not None and action_queue.has_event_triggers(event_type)
+    
     def set_step_engine(self, step_engine) -> None:
         """DEPRECATED: Step engine removed in Phase 4."""
         pass
@@ -283,41 +512,51 @@ class GameEventManager:
     def _execute_event(self, event_context: EventContext) -> List[str]:
         """Execute an event (internal method)."""
         results = []
-        
-        # DEBUG: Trace event triggering
-        logger.debug(f"Triggering event {event_context.event_type.value} with source {getattr(event_context, 'source', None)}")
+        # Dispatch tracing (see utils.logging_config); None while tracing is off
+        tracer = logging_config.TRACER
         
         # Trigger composable abilities
-        composable_abilities = self._composable_listeners.get(event_context.event_type, [])
-        logger.debug(f"Found {len(composable_abilities)} abilities listening for {event_context.event_type.value}")
+        use_zone_registry = self._zone_tracking and event_context.game_state is self.game_state
+        if use_zone_registry:
+            # Only abilities whose card is in one of their activation zones and
+            # whose trigger predicates allow this event; tracing still records
+            # every active ability
+            if tracer is None:
+                composable_abilities = self.get_candidate_listeners(event_context)
+            else:
+                composable_abilities = self.get_active_listeners(event_context.event_type)
+        else:
+            composable_abilities = self._composable_listeners.get(event_context.event_type, [])
         
         for ability in composable_abilities:
-            logger.debug(f"Checking ability {getattr(ability, 'name', 'unknown')} with character {getattr(ability, 'character', None)}")
-            
-            # NEW: Check if source card is in valid zone for this ability
-            source_card = getattr(ability, 'character', None)
-            if source_card:
-                current_zone = get_card_current_zone(source_card, event_context.game_state)
-                logger.debug(f"Source card {source_card} is in zone {current_zone}, ability activation zones: {getattr(ability, 'activation_zones', 'unknown')}")
-                if current_zone not in ability.activation_zones:
-                    # Skip this ability if card is not in valid zone
-                    logger.debug(f"Skipping ability - card not in valid zone")
+            current_zone = None
+            if use_zone_registry:
+                # Skip abilities whose card left its activation zones mid-dispatch
+                if ability not in self._ability_zone:
                     continue
+                if tracer is not None:
+                    current_zone = self._ability_zone[ability]
+            else:
+                # Check if source card is in valid zone for this ability
+                source_card = getattr(ability, 'character', None)
+                if source_card:
+                    current_zone = get_card_current_zone(source_card, event_context.game_state)
+                    if current_zone not in ability.activation_zones:
+                        continue
             
             # NOTE: Step-based abilities removed in Phase 4
             # All abilities now use effect-based execution through ActionQueue
             
-            # Execute immediately for simple abilities - only log if something actually triggered
+            # Execute immediately for simple abilities
             triggered = False
             for listener in ability.listeners:
-                logger.debug(f"Checking listener {listener} should_trigger result: {listener.should_trigger(event_context)}")
                 if listener.should_trigger(event_context):
                     triggered = True
                     break
             
-            logger.debug(f"Ability triggered: {triggered}")
+            if tracer is not None:
+                tracer.dispatch(event_context.event_type, ability, current_zone, triggered)
             if triggered:
-                logger.debug(f"Calling ability.handle_event for {getattr(ability, 'name', 'unknown')}")
                 ability.handle_event(event_context)
                 # Don't generate immediate messages - let the action queue handle messaging
                 # when effects are actually executed
@@ -372,6 +611,7 @@ class GameEventManager:
     def rebuild_listeners(self):
         """Rebuild the composable ability listener registry from current game state."""
         self._composable_listeners.clear()
+        self._clear_active_listeners()
         
         # Register all composable abilities from characters in play
         for player in self.game_state.players:
@@ -29,7 +29,8 @@ class ExecutionEngine:
     Combines action execution, step progression, and conditional effects.
     """
     
-    def __init__(self, game_state, validator, event_manager, choice_manager):
+    def __init__(self, game_state, validator, event_manager, choice_manager, history_retention=None,
+                 lean: bool = False):
         self.game_state = game_state
         self.validator = validator
         self.event_manager = event_manager
@@ -37,7 +38,7 @@ class ExecutionEngine:
         
         # Execution components
         # NOTE: step_engine removed in Phase 4
-        self.action_queue = ActionQueue(event_manager)
+        self.action_queue = ActionQueue(event_manager, history_retention, lean=lean)
         self.action_executor = ActionExecutor(
             game_state, validator, event_manager, choice_manager, self.action_queue
         )
@@ -53,7 +54,7 @@ class ExecutionEngine:
         
         return result
     
-    def process_move(self, move: GameMove) -> str:
+    def process_move(self, move: GameMove) -> int:
         """Convert move directly to effect and queue it.
         
         Returns:
@@ -157,7 +158,7 @@ class ExecutionEngine:
         """
         return self.action_queue.process_next_action()
     
-    def queue_reactive_effects(self) -> List[str]:
+    def queue_reactive_effects(self) -> List[int]:
         """Check and queue reactive effects that should trigger.
         
         Returns:
@@ -173,7 +174,7 @@ class ExecutionEngine:
         
         return action_ids
     
-    def queue_conditional_effects(self) -> List[str]:
+    def queue_conditional_effects(self) -> List[int]:
         """Evaluate and queue conditional effects.
         
         Returns:
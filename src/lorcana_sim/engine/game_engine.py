@@ -1,6 +1,6 @@
 """Game engine for executing actions and managing state transitions."""
 
-from typing import Dict, Any, Tuple, Optional, List, Union
+from typing import Dict, Any, Tuple, Optional, List, Union, TYPE_CHECKING
 from collections import deque
 from ..models.game.game_state import GameState, Phase
 from ..models.cards.character_card import CharacterCard
@@ -20,9 +20,13 @@ from .game_moves import GameMove, ChoiceMove, InkMove, PlayMove, QuestMove, Chal
 from .action_queue import ActionQueue, ActionPriority, QueuedAction
 from .action_executor import ActionExecutor
 from .execution_engine import ExecutionEngine
-from .message_engine import MessageEngine
+from .message_engine import MessageEngine, ExecutedEffect
 from ..models.abilities.composable.activation_zones import ActivationZone
 from .game_event_types import GameEventType
+from ..utils.history import HistoryRetention
+
+if TYPE_CHECKING:
+    from .snapshot import EngineSnapshot
 
 
 def create_event_data(event: GameEvent, **context) -> Dict[str, Any]:
@@ -36,7 +40,16 @@ def create_event_data(event: GameEvent, **context) -> Dict[str, Any]:
 class GameEngine:
     """Executes game actions and manages state transitions with step-by-step support."""
     
-    def __init__(self, game_state: GameState):
+    def __init__(self, game_state: GameState, history_retention: Optional[HistoryRetention] = None,
+                 lean: bool = False):
+        """
+        Args:
+            game_state: The game to run
+            history_retention: How much execution and zone-transition history to
+                               keep (default: all executed actions)
+            lean: Run the action queue in lean mode for headless simulation: no
+                  execution history or action descriptions (see ``ActionQueue``)
+        """
         self.game_state = game_state
         
         # Core managers (unchanged)
@@ -55,8 +68,10 @@ class GameEngine:
         # Three specialized engines
         self.execution_engine = ExecutionEngine(
             game_state, self.validator, self.event_manager, 
-            self.choice_manager
+            self.choice_manager, history_retention, lean=lean
         )
+        if history_retention is not None:
+            game_state.zone_manager.set_history_retention(history_retention)
         self.message_engine = MessageEngine(
             game_state, self.choice_manager, self.validator, self.execution_engine
         )
@@ -90,6 +105,21 @@ class GameEngine:
         """Clear the last event."""
         self.game_state.clear_last_event()
     
+    def snapshot(self) -> 'EngineSnapshot':
+        """Record the game's runtime state so it can be restored after exploring a line.
+        
+        Covers the GameState snapshot plus the pending action queue, pending
+        choices and registered abilities. Cheap enough to take at every node of
+        a search; card definitions and listeners are shared, not copied.
+        """
+        from .snapshot import capture_engine
+        return capture_engine(self)
+    
+    def restore(self, snapshot: 'EngineSnapshot') -> None:
+        """Return this engine to a state recorded by ``snapshot()``, in place."""
+        from .snapshot import restore_engine
+        restore_engine(self, snapshot)
+    
     def trigger_event_with_choices(self, event_context: EventContext) -> List[str]:
         """Trigger an event with choice manager included in the context."""
         # Add choice manager to the event context's additional data
@@ -223,11 +253,28 @@ class GameEngine:
         self.current_choice = self.message_engine.current_choice
         
         return result
-    
-    
-    
-    
-    
+
+    def advance_until_decision(self, move: Optional[GameMove] = None,
+                               effect_log: Optional[List[ExecutedEffect]] = None,
+                               max_steps: Optional[int] = None,
+                               stop_on_new_turn: bool = False) -> GameMessage:
+        """Run the game until a player action or choice is needed, or the game ends.
+
+        Leaves the game in the same state as calling ``next_message`` until it
+        returns something other than a StepExecutedMessage, without building
+        the intermediate messages. See ``MessageEngine.advance_until_decision``.
+        """
+        self.message_engine.waiting_for_input = self.waiting_for_input
+        self.message_engine.current_choice = self.current_choice
+
+        result = self.message_engine.advance_until_decision(
+            move, effect_log, max_steps, stop_on_new_turn)
+
+        self.waiting_for_input = self.message_engine.waiting_for_input
+        self.current_choice = self.message_engine.current_choice
+
+        return result
+
     def trigger_event_with_choices_and_queue(self, event_context: EventContext) -> List[str]:
         """Trigger an event with choice manager and action queue included in the context."""
         # Add choice manager and action queue to the event context's additional data
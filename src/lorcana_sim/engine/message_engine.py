@@ -1,6 +1,6 @@
 """MessageEngine for handling message flow and structured event data creation."""
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, NamedTuple, Tuple
 from ..models.game.game_state import GameState
 from .event_system import GameEvent
 from .choice_system import GameChoiceManager
@@ -35,6 +35,13 @@ class ReadyCharacterReportEffect:
         return target
 
 
+class ExecutedEffect(NamedTuple):
+    """One effect executed while advancing to the next decision."""
+    effect: Any
+    target: Any
+    success: bool
+
+
 def create_event_data(event: GameEvent, **context) -> Dict[str, Any]:
     """Create standardized event_data structure."""
     return {
@@ -53,6 +60,10 @@ class MessageEngine:
         self.execution_engine = execution_engine  # Reference to ExecutionEngine for coordination
         self.next_message_calls = 0
         
+        # (step, move) for every move received, when a caller enables it by
+        # setting a list; lets a copy of the game replay it
+        self.move_log: Optional[List[Tuple[int, GameMove]]] = None
+        
         # Message flow components
         self.waiting_for_input = False
         
@@ -72,6 +83,59 @@ class MessageEngine:
         If that effect triggers hooks that queue more effects, those effects
         are NOT executed in this call - they wait for subsequent calls.
         """
+        return self._step(move)
+    
+    def advance_until_decision(self, move: Optional[GameMove] = None,
+                               effect_log: Optional[List[ExecutedEffect]] = None,
+                               max_steps: Optional[int] = None,
+                               stop_on_new_turn: bool = False) -> GameMessage:
+        """Run steps until a player has to act or choose, or the game ends.
+        
+        Takes exactly the steps repeated ``next_message`` calls would take, in
+        the same order, but without building a StepExecutedMessage (and its
+        effect data) for each one. Every step still counts in
+        ``next_message_calls``.
+        
+        Args:
+            move: Move or choice answering the previous decision, if any
+            effect_log: Optional list that each executed effect is appended to
+            max_steps: Stop after this many steps even if no decision is reached
+            stop_on_new_turn: Also stop right after the step that starts a new turn
+        
+        Returns:
+            The ActionRequiredMessage, ChoiceRequiredMessage or GameOverMessage
+            that ended the run; otherwise a StepExecutedMessage with step
+            "turn_started" (``stop_on_new_turn``) or "step_limit_reached"
+            (``max_steps`` ran out).
+        """
+        turn = self.game_state.turn_number
+        steps = 0
+        while max_steps is None or steps < max_steps:
+            steps += 1
+            message = self._step(move, quiet=True, effect_log=effect_log)
+            move = None
+            if message is not None:
+                return message
+            if stop_on_new_turn and self.game_state.turn_number != turn:
+                return StepExecutedMessage(
+                    type=MessageType.STEP_EXECUTED,
+                    player=self.game_state.current_player,
+                    step="turn_started"
+                )
+        return StepExecutedMessage(
+            type=MessageType.STEP_EXECUTED,
+            player=self.game_state.current_player,
+            step="step_limit_reached"
+        )
+    
+    def _step(self, move: Optional[GameMove] = None, quiet: bool = False,
+              effect_log: Optional[List[ExecutedEffect]] = None) -> Optional[GameMessage]:
+        """Take one step: process the move, then execute at most one effect.
+        
+        Returns the step's message. With ``quiet``, steps that would produce a
+        StepExecutedMessage return None instead, and executed effects are
+        appended to ``effect_log`` when one is given.
+        """
         self.next_message_calls += 1
         # Reset conditional evaluation counter for this call
         self.conditional_evaluations_this_call = 0
@@ -82,6 +146,8 @@ class MessageEngine:
         
         # 2. Process move if provided (queues effect, doesn't execute)
         if move:
+            if self.move_log is not None:
+                self.move_log.append((self.next_message_calls, move))
             self._process_move(move)  # Converts to effect, queues at BACK
             self.waiting_for_input = False
         
@@ -89,7 +155,7 @@ class MessageEngine:
         if self.execution_engine:
             reactive_message = self._check_and_process_reactive_conditions()
             if reactive_message:
-                return reactive_message
+                return None if quiet else reactive_message
         
         # 4. Legacy conditional effects evaluation removed - now handled by modern event-driven system
         
@@ -104,6 +170,9 @@ class MessageEngine:
             # - Queue more effects (but doesn't execute them)
             # - Return a result that we turn into a message
             result = self.execution_engine.action_queue.process_next_action()
+            if effect_log is not None and result is not None and result.queued_action is not None:
+                executed = result.queued_action
+                effect_log.append(ExecutedEffect(executed.effect, executed.target, result.success))
             
             # Check for pending choices AFTER executing the action
             # This is important for choice-generating effects
@@ -118,6 +187,10 @@ class MessageEngine:
                 )
                 return msg
             
+            if quiet:
+                if not result or not result.success:
+                    self._block_failed_action(result)
+                return None
             return self._create_message_from_result(result)
         
         # 6. Check for pending choices
@@ -165,6 +238,8 @@ class MessageEngine:
         # 9. Auto-queue phase progression only if no legal actions available
         if not legal_actions and not self.waiting_for_input:
             self._queue_phase_progression()  # Queues effect for next call
+            if quiet:
+                return None
             # Return a special message indicating auto-progression
             msg = StepExecutedMessage(
                 type=MessageType.STEP_EXECUTED,
@@ -320,13 +395,14 @@ class MessageEngine:
         ready_effects = self.game_state._phase_management.ready_step(self.game_state)
         
         # Queue each effect returned by phase management
+        action_queue = self.execution_engine.action_queue
         for effect in ready_effects:
-            self.execution_engine.action_queue.enqueue(
+            action_queue.enqueue(
                 effect=effect,
                 target=self.game_state.current_player,
                 context={'game_state': self.game_state},
                 priority=ActionPriority.NORMAL,
-                source_description=str(effect)
+                source_description=str(effect) if action_queue.describe else ""
             )
         
         # Finally, queue phase transition to SET
@@ -361,13 +437,14 @@ class MessageEngine:
         draw_effects = self.game_state._phase_management.draw_step(self.game_state)
         
         # Queue each effect returned by phase management
+        action_queue = self.execution_engine.action_queue
         for effect in draw_effects:
-            self.execution_engine.action_queue.enqueue(
+            action_queue.enqueue(
                 effect=effect,
                 target=self.game_state.current_player,
                 context={'game_state': self.game_state},
                 priority=ActionPriority.NORMAL,
-                source_description=str(effect)
+                source_description=str(effect) if action_queue.describe else ""
             )
         
         # Finally, queue phase transition to PLAY
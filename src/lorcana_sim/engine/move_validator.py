@@ -1,21 +1,34 @@
 """Move validation system for Lorcana gameplay."""
 
-from typing import List, Tuple, Optional, Dict, Any
+from typing import List, Tuple, Optional, Dict, Any, Callable
 from ..models.game.game_state import GameState, Phase
 from ..models.cards.character_card import CharacterCard
 from ..models.cards.action_card import ActionCard
 from ..models.cards.item_card import ItemCard
 from ..models.cards.base_card import Card
+from ..models.cards.keywords import Keyword
 
 
 class MoveValidator:
-    """Validates possible moves and game actions."""
+    """Validates possible moves and game actions.
     
-    def __init__(self, game_state: GameState):
+    With ``incremental=True`` the hand-derived moves (ink and playable cards)
+    and songs are cached together with a key built from the state they depend
+    on - zone stamps of the hand and board, available ink, per-card costs and
+    runtime state - and only recomputed when that key changes. Questers and
+    challenges are always recomputed: keying a board costs as much as the
+    single pass that generates them. Generation from scratch is cheap enough
+    that the cache rarely pays for its keys in a normal game, so it is off by
+    default.
+    """
+    
+    def __init__(self, game_state: GameState, incremental: bool = False):
         self.game_state = game_state
+        self.incremental = incremental
         self.temporarily_blocked_actions = set()
         self.last_clear_turn = -1
         self.last_clear_phase = ""
+        self._move_cache: Dict[str, Tuple[Any, Any]] = {}
     
     def get_all_legal_actions(self) -> List[Tuple[str, Dict[str, Any]]]:
         """Get all legal actions for current player in current phase."""
@@ -42,34 +55,28 @@ class MoveValidator:
             pass
         
         elif phase.value == 'play':
+            ink_cards, (characters, actions, items), questing, challenges, songs = self._play_phase_moves()
+            
             # Play ink (once per turn)
-            can_play_ink = self.game_state.can_play_ink()
-            if can_play_ink:
-                ink_cards = self.get_playable_ink_cards()
-                for card in ink_cards:
-                    legal_actions.append(("play_ink", {'card': card}))
+            for card in ink_cards:
+                legal_actions.append(("play_ink", {'card': card}))
             # Play characters
-            characters = self.get_playable_characters()
             for character in characters:
                 legal_actions.append(("play_character", {'card': character}))
             
             # Play actions
-            actions = self.get_playable_actions()
             for action in actions:
                 legal_actions.append(("play_action", {'card': action}))
             
             # Play items
-            items = self.get_playable_items()
             for item in items:
                 legal_actions.append(("play_item", {'card': item}))
             
             # Quest with characters
-            questing = self.get_characters_that_can_quest()
             for character in questing:
                 legal_actions.append(("quest_character", {'character': character}))
             
             # Challenge with characters
-            challenges = self.get_possible_challenges()
             for attacker, defender in challenges:
                 legal_actions.append(("challenge_character", {
                     'attacker': attacker, 
@@ -77,7 +84,6 @@ class MoveValidator:
                 }))
             
             # Sing songs
-            songs = self.get_singable_songs()
             for song, singer in songs:
                 legal_actions.append(("sing_song", {
                     'song': song,
@@ -92,6 +98,8 @@ class MoveValidator:
         self._clear_blocked_actions_if_needed()
         
         # Filter out temporarily blocked actions
+        if not self.temporarily_blocked_actions:
+            return legal_actions
         filtered_actions = []
         for action, params in legal_actions:
             action_signature = self._create_action_signature(action, params)
@@ -100,6 +108,74 @@ class MoveValidator:
         
         return filtered_actions
     
+    def _play_phase_moves(self) -> Tuple[list, Tuple[list, list, list], list, list, list]:
+        """Ink cards, playable (characters, actions, items), questers, challenges and songs."""
+        if not self.incremental:
+            ink_cards, playable, _ = self._get_hand_moves()
+            return (ink_cards, playable, self.get_characters_that_can_quest(),
+                    self.get_possible_challenges(), self.get_singable_songs())
+        
+        game_state = self.game_state
+        player = game_state.current_player
+        player_index = game_state.current_player_index
+        hand = self._hand_key(player)
+        ink_cards, playable, has_songs = self._cached(
+            'hand', (player_index, game_state.can_play_ink(), player.available_ink, hand), self._get_hand_moves)
+        questing = self.get_characters_that_can_quest()
+        
+        challenges = self.get_possible_challenges()
+        songs = []
+        if has_songs and player.characters_in_play:
+            songs = self._cached('songs', (player_index, hand, self._board_key(player)), self.get_singable_songs)
+        return ink_cards, playable, questing, challenges, songs
+    
+    def _cached(self, category: str, key: Any, compute: Callable[[], Any]) -> Any:
+        """Cached result of a move category, recomputed only when its key changes."""
+        entry = self._move_cache.get(category)
+        if entry is not None and entry[0] == key:
+            return entry[1]
+        result = compute()
+        self._move_cache[category] = (key, result)
+        return result
+    
+    @staticmethod
+    def _hand_key(player) -> Tuple[int, List[Tuple[int, bool]]]:
+        # Costs and inkability can be changed by effects without the hand changing
+        return player.zone_stamp('hand'), [(card.cost, card.inkwell) for card in player.hand]
+    
+    @staticmethod
+    def _board_key(player) -> Tuple[int, List[tuple]]:
+        # A card's __dict__ holds all of its runtime state (exerted, damage,
+        # dryness, overridden printed stats); the containers effects mutate in
+        # place are keyed by content - abilities carry Singer
+        return player.zone_stamp('characters_in_play'), [
+            (tuple(char.__dict__.items()), tuple(char.composable_abilities), tuple(char.metadata.items()))
+            for char in player.characters_in_play
+        ]
+    
+    def _get_hand_moves(self) -> Tuple[List[Card], Tuple[List[CharacterCard], List[ActionCard], List[ItemCard]], bool]:
+        """Ink cards, playable (characters, actions, items) and whether the hand holds a song."""
+        # One pass over the hand, equivalent to the get_playable_* methods
+        current_player = self.game_state.current_player
+        can_play_ink = self.game_state.can_play_ink()
+        available_ink = current_player.available_ink
+        ink_cards, characters, actions, items = [], [], [], []
+        has_songs = False
+        for card in current_player.hand:
+            if can_play_ink and card.can_be_inked():
+                ink_cards.append(card)
+            if isinstance(card, ActionCard) and card.is_song:
+                has_songs = True
+            if available_ink < card.cost:
+                continue
+            if isinstance(card, CharacterCard):
+                characters.append(card)
+            elif isinstance(card, ActionCard):
+                actions.append(card)
+            elif isinstance(card, ItemCard):
+                items.append(card)
+        return ink_cards, (characters, actions, items), has_songs
+    
     def get_playable_ink_cards(self) -> List[Card]:
         """Get cards that can be played as ink."""
         current_player = self.game_state.current_player
@@ -156,14 +232,21 @@ class MoveValidator:
         ready_attackers = [char for char in current_player.characters_in_play 
                           if char.can_challenge(current_turn) and not self.game_state.has_character_acted_this_turn(char.id)]
         possible_defenders = opponent.characters_in_play
+        if not ready_attackers or not possible_defenders:
+            return challenges
         
+        # Valid targets only depend on whether the attacker has Evasive, and
+        # already satisfy can_challenge for a ready attacker
+        targets_by_evasive = {}
         for attacker in ready_attackers:
-            # Get valid targets for this attacker (considering targeting modification abilities)
-            valid_defenders = self._get_valid_challenge_targets(attacker, possible_defenders)
+            has_evasive = self._character_has_evasive(attacker)
+            valid_defenders = targets_by_evasive.get(has_evasive)
+            if valid_defenders is None:
+                valid_defenders = targets_by_evasive[has_evasive] = self._get_valid_challenge_targets(
+                    attacker, possible_defenders)
             
             for defender in valid_defenders:
-                if self.can_challenge(attacker, defender):
-                    challenges.append((attacker, defender))
+                challenges.append((attacker, defender))
         
         return challenges
     
@@ -211,25 +294,12 @@ class MoveValidator:
     
     def _character_has_evasive(self, character: CharacterCard) -> bool:
         """Check if a character has Evasive ability."""
-        if hasattr(character, 'composable_abilities'):
-            for ability in character.composable_abilities:
-                if hasattr(ability, 'name') and 'evasive' in ability.name.lower():
-                    return True
-        return False
+        return bool(character.keywords & Keyword.EVASIVE)
     
     def _character_has_bodyguard(self, character: CharacterCard) -> bool:
         """Check if a character has Bodyguard ability."""
-        # Check metadata first (set by BodyguardEffect)
-        if hasattr(character, 'metadata') and character.metadata.get('has_bodyguard', False):
-            return True
-        
-        # Also check composable abilities as fallback
-        if hasattr(character, 'composable_abilities'):
-            for ability in character.composable_abilities:
-                if hasattr(ability, 'name') and 'bodyguard' in ability.name.lower():
-                    return True
-        
-        return False
+        # Printed Bodyguard or has_bodyguard set by BodyguardEffect
+        return bool(character.keywords & Keyword.BODYGUARD)
     
     def can_challenge(self, attacker: CharacterCard, defender: CharacterCard) -> bool:
         """Check if attacker can challenge defender using ability delegation."""
@@ -280,11 +350,9 @@ class MoveValidator:
         # Get the required cost to sing this song
         required_cost = self._get_song_singer_cost(song)
         
-        # Check composable abilities for Singer
-        if hasattr(singer, 'composable_abilities') and singer.composable_abilities:
-            for ability in singer.composable_abilities:
-                if hasattr(ability, 'can_sing_song') and ability.can_sing_song(required_cost):
-                    return True
+        # Singer X can sing songs that require cost X or less
+        if singer.keywords & Keyword.SINGER and required_cost <= singer.keyword_value(Keyword.SINGER):
+            return True
         
         # Check if character's basic cost meets the song requirement
         # Songs like "Characters with cost 3 or more can sing this song"
@@ -0,0 +1,98 @@
+"""Snapshot/restore of a whole engine for search-based AIs.
+
+Extends the GameState snapshot with the engine-side runtime state a game
+needs to continue: the pending action queue, choices waiting for input, the
+set of registered abilities and the message loop's bookkeeping. Everything is
+restored in place onto the same engine, so listeners and abilities stay bound
+to their cards and no object graph is ever deep-copied.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from ..models.game.snapshot import (
+    GameStateSnapshot, capture_attributes, restore_attributes, capture_game_state, restore_game_state
+)
+
+if TYPE_CHECKING:
+    from .game_engine import GameEngine
+
+# Runtime attributes per engine component. Execution history is handled
+# separately (rolled back on restore rather than copied).
+_ACTION_QUEUE_ATTRIBUTES = (
+    '_front', '_heap', '_paused', '_current_action', '_waiting_actions',
+    '_event_triggered_effects', '_phase_effects',
+)
+_CHOICE_MANAGER_ATTRIBUTES = ('pending_choices', 'choice_counter', 'game_paused', 'current_choice', 'choice_results')
+_MESSAGE_ENGINE_ATTRIBUTES = (
+    'next_message_calls', 'waiting_for_input', 'current_choice', 'last_conditional_eval_turn',
+    'last_conditional_eval_phase', 'conditional_evaluations_this_call',
+)
+_VALIDATOR_ATTRIBUTES = ('temporarily_blocked_actions', 'last_clear_turn', 'last_clear_phase')
+_GAME_ENGINE_ATTRIBUTES = ('waiting_for_input', 'current_choice', '_pending_zone_events')
+
+
+@dataclass
+class EngineSnapshot:
+    """Runtime state of a GameEngine, restorable with ``GameEngine.restore``."""
+    engine: 'GameEngine'
+    game_state: GameStateSnapshot
+    components: List[Tuple[Any, Dict[str, Any]]]
+    registered_abilities: List[Any]
+    paused_events: List[Any]
+    history_recorded: int
+    moves_recorded: Optional[int]
+
+
+def _engine_components(engine: 'GameEngine') -> List[Tuple[Any, Tuple[str, ...]]]:
+    return [
+        (engine.execution_engine.action_queue, _ACTION_QUEUE_ATTRIBUTES),
+        (engine.choice_manager, _CHOICE_MANAGER_ATTRIBUTES),
+        (engine.message_engine, _MESSAGE_ENGINE_ATTRIBUTES),
+        (engine.validator, _VALIDATOR_ATTRIBUTES),
+        (engine, _GAME_ENGINE_ATTRIBUTES),
+    ]
+
+
+def capture_engine(engine: 'GameEngine') -> EngineSnapshot:
+    """Record everything needed to resume an engine from its current point."""
+    event_manager = engine.event_manager
+    return EngineSnapshot(
+        engine=engine,
+        game_state=capture_game_state(engine.game_state),
+        components=[(component, capture_attributes(component, names))
+                    for component, names in _engine_components(engine)],
+        # Registration order matters for dispatch order
+        registered_abilities=list(event_manager._ability_seq),
+        paused_events=list(event_manager._paused_events),
+        history_recorded=engine.execution_engine.action_queue._execution_history.recorded,
+        moves_recorded=None if engine.message_engine.move_log is None else len(engine.message_engine.move_log),
+    )
+
+
+def _same_objects(current: List[Any], saved: List[Any]) -> bool:
+    return len(current) == len(saved) and all(a is b for a, b in zip(current, saved))
+
+
+def restore_engine(engine: 'GameEngine', snapshot: EngineSnapshot) -> None:
+    """Put an engine back into a recorded state, in place."""
+    if snapshot.engine is not engine:
+        raise ValueError("Snapshot was taken from a different engine")
+
+    restore_game_state(engine.game_state, snapshot.game_state)
+    for component, saved in snapshot.components:
+        restore_attributes(component, saved)
+
+    # Abilities granted or expired since the snapshot change the registrations;
+    # re-register in the recorded order so dispatch order is preserved
+    event_manager = engine.event_manager
+    if not _same_objects(list(event_manager._ability_seq), snapshot.registered_abilities):
+        event_manager.clear_all_registrations()
+        for ability in snapshot.registered_abilities:
+            event_manager.register_composable_ability(ability)
+    event_manager._paused_events = list(snapshot.paused_events)
+
+    engine.execution_engine.action_queue._execution_history.rollback(snapshot.history_recorded)
+    move_log = engine.message_engine.move_log
+    if move_log is not None and snapshot.moves_recorded is not None:
+        del move_log[snapshot.moves_recorded:]
@@ -1,11 +1,28 @@
-"""Turn History and Timing System for centralized tracking of turn progression."""
+"""Turn History and Timing System for centralized tracking of turn progression.
 
-from typing import List, Dict, Any, Optional
+Temporary effects whose expiry depends only on timing are scheduled on a heap
+keyed by their deadline, ``(turn, phase ordinal)``, so an expiry check costs
+O(expired) rather than O(registered). Only ``until_condition`` effects are
+polled on every check.
+
+Finished turns are folded into a ``TurnSummary``; how many ``TurnInfo``
+records are kept is set by a ``HistoryRetention`` (default: none, only the
+turn in progress).
+"""
+
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
+from heapq import heappush, heappop, heapify
+import itertools
+from ..models.game.game_state import Phase
+from ..utils.history import ExecutionHistory, HistoryRetention
 from ..utils.logging_config import get_game_logger
 
 logger = get_game_logger(__name__)
 
+# Phase names in turn order; unknown phase names sort after all of them
+PHASE_ORDINALS: Dict[str, int] = {phase.value: ordinal for ordinal, phase in enumerate(Phase)}
+
 
 @dataclass
 class TurnInfo:
@@ -27,16 +44,52 @@ class EffectDuration:
     registered_turn: int
     registered_phase: Optional[str] = None
     condition: Optional[callable] = None  # For condition-based durations
+    sequence: int = 0  # Registration order, used to report expired effects in that order
+
+
+@dataclass
+class TurnSummary:
+    """Counters over every turn played, whether or not its TurnInfo is retained."""
+    turns: int = 0
+    completed_turns: int = 0
+    total_time: int = 0
+    events: int = 0
+    events_by_type: Dict[str, int] = field(default_factory=dict)
+
+
+def _turn_record(turn_info: TurnInfo) -> Dict[str, Any]:
+    """JSON-friendly summary of a turn, for SPILL retention."""
+    return {
+        'turn_number': turn_info.turn_number,
+        'player': str(turn_info.player),
+        'start_time': turn_info.start_time,
+        'end_time': turn_info.end_time,
+        'phases': list(turn_info.phases),
+        'events': len(turn_info.events),
+    }
 
 
 class TurnTimingComponent:
-    """Centralized tracking of turn progression and timing."""
+    """Centralized tracking of turn progression and timing.
+    
+    Args:
+        history_retention: Which TurnInfo records to keep once their turn is
+                           over (default: ``HistoryRetention.off()``, counters only;
+                           ``HistoryRetention.keep_all()`` keeps every turn)
+    """
     
-    def __init__(self):
-        self.turn_history: List[TurnInfo] = []
+    def __init__(self, history_retention: Optional[HistoryRetention] = None):
+        self.turn_history = ExecutionHistory(history_retention or HistoryRetention.off(),
+                                             serializer=_turn_record)
+        self.summary = TurnSummary()
         self.current_turn_info: Optional[TurnInfo] = None
         self.duration_tracking: Dict[int, EffectDuration] = {}  # effect_id -> duration_info
         self.event_counter = 0  # For generating unique timestamps
+        # (turn, phase ordinal, sequence, effect_id, info); entries whose info is
+        # no longer in duration_tracking are stale and skipped when popped
+        self._expiry_heap: List[Tuple[int, int, int, int, EffectDuration]] = []
+        self._condition_effects: Dict[int, EffectDuration] = {}
+        self._sequence = itertools.count()
     
     def start_turn(self, turn_number: int, player: Any) -> TurnInfo:
         """Record turn start and setup timing.
@@ -59,6 +112,7 @@ class TurnTimingComponent:
         )
         
         self.turn_history.append(turn_info)
+        self.summary.turns += 1
         self.current_turn_info = turn_info
         
         logger.debug(f"Started turn {turn_number} for player {player}")
@@ -73,6 +127,8 @@ class TurnTimingComponent:
         if self.current_turn_info:
             self.current_turn_info.end_time = self._get_game_time()
             completed_turn = self.current_turn_info
+            self.summary.completed_turns += 1
+            self.summary.total_time += completed_turn.end_time - completed_turn.start_time
             self.current_turn_info = None
             logger.debug(f"Ended turn {completed_turn.turn_number}")
             return completed_turn
@@ -113,6 +169,8 @@ class TurnTimingComponent:
             'timestamp': self._get_game_time(),
             'data': event_data
         }
+        self.summary.events += 1
+        self.summary.events_by_type[event_type] = self.summary.events_by_type.get(event_type, 0) + 1
         
         # Add to current turn
         if self.current_turn_info:
@@ -138,7 +196,7 @@ class TurnTimingComponent:
             Effect ID for tracking
         """
         effect_id = id(effect)
-        current_turn = len(self.turn_history)
+        current_turn = self.summary.turns
         current_phase = self._get_current_phase()
         
         duration_info = EffectDuration(
@@ -147,10 +205,13 @@ class TurnTimingComponent:
             duration_value=duration_value,
             registered_turn=current_turn,
             registered_phase=current_phase,
-            condition=condition
+            condition=condition,
+            sequence=next(self._sequence)
         )
         
+        self._unschedule(effect_id)
         self.duration_tracking[effect_id] = duration_info
+        self._schedule(effect_id, duration_info)
         logger.debug(f"Registered temporary effect {effect} with duration {duration_type}:{duration_value}")
         return effect_id
     
@@ -164,6 +225,7 @@ class TurnTimingComponent:
             True if effect was found and removed, False otherwise
         """
         if effect_id in self.duration_tracking:
+            self._unschedule(effect_id)
             effect_info = self.duration_tracking.pop(effect_id)
             logger.debug(f"Unregistered temporary effect {effect_info.effect}")
             return True
@@ -174,6 +236,9 @@ class TurnTimingComponent:
                            game_state: Optional[Any] = None) -> List[Any]:
         """Get effects that should expire based on current timing.
         
+        Only effects whose deadline has passed are popped from the expiry heap;
+        ``until_condition`` effects are evaluated every time.
+        
         Args:
             current_turn: Current turn number (defaults to latest)
             current_phase: Current phase (defaults to current)
@@ -183,24 +248,33 @@ class TurnTimingComponent:
             List of effects that should expire
         """
         if current_turn is None:
-            current_turn = len(self.turn_history)
+            current_turn = self.summary.turns
         if current_phase is None:
             current_phase = self._get_current_phase()
+        now = (current_turn, self._phase_ordinal(current_phase))
         
-        expired = []
-        expired_ids = []
+        expired: List[Tuple[int, int, EffectDuration]] = []
+        heap = self._expiry_heap
+        while heap and heap[0][:2] <= now:
+            _, _, sequence, effect_id, info = heappop(heap)
+            if self.duration_tracking.get(effect_id) is info:
+                expired.append((sequence, effect_id, info))
         
-        for effect_id, info in self.duration_tracking.items():
+        for effect_id, info in self._condition_effects.items():
             if self._should_expire(info, current_turn, current_phase, game_state):
-                expired.append(info.effect)
-                expired_ids.append(effect_id)
+                expired.append((info.sequence, effect_id, info))
+        
+        if not expired:
+            return []
         
-        # Remove expired effects from tracking
-        for effect_id in expired_ids:
+        # Report in registration order, as a scan over duration_tracking would
+        expired.sort(key=lambda entry: entry[0])
+        for _, effect_id, _ in expired:
+            self._condition_effects.pop(effect_id, None)
             del self.duration_tracking[effect_id]
             logger.debug(f"Effect {effect_id} expired and removed from tracking")
         
-        return expired
+        return [info.effect for _, _, info in expired]
     
     def check_and_queue_expired_effects(self, action_queue: Any, game_state: Any) -> int:
         """Check for expired effects and queue them for execution.
@@ -257,8 +331,8 @@ class TurnTimingComponent:
         return effect_id
     
     def get_turn_count(self) -> int:
-        """Get the total number of completed turns."""
-        return len(self.turn_history)
+        """Get the total number of turns started."""
+        return self.summary.turns
     
     def get_current_turn_number(self) -> Optional[int]:
         """Get the current turn number."""
@@ -271,8 +345,10 @@ class TurnTimingComponent:
             turn_number: Turn number to retrieve
             
         Returns:
-            TurnInfo if found, None otherwise
+            TurnInfo if found (the turn in progress or a retained one), None otherwise
         """
+        if self.current_turn_info and self.current_turn_info.turn_number == turn_number:
+            return self.current_turn_info
         for turn_info in self.turn_history:
             if turn_info.turn_number == turn_number:
                 return turn_info
@@ -285,15 +361,24 @@ class TurnTimingComponent:
             count: Number of recent turns to return
             
         Returns:
-            List of recent TurnInfo objects
+            List of recent TurnInfo objects (retained turns and the turn in progress)
         """
-        return self.turn_history[-count:] if count > 0 else []
+        if count <= 0:
+            return []
+        turns = self.turn_history.recent(count)
+        current = self.current_turn_info
+        if current and (not turns or turns[-1] is not current):
+            turns = (turns + [current])[-count:]
+        return turns
     
     def clear_history(self) -> None:
         """Clear all turn history and timing data."""
         self.turn_history.clear()
+        self.summary = TurnSummary()
         self.current_turn_info = None
         self.duration_tracking.clear()
+        self._expiry_heap.clear()
+        self._condition_effects.clear()
         self.event_counter = 0
         logger.debug("Cleared all turn timing history")
     
@@ -322,6 +407,45 @@ class TurnTimingComponent:
         
         return latest_phase
     
+    @staticmethod
+    def _phase_ordinal(phase: Optional[str]) -> int:
+        """Position of a phase within a turn; no phase counts as the start of the turn."""
+        if phase is None:
+            return 0
+        return PHASE_ORDINALS.get(phase, len(PHASE_ORDINALS))
+    
+    def _expiry_deadline(self, effect_info: EffectDuration) -> Optional[Tuple[int, int]]:
+        """The (turn, phase ordinal) from which an effect is expired.
+        
+        Mirrors ``_should_expire``; None for effects that are polled
+        (``until_condition``) or never expire (unknown duration types).
+        """
+        if effect_info.duration_type in ('until_end_of_turn', 'phases'):
+            return (effect_info.registered_turn + 1, 0)
+        elif effect_info.duration_type == 'turns':
+            return (effect_info.registered_turn + effect_info.duration_value, 0)
+        return None
+    
+    def _schedule(self, effect_id: int, effect_info: EffectDuration) -> None:
+        """Put a newly registered effect on the expiry heap or the polled set."""
+        if effect_info.duration_type == 'until_condition':
+            if effect_info.condition:
+                self._condition_effects[effect_id] = effect_info
+            return
+        deadline = self._expiry_deadline(effect_info)
+        if deadline is not None:
+            heappush(self._expiry_heap, (*deadline, effect_info.sequence, effect_id, effect_info))
+    
+    def _unschedule(self, effect_id: int) -> None:
+        """Forget an effect's schedule; its heap entry goes stale and is dropped lazily."""
+        self._condition_effects.pop(effect_id, None)
+        if effect_id in self.duration_tracking and len(self._expiry_heap) > 2 * len(self.duration_tracking) + 32:
+            # Mostly stale entries: rebuild so unregistering can't grow the heap without bound
+            tracking = self.duration_tracking
+            self._expiry_heap = [entry for entry in self._expiry_heap
+                                 if tracking.get(entry[3]) is entry[4] and entry[3] != effect_id]
+            heapify(self._expiry_heap)
+    
     def _should_expire(self, effect_info: EffectDuration, current_turn: int, current_phase: str, 
                        game_state: Optional[Any] = None) -> bool:
         """Check if effect should expire.
@@ -366,25 +490,20 @@ class TurnTimingComponent:
         Returns:
             Dictionary with timing statistics
         """
-        if not self.turn_history:
+        summary = self.summary
+        if not summary.turns:
             return {'turns': 0, 'total_time': 0, 'avg_turn_time': 0}
         
-        total_time = 0
-        completed_turns = 0
-        
-        for turn_info in self.turn_history:
-            if turn_info.end_time:
-                turn_duration = turn_info.end_time - turn_info.start_time
-                total_time += turn_duration
-                completed_turns += 1
-        
+        total_time = summary.total_time
+        completed_turns = summary.completed_turns
         avg_turn_time = total_time / completed_turns if completed_turns > 0 else 0
         
         return {
-            'turns': len(self.turn_history),
+            'turns': summary.turns,
             'completed_turns': completed_turns,
             'total_time': total_time,
             'avg_turn_time': avg_turn_time,
             'active_temporary_effects': len(self.duration_tracking),
-            'current_turn': self.current_turn_info.turn_number if self.current_turn_info else None
+            'current_turn': self.current_turn_info.turn_number if self.current_turn_info else None,
+            'events': summary.events
         }
\ No newline at end of file
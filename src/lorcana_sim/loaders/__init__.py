@@ -1,6 +1,18 @@
 """Data loaders for Lorcana simulation."""
 
-from .lorcana_json_parser import LorcanaJsonParser
-from .dreamborn_parser import DreambornParser
+from importlib import import_module
 
-__all__ = ["LorcanaJsonParser", "DreambornParser"]
\ No newline at end of file
+# Parsers are imported on first access, so importing one loader module does
+# not import them all
+_LAZY = {
+    "LorcanaJsonParser": ".lorcana_json_parser",
+    "DreambornParser": ".dreamborn_parser",
+}
+
+__all__ = ["LorcanaJsonParser", "DreambornParser"]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        return getattr(import_module(_LAZY[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
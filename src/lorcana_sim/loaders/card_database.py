@@ -1,7 +1,7 @@
 """Card database for loading and matching cards from the all-cards JSON."""
 
-import json
 import re
+from collections import defaultdict
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 from dataclasses import dataclass
@@ -10,6 +10,20 @@ from ..models.cards.character_card import CharacterCard
 from ..models.cards.action_card import ActionCard
 from ..models.cards.item_card import ItemCard
 from ..models.cards.base_card import CardColor, Rarity
+from ..utils.logging_config import get_game_logger
+from .card_matcher import CardMatch, CardMatcher, normalize_name
+from .json_cache import cached_build, load_json
+
+logger = get_game_logger(__name__)
+
+# Lowest fuzzy-match score find_card accepts when no name matches exactly
+MIN_MATCH_SCORE = 0.5
+
+# Index attributes built from the JSON and stored in the on-disk cache
+_INDEX_ATTRIBUTES = (
+    'cards', 'cards_by_id', 'cards_by_name', 'cards_by_full_name', 'cards_by_set_number',
+    'cards_by_color', 'cards_by_cost', 'cards_by_type', 'cards_by_keyword', 'matcher',
+)
 
 
 @dataclass
@@ -37,36 +51,107 @@ class CardData:
 
 
 class CardDatabase:
-    """Database for loading and matching cards."""
+    """Database for loading and matching cards.
+    
+    Parsing the JSON and building the indexes happens once per file content:
+    the result is cached on disk (see ``json_cache``), so constructing a
+    database for an unchanged file only unpickles the indexes. Use
+    ``CardDatabase.shared(path)`` to reuse one instance across loaders.
+    
+    Indexes (values are ``CardData``; all are read-only and shared):
+        cards: Every card, in file order
+        cards_by_id: Card id -> card
+        cards_by_name: Normalized name -> card (last printing wins)
+        cards_by_full_name: Normalized full name and "Name - Version" -> card
+        cards_by_set_number: (set code, number) -> card
+        cards_by_color: Lowercase color -> cards
+        cards_by_cost: Cost -> cards
+        cards_by_type: Lowercase type ('character', 'action', ...) -> cards
+        cards_by_keyword: Lowercase keyword ('evasive', 'shift', ...) -> cards
+        matcher: ``CardMatcher`` for ranked fuzzy name lookups
+    """
+    
+    _shared: Dict[str, 'CardDatabase'] = {}
     
     def __init__(self, cards_json_path: str):
         self.cards_json_path = Path(cards_json_path)
+        self.cards: List[CardData] = []
+        self.cards_by_id: Dict[int, CardData] = {}
         self.cards_by_name: Dict[str, CardData] = {}
         self.cards_by_full_name: Dict[str, CardData] = {}
+        self.cards_by_set_number: Dict[Tuple[str, int], CardData] = {}
+        self.cards_by_color: Dict[str, List[CardData]] = {}
+        self.cards_by_cost: Dict[int, List[CardData]] = {}
+        self.cards_by_type: Dict[str, List[CardData]] = {}
+        self.cards_by_keyword: Dict[str, List[CardData]] = {}
+        self.matcher: Optional[CardMatcher] = None
         self._load_cards()
     
+    @classmethod
+    def shared(cls, cards_json_path: str) -> 'CardDatabase':
+        """The process-wide database for a card file, created on first use.
+        
+        A new instance is made if the file has changed since.
+        """
+        key = str(Path(cards_json_path).resolve())
+        database = cls._shared.get(key)
+        indexes = cached_build(key, 'card-db', cls._build_indexes)
+        if database is None or database._indexes is not indexes:
+            database = cls._shared[key] = cls(cards_json_path)
+        return database
+    
     def _normalize_name(self, name: str) -> str:
         """Normalize name for comparison by removing special characters and converting to lowercase."""
-        # Remove special characters (keep only letters, numbers, spaces, and hyphens)
-        normalized = re.sub(r"[^\w\s\-]", "", name)
-        # Convert to lowercase and strip extra whitespace
-        return normalized.lower().strip()
+        return normalize_name(name)
     
     def _load_cards(self):
-        """Load all cards from the JSON file."""
-        with open(self.cards_json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        """Load all cards from the JSON file (or the cached indexes built from it)."""
+        self._indexes = cached_build(self.cards_json_path, 'card-db', self._build_indexes)
+        for name in _INDEX_ATTRIBUTES:
+            setattr(self, name, self._indexes[name])
+    
+    @classmethod
+    def _build_indexes(cls, path: Path) -> Dict[str, object]:
+        """Parse every card in the JSON file and index it."""
+        builder = cls.__new__(cls)
+        data = load_json(path)
         
+        cards = []
+        by_id, by_name, by_full_name, by_set_number = {}, {}, {}, {}
+        by_color, by_cost = defaultdict(list), defaultdict(list)
+        by_type, by_keyword = defaultdict(list), defaultdict(list)
         for card_data in data.get('cards', []):
-            card = self._parse_card_data(card_data)
+            card = builder._parse_card_data(card_data)
+            cards.append(card)
+            by_id[card.id] = card
+            by_set_number[(card.set_code, card.number)] = card
+            by_color[card.color.lower()].append(card)
+            by_cost[card.cost].append(card)
+            by_type[card.type.lower()].append(card)
+            for keyword in {ability.get('keyword', '').lower() for ability in card.abilities
+                            if ability.get('type') == 'keyword' and ability.get('keyword')}:
+                by_keyword[keyword].append(card)
             
             # Index by normalized name formats for matching
-            self.cards_by_name[self._normalize_name(card.name)] = card
-            self.cards_by_full_name[self._normalize_name(card.full_name)] = card
+            by_name[builder._normalize_name(card.name)] = card
+            by_full_name[builder._normalize_name(card.full_name)] = card
             
             # Also index by nickname format (Name - Version)
             nickname = f"{card.name} - {card.version}"
-            self.cards_by_full_name[self._normalize_name(nickname)] = card
+            by_full_name[builder._normalize_name(nickname)] = card
+        
+        return {
+            'cards': cards,
+            'cards_by_id': by_id,
+            'cards_by_name': by_name,
+            'cards_by_full_name': by_full_name,
+            'cards_by_set_number': by_set_number,
+            'cards_by_color': dict(by_color),
+            'cards_by_cost': dict(by_cost),
+            'cards_by_type': dict(by_type),
+            'cards_by_keyword': dict(by_keyword),
+            'matcher': CardMatcher(cards),
+        }
     
     def _parse_card_data(self, data: dict) -> CardData:
         """Parse raw JSON data into CardData."""
@@ -96,10 +181,22 @@ class CardDatabase:
             image_url=image_url
         )
     
-    def find_card(self, nickname: str) -> Optional[CardData]:
-        """Find a card by nickname (normalized match, case insensitive, ignoring special characters)."""
+    def find_card(self, nickname: str, set_code: Optional[str] = None,
+                  number=None) -> Optional[CardData]:
+        """Find a card by nickname (normalized match, case insensitive, ignoring special characters).
+        
+        Exact full name and name matches win; otherwise the best fuzzy match
+        scoring at least ``MIN_MATCH_SCORE`` is returned. ``set_code`` and
+        ``number`` (e.g. from a collection export) pick between printings.
+        """
         nickname_normalized = self._normalize_name(nickname)
         
+        # A printing named by set/number wins if its name agrees
+        printing = self.matcher.printing(set_code, number)
+        if printing is not None and nickname_normalized in (
+                self._normalize_name(printing.full_name), self._normalize_name(printing.name)):
+            return printing
+        
         # Try exact full name match first
         if nickname_normalized in self.cards_by_full_name:
             return self.cards_by_full_name[nickname_normalized]
@@ -108,13 +205,18 @@ class CardDatabase:
         if nickname_normalized in self.cards_by_name:
             return self.cards_by_name[nickname_normalized]
         
-        # Try partial matches
-        for full_name, card in self.cards_by_full_name.items():
-            if nickname_normalized in full_name or full_name in nickname_normalized:
-                return card
+        # Ranked fuzzy match
+        matches = self.matcher.match(nickname, set_code, number, limit=1)
+        if matches and matches[0].score >= MIN_MATCH_SCORE:
+            return matches[0].card
         
         return None
     
+    def match_cards(self, query: str, set_code: Optional[str] = None, number=None,
+                    limit: int = 5) -> List[CardMatch]:
+        """Best fuzzy matches for a card name with their scores, best first."""
+        return self.matcher.match(query, set_code, number, limit)
+    
     def create_card_object(self, card_data: CardData, unique_id: int) -> object:
         """Create a game card object from CardData."""
         # Map color string to enum
@@ -212,24 +314,47 @@ class CardDatabase:
             )
     
     def _create_composable_abilities(self, character, abilities_data: List[dict]) -> List:
-        """Create composable abilities (keyword and named) for a character based on ability data."""
+        """Create composable abilities (keyword and named) for a character based on ability data.
+        
+        The ability data is compiled into a template once per printed card;
+        each copy only binds the template.
+        """
+        from ..models.abilities.composable.ability_templates import template_for
+        return template_for(abilities_data, CardDatabase._compile_abilities).bind(character)
+    
+    @staticmethod
+    def _compile_abilities(abilities_data: List[dict]):
+        """Compile a card's ability data into an ``AbilityTemplate``."""
         from ..models.abilities.composable.keyword_abilities import (
             create_rush_ability, create_singer_ability, create_resist_ability,
             create_support_ability, create_evasive_ability, create_bodyguard_ability,
             create_challenger_ability, create_ward_ability, create_reckless_ability,
             create_vanish_ability, create_shift_ability, create_sing_together_ability
         )
-        from ..models.abilities.composable.named_abilities import NamedAbilityRegistry
-        import re
+        from ..models.abilities.composable.ability_templates import AbilityTemplate, named_ability_builder
         
-        keyword_abilities = []
+        # Keywords without a value, and keywords with a value (and its default)
+        plain_keywords = {
+            'rush': create_rush_ability,
+            'evasive': create_evasive_ability,
+            'bodyguard': create_bodyguard_ability,
+            'ward': create_ward_ability,
+            'reckless': create_reckless_ability,
+            'vanish': create_vanish_ability,
+            'support': create_support_ability,
+        }
+        valued_keywords = {
+            'singer': (create_singer_ability, 4),
+            'resist': (create_resist_ability, 1),
+            'shift': (create_shift_ability, 1),
+            'sing together': (create_sing_together_ability, 4),
+            'singtogether': (create_sing_together_ability, 4),
+        }
         
+        builders = []
         for ability in abilities_data:
             ability_type = ability.get('type', '').lower()
             keyword = ability.get('keyword', '').lower()
-            name = ability.get('name', '').lower()
-            effect = ability.get('effect', '').lower()
-            full_text = ability.get('fullText', '').lower()
             
             # Handle keyword abilities using the 'keyword' field if available
             if ability_type == 'keyword' and keyword:
@@ -241,59 +366,26 @@ class CardDatabase:
                         keyword_value = ability.get('keywordValue', '')
                         match = re.search(r'[+]?(\d+)', keyword_value)
                         value = int(match.group(1)) if match else 1
-                    keyword_abilities.append(create_challenger_ability(value, character))
-                    
-                elif keyword == 'rush':
-                    keyword_abilities.append(create_rush_ability(character))
-                    
-                elif keyword == 'evasive':
-                    keyword_abilities.append(create_evasive_ability(character))
-                    
-                elif keyword == 'bodyguard':
-                    keyword_abilities.append(create_bodyguard_ability(character))
-                    
-                elif keyword == 'ward':
-                    keyword_abilities.append(create_ward_ability(character))
-                    
-                elif keyword == 'singer':
-                    value = ability.get('keywordValueNumber', 4)
-                    keyword_abilities.append(create_singer_ability(value, character))
-                    
-                elif keyword == 'resist':
-                    value = ability.get('keywordValueNumber', 1)
-                    keyword_abilities.append(create_resist_ability(value, character))
-                    
-                elif keyword == 'shift':
-                    value = ability.get('keywordValueNumber', 1)
-                    keyword_abilities.append(create_shift_ability(value, character))
-                    
-                elif keyword == 'reckless':
-                    keyword_abilities.append(create_reckless_ability(character))
-                    
-                elif keyword == 'vanish':
-                    keyword_abilities.append(create_vanish_ability(character))
-                    
-                elif keyword in ['sing together', 'singtogether']:
-                    value = ability.get('keywordValueNumber', 4)
-                    keyword_abilities.append(create_sing_together_ability(value, character))
-                    
-                elif keyword == 'support':
-                    keyword_abilities.append(create_support_ability(character))
+                    builders.append((keyword, lambda card, value=value: create_challenger_ability(value, card)))
+                
+                elif keyword in plain_keywords:
+                    builders.append((keyword, plain_keywords[keyword]))
+                
+                elif keyword in valued_keywords:
+                    creator, default = valued_keywords[keyword]
+                    value = ability.get('keywordValueNumber', default)
+                    builders.append((keyword, lambda card, creator=creator, value=value: creator(value, card)))
             
             # Handle named abilities
             elif ability.get('name'):
                 ability_name = ability.get('name')
-                named_ability = NamedAbilityRegistry.create_ability(ability_name, character, ability)
-                if named_ability:
-                    keyword_abilities.append(named_ability)
-                    print(f"Added named ability {ability_name} to {character.name}")
+                builder = named_ability_builder(ability_name, ability)
+                if builder:
+                    builders.append((ability_name, builder))
                 else:
-                    print(f"Named ability {ability_name} not implemented yet for {character.name}")
+                    logger.debug(f"Named ability {ability_name} not implemented yet")
             
             # Only process abilities with proper keyword field to avoid false positives
             # Effect text can contain phrases like "grants Evasive" which doesn't mean the card has Evasive
-            else:
-                # Skip abilities without proper keyword field - only use structured keyword data
-                pass
         
-        return keyword_abilities
\ No newline at end of file
+        return AbilityTemplate(tuple(builders))
@@ -0,0 +1,175 @@
+"""Ranked fuzzy matching of card names against the card database.
+
+Deck lists and collection exports name cards loosely: missing punctuation,
+truncated versions, typos, different set-code spellings. ``CardMatcher``
+indexes every card's name tokens in an inverted index, and every distinct
+token by its character trigrams, so a query only ever touches the cards that
+share (or nearly share) one of its tokens instead of scanning the database.
+
+Candidates are scored by IDF-weighted token overlap (a Dice coefficient over
+token weights, so rare tokens such as "Maleficent" count for more than "of"),
+with misspelled query tokens matched to the closest indexed token by trigram
+similarity. An exact set/number hint breaks ties between printings.
+"""
+
+import math
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+_NAME_NOISE = re.compile(r"[^\w\s\-]")
+_TOKEN_SPLIT = re.compile(r"[\s\-]+")
+
+# Lowest trigram similarity at which a misspelled token counts as a match
+MIN_TOKEN_SIMILARITY = 0.5
+
+# Score added when a match's set code and number equal the hint
+SET_NUMBER_BONUS = 0.05
+
+
+@dataclass(frozen=True)
+class CardMatch:
+    """A candidate card for a query, with a score in [0, 1] (higher is better)."""
+    card: object
+    score: float
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase a name and drop everything but letters, digits, spaces and hyphens."""
+    return _NAME_NOISE.sub("", name).lower().strip()
+
+
+def tokenize(name: str) -> List[str]:
+    """Split a name into normalized tokens."""
+    return [token for token in _TOKEN_SPLIT.split(normalize_name(name)) if token]
+
+
+def normalize_set_code(set_code) -> str:
+    """Set codes compare without leading zeros ("001" == "1")."""
+    return str(set_code).strip().lstrip('0').lower()
+
+
+def _set_number_key(set_code, number) -> Optional[Tuple[str, int]]:
+    if set_code is None or number is None:
+        return None
+    try:
+        return normalize_set_code(set_code), int(number)
+    except (TypeError, ValueError):
+        return None
+
+
+def _trigrams(token: str) -> Set[str]:
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class CardMatcher:
+    """Inverted token index over card names with ranked fuzzy lookup.
+
+    Args:
+        cards: Objects with ``full_name``, ``name``, ``version``, ``set_code``
+               and ``number`` attributes (``CardData``); the order is used to
+               break ties deterministically.
+    """
+
+    def __init__(self, cards: Sequence):
+        self.cards = list(cards)
+        self._card_tokens: List[Tuple[str, ...]] = []
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        self._set_numbers: List[Tuple[str, int]] = []
+
+        for index, card in enumerate(self.cards):
+            tokens = tuple(dict.fromkeys(
+                tokenize(card.full_name or f"{card.name} - {card.version}")))
+            self._card_tokens.append(tokens)
+            for token in tokens:
+                self._postings[token].append(index)
+            self._set_numbers.append((normalize_set_code(card.set_code), card.number))
+        self._postings = dict(self._postings)
+        self._printings = {key: index for index, key in enumerate(self._set_numbers)}
+
+        count = max(len(self.cards), 1)
+        self._idf = {token: math.log(1 + count / len(postings))
+                     for token, postings in self._postings.items()}
+        self._unknown_idf = math.log(1 + count)
+        self._card_weight = [sum(self._idf[token] for token in tokens) for tokens in self._card_tokens]
+
+        self._trigram_tokens: Dict[str, List[str]] = defaultdict(list)
+        self._token_trigrams: Dict[str, Set[str]] = {}
+        for token in self._postings:
+            trigrams = _trigrams(token)
+            self._token_trigrams[token] = trigrams
+            for trigram in trigrams:
+                self._trigram_tokens[trigram].append(token)
+        self._trigram_tokens = dict(self._trigram_tokens)
+
+    def _similar_tokens(self, token: str) -> List[Tuple[str, float]]:
+        """Indexed tokens resembling ``token``, with their similarity (1.0 if indexed)."""
+        if token in self._postings:
+            return [(token, 1.0)]
+        trigrams = _trigrams(token)
+        shared = defaultdict(int)
+        for trigram in trigrams:
+            for candidate in self._trigram_tokens.get(trigram, ()):
+                shared[candidate] += 1
+        similar = []
+        for candidate, overlap in shared.items():
+            # Dice coefficient over trigram sets
+            similarity = 2 * overlap / (len(trigrams) + len(self._token_trigrams[candidate]))
+            if similarity >= MIN_TOKEN_SIMILARITY:
+                similar.append((candidate, similarity))
+        return similar
+
+    def match(self, query: str, set_code: Optional[str] = None, number=None,
+              limit: int = 5) -> List[CardMatch]:
+        """Best matches for a card name, best first.
+
+        Args:
+            query: Card name as written in a deck list or collection
+            set_code: Optional set code hint (leading zeros are ignored)
+            number: Optional collector number hint
+            limit: Maximum number of matches to return
+        """
+        query_tokens = list(dict.fromkeys(tokenize(query)))
+        if not query_tokens:
+            return []
+
+        # Weighted overlap per candidate card: each query token contributes
+        # its best similarity to one of the card's tokens, times that token's IDF
+        matched: Dict[int, float] = defaultdict(float)
+        query_weight = 0.0
+        for token in query_tokens:
+            similar = self._similar_tokens(token)
+            if not similar:
+                query_weight += self._unknown_idf
+                continue
+            query_weight += max(self._idf[candidate] for candidate, _ in similar)
+            best: Dict[int, float] = {}
+            for candidate, similarity in similar:
+                weight = similarity * self._idf[candidate]
+                for index in self._postings[candidate]:
+                    if weight > best.get(index, 0.0):
+                        best[index] = weight
+            for index, weight in best.items():
+                matched[index] += weight
+
+        hint = _set_number_key(set_code, number)
+        scored = []
+        for index, overlap in matched.items():
+            hinted = hint is not None and self._set_numbers[index] == hint
+            score = 2 * overlap / (query_weight + self._card_weight[index])
+            if hinted:
+                score += SET_NUMBER_BONUS
+            # Ties go to the hinted printing, then to database order
+            scored.append((-min(score, 1.0), not hinted, index))
+        scored.sort()
+        return [CardMatch(self.cards[index], -score) for score, _, index in scored[:limit]]
+
+    def printing(self, set_code, number) -> Optional[object]:
+        """The card with this set code and collector number, if any."""
+        key = _set_number_key(set_code, number)
+        if key is None:
+            return None
+        index = self._printings.get(key)
+        return None if index is None else self.cards[index]
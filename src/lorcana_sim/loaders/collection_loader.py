@@ -27,7 +27,7 @@ class CollectionLoader:
     """Loads collections from CSV format and maps to card database."""
     
     def __init__(self, cards_json_path: str):
-        self.card_db = CardDatabase(cards_json_path)
+        self.card_db = CardDatabase.shared(cards_json_path)
         self._unique_id_counter = 20000  # Start high to avoid conflicts
     
     def load_collection_from_csv(self, csv_path: str) -> List[object]:
@@ -41,7 +41,8 @@ class CollectionLoader:
         print(f"   Unique cards in CSV: {len(collection_cards)}")
         
         for collection_card in collection_cards:
-            card_data = self.card_db.find_card(collection_card.name)
+            card_data = self.card_db.find_card(collection_card.name, collection_card.set_code,
+                                               collection_card.card_number)
             
             if card_data:
                 # Create card objects for both normal and foil copies
@@ -108,7 +109,8 @@ class CollectionLoader:
             total_count = collection_card.normal_count + collection_card.foil_count
             summary['total_cards'] += total_count
             
-            card_data = self.card_db.find_card(collection_card.name)
+            card_data = self.card_db.find_card(collection_card.name, collection_card.set_code,
+                                               collection_card.card_number)
             
             if card_data:
                 summary['found_cards'] += total_count
@@ -1,7 +1,7 @@
 """Deck loader that combines dreamborn parser with card database."""
 
 import random
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from pathlib import Path
 
 from .dreamborn_parser import DreambornParser
@@ -13,11 +13,16 @@ class DeckLoader:
     """Loads decks from dreamborn format and creates game-ready card objects."""
     
     def __init__(self, cards_json_path: str):
-        self.card_db = CardDatabase(cards_json_path)
+        self.card_db = CardDatabase.shared(cards_json_path)
         self._unique_id_counter = 10000  # Start high to avoid conflicts
     
-    def load_deck_from_file(self, deck_file_path: str, player_name: str) -> Player:
-        """Load a deck from dreamborn format and create a Player with that deck."""
+    def load_deck_from_file(self, deck_file_path: str, player_name: str,
+                            rng: Optional[random.Random] = None) -> Player:
+        """Load a deck from dreamborn format and create a Player with that deck.
+        
+        The deck is shuffled with ``rng`` when given (e.g. ``GameState.rng`` or
+        ``random.Random(seed)``), otherwise with the global ``random`` module.
+        """
         parser = DreambornParser(deck_file_path)
         deck_info = parser.get_deck_info()
         
@@ -50,7 +55,7 @@ class DeckLoader:
         print(f"   ✅ Successfully loaded: {found_cards}/{deck_info.total_cards} cards")
         
         # Shuffle the deck
-        random.shuffle(deck_cards)
+        (rng or random).shuffle(deck_cards)
         
         # Create player
         player = Player(player_name)
@@ -70,14 +75,15 @@ class DeckLoader:
         return self._unique_id_counter
     
     def load_two_decks(self, deck1_path: str, deck2_path: str, 
-                      player1_name: str = "Player 1", player2_name: str = "Player 2") -> Tuple[Player, Player]:
+                      player1_name: str = "Player 1", player2_name: str = "Player 2",
+                      rng: Optional[random.Random] = None) -> Tuple[Player, Player]:
         """Load two decks and return two players ready to play."""
         print("🎴 Loading decks for game...")
         print()
         
-        player1 = self.load_deck_from_file(deck1_path, player1_name)
+        player1 = self.load_deck_from_file(deck1_path, player1_name, rng)
         print()
-        player2 = self.load_deck_from_file(deck2_path, player2_name)
+        player2 = self.load_deck_from_file(deck2_path, player2_name, rng)
         print()
         
         return player1, player2
@@ -0,0 +1,128 @@
+"""Persistent cache for data derived from the card JSON files.
+
+Parsing allCards.json (and indexing it) takes far longer than reading back a
+pickle of the result. ``cached_build`` stores whatever a loader derives from a
+source file in a pickle keyed on the file's content hash, so a warm load skips
+JSON parsing entirely, and an edited file is simply a cache miss. Results are
+also memoized per process, keyed on the file's size and mtime, so repeated
+loads in one process do not even re-hash the file.
+
+The cache lives in ``$LORCANA_CACHE_DIR`` (default ``~/.cache/lorcana_sim``).
+Set ``LORCANA_CACHE_DIR=off`` to disable the on-disk cache. Cached values are
+shared between callers and must be treated as read-only.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ..utils.logging_config import get_game_logger
+
+logger = get_game_logger(__name__)
+
+CACHE_DIR_ENV_VAR = 'LORCANA_CACHE_DIR'
+
+# Bump when anything stored in the cache changes shape
+CACHE_FORMAT = 2
+
+_memo: Dict[Tuple[str, str], Tuple[Tuple[int, int], Any]] = {}
+
+
+def cache_dir() -> Optional[Path]:
+    """Directory holding the on-disk cache, or None when it is disabled."""
+    configured = os.environ.get(CACHE_DIR_ENV_VAR)
+    if configured is None:
+        return Path.home() / '.cache' / 'lorcana_sim'
+    if configured.lower() in ('', '0', 'off', 'false', 'no'):
+        return None
+    return Path(configured)
+
+
+def file_hash(path: Path) -> str:
+    """Content hash of a file, used as its cache key."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def cached_build(path, kind: str, build: Callable[[Path], Any]) -> Any:
+    """Return ``build(path)``, from the process memo or the disk cache when possible.
+
+    Args:
+        path: Source file the value is derived from
+        kind: Name of what ``build`` produces; values of different kinds for the
+              same file are cached separately
+        build: Function deriving the value from the source file; must return
+               something picklable
+    """
+    path = Path(path).resolve()
+    stat = path.stat()
+    signature = (stat.st_size, stat.st_mtime_ns)
+    memo_key = (kind, str(path))
+    memoized = _memo.get(memo_key)
+    if memoized is not None and memoized[0] == signature:
+        return memoized[1]
+
+    directory = cache_dir()
+    cache_file = None
+    value = None
+    if directory is not None:
+        cache_file = directory / f"{kind}-{CACHE_FORMAT}-{file_hash(path)}.pickle"
+        value = _read_cache(cache_file)
+    if value is None:
+        value = build(path)
+        if cache_file is not None:
+            _write_cache(cache_file, value)
+
+    _memo[memo_key] = (signature, value)
+    return value
+
+
+def load_json(path) -> Dict[str, Any]:
+    """Parsed contents of a JSON file, through the cache."""
+    return cached_build(path, 'json', _parse_json)
+
+
+def clear_memo() -> None:
+    """Forget values memoized in this process (the disk cache is kept)."""
+    _memo.clear()
+
+
+def _parse_json(path: Path) -> Dict[str, Any]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _read_cache(cache_file: Path) -> Any:
+    try:
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:  # Corrupt or stale entry: rebuild it
+        logger.debug(f"Ignoring unreadable cache file {cache_file}: {e}")
+        return None
+
+
+def _write_cache(cache_file: Path, value: Any) -> None:
+    # Write to a temporary file and rename, so concurrent loaders never read
+    # a half-written cache entry
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, suffix='.tmp')
+    except OSError as e:
+        logger.debug(f"Could not write cache file {cache_file}: {e}")
+        return
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_file)
+    except Exception as e:
+        logger.debug(f"Could not write cache file {cache_file}: {e}")
+        os.unlink(tmp_path)
@@ -5,12 +5,13 @@ This module provides comprehensive parsing and analysis of lorcana-json format d
 including enumeration of all card components for validation and testing purposes.
 """
 
-import json
 from collections import defaultdict, Counter
 from typing import Dict, List, Set, Any, Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
+from .json_cache import load_json
+
 
 @dataclass
 class CardStatistics:
@@ -61,9 +62,8 @@ class LorcanaJsonParser:
         self._load_data()
     
     def _load_data(self) -> None:
-        """Load and parse the JSON data"""
-        with open(self.json_file_path, 'r', encoding='utf-8') as f:
-            self.data = json.load(f)
+        """Load and parse the JSON data (shared and cached; treat as read-only)"""
+        self.data = load_json(self.json_file_path)
         
         self.cards = self.data.get('cards', [])
         self.sets = self.data.get('sets', {})
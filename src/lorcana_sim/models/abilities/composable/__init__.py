@@ -29,7 +29,7 @@ from .target_selectors import (
     DAMAGED_CHARACTER, ALL_CHARACTERS, ALL_OTHER_CHARACTERS, BODYGUARD_CHARACTER
 )
 from .triggers import (
-    when_event, when_quests, when_any_quests, when_challenges, when_any_challenges,
+    TriggerPredicate, when_event, when_quests, when_any_quests, when_challenges, when_any_challenges,
     when_enters_play, when_any_enters_play, when_leaves_play, when_banished,
     when_takes_damage, when_deals_damage, when_any_takes_damage,
     when_song_sung, when_action_played, when_song_played,
@@ -39,7 +39,7 @@ from .triggers import (
     when_song_cast_attempted, and_conditions, or_conditions, not_condition, metadata_condition
 )
 
-# Import named abilities to register them
+# Named ability registry (ability modules are imported on first use)
 from . import named_abilities
 
 __all__ = [
@@ -70,7 +70,7 @@ __all__ = [
     'DAMAGED_CHARACTER', 'ALL_CHARACTERS', 'ALL_OTHER_CHARACTERS', 'BODYGUARD_CHARACTER',
     
     # Triggers
-    'when_event', 'when_quests', 'when_any_quests', 'when_challenges', 'when_any_challenges',
+    'TriggerPredicate', 'when_event', 'when_quests', 'when_any_quests', 'when_challenges', 'when_any_challenges',
     'when_enters_play', 'when_any_enters_play', 'when_leaves_play', 'when_banished',
     'when_takes_damage', 'when_deals_damage', 'when_any_takes_damage',
     'when_song_sung', 'when_action_played', 'when_song_played',
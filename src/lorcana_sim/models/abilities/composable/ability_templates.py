@@ -0,0 +1,101 @@
+"""Ability templates: a card's abilities compiled once per printed card.
+
+Turning a card's JSON ability list into composable abilities means reading
+each entry, dispatching on its type and keyword, parsing keyword values and
+looking up named-ability creators. Every copy of a card used to repeat all of
+that. An ``AbilityTemplate`` does it once per printed card and keeps only the
+resulting builders; binding the template to a card instance just calls them
+with the card.
+
+Ability objects themselves stay per card: their triggers, conditions and
+effects refer to the card that owns them (its zone, controller, damage...).
+
+Templates are cached by the identity of the ability list (and keyword list)
+they were compiled from, so cards created from the same loaded card data (a
+database entry, a ``CardData``) share one template, while freshly built dicts
+get their own.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .composable_ability import ComposableAbility
+from ....utils.logging_config import get_game_logger
+
+logger = get_game_logger(__name__)
+
+AbilityBuilder = Callable[[Any], Optional[ComposableAbility]]
+AbilityCompiler = Callable[..., 'AbilityTemplate']
+
+
+@dataclass(frozen=True)
+class AbilityTemplate:
+    """Compiled abilities of one printed card, ready to bind to any copy of it.
+
+    Attributes:
+        builders: (ability name, builder) pairs; ``builder(card)`` returns the
+                  ability bound to that card
+    """
+    builders: Tuple[Tuple[str, AbilityBuilder], ...] = ()
+
+    def bind(self, card: Any) -> List[ComposableAbility]:
+        """Build this template's abilities for one card."""
+        abilities = []
+        for name, build in self.builders:
+            try:
+                ability = build(card)
+            except Exception as e:
+                logger.warning(f"Failed to create ability {name} for {card.name}: {e}")
+                continue
+            if ability is not None:
+                abilities.append(ability)
+        return abilities
+
+
+EMPTY_TEMPLATE = AbilityTemplate()
+
+# (compiler, id(ability list), id(keyword list)) -> (ability list, keyword list,
+# template); the lists are kept so their ids cannot be reused by other lists
+# while the entry exists
+_TEMPLATES: Dict[Tuple[AbilityCompiler, int, int],
+                 Tuple[Sequence[dict], Sequence[str], AbilityTemplate]] = {}
+
+
+def template_for(abilities_data: Sequence[dict], compiler: AbilityCompiler,
+                 keyword_abilities: Sequence[str] = ()) -> AbilityTemplate:
+    """The template compiled from an ability list, compiling it on first use.
+
+    ``keyword_abilities`` is an optional list of plain keyword names
+    (lorcana-json's ``keywordAbilities``); when given, the compiler is called
+    with both lists.
+    """
+    if not abilities_data and not keyword_abilities:
+        return EMPTY_TEMPLATE
+    key = (compiler, id(abilities_data), id(keyword_abilities))
+    entry = _TEMPLATES.get(key)
+    if entry is None or entry[0] is not abilities_data or entry[1] is not keyword_abilities:
+        if keyword_abilities:
+            template = compiler(abilities_data, keyword_abilities)
+        else:
+            template = compiler(abilities_data)
+        entry = _TEMPLATES[key] = (abilities_data, keyword_abilities, template)
+    return entry[2]
+
+
+def compiled_template_count() -> int:
+    """Number of ability templates compiled so far."""
+    return len(_TEMPLATES)
+
+
+def clear_templates() -> None:
+    """Drop all compiled templates (they are rebuilt on next use)."""
+    _TEMPLATES.clear()
+
+
+def named_ability_builder(ability_name: str, ability_data: dict) -> Optional[AbilityBuilder]:
+    """Builder for a registered named ability, or None if it is not implemented."""
+    from .named_abilities.registry import get_named_ability_creator
+    creator = get_named_ability_creator(ability_name)
+    if creator is None:
+        return None
+    return lambda card: creator(card, ability_data)
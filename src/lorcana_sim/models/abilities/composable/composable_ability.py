@@ -1,6 +1,6 @@
 """Main composable ability class and listener system."""
 
-from typing import List, Callable, Dict, Any, Optional, Set
+from typing import List, Callable, Dict, Any, Optional, Set, TYPE_CHECKING
 from dataclasses import dataclass, field
 
 from .effects import Effect
@@ -8,6 +8,9 @@ from .target_selectors import TargetSelector
 from .activation_zones import ActivationZone
 from ....engine.event_system import GameEvent, EventContext
 
+if TYPE_CHECKING:
+    from .triggers import TriggerPredicate
+
 
 @dataclass
 class ComposableListener:
@@ -18,6 +21,11 @@ class ComposableListener:
     priority: int = 0
     name: str = ""
     
+    @property
+    def predicate(self) -> Optional['TriggerPredicate']:
+        """Declarative part of the trigger condition, if it has one."""
+        return getattr(self.trigger_condition, 'predicate', None)
+    
     def should_trigger(self, event_context: EventContext) -> bool:
         """Check if this listener should trigger for the event."""
         result = self.trigger_condition(event_context)
@@ -73,15 +81,18 @@ class ComposableListener:
                 actual_effect=targeted_effect
             )
         
-        # Get full ability description for richer trigger messages
-        full_description = self._get_full_ability_description(context)
+        # Get full ability description for richer trigger messages (skipped by lean queues)
+        source_description = ""
+        if getattr(action_queue, 'describe', True):
+            full_description = self._get_full_ability_description(context)
+            source_description = f"✨ Triggered {getattr(context.get('ability_owner'), 'name', 'Unknown')}'s {self.name}: {full_description}"
         
         action_queue.enqueue(
             effect=trigger_effect,  # Queue the wrapper with the appropriate effect
             target=event_context.source,  # Use the ability owner as the initial target
             context=context,
             priority=ActionPriority.HIGH,  # Triggered effects go to front
-            source_description=f"✨ Triggered {getattr(context.get('ability_owner'), 'name', 'Unknown')}'s {self.name}: {full_description}"
+            source_description=source_description
         )
     
     def _get_full_ability_description(self, context: dict) -> str:
@@ -113,8 +124,8 @@ class ComposableListener:
         
         # Second try: Get description from named ability registry docstring
         try:
-            from .named_abilities.registry import _NAMED_ABILITY_REGISTRY
-            creator_func = _NAMED_ABILITY_REGISTRY.get(self.name)
+            from .named_abilities.registry import get_named_ability_creator
+            creator_func = get_named_ability_creator(self.name)
             if creator_func and hasattr(creator_func, '__doc__') and creator_func.__doc__:
                 doc = creator_func.__doc__.strip()
                 if doc:
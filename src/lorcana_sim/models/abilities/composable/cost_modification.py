@@ -1,9 +1,19 @@
-"""Cost modification system for conditional abilities."""
+"""Cost modification system for conditional abilities.
 
+``CostModificationManager`` indexes registered modifiers by scope (the
+controller, card type or subtype they are limited to), so a cost lookup only
+considers modifiers that can apply to the card, and caches each card's
+effective cost. The cache is dropped whenever a modifier is registered,
+unregistered, activated or deactivated, or a card changes zones; a modifier
+whose condition or filter depends on anything else (lore, damage...) must
+call ``CostModificationManager.invalidate()`` when that changes.
+"""
+
+import itertools
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Set, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ...cards.base_card import Card
@@ -41,10 +51,21 @@ class CostModifier:
     priority: int = 0  # Higher priority modifiers apply first
     stacks_with_others: bool = True
     
+    # Scope: the cards this modifier can apply to at all (None/empty means
+    # any). The manager indexes modifiers by scope; applies_to_filter still
+    # decides within it.
+    controller: Optional['Player'] = None  # Cards held or controlled by this player
+    card_type: Optional[str] = None  # "Character", "Action", "Item" or "Location"
+    subtypes: Tuple[str, ...] = ()  # Cards with any of these subtypes
+    
     # State tracking
     is_active: bool = False
     metadata: Dict[str, Any] = field(default_factory=dict)
     
+    # Set by the manager the modifier is registered with
+    manager: Optional['CostModificationManager'] = field(default=None, init=False, repr=False, compare=False)
+    sequence: int = field(default=0, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Validate cost modifier after creation."""
         if not self.modifier_id:
@@ -80,13 +101,63 @@ class CostModifier:
         
         return original_cost
     
+    def in_scope(self, card: 'Card', controller: Optional['Player']) -> bool:
+        """Check if a card (held or controlled by ``controller``) is within this modifier's scope."""
+        if self.controller is not None and controller is not self.controller:
+            return False
+        if self.card_type is not None and getattr(card, 'card_type', None) != self.card_type:
+            return False
+        if self.subtypes:
+            card_subtypes = getattr(card, 'subtypes', ())
+            return any(subtype in card_subtypes for subtype in self.subtypes)
+        return True
+    
+    def scope_keys(self) -> List[Tuple[str, Any]]:
+        """Index keys for this modifier, from its most selective scope field."""
+        if self.subtypes:
+            return [('subtype', subtype) for subtype in dict.fromkeys(self.subtypes)]
+        if self.card_type is not None:
+            return [('card_type', self.card_type)]
+        if self.controller is not None:
+            return [('controller', id(self.controller))]
+        return [('any', None)]
+    
     def activate(self) -> None:
         """Activate this cost modifier."""
         self.is_active = True
+        if self.manager is not None:
+            self.manager.invalidate()
     
     def deactivate(self) -> None:
         """Deactivate this cost modifier."""
         self.is_active = False
+        if self.manager is not None:
+            self.manager.invalidate()
+
+
+# Registration order of modifiers, used to break priority ties the same way
+# regardless of how the index groups them
+_modifier_sequence = itertools.count(1)
+
+
+class _CostCache:
+    """Effective costs by card, valid for one version of the modifiers and zones.
+
+    Held by reference, so game snapshots share it instead of copying it.
+    """
+
+    def __init__(self):
+        self.version = 0
+        self.costs: Dict[int, Tuple[Any, int]] = {}  # id(card) -> (card, cost)
+        self.observed_players: Set[int] = set()
+
+    def invalidate(self) -> None:
+        self.version += 1
+        self.costs.clear()
+
+    def __reduce__(self):
+        # Copies start empty: they belong to other players' zones
+        return _CostCache, ()
 
 
 @dataclass
@@ -99,9 +170,39 @@ class CostModificationManager:
     # Performance optimization - group by source
     modifiers_by_source: Dict[str, List[CostModifier]] = field(default_factory=dict)
     
+    # Registered modifiers by scope key (see CostModifier.scope_keys)
+    modifiers_by_scope: Dict[Tuple[str, Any], List[CostModifier]] = field(default_factory=dict)
+    
+    _cache: _CostCache = field(default_factory=_CostCache, repr=False, compare=False)
+    
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever cached costs are dropped."""
+        return self._cache.version
+    
+    def invalidate(self) -> None:
+        """Drop cached costs (done automatically on modifier and zone changes)."""
+        self._cache.invalidate()
+    
+    def on_restore(self) -> None:
+        """Re-link the registered modifiers and drop cached costs after a snapshot restore."""
+        for modifier in self.all_modifiers:
+            modifier.manager = self
+        self._cache.invalidate()
+    
+    def _on_zone_change(self, card) -> None:
+        self._cache.invalidate()
+    
+    def _is_registered(self, modifier: CostModifier) -> bool:
+        source_modifiers = self.modifiers_by_source.get(id(modifier.source_card), ())
+        return any(registered is modifier for registered in source_modifiers)
+    
     def register_cost_modifier(self, modifier: CostModifier) -> None:
         """Register a cost modifier with the manager."""
-        if modifier not in self.all_modifiers:
+        if not self._is_registered(modifier):
+            modifier.manager = self
+            if not modifier.sequence:
+                modifier.sequence = next(_modifier_sequence)
             self.all_modifiers.append(modifier)
             
             # Group by source for efficiency
@@ -109,26 +210,87 @@ class CostModificationManager:
             if source_id not in self.modifiers_by_source:
                 self.modifiers_by_source[source_id] = []
             self.modifiers_by_source[source_id].append(modifier)
+            
+            for key in modifier.scope_keys():
+                self.modifiers_by_scope.setdefault(key, []).append(modifier)
+            self.invalidate()
     
     def unregister_cost_modifier(self, modifier: CostModifier) -> None:
         """Unregister a cost modifier from the manager."""
-        if modifier in self.all_modifiers:
-            self.all_modifiers.remove(modifier)
+        if self._is_registered(modifier):
+            self.all_modifiers[:] = [m for m in self.all_modifiers if m is not modifier]
             
             # Remove from source grouping
             source_id = id(modifier.source_card)
             if source_id in self.modifiers_by_source:
-                self.modifiers_by_source[source_id].remove(modifier)
+                self.modifiers_by_source[source_id] = [
+                    m for m in self.modifiers_by_source[source_id] if m is not modifier]
                 if not self.modifiers_by_source[source_id]:
                     del self.modifiers_by_source[source_id]
+            
+            for key in modifier.scope_keys():
+                scoped = [m for m in self.modifiers_by_scope.get(key, ()) if m is not modifier]
+                if scoped:
+                    self.modifiers_by_scope[key] = scoped
+                else:
+                    self.modifiers_by_scope.pop(key, None)
+            
+            if modifier.manager is self:
+                modifier.manager = None
+            self.invalidate()
+    
+    def _card_controller(self, card: 'Card', game_state: 'GameState') -> Optional['Player']:
+        controller = getattr(card, 'controller', None)
+        if controller is None and game_state is not None:
+            for player in getattr(game_state, 'players', ()):
+                if hasattr(player, 'owns_card') and player.owns_card(card):
+                    return player
+        return controller
+    
+    def _candidate_modifiers(self, card: 'Card', game_state: 'GameState') -> List[CostModifier]:
+        """Active modifiers whose scope covers the card, in registration order."""
+        controller = self._card_controller(card, game_state)
+        index = self.modifiers_by_scope
+        buckets = [index.get(('any', None)), index.get(('card_type', getattr(card, 'card_type', None)))]
+        if controller is not None:
+            buckets.append(index.get(('controller', id(controller))))
+        for subtype in getattr(card, 'subtypes', ()):
+            buckets.append(index.get(('subtype', subtype)))
+        candidates = {}
+        for bucket in buckets:
+            if bucket:
+                for modifier in bucket:
+                    # A modifier with several subtypes sits in several buckets
+                    if modifier.is_active and modifier.in_scope(card, controller):
+                        candidates[id(modifier)] = modifier
+        return sorted(candidates.values(), key=lambda m: m.sequence)
+    
+    def _watch_zones(self, game_state: 'GameState') -> None:
+        observed = self._cache.observed_players
+        for player in getattr(game_state, 'players', ()):
+            if id(player) not in observed and hasattr(player, 'add_zone_observer'):
+                player.add_zone_observer(self._on_zone_change)
+                observed.add(id(player))
     
     def get_modified_cost(self, card: 'Card', game_state: 'GameState') -> int:
         """Get the final modified cost for a card after all applicable modifiers."""
         original_cost = getattr(card, 'cost', 0)
+        if not self.all_modifiers:
+            return original_cost
         
+        cache = self._cache
+        cached = cache.costs.get(id(card))
+        if cached is not None and cached[0] is card:
+            return cached[1]
+        self._watch_zones(game_state)
+        cost = self._compute_modified_cost(card, game_state, original_cost)
+        cache.costs[id(card)] = (card, cost)
+        return cost
+    
+    def _compute_modified_cost(self, card: 'Card', game_state: 'GameState', original_cost: int) -> int:
         # Get all applicable modifiers
         applicable_modifiers = []
-        for modifier in self.all_modifiers:
+        for modifier in self._candidate_modifiers(card, game_state):
             if modifier.is_applicable_to_card(card, game_state):
                 applicable_modifiers.append(modifier)
         
@@ -162,7 +324,7 @@ class CostModificationManager:
     def get_applicable_modifiers(self, card: 'Card', game_state: 'GameState') -> List[CostModifier]:
         """Get all modifiers that apply to a specific card."""
         applicable = []
-        for modifier in self.all_modifiers:
+        for modifier in self._candidate_modifiers(card, game_state):
             if modifier.is_applicable_to_card(card, game_state):
                 applicable.append(modifier)
         return applicable
@@ -184,8 +346,13 @@ class CostModificationManager:
     
     def clear_all_modifiers(self) -> None:
         """Clear all registered cost modifiers."""
+        for modifier in self.all_modifiers:
+            if modifier.manager is self:
+                modifier.manager = None
         self.all_modifiers.clear()
         self.modifiers_by_source.clear()
+        self.modifiers_by_scope.clear()
+        self.invalidate()
     
     def get_debug_info(self) -> Dict[str, Any]:
         """Get debugging information about cost modifiers."""
@@ -209,8 +376,11 @@ def create_ink_reduction_modifier(modifier_id: str,
                                 reduction_amount: int,
                                 applies_to_filter: Callable[['Card', 'GameState'], bool],
                                 condition_func: Callable[['GameState', 'CharacterCard'], bool] = lambda gs, sc: True,
-                                priority: int = 0) -> CostModifier:
-    """Create an ink cost reduction modifier."""
+                                priority: int = 0,
+                                controller: Optional['Player'] = None,
+                                card_type: Optional[str] = None,
+                                subtypes: Tuple[str, ...] = ()) -> CostModifier:
+    """Create an ink cost reduction modifier (optionally scoped, see CostModifier)."""
     return CostModifier(
         modifier_id=modifier_id,
         source_card=source_card,
@@ -218,7 +388,10 @@ def create_ink_reduction_modifier(modifier_id: str,
         amount=reduction_amount,
         applies_to_filter=applies_to_filter,
         condition_func=condition_func,
-        priority=priority
+        priority=priority,
+        controller=controller,
+        card_type=card_type,
+        subtypes=tuple(subtypes)
     )
 
 
@@ -72,13 +72,16 @@ class AbilityTriggerEffect(Effect):
             # Import here to avoid circular imports
             from ....engine.action_queue import ActionPriority
             # Queue the real effect with ability attribution
-            source_name = getattr(self.source_card, 'name', 'Unknown')
+            source_description = ""
+            if getattr(action_queue, 'describe', True):
+                source_name = getattr(self.source_card, 'name', 'Unknown')
+                source_description = f"🔮 {source_name}'s {self.ability_name}"
             action_queue.enqueue(
                 effect=self.actual_effect,
                 target=target,
                 context=context,
                 priority=ActionPriority.HIGH,
-                source_description=f"🔮 {source_name}'s {self.ability_name}"
+                source_description=source_description
             )
         else:
             # Fallback: apply immediately if no action_queue available
@@ -304,18 +307,9 @@ class TemporaryAbility:
             if self in self.target.composable_abilities:
                 self.target.composable_abilities.remove(self)
         
-        # Unregister from event system
+        # Unregister from event system (removes it from every event listener list)
         if self._event_manager and self._registered:
-            # Remove from all event listener lists
-            for event_type in self.get_relevant_events():
-                if event_type in self._event_manager._composable_listeners:
-                    if self in self._event_manager._composable_listeners[event_type]:
-                        self._event_manager._composable_listeners[event_type].remove(self)
-            
-            # Remove from registered abilities set
-            if self in self._event_manager._registered_abilities:
-                self._event_manager._registered_abilities.remove(self)
-            
+            self._event_manager.unregister_composable_ability(self)
             self._registered = False
     
     def should_trigger(self, event_context) -> bool:
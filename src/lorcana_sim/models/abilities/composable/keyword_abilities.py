@@ -2,6 +2,7 @@
 
 from typing import Any
 from .composable_ability import ComposableAbility, quick_ability
+from ...cards.keywords import Keyword
 from .effects import (
     StatModification, PreventEffect, ModifyDamage, ForceRetarget, 
     GrantProperty, NoEffect, ConditionalEffect,
@@ -96,13 +97,8 @@ def create_evasive_ability(character: Any) -> ComposableAbility:
         if not challenger:
             return False
         
-        # Check if challenger has Evasive ability
-        if hasattr(challenger, 'composable_abilities'):
-            for ability in challenger.composable_abilities:
-                if hasattr(ability, 'name') and 'evasive' in ability.name.lower():
-                    return False  # Challenger has Evasive, allow challenge
-        
-        return True  # Challenger doesn't have Evasive, prevent challenge
+        # Challenger has Evasive (printed or granted): allow challenge
+        return not getattr(challenger, 'keywords', 0) & Keyword.EVASIVE
     
     # Add event introspection
     evasive_condition.get_relevant_events = lambda: [GameEvent.CHARACTER_CHALLENGES]
@@ -155,13 +151,8 @@ def create_support_ability(character: Any) -> ComposableAbility:
     character to receive the strength bonus.
     """
     
-    def support_condition(event_context):
-        """Trigger when this character quests."""
-        return (when_event(GameEvent.CHARACTER_QUESTS)(event_context) and 
-                event_context.source == character)
-    
-    # Add event introspection
-    support_condition.get_relevant_events = lambda: [GameEvent.CHARACTER_QUESTS]
+    # Trigger when this character quests
+    support_condition = when_event(GameEvent.CHARACTER_QUESTS, source=character)
     
     # Target another friendly character (in full implementation, this would be chosen)
     return quick_ability(
@@ -324,13 +315,9 @@ def create_sing_together_ability(cost: int, character: Any) -> ComposableAbility
     
     Implementation: When singing a song, this character can contribute its Singer value.
     """
-    def sing_together_condition(event_context):
-        return (when_event(GameEvent.SONG_SUNG)(event_context) and
-                event_context.additional_data and
-                event_context.additional_data.get('allow_multiple_singers', False))
-    
-    # Add event introspection
-    sing_together_condition.get_relevant_events = lambda: [GameEvent.SONG_SUNG]
+    sing_together_condition = when_event(
+        GameEvent.SONG_SUNG,
+        metadata_filter=lambda meta, ctx: bool(meta.get('allow_multiple_singers', False)))
     
     return quick_ability(
         name=f"Sing Together {cost}",
@@ -345,30 +332,32 @@ def create_sing_together_ability(cost: int, character: Any) -> ComposableAbility
 # CONVENIENCE FUNCTIONS FOR ALL ABILITIES
 # =============================================================================
 
+# Keyword name -> factory(character, value, target_name)
+KEYWORD_FACTORIES = {
+    'Resist': lambda char, val, tgt: create_resist_ability(val or 1, char),
+    'Ward': lambda char, val, tgt: create_ward_ability(char),
+    'Bodyguard': lambda char, val, tgt: create_bodyguard_ability(char),
+    'Evasive': lambda char, val, tgt: create_evasive_ability(char),
+    'Singer': lambda char, val, tgt: create_singer_ability(val or 4, char),
+    'Support': lambda char, val, tgt: create_support_ability(char),
+    'Rush': lambda char, val, tgt: create_rush_ability(char),
+    'Shift': lambda char, val, tgt: create_shift_ability(val or 0, char),
+    'Puppy Shift': lambda char, val, tgt: create_puppy_shift_ability(val or 0, char),
+    'Universal Shift': lambda char, val, tgt: create_universal_shift_ability(val or 0, char),
+    'Challenger': lambda char, val, tgt: create_challenger_ability(val or 1, char),
+    'Reckless': lambda char, val, tgt: create_reckless_ability(char),
+    'Vanish': lambda char, val, tgt: create_vanish_ability(char),
+    'Sing Together': lambda char, val, tgt: create_sing_together_ability(val or 1, char),
+}
+
+
 def create_keyword_ability(keyword: str, character: Any, value: int = None, target_name: str = None) -> ComposableAbility:
     """Create any keyword ability by name."""
     
-    keyword_factories = {
-        'Resist': lambda char, val, tgt: create_resist_ability(val or 1, char),
-        'Ward': lambda char, val, tgt: create_ward_ability(char),
-        'Bodyguard': lambda char, val, tgt: create_bodyguard_ability(char),
-        'Evasive': lambda char, val, tgt: create_evasive_ability(char),
-        'Singer': lambda char, val, tgt: create_singer_ability(val or 4, char),
-        'Support': lambda char, val, tgt: create_support_ability(char),
-        'Rush': lambda char, val, tgt: create_rush_ability(char),
-        'Shift': lambda char, val, tgt: create_shift_ability(val or 0, char),
-        'Puppy Shift': lambda char, val, tgt: create_puppy_shift_ability(val or 0, char),
-        'Universal Shift': lambda char, val, tgt: create_universal_shift_ability(val or 0, char),
-        'Challenger': lambda char, val, tgt: create_challenger_ability(val or 1, char),
-        'Reckless': lambda char, val, tgt: create_reckless_ability(char),
-        'Vanish': lambda char, val, tgt: create_vanish_ability(char),
-        'Sing Together': lambda char, val, tgt: create_sing_together_ability(val or 1, char),
-    }
-    
-    if keyword not in keyword_factories:
+    if keyword not in KEYWORD_FACTORIES:
         raise ValueError(f"Unknown keyword ability: {keyword}")
     
-    return keyword_factories[keyword](character, value, target_name)
+    return KEYWORD_FACTORIES[keyword](character, value, target_name)
 
 
 # =============================================================================
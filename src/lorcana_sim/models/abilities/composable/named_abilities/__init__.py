@@ -1,11 +1,12 @@
-"""Named ability implementations for Lorcana cards."""
+"""Named ability implementations for Lorcana cards.
+
+Ability modules are not imported with this package: the registry imports each
+one the first time its ability is looked up (see registry.py and manifest.py).
+"""
 
 from .registry import NamedAbilityRegistry, register_named_ability
-from .static import *
-from .triggered import *
-from .activated import *
 
 __all__ = [
     'NamedAbilityRegistry',
     'register_named_ability'
-]
\ No newline at end of file
+]
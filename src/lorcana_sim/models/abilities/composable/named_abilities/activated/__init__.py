@@ -1,8 +1,9 @@
 """Activated named abilities - abilities that can be used for a cost."""
 
-from .a_wonderful_dream import *
-from .extract_of_amethyst import *
-from .ice_over import *
+from ..registry import category_getattr
+
+# Ability modules are imported on first use (see registry.py)
+__getattr__ = category_getattr(__name__)
 
 __all__ = [
     'create_a_wonderful_dream',
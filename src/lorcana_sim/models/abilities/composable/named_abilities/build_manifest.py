@@ -0,0 +1,84 @@
+"""Generate the named ability manifest (``manifest.py``).
+
+Scans the ability modules under static/, triggered/ and activated/ for
+``@register_named_ability("NAME")`` decorators without importing them, and
+writes the ability name -> (module, creator) table the registry uses to import
+an ability's module on first use. setup.py runs this when the package is
+built; after adding or renaming an ability, regenerate it with
+
+    python src/lorcana_sim/models/abilities/composable/named_abilities/build_manifest.py
+
+This file must not import anything from lorcana_sim, so it can run before the
+package is importable.
+"""
+
+import ast
+import sys
+from pathlib import Path
+from typing import Dict, Tuple
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+CATEGORIES = ("static", "triggered", "activated")
+MANIFEST_FILE = "manifest.py"
+
+HEADER = '''"""Named ability manifest: ability name -> (module, creator function).
+
+Generated by build_manifest.py from the @register_named_ability decorators;
+do not edit by hand. Modules are relative to the named_abilities package.
+"""
+
+NAMED_ABILITIES = {
+'''
+
+
+def scan_named_abilities(package_dir: Path = PACKAGE_DIR) -> Dict[str, Tuple[str, str]]:
+    """Registered ability names mapped to (module, creator function), sorted by name."""
+    entries = {}
+    for category in CATEGORIES:
+        for path in sorted((package_dir / category).glob("*.py")):
+            if path.name == "__init__.py":
+                continue
+            module = f"{category}.{path.stem}"
+            tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+            for node in tree.body:
+                if not isinstance(node, ast.FunctionDef):
+                    continue
+                for name in _registered_names(node):
+                    if name in entries:
+                        raise ValueError(f"Named ability {name!r} is registered by both "
+                                         f"{entries[name][0]} and {module}")
+                    entries[name] = (module, node.name)
+    return dict(sorted(entries.items()))
+
+
+def _registered_names(function: ast.FunctionDef):
+    for decorator in function.decorator_list:
+        if (isinstance(decorator, ast.Call) and isinstance(decorator.func, ast.Name)
+                and decorator.func.id == "register_named_ability"):
+            argument = decorator.args[0] if decorator.args else None
+            if not (isinstance(argument, ast.Constant) and isinstance(argument.value, str)):
+                raise ValueError(f"{function.name}: register_named_ability needs a string literal")
+            yield argument.value
+
+
+def render_manifest(entries: Dict[str, Tuple[str, str]]) -> str:
+    """Source of manifest.py for the given entries."""
+    lines = [f"    {name!r}: ({module!r}, {creator!r}),\n"
+             for name, (module, creator) in entries.items()]
+    return HEADER + "".join(lines) + "}\n"
+
+
+def write_manifest(package_dir: Path = PACKAGE_DIR) -> bool:
+    """Regenerate manifest.py; returns True if its contents changed."""
+    source = render_manifest(scan_named_abilities(package_dir))
+    path = package_dir / MANIFEST_FILE
+    if path.exists() and path.read_text(encoding="utf-8") == source:
+        return False
+    path.write_text(source, encoding="utf-8")
+    return True
+
+
+if __name__ == "__main__":
+    changed = write_manifest()
+    print(f"{MANIFEST_FILE} {'updated' if changed else 'up to date'}")
+    sys.exit(0)
@@ -0,0 +1,47 @@
+"""Named ability manifest: ability name -> (module, creator function).
+
+Generated by build_manifest.py from the @register_named_ability decorators;
+do not edit by hand. Modules are relative to the named_abilities package.
+"""
+
+NAMED_ABILITIES = {
+    'A WONDERFUL DREAM': ('activated.a_wonderful_dream', 'create_a_wonderful_dream'),
+    'AND TWO FOR TEA!': ('triggered.and_two_for_tea', 'create_and_two_for_tea'),
+    'CLEAR THE PATH': ('static.clear_the_path', 'create_clear_the_path'),
+    'CRYSTALLIZE': ('triggered.crystallize', 'create_crystallize'),
+    'DANCE-OFF': ('triggered.dance_off', 'create_dance_off'),
+    'EXCEPTIONAL POWER': ('triggered.exceptional_power', 'create_exceptional_power'),
+    'EXTRACT OF AMETHYST': ('activated.extract_of_amethyst', 'create_extract_of_amethyst'),
+    'FLY, MY PET!': ('triggered.fly_my_pet', 'create_fly_my_pet'),
+    'GRASPING TRUNK': ('triggered.grasping_trunk', 'create_grasping_trunk'),
+    'GROWING POWERS': ('triggered.growing_powers', 'create_growing_powers'),
+    'HEAVILY ARMED': ('triggered.heavily_armed', 'create_heavily_armed'),
+    'HEROISM': ('triggered.heroism', 'create_heroism'),
+    'HORSE KICK': ('triggered.horse_kick', 'create_horse_kick'),
+    'I WIN': ('triggered.i_win', 'create_i_win'),
+    'ICE OVER': ('activated.ice_over', 'create_ice_over'),
+    'LOYAL': ('static.loyal', 'create_loyal'),
+    'MUSICAL DEBUT': ('triggered.musical_debut', 'create_musical_debut'),
+    'MY ORDERS COME FROM JAFAR': ('triggered.my_orders_come_from_jafar', 'create_my_orders_come_from_jafar'),
+    'MYSTERIOUS ADVANTAGE': ('triggered.mysterious_advantage', 'create_mysterious_advantage'),
+    'NEW ROSTER': ('triggered.new_roster', 'create_new_roster'),
+    'PARTING GIFT': ('triggered.parting_gift', 'create_parting_gift'),
+    'PHENOMENAL SHOWMAN': ('static.phenomenal_showman', 'create_phenomenal_showman'),
+    'PLAY ROUGH': ('triggered.play_rough', 'create_play_rough'),
+    'PLUCKY PLAY': ('triggered.plucky_play', 'create_plucky_play'),
+    'QUICK REFLEXES': ('static.quick_reflexes', 'create_quick_reflexes'),
+    'RECURRING GUST': ('triggered.recurring_gust', 'create_recurring_gust'),
+    'REFRESHING BREAK': ('triggered.refreshing_break', 'create_refreshing_break'),
+    'SHOWSTOPPER': ('triggered.showstopper', 'create_showstopper'),
+    'SINISTER PLOT': ('static.sinister_plot', 'create_sinister_plot'),
+    'TAKE POINT': ('static.take_point', 'create_take_point'),
+    'TALE OF THE FIFTH SPIRIT': ('triggered.tale_of_the_fifth_spirit', 'create_tale_of_the_fifth_spirit'),
+    "THAT'S BETTER": ('triggered.thats_better', 'create_thats_better'),
+    'THIS IS NOT DONE YET': ('triggered.this_is_not_done_yet', 'create_this_is_not_done_yet'),
+    'TURNING TIDES': ('triggered.turning_tides', 'create_turning_tides'),
+    'UNTOLD TREASURE': ('triggered.untold_treasure', 'create_untold_treasure'),
+    'VOICELESS': ('static.voiceless', 'create_voiceless'),
+    'WE CAN FIX IT': ('triggered.we_can_fix_it', 'create_we_can_fix_it'),
+    'WELL OF SOULS': ('triggered.well_of_souls', 'create_well_of_souls'),
+    'WHAT DO WE DO NOW?': ('triggered.what_do_we_do_now', 'create_what_do_we_do_now'),
+}
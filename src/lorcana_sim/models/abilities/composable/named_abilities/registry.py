@@ -1,9 +1,17 @@
-"""Registry system for named abilities."""
+"""Registry system for named abilities.
 
+Ability modules are imported on demand: ``manifest.NAMED_ABILITIES`` (generated
+by build_manifest.py) maps every ability name to the module that registers it,
+and the first lookup of a name imports that module, whose
+``@register_named_ability`` decorator fills in the registry.
+"""
+
+from importlib import import_module
 from typing import Dict, Callable, Any, Optional
 from ..composable_ability import ComposableAbility
+from .manifest import NAMED_ABILITIES
 
-# Global registry of named ability creators
+# Global registry of named ability creators (those imported so far)
 _NAMED_ABILITY_REGISTRY: Dict[str, Callable[[Any, dict], ComposableAbility]] = {}
 
 def register_named_ability(ability_name: str):
@@ -13,6 +21,38 @@ def register_named_ability(ability_name: str):
         return creator_func
     return decorator
 
+def get_named_ability_creator(ability_name: str) -> Optional[Callable[[Any, dict], ComposableAbility]]:
+    """The creator registered for an ability name, importing its module if needed."""
+    creator_func = _NAMED_ABILITY_REGISTRY.get(ability_name)
+    if creator_func is None and ability_name in NAMED_ABILITIES:
+        module, _ = NAMED_ABILITIES[ability_name]
+        import_module(f"{__package__}.{module}")
+        creator_func = _NAMED_ABILITY_REGISTRY.get(ability_name)
+    return creator_func
+
+def load_all_named_abilities() -> None:
+    """Import every ability module in the manifest."""
+    for module in sorted({module for module, _ in NAMED_ABILITIES.values()}):
+        import_module(f"{__package__}.{module}")
+
+def category_getattr(package: str) -> Callable[[str], Any]:
+    """Module ``__getattr__`` for a category package (static, triggered, activated).
+
+    Resolves ``create_*`` names by importing the module that defines them, so
+    ``from .triggered import create_dance_off`` keeps working without the
+    package importing all of its modules up front.
+    """
+    category = package.rsplit('.', 1)[-1]
+    creators = {creator: module for module, creator in NAMED_ABILITIES.values()
+                if module.startswith(category + '.')}
+
+    def __getattr__(name: str) -> Any:
+        module = creators.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        return getattr(import_module(f"{__package__}.{module}"), name)
+    return __getattr__
+
 class NamedAbilityRegistry:
     """Registry for creating named abilities from card data."""
     
@@ -28,7 +68,7 @@ class NamedAbilityRegistry:
         Returns:
             ComposableAbility instance if implementation exists, None otherwise
         """
-        creator_func = _NAMED_ABILITY_REGISTRY.get(ability_name)
+        creator_func = get_named_ability_creator(ability_name)
         if creator_func:
             return creator_func(character, ability_data)
         return None
@@ -36,9 +76,10 @@ class NamedAbilityRegistry:
     @staticmethod
     def get_registered_abilities() -> Dict[str, Callable]:
         """Get all registered named abilities."""
+        load_all_named_abilities()
         return _NAMED_ABILITY_REGISTRY.copy()
     
     @staticmethod
     def is_ability_implemented(ability_name: str) -> bool:
         """Check if a named ability is implemented."""
-        return ability_name in _NAMED_ABILITY_REGISTRY
\ No newline at end of file
+        return ability_name in _NAMED_ABILITY_REGISTRY or ability_name in NAMED_ABILITIES
\ No newline at end of file
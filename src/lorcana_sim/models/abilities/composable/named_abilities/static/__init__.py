@@ -1,12 +1,9 @@
 """Static named abilities - abilities that provide ongoing effects."""
 
-from .voiceless import *
-from .loyal import *
-from .clear_the_path import *
-from .take_point import *
-from .phenomenal_showman import *
-from .sinister_plot import *
-from .quick_reflexes import *
+from ..registry import category_getattr
+
+# Ability modules are imported on first use (see registry.py)
+__getattr__ = category_getattr(__name__)
 
 __all__ = [
     'create_voiceless',
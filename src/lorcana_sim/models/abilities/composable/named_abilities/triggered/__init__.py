@@ -1,34 +1,9 @@
 """Triggered named abilities - abilities that activate when something happens."""
 
-from .musical_debut import *
-from .and_two_for_tea import *
-from .well_of_souls import *
-from .horse_kick import *
-from .we_can_fix_it import *
-from .heroism import *
-from .crystallize import *
-from .dance_off import *
-from .exceptional_power import *
-from .fly_my_pet import *
-from .grasping_trunk import *
-from .growing_powers import *
-from .heavily_armed import *
-from .i_win import *
-from .parting_gift import *
-from .play_rough import *
-from .recurring_gust import *
-from .thats_better import *
-from .untold_treasure import *
-from .what_do_we_do_now import *
-from .this_is_not_done_yet import *
-from .mysterious_advantage import *
-from .my_orders_come_from_jafar import *
-from .new_roster import *
-from .showstopper import *
-from .tale_of_the_fifth_spirit import *
-from .turning_tides import *
-from .refreshing_break import *
-from .plucky_play import *
+from ..registry import category_getattr
+
+# Ability modules are imported on first use (see registry.py)
+__getattr__ = category_getattr(__name__)
 
 __all__ = [
     'create_musical_debut',
@@ -11,13 +11,7 @@ from ......engine.event_system import GameEvent
 
 def mickey_mouse_challenges(character: Any):
     """Trigger when any Mickey Mouse controlled by the same player challenges."""
-    def mickey_filter(challenger, event_context):
-        # Check if challenger is controlled by same player and is named Mickey Mouse
-        return (challenger.controller == character.controller and 
-                hasattr(challenger, 'name') and 'Mickey Mouse' in challenger.name)
-    
-    return when_event(GameEvent.CHARACTER_CHALLENGES, 
-                     source_filter=mickey_filter)
+    return when_event(GameEvent.CHARACTER_CHALLENGES, name='Mickey Mouse', ally_of=character)
 
 
 @register_named_ability("DANCE-OFF")
@@ -1,13 +1,86 @@
 """Event trigger system for composable abilities using existing GameEvent enum."""
 
-from typing import Callable, Dict, Any, Optional
+from dataclasses import dataclass
+from typing import Callable, Dict, Any, Optional, Tuple
 from ....engine.event_system import GameEvent, EventContext
 
 
+class _AnyValue:
+    """Marker for a predicate field that accepts any value."""
+    
+    def __repr__(self) -> str:
+        return 'ANY'
+
+
+ANY = _AnyValue()
+
+
+@dataclass(frozen=True, eq=False)
+class TriggerPredicate:
+    """Declarative part of a trigger condition.
+    
+    A trigger can only fire when its predicate matches, so the event manager
+    can read the predicate to skip abilities without calling their condition
+    (e.g. only the questing character's "whenever this character quests"
+    abilities are consulted for a quest). Objects are compared by identity;
+    ``source``, ``target`` and ``player`` accept anything when left as ``ANY``
+    (``None`` requires the field to be None), the other filters when None.
+    
+    Attributes:
+        event: Event type the trigger fires on
+        source: Event source must be this object (e.g. "this character")
+        target: Event target must be this object
+        player: Event player must be this player
+        controller: Event source must be controlled by this player
+        ally_of: Event source must share this card's controller (read at event time)
+        subtype: Event source must have this subtype
+        name: Event source's name must contain this text
+    """
+    event: GameEvent
+    source: Any = ANY
+    target: Any = ANY
+    player: Any = ANY
+    controller: Any = None
+    ally_of: Any = None
+    subtype: Optional[str] = None
+    name: Optional[str] = None
+    
+    def matches(self, event_context: EventContext) -> bool:
+        """Check the predicate against an event."""
+        if event_context.event_type is not self.event:
+            return False
+        source = event_context.source
+        if self.source is not ANY and source is not self.source:
+            return False
+        if self.target is not ANY and event_context.target is not self.target:
+            return False
+        if self.player is not ANY and event_context.player is not self.player:
+            return False
+        if self.controller is not None and getattr(source, 'controller', None) is not self.controller:
+            return False
+        if self.ally_of is not None and (
+                source is None or getattr(source, 'controller', None) is not self.ally_of.controller):
+            return False
+        if self.subtype is not None and self.subtype not in (getattr(source, 'subtypes', None) or ()):
+            return False
+        if self.name is not None and self.name not in (getattr(source, 'name', None) or ''):
+            return False
+        return True
+    
+    def dispatch_key(self) -> Optional[Tuple[str, int]]:
+        """('source' | 'target', id(object)) when the trigger only fires for one object's events."""
+        if self.source is not ANY:
+            return ('source', id(self.source))
+        if self.target is not ANY:
+            return ('target', id(self.target))
+        return None
+
+
 def when_event(event: GameEvent, 
                source_filter: Optional[Callable[[Any, EventContext], bool]] = None,
                target_filter: Optional[Callable[[Any, EventContext], bool]] = None,
-               metadata_filter: Optional[Callable[[Dict, EventContext], bool]] = None) -> Callable[[EventContext], bool]:
+               metadata_filter: Optional[Callable[[Dict, EventContext], bool]] = None,
+               **predicate_fields: Any) -> Callable[[EventContext], bool]:
     """Create a trigger condition for any GameEvent.
     
     Args:
@@ -15,17 +88,20 @@ def when_event(event: GameEvent,
         source_filter: Optional filter for event source
         target_filter: Optional filter for event target
         metadata_filter: Optional filter for event metadata
+        **predicate_fields: Declarative filters (``source``, ``target``, ``player``,
+                            ``controller``, ``ally_of``, ``subtype``, ``name``; see
+                            ``TriggerPredicate``), checked before the filter callbacks
         
     Returns:
         A condition function that returns True if the event matches
     """
+    predicate = TriggerPredicate(event, **predicate_fields)
     
     def condition(event_context: EventContext) -> bool:
-        # Check event type
-        if event_context.event_type != event:
+        # Check event type and declarative filters
+        if not predicate.matches(event_context):
             return False
         
-        
         # Check source filter
         if source_filter and not source_filter(event_context.source, event_context):
             return False
@@ -42,6 +118,7 @@ def when_event(event: GameEvent,
     
     # Add event information to the condition function for introspection
     condition.event_type = event
+    condition.predicate = predicate
     condition.get_relevant_events = lambda: [event]
     
     return condition
@@ -54,8 +131,7 @@ def when_event(event: GameEvent,
 # Character action triggers
 def when_quests(character: Any) -> Callable[[EventContext], bool]:
     """Trigger when this specific character quests."""
-    return when_event(GameEvent.CHARACTER_QUESTS, 
-                     source_filter=lambda src, ctx: src == character)
+    return when_event(GameEvent.CHARACTER_QUESTS, source=character)
 
 
 def when_any_quests() -> Callable[[EventContext], bool]:
@@ -65,8 +141,7 @@ def when_any_quests() -> Callable[[EventContext], bool]:
 
 def when_challenges(character: Any) -> Callable[[EventContext], bool]:
     """Trigger when this character challenges."""
-    return when_event(GameEvent.CHARACTER_CHALLENGES,
-                     source_filter=lambda src, ctx: src == character)
+    return when_event(GameEvent.CHARACTER_CHALLENGES, source=character)
 
 
 def when_any_challenges() -> Callable[[EventContext], bool]:
@@ -77,8 +152,7 @@ def when_any_challenges() -> Callable[[EventContext], bool]:
 # Character lifecycle triggers
 def when_enters_play(character: Any) -> Callable[[EventContext], bool]:
     """Trigger when this specific character enters play."""
-    return when_event(GameEvent.CHARACTER_ENTERS_PLAY,
-                     source_filter=lambda src, ctx: src == character)
+    return when_event(GameEvent.CHARACTER_ENTERS_PLAY, source=character)
 
 
 def when_any_enters_play() -> Callable[[EventContext], bool]:
@@ -93,8 +167,7 @@ def when_any_leaves_play() -> Callable[[EventContext], bool]:
 
 def when_leaves_play(character: Any) -> Callable[[EventContext], bool]:
     """Trigger when this specific character leaves play."""
-    return when_event(GameEvent.CHARACTER_LEAVES_PLAY,
-                     source_filter=lambda src, ctx: src == character)
+    return when_event(GameEvent.CHARACTER_LEAVES_PLAY, source=character)
 
 
 def when_banished(character: Any) -> Callable[[EventContext], bool]:
@@ -104,21 +177,18 @@ def when_banished(character: Any) -> Callable[[EventContext], bool]:
         return when_event(GameEvent.CHARACTER_BANISHED)
     else:
         # Listen for specific character being banished
-        return when_event(GameEvent.CHARACTER_BANISHED,
-                         source_filter=lambda src, ctx: src == character)
+        return when_event(GameEvent.CHARACTER_BANISHED, source=character)
 
 
 # Damage triggers
 def when_takes_damage(character: Any) -> Callable[[EventContext], bool]:
     """Trigger when this character takes damage."""
-    return when_event(GameEvent.CHARACTER_TAKES_DAMAGE,
-                     target_filter=lambda tgt, ctx: tgt == character)
+    return when_event(GameEvent.CHARACTER_TAKES_DAMAGE, target=character)
 
 
 def when_deals_damage(character: Any) -> Callable[[EventContext], bool]:
     """Trigger when this character deals damage."""
-    return when_event(GameEvent.CHARACTER_DEALS_DAMAGE,
-                     source_filter=lambda src, ctx: src == character)
+    return when_event(GameEvent.CHARACTER_DEALS_DAMAGE, source=character)
 
 
 def when_any_takes_damage() -> Callable[[EventContext], bool]:
@@ -146,16 +216,14 @@ def when_song_played() -> Callable[[EventContext], bool]:
 def when_turn_begins(player: Any = None) -> Callable[[EventContext], bool]:
     """Trigger at start of turn (optionally specific player's turn)."""
     if player:
-        return when_event(GameEvent.TURN_BEGINS,
-                         metadata_filter=lambda meta, ctx: ctx.player == player)
+        return when_event(GameEvent.TURN_BEGINS, player=player)
     return when_event(GameEvent.TURN_BEGINS)
 
 
 def when_turn_ends(player: Any = None) -> Callable[[EventContext], bool]:
     """Trigger at end of turn (optionally specific player's turn)."""
     if player:
-        return when_event(GameEvent.TURN_ENDS,
-                         metadata_filter=lambda meta, ctx: ctx.player == player)
+        return when_event(GameEvent.TURN_ENDS, player=player)
     return when_event(GameEvent.TURN_ENDS)
 
 
@@ -234,22 +302,19 @@ def when_targeted_by_ability(character: Any) -> Callable[[EventContext], bool]:
 
 def when_challenge_declared_against(character: Any) -> Callable[[EventContext], bool]:
     """Trigger when a challenge is declared against a character (for redirection)."""
-    return when_event(GameEvent.CHARACTER_CHALLENGES,
-                     target_filter=lambda tgt, ctx: tgt == character)
+    return when_event(GameEvent.CHARACTER_CHALLENGES, target=character)
 
 
 def when_damage_would_be_dealt_to(character: Any) -> Callable[[EventContext], bool]:
     """Trigger before damage is dealt (for Resist)."""
     # This might need GameEvent.DAMAGE_WOULD_BE_DEALT
     # For now use CHARACTER_TAKES_DAMAGE with early priority
-    return when_event(GameEvent.CHARACTER_TAKES_DAMAGE,
-                     target_filter=lambda tgt, ctx: tgt == character)
+    return when_event(GameEvent.CHARACTER_TAKES_DAMAGE, target=character)
 
 
 def when_song_cast_attempted(singer: Any) -> Callable[[EventContext], bool]:
     """Trigger when trying to cast a song with this singer."""
-    return when_event(GameEvent.SONG_SUNG,
-                     source_filter=lambda src, ctx: src == singer,
+    return when_event(GameEvent.SONG_SUNG, source=singer,
                      metadata_filter=lambda meta, ctx: meta.get('attempt_phase', False))
 
 
@@ -262,6 +327,11 @@ def and_conditions(*conditions: Callable[[EventContext], bool]) -> Callable[[Eve
     def combined_condition(event_context: EventContext) -> bool:
         return all(condition(event_context) for condition in conditions)
     
+    # Every condition must hold, so any one predicate still limits when this fires
+    predicate = next((c.predicate for c in conditions if getattr(c, 'predicate', None)), None)
+    if predicate is not None:
+        combined_condition.predicate = predicate
+    
     # Combine relevant events from all conditions
     def get_combined_events():
         all_events = set()
@@ -337,8 +407,12 @@ def is_enemy_source(event_context: EventContext) -> bool:
 
 def get_relevant_events_for_trigger(trigger_condition: Callable) -> list[GameEvent]:
     """Analyze a trigger condition to determine which events it cares about."""
-    # This is a simplified version - in production we'd parse the condition
-    # For now, return all events and optimize later
+    predicate = getattr(trigger_condition, 'predicate', None)
+    if predicate is not None:
+        return [predicate.event]
+    if hasattr(trigger_condition, 'get_relevant_events'):
+        return list(trigger_condition.get_relevant_events())
+    # Opaque condition: it could care about anything
     return list(GameEvent)
 
 
@@ -348,106 +422,32 @@ def get_relevant_events_for_trigger(trigger_condition: Callable) -> list[GameEve
 
 def when_banished_in_challenge(character: Any) -> Callable[[EventContext], bool]:
     """Trigger when this character is banished specifically in a challenge."""
-    return when_event(GameEvent.CHARACTER_BANISHED_IN_CHALLENGE,
-                     source_filter=lambda src, ctx: src == character)
+    return when_event(GameEvent.CHARACTER_BANISHED_IN_CHALLENGE, source=character)
 
 
 def when_character_type_enters_play(character_type: str, controller: Any = None) -> Callable[[EventContext], bool]:
     """Trigger when a character of specific type enters play."""
-    def condition(event_context: EventContext) -> bool:
-        if event_context.event_type != GameEvent.CHARACTER_ENTERS_PLAY:
-            return False
-        
-        character = event_context.source
-        if not character:
-            return False
-            
-        # Check character type/subtype
-        if hasattr(character, 'subtypes') and character_type in character.subtypes:
-            # Check controller if specified
-            if controller and hasattr(character, 'controller'):
-                return character.controller == controller
-            return True
-        
-        return False
-    
-    condition.get_relevant_events = lambda: [GameEvent.CHARACTER_ENTERS_PLAY]
-    return condition
+    return when_event(GameEvent.CHARACTER_ENTERS_PLAY, subtype=character_type, controller=controller)
 
 
 def when_character_type_leaves_play(character_type: str, controller: Any = None) -> Callable[[EventContext], bool]:
     """Trigger when a character of specific type leaves play."""
-    def condition(event_context: EventContext) -> bool:
-        if event_context.event_type != GameEvent.CHARACTER_LEAVES_PLAY:
-            return False
-        
-        character = event_context.source
-        if not character:
-            return False
-            
-        # Check character type/subtype
-        if hasattr(character, 'subtypes') and character_type in character.subtypes:
-            # Check controller if specified
-            if controller and hasattr(character, 'controller'):
-                return character.controller == controller
-            return True
-        
-        return False
-    
-    condition.get_relevant_events = lambda: [GameEvent.CHARACTER_LEAVES_PLAY]
-    return condition
+    return when_event(GameEvent.CHARACTER_LEAVES_PLAY, subtype=character_type, controller=controller)
 
 
 def when_character_name_enters_play(character_name: str, controller: Any = None) -> Callable[[EventContext], bool]:
     """Trigger when a character with specific name enters play."""
-    def condition(event_context: EventContext) -> bool:
-        if event_context.event_type != GameEvent.CHARACTER_ENTERS_PLAY:
-            return False
-        
-        character = event_context.source
-        if not character:
-            return False
-            
-        # Check character name
-        if hasattr(character, 'name') and character_name in character.name:
-            # Check controller if specified
-            if controller and hasattr(character, 'controller'):
-                return character.controller == controller
-            return True
-        
-        return False
-    
-    condition.get_relevant_events = lambda: [GameEvent.CHARACTER_ENTERS_PLAY]
-    return condition
+    return when_event(GameEvent.CHARACTER_ENTERS_PLAY, name=character_name, controller=controller)
 
 
 def when_character_name_leaves_play(character_name: str, controller: Any = None) -> Callable[[EventContext], bool]:
     """Trigger when a character with specific name leaves play."""
-    def condition(event_context: EventContext) -> bool:
-        if event_context.event_type != GameEvent.CHARACTER_LEAVES_PLAY:
-            return False
-        
-        character = event_context.source
-        if not character:
-            return False
-            
-        # Check character name
-        if hasattr(character, 'name') and character_name in character.name:
-            # Check controller if specified
-            if controller and hasattr(character, 'controller'):
-                return character.controller == controller
-            return True
-        
-        return False
-    
-    condition.get_relevant_events = lambda: [GameEvent.CHARACTER_LEAVES_PLAY]
-    return condition
+    return when_event(GameEvent.CHARACTER_LEAVES_PLAY, name=character_name, controller=controller)
 
 
 def when_ability_activated(character: Any, ability_name: str) -> Callable[[EventContext], bool]:
     """Trigger when specific activated ability is used."""
-    return when_event(GameEvent.ABILITY_ACTIVATED,
-                     source_filter=lambda src, ctx: src == character,
+    return when_event(GameEvent.ABILITY_ACTIVATED, source=character,
                      metadata_filter=lambda meta, ctx: meta.get('ability_name') == ability_name)
 
 
@@ -459,31 +459,27 @@ def on_activation() -> Callable[[EventContext], bool]:
 def when_turn_starts(player: Any = None) -> Callable[[EventContext], bool]:
     """Trigger at start of turn (optionally specific player's turn)."""
     if player:
-        return when_event(GameEvent.TURN_BEGINS,
-                         metadata_filter=lambda meta, ctx: ctx.player == player)
+        return when_event(GameEvent.TURN_BEGINS, player=player)
     return when_event(GameEvent.TURN_BEGINS)
 
 
 def when_character_exerts(character: Any = None) -> Callable[[EventContext], bool]:
     """Trigger when a character is exerted."""
     if character:
-        return when_event(GameEvent.CHARACTER_EXERTS,
-                         source_filter=lambda src, ctx: src == character)
+        return when_event(GameEvent.CHARACTER_EXERTS, source=character)
     return when_event(GameEvent.CHARACTER_EXERTS)
 
 
 def when_character_readies(character: Any = None) -> Callable[[EventContext], bool]:
     """Trigger when a character readies."""
     if character:
-        return when_event(GameEvent.CHARACTER_READIED,
-                         source_filter=lambda src, ctx: src == character)
+        return when_event(GameEvent.CHARACTER_READIED, source=character)
     return when_event(GameEvent.CHARACTER_READIED)
 
 
 def when_moves_to_location(character: Any) -> Callable[[EventContext], bool]:
     """Trigger when a character moves to a location."""
-    return when_event(GameEvent.CHARACTER_MOVES_TO_LOCATION,
-                     source_filter=lambda src, ctx: src == character)
+    return when_event(GameEvent.CHARACTER_MOVES_TO_LOCATION, source=character)
 
 
 def always_active() -> Callable[[EventContext], bool]:
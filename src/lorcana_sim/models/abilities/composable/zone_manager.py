@@ -5,6 +5,7 @@ from typing import Dict, List, Set, Optional, Tuple, TYPE_CHECKING, Any
 from collections import defaultdict
 
 from .activation_zones import ActivationZone
+from ....utils.history import ExecutionHistory, HistoryRetention
 
 if TYPE_CHECKING:
     from ...cards.character_card import CharacterCard
@@ -28,9 +29,18 @@ class ZoneManager:
     all_effects: Set[Any] = field(default_factory=set)
     
     # Track zone transitions for debugging
-    recent_transitions: List[Tuple[str, ActivationZone, ActivationZone]] = field(default_factory=list)
+    recent_transitions: Optional[ExecutionHistory] = None
     max_transition_history: int = 50
     
+    def __post_init__(self):
+        if self.recent_transitions is None:
+            self.recent_transitions = ExecutionHistory(HistoryRetention.ring(self.max_transition_history))
+    
+    def set_history_retention(self, retention: HistoryRetention) -> None:
+        """Change how many zone transitions are kept for debugging."""
+        self.recent_transitions.close()
+        self.recent_transitions = ExecutionHistory(retention)
+    
     def register_conditional_effect(self, effect: Any) -> None:
         """Register a conditional effect with the zone manager."""
         # NOTE: Disabled for legacy migration - StatefulConditionalEffect pattern doesn't use ZoneManager
@@ -93,14 +103,10 @@ class ZoneManager:
     def _record_transition(self, card_name: str, from_zone: ActivationZone, to_zone: ActivationZone) -> None:
         """Record a zone transition for debugging."""
         self.recent_transitions.append((card_name, from_zone, to_zone))
-        
-        # Limit history size
-        if len(self.recent_transitions) > self.max_transition_history:
-            self.recent_transitions.pop(0)
     
     def get_transition_history(self) -> List[Tuple[str, ActivationZone, ActivationZone]]:
         """Get recent zone transitions for debugging."""
-        return self.recent_transitions.copy()
+        return list(self.recent_transitions)
     
     def get_debug_info(self) -> Dict:
         """Get debugging information about the zone manager state."""
@@ -1,6 +1,8 @@
 """Card models for Lorcana simulation."""
 
 from .base_card import Card, CardColor, Rarity
+from .card_definition import CardDefinition
+from .keywords import Keyword
 from .character_card import CharacterCard
 from .action_card import ActionCard
 from .item_card import ItemCard
@@ -11,6 +13,8 @@ __all__ = [
     "Card",
     "CardColor",
     "Rarity",
+    "CardDefinition",
+    "Keyword",
     "CharacterCard",
     "ActionCard",
     "ItemCard", 
@@ -4,9 +4,11 @@ from dataclasses import dataclass, field
 from typing import List, Optional
 
 from .base_card import Card
+from .card_definition import definition_backed
 
 
-@dataclass
+@definition_backed
+@dataclass(eq=False)
 class ActionCard(Card):
     """Represents an action card (includes songs) in Lorcana."""
     
@@ -1,8 +1,10 @@
 """Base card class and common enums for Lorcana cards."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+
+from .card_definition import CardDefinition, bind_definition, definition_backed
 
 
 class CardColor(Enum):
@@ -26,6 +28,17 @@ class Rarity(Enum):
     ENCHANTED = "Enchanted"
 
 
+_COMPARE_FIELDS: Dict[type, Tuple[str, ...]] = {}
+
+
+def _compare_fields(card_class: type) -> Tuple[str, ...]:
+    names = _COMPARE_FIELDS.get(card_class)
+    if names is None:
+        names = _COMPARE_FIELDS[card_class] = tuple(f.name for f in fields(card_class) if f.compare)
+    return names
+
+
+@definition_backed
 @dataclass
 class Card:
     """Base class for all Lorcana cards."""
@@ -66,6 +79,48 @@ class Card:
             raise ValueError("Card name cannot be empty")
         if not self.full_name:
             self.full_name = f"{self.name} - {self.version}" if self.version else self.name
+        
+        # Printed data lives in the shared definition; the card keeps runtime state
+        if getattr(self, '_definition', None) is None:
+            bind_definition(self)  # Subclass without @definition_backed
+    
+    def __setattr__(self, name, value):
+        # Exerting or readying a card in an inkwell keeps its owner's ink counters current
+        if name == 'exerted':
+            state = self.__dict__
+            owners = state.get('_ink_owners')
+            if owners and bool(value) != bool(state.get('exerted')):
+                state['exerted'] = value
+                for owner in owners:
+                    owner._ink_exerted(self, value)
+                return
+        object.__setattr__(self, name, value)
+    
+    def __getstate__(self):
+        # Copies are not in anyone's inkwell until a zone adds them
+        state = self.__dict__.copy()
+        state.pop('_ink_owners', None)
+        return state
+    
+    @property
+    def definition(self) -> CardDefinition:
+        """The interned printed data shared by every copy of this card."""
+        return self._definition
+    
+    def __eq__(self, other) -> bool:
+        """Field-by-field equality, as dataclass generates it, short-circuiting on id.
+        
+        Subclasses are declared with ``eq=False`` so they share this method;
+        printed fields are read through the definition, which makes the
+        generated comparison (all fields, every time) needlessly slow for the
+        common ``card in zone`` scans where ids differ.
+        """
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        if self.id != other.id:
+            return False
+        names = _compare_fields(self.__class__)
+        return tuple(getattr(self, n) for n in names) == tuple(getattr(other, n) for n in names)
     
     @property
     def card_type(self) -> str:
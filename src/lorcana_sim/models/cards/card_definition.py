@@ -0,0 +1,195 @@
+"""Shared, immutable printed data for cards.
+
+Every physical copy of a card in a game used to carry its own copy of the
+printed data (name, text, stats, subtypes, artists...). A ``CardDefinition``
+holds that data once; card objects keep only a reference to the interned
+definition plus their runtime state (damage, exerted, controller, ...).
+
+``Card`` and its subclasses remain the public API: printed fields are read
+through the definition, and writing one (e.g. an effect changing
+``strength``) stores a per-card override without touching the shared
+definition.
+"""
+
+import inspect
+from typing import Any, Dict, NamedTuple, Optional, Tuple, Type, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base_card import CardColor, Rarity
+
+
+class CardDefinition(NamedTuple):
+    """Printed, game-independent data of a card, shared by every copy."""
+    card_type: str
+    name: str
+    version: Optional[str]
+    full_name: str
+    cost: int
+    color: 'CardColor'
+    inkwell: bool
+    rarity: 'Rarity'
+    set_code: str
+    number: int
+    story: str
+    flavor_text: Optional[str] = None
+    full_text: str = ""
+    artists: Tuple[str, ...] = ()
+    image_url: Optional[str] = None
+
+    # Character / location printed stats
+    strength: Optional[int] = None
+    willpower: Optional[int] = None
+    lore: Optional[int] = None
+    subtypes: Tuple[str, ...] = ()
+    move_cost: Optional[int] = None
+
+    # Action effect text
+    effects: Tuple[str, ...] = ()
+
+    def __reduce__(self):
+        # Copies and unpickled definitions resolve to the interned instance
+        return (_restore_definition, (tuple(self),))
+
+
+# Printed fields that are lists on the card API and tuples in the definition
+LIST_FIELDS = frozenset({'artists', 'subtypes', 'effects'})
+
+_INTERNED: Dict[CardDefinition, CardDefinition] = {}
+
+
+def intern_definition(definition: CardDefinition) -> CardDefinition:
+    """Return the canonical instance of a definition, registering it if new."""
+    try:
+        return _INTERNED.setdefault(definition, definition)
+    except TypeError:
+        return definition  # Unhashable printed data (unusual test input); share nothing
+
+
+def _restore_definition(values: Tuple[Any, ...]) -> CardDefinition:
+    return intern_definition(CardDefinition(*values))
+
+
+def interned_definition_count() -> int:
+    """Number of distinct card definitions interned so far."""
+    return len(_INTERNED)
+
+
+class DefinitionField:
+    """Non-data descriptor reading a printed field from the card's definition.
+
+    Being a non-data descriptor, a value in the card's ``__dict__`` always
+    wins, so assigning the attribute simply creates a per-card override.
+    """
+
+    __slots__ = ('name', 'index')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.index = CardDefinition._fields.index(name)
+
+    def __get__(self, card: Any, owner: Optional[Type] = None) -> Any:
+        if card is None:
+            return self
+        return card._definition[self.index]
+
+
+class DefinitionListField(DefinitionField):
+    """Definition field exposed as a list on the card.
+
+    The list is materialized per card on first access so callers can keep
+    treating (and mutating) it as a list without touching the definition.
+    """
+
+    __slots__ = ()
+
+    def __get__(self, card: Any, owner: Optional[Type] = None) -> Any:
+        if card is None:
+            return self
+        value = card.__dict__[self.name] = list(card._definition[self.index])
+        return value
+
+
+# Per card class: (field name, definition index, is list field) for each
+# dataclass field stored on the definition
+_LAYOUTS: Dict[Type, Tuple[Tuple[str, int, bool], ...]] = {}
+_CARD_TYPE_INDEX = CardDefinition._fields.index('card_type')
+_NAME_INDEX = CardDefinition._fields.index('name')
+_VERSION_INDEX = CardDefinition._fields.index('version')
+_FULL_NAME_INDEX = CardDefinition._fields.index('full_name')
+
+
+def definition_layout(card_class: Type) -> Tuple[Tuple[str, int, bool], ...]:
+    """Printed fields of a card class, installing their descriptors on first use."""
+    layout = _LAYOUTS.get(card_class)
+    if layout is None:
+        field_names = getattr(card_class, '__dataclass_fields__', {})
+        layout = tuple((name, index, name in LIST_FIELDS)
+                       for index, name in enumerate(CardDefinition._fields) if name in field_names)
+        for name, _, is_list in layout:
+            if not isinstance(card_class.__dict__.get(name), DefinitionField):
+                descriptor = DefinitionListField(name) if is_list else DefinitionField(name)
+                setattr(card_class, name, descriptor)
+        _LAYOUTS[card_class] = layout
+    return layout
+
+
+_DEFAULT_VALUES = tuple(CardDefinition._field_defaults.get(name) for name in CardDefinition._fields)
+
+
+def _pop_definition(card_class: Type, values: Dict[str, Any]) -> CardDefinition:
+    """Remove a card's printed fields from ``values`` and return their interned definition."""
+    definition_values = list(_DEFAULT_VALUES)
+    definition_values[_CARD_TYPE_INDEX] = card_class.__name__
+    for name, index, is_list in _LAYOUTS.get(card_class) or definition_layout(card_class):
+        value = values.pop(name)
+        definition_values[index] = tuple(value) if is_list and value is not None else value
+    if not definition_values[_FULL_NAME_INDEX] and definition_values[_NAME_INDEX]:
+        # Same derivation as Card.__post_init__, so the definition holds the final name
+        name, version = definition_values[_NAME_INDEX], definition_values[_VERSION_INDEX]
+        definition_values[_FULL_NAME_INDEX] = f"{name} - {version}" if version else name
+    return intern_definition(CardDefinition._make(definition_values))
+
+
+def bind_definition(card: Any) -> CardDefinition:
+    """Move a constructed card's printed fields into an interned definition.
+
+    Fallback for card classes not decorated with ``definition_backed`` (their
+    dataclass ``__init__`` stores every field on the instance); afterwards the
+    card's ``__dict__`` holds only runtime state and the ``_definition``.
+    """
+    definition = _pop_definition(type(card), card.__dict__)
+    card.__dict__['_definition'] = definition
+    return definition
+
+
+class _FieldBuffer:
+    """Receives the dataclass ``__init__`` assignments of a card under construction."""
+
+    def __post_init__(self) -> None:
+        pass
+
+
+def definition_backed(card_class: Type) -> Type:
+    """Class decorator (applied above ``@dataclass``) keeping printed fields off instances.
+
+    The dataclass-generated ``__init__`` (signature, defaults, default
+    factories) is reused, but runs against a scratch buffer; the printed
+    fields are interned into a definition and only runtime fields are set on
+    the card, so instances stay small. ``__post_init__`` then runs as usual.
+    """
+    dataclass_init = card_class.__init__
+    definition_layout(card_class)
+
+    def __init__(self, *args, **kwargs):
+        buffer = _FieldBuffer()
+        dataclass_init(buffer, *args, **kwargs)
+        values = buffer.__dict__
+        state = self.__dict__
+        state['_definition'] = _pop_definition(self.__class__, values)
+        state.update(values)
+        self.__post_init__()
+
+    __init__.__signature__ = inspect.signature(dataclass_init)
+    __init__.__doc__ = dataclass_init.__doc__
+    card_class.__init__ = __init__
+    return card_class
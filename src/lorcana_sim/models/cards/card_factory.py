@@ -1,12 +1,15 @@
 """Factory for creating card objects from JSON data."""
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Sequence
 
 from .base_card import Card, CardColor, Rarity
 from .character_card import CharacterCard
 from .action_card import ActionCard
 from .item_card import ItemCard
 from .location_card import LocationCard
+from ...utils.logging_config import get_game_logger
+
+logger = get_game_logger(__name__)
 
 
 class CardFactory:
@@ -140,51 +143,72 @@ class CardFactory:
     
     @staticmethod
     def _add_composable_abilities(character: CharacterCard, card_data: Dict[str, Any]) -> None:
-        """Add composable abilities to a character card from JSON data."""
+        """Add composable abilities to a character card from JSON data.
+        
+        The ability data is compiled into a template once per printed card;
+        each copy only binds the template.
+        """
         # Lazy imports to avoid circular dependency
         try:
-            from ..abilities.composable.named_abilities import NamedAbilityRegistry
-            from ..abilities.composable.keyword_abilities import create_keyword_ability
+            from ..abilities.composable.ability_templates import template_for
         except ImportError:
             # If abilities aren't available, skip ability processing
             return
         
-        # Process abilities from the abilities array
-        for ability_data in card_data.get("abilities", []):
+        # Missing lists default to the shared empty tuple so they do not make
+        # a fresh cache key per copy
+        template = template_for(card_data.get("abilities") or (), CardFactory._compile_abilities,
+                                card_data.get("keywordAbilities") or ())
+        abilities = template.bind(character)
+        if abilities:
+            character.composable_abilities.extend(abilities)
+    
+    @staticmethod
+    def _compile_abilities(abilities_data: Sequence[Dict[str, Any]], keyword_abilities: Sequence[str] = ()):
+        """Compile a character's ability data into an ``AbilityTemplate``.
+        
+        Keywords listed only in ``keywordAbilities`` are added too; ones already
+        in the abilities array are not added twice.
+        """
+        from ..abilities.composable.ability_templates import AbilityTemplate, named_ability_builder
+        from ..abilities.composable.keyword_abilities import KEYWORD_FACTORIES, create_keyword_ability
+        
+        builders = []
+        keywords = set()
+        for ability_data in abilities_data:
             ability_type = ability_data.get("type")
             
             if ability_type == "keyword":
                 # Handle keyword abilities
                 keyword = ability_data.get("keyword")
                 if keyword:
-                    try:
-                        keyword_ability = create_keyword_ability(keyword, character, ability_data)
-                        if keyword_ability:
-                            character.add_composable_ability(keyword_ability)
-                    except Exception as e:
-                        print(f"Warning: Failed to create keyword ability {keyword} for {character.name}: {e}")
+                    keywords.add(keyword)
+                    value = ability_data.get("keywordValueNumber")
+                    factory = KEYWORD_FACTORIES.get(keyword)
+                    if factory:
+                        builders.append((keyword, lambda card, factory=factory, value=value:
+                                         factory(card, value, None)))
+                    else:
+                        # Unknown keywords fail (and are logged) when bound
+                        builders.append((keyword, lambda card, keyword=keyword, value=value:
+                                         create_keyword_ability(keyword, card, value)))
             
             elif ability_data.get("name"):
                 # Handle named abilities
                 ability_name = ability_data.get("name")
-                try:
-                    named_ability = NamedAbilityRegistry.create_ability(ability_name, character, ability_data)
-                    if named_ability:
-                        character.add_composable_ability(named_ability)
-                        print(f"Added named ability {ability_name} to {character.name}")
-                    else:
-                        print(f"Named ability {ability_name} not implemented yet for {character.name}")
-                except Exception as e:
-                    print(f"Warning: Failed to create named ability {ability_name} for {character.name}: {e}")
+                builder = named_ability_builder(ability_name, ability_data)
+                if builder:
+                    builders.append((ability_name, builder))
+                else:
+                    logger.debug(f"Named ability {ability_name} not implemented yet")
         
         # Also process keyword abilities from keywordAbilities array for compatibility
-        for keyword in card_data.get("keywordAbilities", []):
-            try:
-                keyword_ability = create_keyword_ability(keyword, character)
-                if keyword_ability:
-                    character.add_composable_ability(keyword_ability)
-            except Exception as e:
-                print(f"Warning: Failed to create keyword ability {keyword} for {character.name}: {e}")
+        for keyword in keyword_abilities:
+            if keyword not in keywords:
+                keywords.add(keyword)
+                builders.append((keyword, lambda card, keyword=keyword: create_keyword_ability(keyword, card)))
+        
+        return AbilityTemplate(tuple(builders))
     
     @staticmethod
     def find_card_by_dreamborn_name(database: List[Dict[str, Any]], dreamborn_name: str) -> Optional[Dict[str, Any]]:
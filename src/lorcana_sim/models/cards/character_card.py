@@ -4,6 +4,8 @@ from dataclasses import dataclass, field
 from typing import List, Optional, TYPE_CHECKING, Dict, Any, Tuple
 
 from .base_card import Card
+from .card_definition import definition_backed
+from .keywords import Keyword, keyword_value, tracked_abilities, tracked_metadata
 
 if TYPE_CHECKING:
     from ..game.game_state import GameState
@@ -12,7 +14,8 @@ if TYPE_CHECKING:
     from ..game.player import Player
 
 
-@dataclass
+@definition_backed
+@dataclass(eq=False)
 class CharacterCard(Card):
     """Represents a character card in Lorcana."""
     
@@ -30,13 +33,6 @@ class CharacterCard(Card):
     is_dry: bool = False  # Ink drying status - False means wet ink (can't act), True means dry (can act)
     location: Optional[str] = None
     
-    def __setattr__(self, name, value):
-        if name == 'damage' and hasattr(self, 'damage'):
-            old_damage = self.damage
-            super().__setattr__(name, value)
-        else:
-            super().__setattr__(name, value)
-    
     # Composable Ability Integration
     composable_abilities: List['ComposableAbility'] = field(default_factory=list)
     controller: Optional['Player'] = None
@@ -46,6 +42,9 @@ class CharacterCard(Card):
     def __post_init__(self) -> None:
         """Validate character card data after creation."""
         super().__post_init__()
+        state = self.__dict__
+        state['composable_abilities'] = tracked_abilities(state['composable_abilities'])
+        state['metadata'] = tracked_metadata(state['metadata'])
         
         if self.strength < 0:
             raise ValueError(f"Character strength cannot be negative: {self.strength}")
@@ -56,6 +55,14 @@ class CharacterCard(Card):
         if self.damage < 0:
             raise ValueError(f"Character damage cannot be negative: {self.damage}")
     
+    def __setattr__(self, name, value):
+        # Replacement ability lists and metadata dicts are tracked for keywords too
+        if name == 'composable_abilities':
+            value = tracked_abilities(value)
+        elif name == 'metadata':
+            value = tracked_metadata(value)
+        super().__setattr__(name, value)
+    
     @property
     def is_alive(self) -> bool:
         """Check if character is still alive (damage < willpower)."""
@@ -124,23 +131,26 @@ class CharacterCard(Card):
         ready_effect.apply(self, {'reason': 'manual_ready'})
     
     
+    @property
+    def keywords(self) -> int:
+        """Keyword bitmask (see Keyword) from abilities and granted properties."""
+        return self.composable_abilities.keyword_mask | self.metadata.keyword_mask
+    
+    def has_keyword(self, keyword: int) -> bool:
+        """Check if character currently has a keyword."""
+        return bool(self.keywords & keyword)
+    
+    def keyword_value(self, keyword: int) -> int:
+        """Value of Singer, Challenger, Resist or Shift (0 if the character doesn't have it)."""
+        return keyword_value(self.composable_abilities, self.metadata, keyword)
+    
     def has_rush_ability(self) -> bool:
-        """Check if character has Rush ability."""
-        # Check composable abilities for Rush
-        for ability in self.composable_abilities:
-            if 'rush' in ability.name.lower():
-                return True
-        # Check metadata set by Rush ability
-        return self.metadata.get('can_challenge_with_wet_ink', False)
+        """Check if character has Rush ability (printed or granted)."""
+        return bool(self.keywords & Keyword.RUSH)
     
     def has_evasive_ability(self) -> bool:
-        """Check if character has Evasive ability."""
-        # Check composable abilities for Evasive
-        for ability in self.composable_abilities:
-            if 'evasive' in ability.name.lower():
-                return True
-        # Check metadata set by temporary effects
-        return self.metadata.get('has_evasive', False)
+        """Check if character has Evasive ability (printed or granted)."""
+        return bool(self.keywords & Keyword.EVASIVE)
     
     def can_quest(self, current_turn: int) -> bool:
         """Check if this character can quest.
@@ -4,9 +4,11 @@ from dataclasses import dataclass
 from typing import Optional
 
 from .base_card import Card
+from .card_definition import definition_backed
 
 
-@dataclass
+@definition_backed
+@dataclass(eq=False)
 class ItemCard(Card):
     """Represents an item card in Lorcana."""
     
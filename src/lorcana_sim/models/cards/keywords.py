@@ -0,0 +1,255 @@
+"""Keyword flags for characters.
+
+Keyword presence used to be found by scanning a character's abilities for a
+substring of their name on every check. Instead, a character's ability list
+and metadata are tracked containers that recompute a ``Keyword`` bitmask (and
+the values of Singer, Challenger, Resist and Shift) whenever they change, so
+hot paths only test bits.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class Keyword:
+    """Keyword ability bits.
+
+    Plain ints rather than an IntFlag: masks are tested on every legal-move
+    query, and IntFlag arithmetic runs in Python.
+    """
+    EVASIVE = 1 << 0
+    BODYGUARD = 1 << 1
+    WARD = 1 << 2
+    RUSH = 1 << 3
+    RECKLESS = 1 << 4
+    SINGER = 1 << 5
+    CHALLENGER = 1 << 6
+    RESIST = 1 << 7
+    SUPPORT = 1 << 8
+    SHIFT = 1 << 9
+    VANISH = 1 << 10
+
+
+_KEYWORD_BITS = {name: bit for name, bit in vars(Keyword).items() if name.isupper()}
+
+
+def keyword_names(mask: int) -> List[str]:
+    """Names of the keywords set in a mask, e.g. ``['EVASIVE', 'SINGER']``."""
+    return [name for name, bit in _KEYWORD_BITS.items() if mask & bit]
+
+
+# Keywords carrying a number, in the order of the values tuple
+VALUED_KEYWORDS = (Keyword.SINGER, Keyword.CHALLENGER, Keyword.RESIST, Keyword.SHIFT)
+NO_VALUES = (0, 0, 0, 0)
+
+# Metadata flags granted by effects (GrantProperty, Bodyguard, temporary modifiers)
+METADATA_KEYWORDS = {
+    'has_evasive': Keyword.EVASIVE,
+    'has_bodyguard': Keyword.BODYGUARD,
+    'has_ward': Keyword.WARD,
+    'has_rush': Keyword.RUSH,
+    'can_challenge_with_wet_ink': Keyword.RUSH,
+    'has_challenger': Keyword.CHALLENGER,
+    'has_resist': Keyword.RESIST,
+    'has_support': Keyword.SUPPORT,
+}
+_METADATA_VALUE_KEYS = {'resist_value'}
+
+_KEYWORD_PATTERN = re.compile(
+    r'\b(evasive|bodyguard|ward|rush|reckless|singer|challenger|resist|support|shift|vanish)\b'
+    r'(?:\s*\+?(\d+))?'
+)
+
+
+@lru_cache(maxsize=None)
+def parse_keyword(ability_name: str) -> Tuple[int, int]:
+    """Keyword bit and value named by an ability name (``(0, 0)`` if none).
+
+    ``"Singer 5"`` -> ``(Keyword.SINGER, 5)``, ``"Challenger +2"`` ->
+    ``(Keyword.CHALLENGER, 2)``, ``"Evasive"`` -> ``(Keyword.EVASIVE, 0)``.
+    """
+    match = _KEYWORD_PATTERN.search(ability_name.lower())
+    if match is None:
+        return 0, 0
+    return _KEYWORD_BITS[match.group(1).upper()], int(match.group(2) or 0)
+
+
+def _combine_value(keyword: int, current: int, value: int) -> int:
+    # Challenger and Resist stack; Singer uses the best value; Shift the cheapest
+    if keyword in (Keyword.CHALLENGER, Keyword.RESIST):
+        return current + value
+    if keyword == Keyword.SHIFT:
+        return min(current, value) if current else value
+    return max(current, value)
+
+
+def abilities_keywords(abilities: Iterable[Any]) -> Tuple[int, Tuple[int, ...]]:
+    """Keyword bitmask and values of a collection of abilities."""
+    mask = 0
+    values = None
+    for ability in abilities:
+        name = getattr(ability, 'name', None)
+        if not name:
+            continue
+        keyword, value = parse_keyword(name)
+        if not keyword:
+            continue
+        mask |= keyword
+        if value and keyword in VALUED_KEYWORDS:
+            if values is None:
+                values = list(NO_VALUES)
+            index = VALUED_KEYWORDS.index(keyword)
+            values[index] = _combine_value(keyword, values[index], value)
+    return mask, tuple(values) if values is not None else NO_VALUES
+
+
+class AbilityList(list):
+    """A character's ability list that keeps its keyword flags current.
+
+    Behaves exactly like a list; every mutation recomputes ``keyword_mask``
+    and ``keyword_values`` (ability lists are short and rarely change).
+    """
+
+    __slots__ = ('keyword_mask', 'keyword_values')
+
+    def __init__(self, abilities: Iterable = ()):
+        super().__init__(abilities)
+        self._refresh()
+
+    def _refresh(self) -> None:
+        self.keyword_mask, self.keyword_values = abilities_keywords(self)
+
+    def append(self, ability) -> None:
+        super().append(ability)
+        self._refresh()
+
+    def extend(self, abilities: Iterable) -> None:
+        super().extend(abilities)
+        self._refresh()
+
+    def __iadd__(self, abilities: Iterable):
+        super().extend(abilities)
+        self._refresh()
+        return self
+
+    def insert(self, index: int, ability) -> None:
+        super().insert(index, ability)
+        self._refresh()
+
+    def remove(self, ability) -> None:
+        super().remove(ability)
+        self._refresh()
+
+    def pop(self, index: int = -1):
+        ability = super().pop(index)
+        self._refresh()
+        return ability
+
+    def clear(self) -> None:
+        super().clear()
+        self._refresh()
+
+    def __setitem__(self, index, value) -> None:
+        super().__setitem__(index, value)
+        self._refresh()
+
+    def __delitem__(self, index) -> None:
+        super().__delitem__(index)
+        self._refresh()
+
+    def copy(self) -> 'AbilityList':
+        copied = AbilityList.__new__(AbilityList)
+        list.extend(copied, self)
+        copied.keyword_mask, copied.keyword_values = self.keyword_mask, self.keyword_values
+        return copied
+
+    def __reduce_ex__(self, protocol):
+        return AbilityList, (list(self),)
+
+
+class CardMetadata(dict):
+    """A character's metadata dict that keeps the keyword flags granted through it current."""
+
+    __slots__ = ('keyword_mask', 'resist_value')
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._refresh()
+
+    def _refresh(self) -> None:
+        mask = 0
+        for key, keyword in METADATA_KEYWORDS.items():
+            if dict.get(self, key):
+                mask |= keyword
+        self.keyword_mask = mask
+        self.resist_value = dict.get(self, 'resist_value', 1) if mask & Keyword.RESIST else 0
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        if key in METADATA_KEYWORDS or key in _METADATA_VALUE_KEYS:
+            self._refresh()
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        if key in METADATA_KEYWORDS or key in _METADATA_VALUE_KEYS:
+            self._refresh()
+
+    def pop(self, key, *default):
+        value = super().pop(key, *default)
+        self._refresh()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._refresh()
+        return item
+
+    def setdefault(self, key, default=None):
+        value = super().setdefault(key, default)
+        self._refresh()
+        return value
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self._refresh()
+
+    def __ior__(self, other):
+        super().update(other)
+        self._refresh()
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self._refresh()
+
+    def copy(self) -> 'CardMetadata':
+        copied = CardMetadata.__new__(CardMetadata)
+        dict.update(copied, self)
+        copied.keyword_mask, copied.resist_value = self.keyword_mask, self.resist_value
+        return copied
+
+    def __reduce_ex__(self, protocol):
+        return CardMetadata, (dict(self),)
+
+
+def keyword_value(abilities: AbilityList, metadata: CardMetadata, keyword: int) -> int:
+    """Value of a numbered keyword from a character's abilities and metadata (0 if absent)."""
+    value = abilities.keyword_values[VALUED_KEYWORDS.index(keyword)]
+    if keyword == Keyword.RESIST and metadata.resist_value:
+        value += metadata.resist_value
+    return value
+
+
+def tracked_abilities(abilities: Optional[Iterable]) -> AbilityList:
+    """``abilities`` as an AbilityList (unchanged if it already is one)."""
+    if abilities.__class__ is AbilityList:
+        return abilities
+    return AbilityList(abilities or ())
+
+
+def tracked_metadata(metadata: Optional[Dict[str, Any]]) -> CardMetadata:
+    """``metadata`` as a CardMetadata (unchanged if it already is one)."""
+    if metadata.__class__ is CardMetadata:
+        return metadata
+    return CardMetadata(metadata or {})
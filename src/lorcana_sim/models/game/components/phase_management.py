@@ -85,8 +85,7 @@ class PhaseManagementComponent:
             effects_to_queue.append(ReadyCharacter(item))  # Reuse same effect
         
         # Ink readying effect
-        exerted_ink_count = sum(1 for card in current_player.inkwell if card.exerted)
-        if exerted_ink_count > 0:
+        if current_player.exerted_ink > 0:
             effects_to_queue.append(ReadyInk())
         
         return effects_to_queue
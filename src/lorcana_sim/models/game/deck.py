@@ -2,7 +2,7 @@
 
 import random
 from dataclasses import dataclass, field
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Optional
 from collections import Counter
 
 from ..cards.base_card import Card
@@ -60,12 +60,16 @@ class Deck:
         
         return len(errors) == 0, errors
     
-    def shuffle(self) -> List[Card]:
-        """Return a shuffled list of all cards in the deck."""
+    def shuffle(self, rng: Optional[random.Random] = None) -> List[Card]:
+        """Return a shuffled list of all cards in the deck.
+        
+        Pass the game's ``rng`` (``GameState.rng``) for a reproducible order;
+        without one the global ``random`` module is used.
+        """
         all_cards = []
         for deck_card in self.cards:
             all_cards.extend([deck_card.card] * deck_card.quantity)
-        random.shuffle(all_cards)
+        (rng or random).shuffle(all_cards)
         return all_cards
     
     def get_color_distribution(self) -> Dict[str, int]:
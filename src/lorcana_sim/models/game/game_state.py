@@ -2,7 +2,8 @@
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional, Tuple, Any, Dict
+import random
+from typing import List, Optional, Tuple, Any, Dict, TYPE_CHECKING
 
 from .player import Player
 from ..cards.location_card import LocationCard
@@ -14,6 +15,9 @@ from .components import (
     TurnManagementComponent
 )
 
+if TYPE_CHECKING:
+    from .snapshot import GameStateSnapshot
+
 
 class Phase(Enum):
     """Lorcana turn phases."""
@@ -66,6 +70,11 @@ class GameState:
     # Last event tracking for inspection
     last_event: Optional[Dict[str, Any]] = None  # The most recent event that occurred
     
+    # Randomness: every shuffle and random choice in the game draws from rng,
+    # so a game is fully determined by its deck lists, seed and policies
+    seed: Optional[int] = None
+    rng: Optional[random.Random] = field(default=None, repr=False, compare=False)
+    
     # Component instances for delegated functionality
     _zone_management: ZoneManagementComponent = field(default_factory=ZoneManagementComponent)
     _cost_modification: CostModificationComponent = field(default_factory=CostModificationComponent)
@@ -79,6 +88,16 @@ class GameState:
             raise ValueError("Game must have at least 2 players")
         if self.current_player_index >= len(self.players):
             raise ValueError("Current player index out of range")
+        if self.rng is None:
+            self.rng = random.Random(self.seed)
+    
+    def spawn_rng(self) -> random.Random:
+        """A new RNG seeded from the game's RNG.
+        
+        Gives a consumer (e.g. one player's policy) its own stream, so how much
+        randomness it uses cannot shift what the rest of the game draws.
+        """
+        return random.Random(self.rng.getrandbits(64))
     
     @property
     def current_player(self) -> Player:
@@ -161,6 +180,9 @@ class GameState:
     
     def notify_card_zone_change(self, card, from_zone_name: Optional[str], to_zone_name: Optional[str]) -> List[Dict]:
         """Notify zone manager of card movement and return any events generated."""
+        event_manager = getattr(self, 'event_manager', None)
+        if event_manager is not None and hasattr(event_manager, 'notify_card_zone_change'):
+            event_manager.notify_card_zone_change(card, from_zone_name, to_zone_name)
         return self._zone_management.notify_card_zone_change(card, from_zone_name, to_zone_name, self)
     
     
@@ -203,6 +225,26 @@ class GameState:
         self.actions_this_turn.append(action_description)
         self._turn_management.record_action(action_description, self)
     
+    # Snapshots for search
+    def snapshot(self) -> 'GameStateSnapshot':
+        """Record the mutable runtime state of the game.
+        
+        Captures zone contents, per-card runtime state (damage, exerted, dry,
+        metadata, granted abilities), lore, turn flags, modifier registries and
+        the position of the game's RNG.
+        Card definitions are shared with the live game, not copied.
+        """
+        from .snapshot import capture_game_state
+        return capture_game_state(self)
+    
+    def restore(self, snapshot: 'GameStateSnapshot') -> None:
+        """Return the game to a state recorded by ``snapshot()``, in place.
+        
+        A snapshot can be restored any number of times.
+        """
+        from .snapshot import restore_game_state
+        restore_game_state(self, snapshot)
+    
     def set_last_event(self, event_type: str, **kwargs) -> None:
         """Set the last event that occurred in the game."""
         import time
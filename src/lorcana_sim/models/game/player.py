@@ -3,11 +3,27 @@
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Set
 from collections import Counter
+import itertools
+import os
+import weakref
 
 from ..cards.base_card import Card, CardColor
 from ..cards.character_card import CharacterCard
 from ..cards.action_card import ActionCard
 from ..cards.item_card import ItemCard
+from .zones import DeckZone, ZoneList
+
+# Attributes holding a player's card zones, in the order zone lookups prefer
+# when the same card object appears in more than one zone.
+ZONE_ATTRIBUTES = ('hand', 'characters_in_play', 'deck', 'discard_pile', 'inkwell', 'items_in_play')
+
+# Zone stamps come from one process-wide counter and are never reused, so a
+# stamp always identifies one particular content of a zone.
+_zone_stamps = itertools.count(1)
+
+# Check the running ink counters against a recount of the inkwell whenever
+# they are read. For tests and debugging; enable with LORCANA_CHECK_INK=1.
+CHECK_INK_COUNTERS = bool(os.environ.get('LORCANA_CHECK_INK'))
 
 
 @dataclass
@@ -28,6 +44,174 @@ class Player:
     # Resources
     lore: int = 0
     
+    def __setattr__(self, name, value):
+        if name in ZONE_ATTRIBUTES:
+            cards = list(value)
+            old_zone = self.__dict__.get(name)
+            if old_zone is not None:
+                old_zone.detach()  # Cards leaving with the old list drop out of the index
+            zone_type = DeckZone if name == 'deck' else ZoneList
+            value = zone_type(self, name, cards)
+        super().__setattr__(name, value)
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_card_zones', None)
+        state.pop('_ink_ready', None)  # Ink counters are rebuilt with the inkwell
+        state.pop('_ink_colors', None)
+        state.pop('_zone_observers', None)  # Observers belong to the live engine
+        return state
+    
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+    
+    # Card -> zone index (maintained by ZoneList)
+    
+    @property
+    def _zone_index(self) -> Dict[int, List[str]]:
+        index = self.__dict__.get('_card_zones')
+        if index is None:
+            index = self.__dict__['_card_zones'] = {}
+        return index
+    
+    def _index_card(self, card: Card, zone: str) -> None:
+        self._zone_index.setdefault(id(card), []).append(zone)
+        self._stamp_zone(zone)
+        if zone == 'inkwell':
+            self._ink_added(card)
+        if self.__dict__.get('_zone_observers'):
+            self._notify_zone_observers(card)
+    
+    def _unindex_card(self, card: Card, zone: str) -> None:
+        index = self._zone_index
+        zones = index.get(id(card))
+        if zones:
+            zones.remove(zone)
+            if not zones:
+                del index[id(card)]
+        self._stamp_zone(zone)
+        if zone == 'inkwell':
+            self._ink_removed(card, still_inked='inkwell' in (zones or ()))
+        if self.__dict__.get('_zone_observers'):
+            self._notify_zone_observers(card)
+    
+    def _stamp_zone(self, zone: str) -> None:
+        stamps = self.__dict__.get('_zone_stamps')
+        if stamps is None:
+            stamps = self.__dict__['_zone_stamps'] = {}
+        stamps[zone] = next(_zone_stamps)
+    
+    def zone_stamp(self, zone: str) -> int:
+        """Stamp that changes whenever a card enters or leaves the given zone.
+        
+        Equal stamps mean the zone holds the same cards in the same order, which
+        lets callers cache anything derived from a zone's contents.
+        """
+        return self.__dict__.get('_zone_stamps', {}).get(zone, 0)
+    
+    def add_zone_observer(self, callback) -> None:
+        """Call ``callback(card)`` whenever a card enters or leaves one of this player's zones.
+        
+        Bound methods are held weakly so observers (e.g. an event manager) do not
+        outlive their engine.
+        """
+        observers = self.__dict__.setdefault('_zone_observers', [])
+        if hasattr(callback, '__self__'):
+            observers.append(weakref.WeakMethod(callback))
+        else:
+            observers.append(lambda: callback)
+    
+    def remove_zone_observer(self, callback) -> None:
+        """Stop notifying a previously added zone observer."""
+        observers = self.__dict__.get('_zone_observers', [])
+        observers[:] = [ref for ref in observers if ref() not in (None, callback)]
+    
+    def _notify_zone_observers(self, card: Card) -> None:
+        observers = self.__dict__['_zone_observers']
+        for ref in list(observers):
+            callback = ref()
+            if callback is None:
+                observers.remove(ref)
+            else:
+                callback(card)
+    
+    # Ink counters (maintained by the inkwell ZoneList and Card.exerted writes)
+    
+    def _ink_color_counts(self) -> Counter:
+        colors = self.__dict__.get('_ink_colors')
+        if colors is None:
+            colors = self.__dict__['_ink_colors'] = Counter()
+        return colors
+    
+    def _add_ink_owner(self, card: Card) -> None:
+        # A tuple, so snapshots (which copy card dicts shallowly) record it by value
+        owners = card.__dict__.get('_ink_owners', ())
+        if not any(owner is self for owner in owners):
+            card.__dict__['_ink_owners'] = owners + (self,)
+    
+    def _ink_added(self, card: Card) -> None:
+        self._add_ink_owner(card)
+        if not card.exerted:
+            self.__dict__['_ink_ready'] = self.__dict__.get('_ink_ready', 0) + 1
+        self._ink_color_counts()[card.color] += 1
+    
+    def _ink_removed(self, card: Card, still_inked: bool) -> None:
+        if not still_inked:
+            owners = card.__dict__.get('_ink_owners', ())
+            card.__dict__['_ink_owners'] = tuple(owner for owner in owners if owner is not self)
+        if not card.exerted:
+            self.__dict__['_ink_ready'] = self.__dict__.get('_ink_ready', 0) - 1
+        colors = self._ink_color_counts()
+        colors[card.color] -= 1
+        if not colors[card.color]:
+            del colors[card.color]
+    
+    def _ink_exerted(self, card: Card, exerted: bool) -> None:
+        # The same object may sit in the inkwell more than once
+        count = self._zone_index.get(id(card), ()).count('inkwell')
+        self.__dict__['_ink_ready'] = self.__dict__.get('_ink_ready', 0) + (-count if exerted else count)
+    
+    def _recount_ink(self) -> None:
+        """Rebuild the ink counters from the inkwell.
+        
+        Needed only after card state was written behind the counters' back
+        (snapshot restore replaces cards' ``__dict__`` wholesale).
+        """
+        colors = self.__dict__['_ink_colors'] = Counter()
+        ready = 0
+        for card in self.inkwell:
+            self._add_ink_owner(card)
+            colors[card.color] += 1
+            if not card.exerted:
+                ready += 1
+        self.__dict__['_ink_ready'] = ready
+    
+    def _check_ink_counters(self) -> None:
+        ready = sum(1 for card in self.inkwell if not card.exerted)
+        colors = Counter(card.color for card in self.inkwell)
+        assert self.__dict__.get('_ink_ready', 0) == ready, \
+            f"{self.name}: ink counter says {self.__dict__.get('_ink_ready', 0)} ready, inkwell has {ready}"
+        assert self._ink_color_counts() == colors, \
+            f"{self.name}: ink colors {dict(self._ink_color_counts())} != inkwell {dict(colors)}"
+    
+    def get_card_zone(self, card: Card) -> Optional[str]:
+        """Get the name of the zone attribute holding this exact card object.
+        
+        O(1) lookup through the card index. Returns None if the card is not in
+        any of this player's zones.
+        """
+        zones = self._zone_index.get(id(card))
+        if not zones:
+            return None
+        if len(zones) == 1:
+            return zones[0]
+        # Same object in several zones (e.g. duplicated deck entries)
+        return min(zones, key=ZONE_ATTRIBUTES.index)
+    
+    def owns_card(self, card: Card) -> bool:
+        """Check if this exact card object is in any of this player's zones."""
+        return id(card) in self._zone_index
     
     @property
     def total_ink(self) -> int:
@@ -36,16 +220,22 @@ class Player:
     
     @property
     def available_ink(self) -> int:
-        """Ink available to spend this turn."""
-        return sum(1 for card in self.inkwell if not card.exerted)
+        """Ink available to spend this turn (ready cards in the inkwell)."""
+        if CHECK_INK_COUNTERS:
+            self._check_ink_counters()
+        return self.__dict__.get('_ink_ready', 0)
+    
+    @property
+    def exerted_ink(self) -> int:
+        """Ink cards exerted this turn."""
+        return len(self.inkwell) - self.available_ink
     
     @property
     def ink_by_color(self) -> Dict[CardColor, int]:
-        """Available ink by color."""
-        ink_colors = Counter()
-        for card in self.inkwell:
-            ink_colors[card.color] += 1
-        return dict(ink_colors)
+        """Inkwell cards by color."""
+        if CHECK_INK_COUNTERS:
+            self._check_ink_counters()
+        return dict(self._ink_color_counts())
     
     @property
     def hand_size(self) -> int:
@@ -59,7 +249,9 @@ class Player:
     
     def can_afford(self, card: Card) -> bool:
         """Check if player can afford to play a card."""
-        return self.available_ink >= card.cost
+        if CHECK_INK_COUNTERS:
+            self._check_ink_counters()
+        return self.__dict__.get('_ink_ready', 0) >= card.cost
     
     def can_afford_with_colors(self, card: Card, required_colors: Dict[CardColor, int] = None) -> bool:
         """Check if player can afford card with color requirements."""
@@ -76,11 +268,10 @@ class Player:
     
     def draw_card(self) -> Optional[Card]:
         """Draw a card from deck to hand."""
-        if self.deck:
-            card = self.deck.pop(0)
+        card = self.deck.draw()
+        if card is not None:
             self.hand.append(card)
-            return card
-        return None
+        return card
     
     def draw_cards(self, count: int) -> List[Card]:
         """Draw multiple cards from deck."""
@@ -140,9 +331,9 @@ class Player:
         Returns:
             List of cards that were exerted as ink.
         """
-        available_cards = [card for card in self.inkwell if not card.exerted]
-        if len(available_cards) < amount:
+        if self.available_ink < amount:
             return []
+        available_cards = [card for card in self.inkwell if not card.exerted]
         
         # Exert the first X available cards
         exerted_cards = []
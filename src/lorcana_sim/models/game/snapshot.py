@@ -0,0 +1,204 @@
+"""Cheap snapshots of a game's mutable runtime state.
+
+Search-based AIs need to branch a game thousands of times per decision.
+``copy.deepcopy`` drags along the event manager, listeners, closures and every
+card's definition data; a snapshot instead records only what play can change
+(zone contents, damage/exerted/dry flags, lore, turn flags, modifiers) and
+restores it in place onto the same card and player objects. Card definition
+data (names, costs, text, printed abilities) is shared, never copied, and
+abilities stay bound to their cards.
+"""
+
+from collections import deque
+from dataclasses import dataclass, fields
+from typing import Any, Dict, List, Tuple, TYPE_CHECKING
+
+from .player import ZONE_ATTRIBUTES
+from ...utils.history import ExecutionHistory
+
+if TYPE_CHECKING:
+    from .game_state import GameState
+    from .player import Player
+
+# Card attributes holding containers that effects mutate in place. Other
+# container attributes (artists, subtypes, printed abilities) are definition
+# data and are shared between snapshots.
+MUTABLE_CARD_CONTAINERS = ('metadata', 'composable_abilities', 'characters')
+
+# GameState attributes that are wiring rather than game state
+_GAME_STATE_EXCLUDED = frozenset({
+    'players', 'event_manager', 'choice_manager', 'rng',
+    '_zone_management', '_cost_modification', '_phase_management',
+    '_game_state_checker', '_turn_management',
+})
+
+
+def copy_runtime_value(value: Any) -> Any:
+    """Copy a runtime value one level deep.
+
+    Containers are copied along with any containers directly inside them
+    (e.g. modifier lists grouped by source); everything else, including cards
+    and effects, is shared.
+    """
+    if isinstance(value, dict):
+        copied = value.copy()
+        for key, item in copied.items():
+            if isinstance(item, (list, dict, set, deque)):
+                copied[key] = copy_runtime_value(item)
+        return copied
+    if isinstance(value, (list, set, deque, ExecutionHistory)):
+        return value.copy()
+    return value
+
+
+def capture_attributes(obj: Any, names) -> Dict[str, Any]:
+    """Record the given attributes of an object, copying containers."""
+    state = obj.__dict__
+    return {name: copy_runtime_value(state[name]) for name in names if name in state}
+
+
+def restore_attributes(obj: Any, saved: Dict[str, Any]) -> None:
+    """Write recorded attributes back, copying again so the snapshot stays reusable."""
+    for name, value in saved.items():
+        setattr(obj, name, copy_runtime_value(value))
+
+
+def _capture_card(card: Any) -> Dict[str, Any]:
+    # A shallow dict copy shares the definition values and is much cheaper than
+    # picking individual runtime fields; only in-place-mutated containers are
+    # copied. Lists are frozen to tuples and empty containers are recorded as
+    # their type, which keeps the common (empty) case allocation-free.
+    state = card.__dict__.copy()
+    for name in MUTABLE_CARD_CONTAINERS:
+        value = state.get(name)
+        if value is None:
+            continue
+        if value.__class__ is list:
+            state[name] = tuple(value)
+        elif not value:
+            state[name] = value.__class__
+        else:
+            state[name] = copy_runtime_value(value)
+    return state
+
+
+def _restore_card(card: Any, state: Dict[str, Any]) -> None:
+    card_dict = card.__dict__
+    card_dict.clear()
+    card_dict.update(state)
+    for name in MUTABLE_CARD_CONTAINERS:
+        value = state.get(name)
+        if value is None:
+            continue
+        if value.__class__ is tuple:
+            card_dict[name] = list(value)
+        elif value.__class__ is type:
+            card_dict[name] = value()
+        else:
+            card_dict[name] = copy_runtime_value(value)
+
+
+def _same_cards(zone: List[Any], saved: Tuple[Any, ...]) -> bool:
+    if len(zone) != len(saved):
+        return False
+    for card, saved_card in zip(zone, saved):
+        if card is not saved_card:
+            return False
+    return True
+
+
+@dataclass
+class PlayerSnapshot:
+    """Recorded zones and scalar state of one player."""
+    player: 'Player'
+    zones: Dict[str, Tuple[Any, ...]]
+    attributes: Dict[str, Any]
+
+
+@dataclass
+class GameStateSnapshot:
+    """Mutable runtime state of a GameState, restorable with ``GameState.restore``."""
+    game_state: 'GameState'
+    attributes: Dict[str, Any]
+    players: List[PlayerSnapshot]
+    cards: List[Tuple[Any, Dict[str, Any]]]
+    managers: List[Tuple[Any, Dict[str, Any]]]
+    rng_state: Any = None
+
+
+def _game_state_attributes(game_state: 'GameState') -> List[str]:
+    return [f.name for f in fields(game_state) if f.name not in _GAME_STATE_EXCLUDED]
+
+
+def _runtime_managers(game_state: 'GameState') -> List[Any]:
+    """Manager instances holding game state (created if not yet used)."""
+    return [game_state.zone_manager, game_state.cost_modification_manager]
+
+
+def capture_game_state(game_state: 'GameState') -> GameStateSnapshot:
+    """Record the mutable runtime state of a game."""
+    players = []
+    cards = []
+    seen = set()
+    for player in game_state.players:
+        zones = {}
+        for zone in ZONE_ATTRIBUTES:
+            zone_cards = tuple(getattr(player, zone))
+            zones[zone] = zone_cards
+            for card in zone_cards:
+                if id(card) not in seen:
+                    seen.add(id(card))
+                    cards.append((card, _capture_card(card)))
+        attributes = {name: copy_runtime_value(value) for name, value in player.__dict__.items()
+                      if name not in ZONE_ATTRIBUTES and not name.startswith('_')}
+        players.append(PlayerSnapshot(player, zones, attributes))
+
+    for location in game_state.locations_in_play:
+        if id(location) not in seen:
+            seen.add(id(location))
+            cards.append((location, _capture_card(location)))
+
+    managers = [(manager, capture_attributes(manager, list(manager.__dict__)))
+                for manager in _runtime_managers(game_state)]
+
+    return GameStateSnapshot(
+        game_state=game_state,
+        attributes=capture_attributes(game_state, _game_state_attributes(game_state)),
+        players=players,
+        cards=cards,
+        managers=managers,
+        rng_state=game_state.rng.getstate(),
+    )
+
+
+def restore_game_state(game_state: 'GameState', snapshot: GameStateSnapshot) -> None:
+    """Put a game back into a recorded state, in place.
+
+    Only zones whose contents changed are rewritten, so the players' zone
+    indexes (and anything observing them) see just the cards that moved.
+    """
+    if snapshot.game_state is not game_state:
+        raise ValueError("Snapshot was taken from a different game state")
+
+    for card, state in snapshot.cards:
+        _restore_card(card, state)
+
+    for player_snapshot in snapshot.players:
+        player = player_snapshot.player
+        for zone, saved_cards in player_snapshot.zones.items():
+            current = getattr(player, zone)
+            if not _same_cards(current, saved_cards):
+                current[:] = saved_cards
+        restore_attributes(player, player_snapshot.attributes)
+        # Card states were swapped in wholesale, bypassing the ink counters
+        player._recount_ink()
+
+    restore_attributes(game_state, snapshot.attributes)
+    for manager, saved in snapshot.managers:
+        restore_attributes(manager, saved)
+        on_restore = getattr(manager, 'on_restore', None)
+        if on_restore is not None:
+            on_restore()
+    # Rewind the RNG in place; policies may hold a reference to it
+    if snapshot.rng_state is not None:
+        game_state.rng.setstate(snapshot.rng_state)
@@ -0,0 +1,297 @@
+"""Zone types that keep their owner's card index in sync."""
+
+import random
+from collections import deque
+from itertools import islice
+from typing import Any, Iterable, List, Optional
+
+
+class _ZoneReporting:
+    """Reports cards entering, leaving or reordering a zone to its owner."""
+
+    __slots__ = ()
+
+    def _added(self, card) -> None:
+        if self.owner is not None:
+            self.owner._index_card(card, self.zone)
+
+    def _removed(self, card) -> None:
+        if self.owner is not None:
+            self.owner._unindex_card(card, self.zone)
+
+    def _reordered(self) -> None:
+        if self.owner is not None:
+            self.owner._stamp_zone(self.zone)
+
+    def detach(self) -> None:
+        """Unindex every card and stop reporting to the owner.
+
+        Called when the owner replaces this zone with a new list; the old list
+        keeps its contents but no longer affects the owner's index.
+        """
+        for card in self:
+            self._removed(card)
+        self.owner = None
+
+
+class ZoneList(_ZoneReporting, list):
+    """A list of cards making up one of a player's zones.
+
+    Behaves exactly like a list, but reports every card that enters or leaves
+    it to the owning player so the player's card -> zone index never drifts,
+    whether cards are moved through Player methods or by mutating the list
+    directly (``player.hand.remove(card)``, ``player.inkwell.clear()``, ...).
+    """
+
+    __slots__ = ('owner', 'zone')
+
+    def __init__(self, owner: Any, zone: str, cards: Iterable = ()):
+        super().__init__()
+        self.owner = owner
+        self.zone = zone
+        self.extend(cards)
+
+    def append(self, card) -> None:
+        super().append(card)
+        self._added(card)
+
+    def extend(self, cards: Iterable) -> None:
+        cards = list(cards)
+        super().extend(cards)
+        for card in cards:
+            self._added(card)
+
+    def __iadd__(self, cards: Iterable):
+        self.extend(cards)
+        return self
+
+    def insert(self, index: int, card) -> None:
+        super().insert(index, card)
+        self._added(card)
+
+    def remove(self, card) -> None:
+        # list.remove matches by equality; unindex the object actually removed
+        removed = super().pop(self.index(card))
+        self._removed(removed)
+
+    def pop(self, index: int = -1):
+        card = super().pop(index)
+        self._removed(card)
+        return card
+
+    def clear(self) -> None:
+        for card in self:
+            self._removed(card)
+        super().clear()
+
+    def __setitem__(self, index, value) -> None:
+        old = self[index] if isinstance(index, slice) else [self[index]]
+        if isinstance(index, slice):
+            value = list(value)
+        super().__setitem__(index, value)
+        for card in old:
+            self._removed(card)
+        for card in (value if isinstance(index, slice) else [value]):
+            self._added(card)
+
+    def __delitem__(self, index) -> None:
+        old = self[index] if isinstance(index, slice) else [self[index]]
+        super().__delitem__(index)
+        for card in old:
+            self._removed(card)
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._reordered()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._reordered()
+
+    def __imul__(self, count: int):
+        extra = list(self) * (count - 1) if count > 0 else []
+        if count <= 0:
+            self.clear()
+        else:
+            self.extend(extra)
+        return self
+
+    def __reduce_ex__(self, protocol):
+        # Pickle/copy as a plain list; the owning Player re-wraps it on restore
+        return (list, (list(self),))
+
+
+class DeckZone(_ZoneReporting):
+    """A player's deck, with the top card at index 0.
+
+    Backed by a deque so drawing from the top (``pop(0)``/``draw``) and putting
+    cards on either end are O(1); a list pays O(n) for every ``pop(0)``.
+    Otherwise it stands in for the list the deck used to be: indexing, slicing
+    (which returns a plain list), iteration, ``in``, ``len`` and the list
+    mutators all work, and it compares equal to a list of the same cards.
+    """
+
+    __slots__ = ('owner', 'zone', '_cards')
+
+    def __init__(self, owner: Any, zone: str, cards: Iterable = ()):
+        self.owner = owner
+        self.zone = zone
+        self._cards = deque()
+        self.extend(cards)
+
+    # Deck operations
+
+    def draw(self) -> Optional[Any]:
+        """Remove and return the top card, or None if the deck is empty."""
+        if not self._cards:
+            return None
+        card = self._cards.popleft()
+        self._removed(card)
+        return card
+
+    def put_on_top(self, card) -> None:
+        """Put a card on top of the deck."""
+        self._cards.appendleft(card)
+        self._added(card)
+
+    def put_on_bottom(self, card) -> None:
+        """Put a card on the bottom of the deck."""
+        self.append(card)
+
+    def peek(self, count: int = 1) -> List[Any]:
+        """The top ``count`` cards, top first, without removing them."""
+        return list(islice(self._cards, max(count, 0)))
+
+    def shuffle(self, rng: Optional[random.Random] = None) -> None:
+        """Shuffle the deck in place, with ``rng`` for reproducible games."""
+        cards = list(self._cards)
+        (rng or random).shuffle(cards)
+        self._cards = deque(cards)
+        self._reordered()
+
+    # List interface
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    def __iter__(self):
+        return iter(self._cards)
+
+    def __reversed__(self):
+        return reversed(self._cards)
+
+    def __contains__(self, card) -> bool:
+        return card in self._cards
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._cards)[index]
+        return self._cards[index]
+
+    def __setitem__(self, index, value) -> None:
+        if not isinstance(index, slice):
+            old = self._cards[index]
+            self._cards[index] = value
+            self._removed(old)
+            self._added(value)
+            return
+        cards = list(self._cards)
+        old = cards[index]
+        value = list(value)
+        cards[index] = value
+        self._cards = deque(cards)
+        for card in old:
+            self._removed(card)
+        for card in value:
+            self._added(card)
+
+    def __delitem__(self, index) -> None:
+        if not isinstance(index, slice):
+            card = self._cards[index]
+            del self._cards[index]
+            self._removed(card)
+            return
+        cards = list(self._cards)
+        old = cards[index]
+        del cards[index]
+        self._cards = deque(cards)
+        for card in old:
+            self._removed(card)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (DeckZone, list, tuple, deque)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __add__(self, other) -> List[Any]:
+        return list(self._cards) + list(other)
+
+    def __iadd__(self, cards: Iterable):
+        self.extend(cards)
+        return self
+
+    def __repr__(self) -> str:
+        return repr(list(self._cards))
+
+    def append(self, card) -> None:
+        self._cards.append(card)
+        self._added(card)
+
+    def extend(self, cards: Iterable) -> None:
+        cards = list(cards)
+        self._cards.extend(cards)
+        for card in cards:
+            self._added(card)
+
+    def insert(self, index: int, card) -> None:
+        self._cards.insert(index, card)
+        self._added(card)
+
+    def remove(self, card) -> None:
+        # Matches by equality like list.remove; unindex the object actually removed
+        index = self._cards.index(card)
+        removed = self._cards[index]
+        del self._cards[index]
+        self._removed(removed)
+
+    def pop(self, index: int = -1):
+        if not self._cards:
+            raise IndexError("pop from empty deck")
+        if index == 0:
+            card = self._cards.popleft()
+        elif index == -1 or index == len(self._cards) - 1:
+            card = self._cards.pop()
+        else:
+            card = self._cards[index]
+            del self._cards[index]
+        self._removed(card)
+        return card
+
+    def clear(self) -> None:
+        for card in self._cards:
+            self._removed(card)
+        self._cards.clear()
+
+    def index(self, card, *args) -> int:
+        return self._cards.index(card, *args)
+
+    def count(self, card) -> int:
+        return self._cards.count(card)
+
+    def copy(self) -> List[Any]:
+        return list(self._cards)
+
+    def sort(self, *args, **kwargs) -> None:
+        cards = sorted(self._cards, *args, **kwargs)
+        self._cards = deque(cards)
+        self._reordered()
+
+    def reverse(self) -> None:
+        self._cards.reverse()
+        self._reordered()
+
+    def __reduce_ex__(self, protocol):
+        # Pickle/copy as a plain list; the owning Player re-wraps it on restore
+        return (list, (list(self._cards),))
@@ -0,0 +1,16 @@
+"""Reinforcement-learning environments: games stepped by action index, in batches.
+
+Needs NumPy (``pip install lorcana-sim[rl]``).
+"""
+
+from .encoding import ActionLayout, encode_actions, encode_observation
+from .env import GameEnv
+from .vec_env import VecGameEnv
+
+__all__ = [
+    "VecGameEnv",
+    "GameEnv",
+    "ActionLayout",
+    "encode_actions",
+    "encode_observation",
+]
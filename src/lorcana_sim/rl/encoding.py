@@ -0,0 +1,172 @@
+"""Fixed-size observation and action encodings for learning agents.
+
+Observations are flat float32 vectors seen from the deciding player's side.
+Actions are indexes into a fixed layout of slots: hand slots for inking and
+playing, in-play slots for questing, challenging and singing, and option
+slots for choices. The legal-action mask marks which indexes the current
+decision accepts. Cards beyond the slot counts are not addressable; a pass is
+always available.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from ..engine.game_messages import ActionRequiredMessage, ChoiceRequiredMessage, GameMessage
+from ..engine.game_moves import GameMove, ChoiceMove, PassMove
+from ..models.game.game_state import Phase
+from ..sim.policies import action_to_move
+
+PHASES = list(Phase)
+
+GLOBAL_FEATURES = 5 + len(PHASES)  # turn, my turn, choice pending, ink played, to-play deck, phase one-hot
+PLAYER_FEATURES = 6  # lore, hand, deck, inkwell, ready ink, discard
+HAND_CARD_FEATURES = 9  # present, cost, strength, willpower, lore, inkable, character, action, item
+IN_PLAY_FEATURES = 7  # present, strength, willpower, lore, damage, exerted, dry
+
+
+@dataclass(frozen=True)
+class ActionLayout:
+    """Slot counts of the action space and of the observation.
+
+    Index layout: 0 = pass, then ink hand[i], play hand[i], quest with
+    in_play[j], challenge in_play[j] -> opponent in_play[k], sing
+    in_play[j] -> hand[i], and finally choice option m.
+    """
+    max_hand: int = 10
+    max_in_play: int = 10
+    max_options: int = 8
+
+    @property
+    def ink_offset(self) -> int:
+        return 1
+
+    @property
+    def play_offset(self) -> int:
+        return self.ink_offset + self.max_hand
+
+    @property
+    def quest_offset(self) -> int:
+        return self.play_offset + self.max_hand
+
+    @property
+    def challenge_offset(self) -> int:
+        return self.quest_offset + self.max_in_play
+
+    @property
+    def sing_offset(self) -> int:
+        return self.challenge_offset + self.max_in_play * self.max_in_play
+
+    @property
+    def choice_offset(self) -> int:
+        return self.sing_offset + self.max_in_play * self.max_hand
+
+    @property
+    def num_actions(self) -> int:
+        return self.choice_offset + self.max_options
+
+    @property
+    def observation_size(self) -> int:
+        return (GLOBAL_FEATURES + 2 * PLAYER_FEATURES + self.max_hand * HAND_CARD_FEATURES
+                + 2 * self.max_in_play * IN_PLAY_FEATURES)
+
+
+def _slots(cards, limit: int) -> Dict[int, int]:
+    return {id(card): slot for slot, card in enumerate(cards[:limit])}
+
+
+def encode_actions(message: GameMessage, player: Any, opponent: Any, layout: ActionLayout,
+                   mask: Any) -> Dict[int, GameMove]:
+    """Mark the legal indexes of a decision in ``mask`` (cleared first).
+
+    Returns:
+        The move for every legal index
+    """
+    mask[:] = False
+    moves: Dict[int, GameMove] = {0: PassMove()}
+    mask[0] = True
+
+    if isinstance(message, ChoiceRequiredMessage):
+        choice = message.choice
+        for slot, option in enumerate(choice.options[:layout.max_options]):
+            index = layout.choice_offset + slot
+            moves[index] = ChoiceMove(choice_id=choice.choice_id, option=option.id)
+            mask[index] = True
+        # A choice is answered, not passed, when it has options
+        if len(moves) > 1:
+            del moves[0]
+            mask[0] = False
+        return moves
+
+    hand = _slots(player.hand, layout.max_hand)
+    in_play = _slots(player.characters_in_play, layout.max_in_play)
+    defenders = None
+    for legal_action in message.legal_actions:
+        action = legal_action.action
+        params = legal_action.parameters
+        index: Optional[int] = None
+        if action == "play_ink":
+            slot = hand.get(id(params.get('card', legal_action.target)))
+            index = None if slot is None else layout.ink_offset + slot
+        elif action in ("play_character", "play_action", "play_item"):
+            slot = hand.get(id(params.get('card', legal_action.target)))
+            index = None if slot is None else layout.play_offset + slot
+        elif action == "quest_character":
+            slot = in_play.get(id(params.get('character', legal_action.target)))
+            index = None if slot is None else layout.quest_offset + slot
+        elif action == "challenge_character":
+            if defenders is None:
+                defenders = _slots(opponent.characters_in_play, layout.max_in_play)
+            attacker, defender = in_play.get(id(params['attacker'])), defenders.get(id(params['defender']))
+            if attacker is not None and defender is not None:
+                index = layout.challenge_offset + attacker * layout.max_in_play + defender
+        elif action == "sing_song":
+            singer, song = in_play.get(id(params['singer'])), hand.get(id(params['song']))
+            if singer is not None and song is not None:
+                index = layout.sing_offset + singer * layout.max_hand + song
+        if index is not None and index not in moves:
+            moves[index] = action_to_move(legal_action)
+            mask[index] = True
+    return moves
+
+
+def encode_observation(game_state: Any, message: GameMessage, player: Any, opponent: Any,
+                       to_play: int, layout: ActionLayout, out: Any) -> None:
+    """Write the deciding player's view of the game into ``out`` (a float32 row)."""
+    out[:] = 0.0
+    out[0] = game_state.turn_number / 50.0
+    out[1] = 1.0 if game_state.current_player is player else 0.0
+    out[2] = 1.0 if isinstance(message, ChoiceRequiredMessage) else 0.0
+    out[3] = 1.0 if game_state.ink_played_this_turn else 0.0
+    out[4] = float(to_play)
+    out[5 + PHASES.index(game_state.current_phase)] = 1.0
+    position = GLOBAL_FEATURES
+
+    for side in (player, opponent):
+        out[position:position + PLAYER_FEATURES] = (
+            side.lore / 20.0, len(side.hand) / 10.0, len(side.deck) / 60.0,
+            len(side.inkwell) / 10.0, side.available_ink / 10.0, len(side.discard_pile) / 60.0)
+        position += PLAYER_FEATURES
+
+    for card in player.hand[:layout.max_hand]:
+        card_type = card.card_type
+        out[position:position + HAND_CARD_FEATURES] = (
+            1.0, card.cost / 10.0, getattr(card, 'strength', 0) / 10.0,
+            getattr(card, 'willpower', 0) / 10.0, getattr(card, 'lore', 0) / 5.0,
+            1.0 if card.inkwell else 0.0, 1.0 if card_type == "Character" else 0.0,
+            1.0 if card_type == "Action" else 0.0, 1.0 if card_type == "Item" else 0.0)
+        position += HAND_CARD_FEATURES
+    position = GLOBAL_FEATURES + 2 * PLAYER_FEATURES + layout.max_hand * HAND_CARD_FEATURES
+
+    for side in (player, opponent):
+        start = position
+        for card in side.characters_in_play[:layout.max_in_play]:
+            out[position:position + IN_PLAY_FEATURES] = (
+                1.0, card.current_strength / 10.0, card.willpower / 10.0, card.current_lore / 5.0,
+                card.damage / 10.0, 1.0 if card.exerted else 0.0, 1.0 if card.is_dry else 0.0)
+            position += IN_PLAY_FEATURES
+        position = start + layout.max_in_play * IN_PLAY_FEATURES
+
+
+def is_decision(message: GameMessage) -> bool:
+    """Whether a message waits for a player's move."""
+    return isinstance(message, (ActionRequiredMessage, ChoiceRequiredMessage))
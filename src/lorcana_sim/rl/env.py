@@ -0,0 +1,124 @@
+"""One game driven one decision at a time by action indexes."""
+
+from typing import Any, Dict, Optional, Tuple
+
+from ..engine.game_messages import ActionRequiredMessage, ChoiceRequiredMessage, GameMessage
+from ..engine.game_moves import GameMove
+from ..sim.runner import BatchRunner
+from .encoding import ActionLayout, encode_actions, encode_observation, is_decision
+
+LEARNER_DECK = 0
+
+
+class GameEnv:
+    """A single game between the runner's two decks, seen by a learning agent.
+
+    The agent plays deck A (the runner's ``deck_a``) and the runner's
+    ``policy_b`` answers deck B's decisions inside ``step``. With
+    ``self_play`` the agent answers every decision, for either deck, and
+    ``to_play`` says whose decision the current observation is.
+
+    Rewards go to the deck that acted: +1 for winning, -1 for losing, 0
+    otherwise, plus ``lore_reward`` times its lore gain minus the opponent's
+    over the step. Games longer than the runner's ``max_messages`` engine
+    steps end without a winner.
+
+    Args:
+        runner: Supplies the decks, the opponent policy and the step limit
+        layout: Action and observation slot counts
+        self_play: Let the agent play both decks
+        lore_reward: Weight of the per-step lore difference in the reward
+    """
+
+    def __init__(self, runner: BatchRunner, layout: Optional[ActionLayout] = None,
+                 self_play: bool = False, lore_reward: float = 0.0):
+        self.runner = runner
+        self.layout = layout or ActionLayout()
+        self.self_play = self_play
+        self.lore_reward = lore_reward
+        self.setup = None
+        self.message: Optional[GameMessage] = None
+        self.to_play = LEARNER_DECK  # Deck index of the decision waiting for the agent
+        self.done = True
+        self._moves: Dict[int, GameMove] = {}
+        self._first_step = 0
+
+    def reset(self, seed: int) -> None:
+        """Deal a new seeded game and run it to the agent's first decision."""
+        self.setup = self.runner.setup_game(seed)
+        self._first_step = self.setup.engine.message_engine.next_message_calls
+        self.done = False
+        self._advance(None)
+
+    def step(self, index: int) -> Tuple[float, bool]:
+        """Answer the pending decision with action ``index``.
+
+        Returns:
+            (reward for the deck that acted, whether the game is over)
+        """
+        move = self._moves.get(index)
+        if move is None:
+            raise ValueError(f"action {index} is not legal in this position")
+        players = self.setup.players
+        acting = self._player_of(self.to_play)
+        opponent = players[1] if acting is players[0] else players[0]
+        lore_before = acting.lore - opponent.lore
+
+        self._advance(move)
+
+        reward = self.lore_reward * ((acting.lore - opponent.lore) - lore_before)
+        if self.done:
+            winner = self.setup.game_state.winner
+            if winner is acting:
+                reward += 1.0
+            elif winner is opponent:
+                reward -= 1.0
+        return reward, self.done
+
+    def write(self, observation: Any, mask: Any) -> None:
+        """Encode the pending decision into an observation row and mask row."""
+        if self.done:
+            observation[:] = 0.0
+            mask[:] = False
+            self._moves = {}
+            return
+        setup = self.setup
+        player = self._player_of(self.to_play)
+        opponent = setup.players[1] if player is setup.players[0] else setup.players[0]
+        self._moves = encode_actions(self.message, player, opponent, self.layout, mask)
+        encode_observation(setup.game_state, self.message, player, opponent, self.to_play,
+                           self.layout, observation)
+
+    def _advance(self, move: Optional[GameMove]) -> None:
+        """Run the game until the agent must decide, playing deck B's turns unless self-playing."""
+        engine, _, _, _, deck_index_of, policy_rngs = self.setup
+        max_messages = self.runner.max_messages
+        while True:
+            steps = engine.message_engine.next_message_calls - self._first_step
+            if steps >= max_messages:
+                break
+            message = engine.advance_until_decision(move, max_steps=max_messages - steps)
+            move = None
+            if not is_decision(message):
+                break
+            if isinstance(message, ChoiceRequiredMessage):
+                chooser = message.choice.player or message.player
+            else:
+                chooser = message.player
+            deck_index = deck_index_of.get(id(chooser), LEARNER_DECK)
+            if self.self_play or deck_index == LEARNER_DECK:
+                self.message, self.to_play = message, deck_index
+                return
+            policy = self.runner.policies[deck_index]
+            if isinstance(message, ActionRequiredMessage):
+                move = policy.choose_action(message, policy_rngs[deck_index])
+                if move is None:
+                    break
+            else:
+                move = policy.choose_option(message, policy_rngs[deck_index])
+        self.message = None
+        self.done = True
+
+    def _player_of(self, deck_index: int) -> Any:
+        seats = self.setup.seats
+        return self.setup.players[seats.index(deck_index)]
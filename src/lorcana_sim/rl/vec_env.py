@@ -0,0 +1,291 @@
+"""Many games stepped in lockstep, with batched NumPy inputs and outputs.
+
+``VecGameEnv`` owns N games and steps them all with one call: actions go in
+as one integer array and observations, rewards, done flags and legal-action
+masks come back as arrays. Finished games are reset to a new seed inside
+``step``. The arrays are allocated once and rewritten in place on every call.
+
+With ``workers``, the games are split into contiguous slices, one per worker
+process. The arrays then live in shared memory: workers read their actions
+from it and write their results into it, so a step only passes one short
+command message per worker.
+"""
+
+import multiprocessing
+import traceback
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..sim.runner import BatchRunner
+from .encoding import ActionLayout
+from .env import GameEnv
+
+# Consecutive games that end before the agent's first decision before an
+# auto-reset gives up and leaves the game done
+MAX_EMPTY_GAMES = 10
+
+
+def _buffer_specs(num_envs: int, layout: ActionLayout) -> Dict[str, Tuple[Tuple[int, ...], Any]]:
+    return {
+        'observations': ((num_envs, layout.observation_size), np.float32),
+        'masks': ((num_envs, layout.num_actions), np.bool_),
+        'rewards': ((num_envs,), np.float32),
+        'dones': ((num_envs,), np.bool_),
+        'to_play': ((num_envs,), np.int8),
+        'actions': ((num_envs,), np.int64),
+    }
+
+
+class _EnvBatch:
+    """A contiguous slice of the games, writing into slices of the shared arrays.
+
+    Game ``i`` of the whole VecGameEnv plays seeds ``seed_i``,
+    ``seed_i + num_envs``, ``seed_i + 2 * num_envs``, ..., so which games are
+    played does not depend on how the games are split between workers.
+    """
+
+    def __init__(self, runner_factory: Callable[[], BatchRunner], count: int, num_envs: int,
+                 env_kwargs: Dict[str, Any], buffers: Dict[str, Any]):
+        self.envs = [GameEnv(runner_factory(), **env_kwargs) for _ in range(count)]
+        self.num_envs = num_envs
+        self.seeds = [0] * count
+        self.buffers = buffers
+
+    def reset(self, seeds: Sequence[int]) -> None:
+        buffers = self.buffers
+        for i, env in enumerate(self.envs):
+            self.seeds[i] = int(seeds[i])
+            self._start(i)
+            buffers['rewards'][i] = 0.0
+            buffers['dones'][i] = False
+
+    def step(self) -> None:
+        buffers = self.buffers
+        actions, rewards, dones = buffers['actions'], buffers['rewards'], buffers['dones']
+        for i, env in enumerate(self.envs):
+            if env.done:
+                reward, done = 0.0, True
+            else:
+                reward, done = env.step(int(actions[i]))
+            rewards[i] = reward
+            dones[i] = done
+            if done:
+                self.seeds[i] += self.num_envs
+                self._start(i)
+            else:
+                env.write(buffers['observations'][i], buffers['masks'][i])
+                buffers['to_play'][i] = env.to_play
+
+    def _start(self, i: int) -> None:
+        """Reset game ``i`` to its current seed (moving past games with no decision)."""
+        env = self.envs[i]
+        for _ in range(MAX_EMPTY_GAMES):
+            env.reset(self.seeds[i])
+            if not env.done:
+                break
+            self.seeds[i] += self.num_envs
+        env.write(self.buffers['observations'][i], self.buffers['masks'][i])
+        self.buffers['to_play'][i] = env.to_play
+
+
+def _worker_main(conn, runner_factory: Callable[[], BatchRunner], start: int, count: int,
+                 num_envs: int, env_kwargs: Dict[str, Any], shm_names: Dict[str, str]) -> None:
+    layout = env_kwargs.get('layout') or ActionLayout()
+    segments, buffers = [], {}
+    for name, (shape, dtype) in _buffer_specs(num_envs, layout).items():
+        segment = shared_memory.SharedMemory(name=shm_names[name])
+        segments.append(segment)
+        buffers[name] = np.ndarray(shape, dtype=dtype, buffer=segment.buf)[start:start + count]
+    batch = None
+    try:
+        try:
+            batch = _EnvBatch(runner_factory, count, num_envs, env_kwargs, buffers)
+        except Exception:
+            conn.send(traceback.format_exc())
+            return
+        conn.send(None)
+        while True:
+            command, payload = conn.recv()
+            if command == 'close':
+                break
+            try:
+                if command == 'reset':
+                    batch.reset(payload)
+                else:
+                    batch.step()
+                conn.send(None)
+            except Exception:
+                conn.send(traceback.format_exc())
+    finally:
+        batch = None
+        buffers.clear()
+        for segment in segments:
+            segment.close()
+        conn.close()
+
+
+class VecGameEnv:
+    """N games between the same two decks, stepped together.
+
+    Each game is a ``GameEnv``: the agent plays deck A, the runner's
+    ``policy_b`` plays deck B (or the agent plays both with ``self_play``).
+
+    Args:
+        runner_factory: Picklable zero-argument callable returning a BatchRunner,
+            e.g. ``functools.partial(BatchRunner, deck_a, deck_b, cards_json_path=...)``;
+            called once per game slot
+        num_envs: Number of games
+        workers: Worker processes to spread the games over (0 = step in this process)
+        layout: Action and observation slot counts
+        self_play: Let the agent answer deck B's decisions too
+        lore_reward: Weight of per-step lore differences in the reward
+        mp_context: Optional multiprocessing context or start method name
+    """
+
+    def __init__(self, runner_factory: Callable[[], BatchRunner], num_envs: int, workers: int = 0,
+                 layout: Optional[ActionLayout] = None, self_play: bool = False,
+                 lore_reward: float = 0.0, mp_context=None):
+        if num_envs <= 0:
+            raise ValueError("num_envs must be positive")
+        self.num_envs = num_envs
+        self.layout = layout or ActionLayout()
+        self.workers = min(max(0, workers), num_envs)
+        env_kwargs = {'layout': self.layout, 'self_play': self_play, 'lore_reward': lore_reward}
+
+        specs = _buffer_specs(num_envs, self.layout)
+        self._segments: List[shared_memory.SharedMemory] = []
+        self._connections = []
+        self._processes = []
+        if self.workers == 0:
+            buffers = {name: np.zeros(shape, dtype=dtype) for name, (shape, dtype) in specs.items()}
+            self._batch = _EnvBatch(runner_factory, num_envs, num_envs, env_kwargs, buffers)
+        else:
+            buffers = {}
+            for name, (shape, dtype) in specs.items():
+                size = max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+                segment = shared_memory.SharedMemory(create=True, size=size)
+                self._segments.append(segment)
+                buffers[name] = np.ndarray(shape, dtype=dtype, buffer=segment.buf)
+                buffers[name].fill(0)
+            self._batch = None
+            self._start_workers(runner_factory, env_kwargs, mp_context)
+        self._buffers = buffers
+
+        self.observations = buffers['observations']
+        self.masks = buffers['masks']
+        self.rewards = buffers['rewards']
+        self.dones = buffers['dones']
+        self.to_play = buffers['to_play']
+        self._actions = buffers['actions']
+
+    @property
+    def num_actions(self) -> int:
+        return self.layout.num_actions
+
+    @property
+    def observation_size(self) -> int:
+        return self.layout.observation_size
+
+    def reset(self, seeds: Optional[Sequence[int]] = None) -> Tuple[Any, Any]:
+        """Start a new game in every slot.
+
+        Args:
+            seeds: One seed per game (default ``0 .. num_envs - 1``)
+
+        Returns:
+            (observations, masks)
+        """
+        seeds = list(range(self.num_envs)) if seeds is None else [int(seed) for seed in seeds]
+        if len(seeds) != self.num_envs:
+            raise ValueError(f"expected {self.num_envs} seeds, got {len(seeds)}")
+        if self._batch is not None:
+            self._batch.reset(seeds)
+        else:
+            for connection, (start, count) in zip(self._connections, self._slices):
+                connection.send(('reset', seeds[start:start + count]))
+            self._wait()
+        return self.observations, self.masks
+
+    def step(self, actions: Sequence[int]) -> Tuple[Any, Any, Any, Any]:
+        """Apply one action per game; finished games restart on their next seed.
+
+        For a game that just ended, the reward and done flag are its last, and
+        the observation and mask already belong to its next game.
+
+        Returns:
+            (observations, rewards, dones, masks), arrays overwritten by the next call
+        """
+        self._actions[:] = actions
+        if self._batch is not None:
+            self._batch.step()
+        else:
+            for connection in self._connections:
+                connection.send(('step', None))
+            self._wait()
+        return self.observations, self.rewards, self.dones, self.masks
+
+    def close(self) -> None:
+        """Stop the workers and free the shared memory."""
+        for connection in self._connections:
+            try:
+                connection.send(('close', None))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self._connections, self._processes = [], []
+        # Views must be dropped before their shared memory can be closed
+        self._buffers = {}
+        self.observations = self.masks = self.rewards = self.dones = self.to_play = self._actions = None
+        for segment in self._segments:
+            try:
+                segment.close()
+            except BufferError:
+                pass  # The caller still holds an array; the mapping goes when it does
+            segment.unlink()
+        self._segments = []
+
+    def __enter__(self) -> 'VecGameEnv':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _start_workers(self, runner_factory: Callable[[], BatchRunner], env_kwargs: Dict[str, Any],
+                       mp_context) -> None:
+        if isinstance(mp_context, str) or mp_context is None:
+            mp_context = multiprocessing.get_context(mp_context)
+        shm_names = {name: segment.name for name, segment in
+                     zip(_buffer_specs(self.num_envs, self.layout), self._segments)}
+        base, extra = divmod(self.num_envs, self.workers)
+        self._slices = []
+        start = 0
+        for worker in range(self.workers):
+            count = base + (1 if worker < extra else 0)
+            self._slices.append((start, count))
+            parent, child = mp_context.Pipe()
+            process = mp_context.Process(
+                target=_worker_main, daemon=True,
+                args=(child, runner_factory, start, count, self.num_envs, env_kwargs, shm_names))
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._processes.append(process)
+            start += count
+        self._wait()
+
+    def _wait(self) -> None:
+        errors = []
+        for connection in self._connections:
+            try:
+                error = connection.recv()
+            except EOFError:
+                error = "worker exited unexpectedly"
+            if error is not None:
+                errors.append(error)
+        if errors:
+            raise RuntimeError("VecGameEnv worker failed:\n" + errors[0])
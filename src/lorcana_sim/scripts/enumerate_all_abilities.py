@@ -10,13 +10,15 @@ This script reads the lorcana-json database and extracts:
 - Creates a checklist format output file
 """
 
-import json
 import re
 from collections import defaultdict, Counter
 from pathlib import Path
 from typing import Dict, List
 from datetime import datetime
 
+from lorcana_sim.loaders.json_cache import load_json
+from lorcana_sim.utils.logging_config import setup_logging
+
 
 class AbilityAnalyzer:
     """Analyzes abilities from Lorcana cards."""
@@ -33,9 +35,7 @@ class AbilityAnalyzer:
         
     def load_data(self):
         """Load the card data from JSON file."""
-        with open(self.data_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            self.cards = data['cards']
+        self.cards = load_json(self.data_path)['cards']
             
     def extract_abilities(self):
         """Extract all abilities from the cards."""
@@ -468,4 +468,5 @@ def main():
 
 
 if __name__ == "__main__":
+    setup_logging()
     main()
\ No newline at end of file
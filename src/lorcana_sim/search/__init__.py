@@ -0,0 +1,15 @@
+"""Search-based players: information-set Monte Carlo tree search over GameEngine."""
+
+from .determinization import determinize, public_state_key
+from .mcts import MCTSPolicy, lore_evaluation, move_key
+from .tree import Node, SearchStats
+
+__all__ = [
+    "MCTSPolicy",
+    "SearchStats",
+    "Node",
+    "determinize",
+    "public_state_key",
+    "lore_evaluation",
+    "move_key",
+]
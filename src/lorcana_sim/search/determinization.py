@@ -0,0 +1,63 @@
+"""Determinization of hidden information for search.
+
+A searching player knows the contents of its own hand and the public zones,
+but not the order of its own deck or which of the opponent's cards are in
+hand rather than in the deck. Each search iteration samples one concrete game
+consistent with what the searcher can see, by redealing those cards in place.
+Deck lists are assumed known, as in tournament play; inkwells are treated as
+public.
+"""
+
+import random
+from typing import Any, Tuple
+
+from ..models.game.player import ZONE_ATTRIBUTES
+
+# Zones whose contents other players cannot see; only their sizes are public
+HIDDEN_ZONES = ('hand', 'deck')
+
+
+def determinize(game_state: Any, observer: Any, rng: random.Random) -> None:
+    """Redeal, in place, every card ``observer`` cannot see.
+
+    The observer's deck is shuffled; every other player's hand and deck are
+    pooled, shuffled and dealt back with the same sizes. Card objects only
+    change zones, so move keys built from card ids stay valid.
+
+    Args:
+        game_state: Game to redeal (usually just restored from a snapshot)
+        observer: The player whose information set is sampled
+        rng: Source of the redeal
+    """
+    for player in game_state.players:
+        if player is observer:
+            deck = list(player.deck)
+            rng.shuffle(deck)
+            player.deck[:] = deck
+        else:
+            hidden = list(player.hand) + list(player.deck)
+            rng.shuffle(hidden)
+            hand_size = len(player.hand)
+            player.hand[:] = hidden[:hand_size]
+            player.deck[:] = hidden[hand_size:]
+
+
+def public_state_key(game_state: Any) -> Tuple:
+    """Hashable summary of everything both players can see.
+
+    Hands and decks contribute only their sizes, so the key is the same in
+    every determinization of a position. Search uses it to find the current
+    position in the tree kept from the previous decision.
+    """
+    players = []
+    for player in game_state.players:
+        zones = []
+        for zone in ZONE_ATTRIBUTES:
+            cards = getattr(player, zone)
+            if zone in HIDDEN_ZONES:
+                zones.append(len(cards))
+            else:
+                zones.append(tuple((card.id, card.exerted, getattr(card, 'damage', 0)) for card in cards))
+        players.append((player.lore, tuple(zones)))
+    return (game_state.turn_number, game_state.current_player_index, game_state.current_phase,
+            game_state.ink_played_this_turn, tuple(players))
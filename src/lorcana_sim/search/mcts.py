@@ -0,0 +1,334 @@
+"""Information-set Monte Carlo tree search over a live GameEngine.
+
+``MCTSPolicy`` answers ActionRequiredMessage and ChoiceRequiredMessage like
+any other MovePolicy, but searches before it answers. Every iteration
+restores the decision point from a snapshot, redeals the cards the deciding
+player cannot see (``determinize``), walks the tree with UCB over the moves
+legal in that deal, adds one node, plays the game out with a fast rollout
+policy and backs the result up. Both players' decisions are in the tree,
+keyed by move, so one tree serves every determinization (single-observer
+ISMCTS).
+
+The search runs on the game's own engine and restores it before returning,
+so the game continues exactly as if no search had happened.
+"""
+
+import math
+import random
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ..engine.game_messages import ActionRequiredMessage, ChoiceRequiredMessage, GameMessage
+from ..engine.game_moves import (
+    GameMove, InkMove, PlayMove, QuestMove, ChallengeMove, SingMove, ChoiceMove
+)
+from ..models.game.game_state import GameResult
+from ..sim.policies import MovePolicy, GreedyPolicy, action_to_move
+from .determinization import determinize, public_state_key
+from .parallel import RootWorkers, fork_available, in_daemon_process, root_totals
+from .tree import MoveKey, Node, SearchStats
+
+LORE_TO_WIN = 20
+
+# Reward for one seat in [0, 1]; the other seat gets 1 minus it
+Evaluator = Callable[[Any, int], float]
+
+# Bound on the nodes scanned when looking for the current position in the previous tree
+REUSE_SCAN_LIMIT = 20000
+
+
+def move_key(move: GameMove) -> MoveKey:
+    """Identify a move by card ids, so it means the same in every determinization."""
+    if isinstance(move, InkMove):
+        return ('ink', move.card.id)
+    elif isinstance(move, PlayMove):
+        return ('play', move.card.id)
+    elif isinstance(move, QuestMove):
+        return ('quest', move.character.id)
+    elif isinstance(move, ChallengeMove):
+        return ('challenge', move.attacker.id, move.defender.id)
+    elif isinstance(move, SingMove):
+        return ('sing', move.singer.id, move.song.id)
+    elif isinstance(move, ChoiceMove):
+        return ('choice', move.option)
+    return (type(move).__name__,)
+
+
+def lore_evaluation(game_state: Any, seat: int) -> float:
+    """1 or 0 for a decided game, 0.5 for a draw, otherwise scaled by lore lead."""
+    players = game_state.players
+    if game_state.winner is not None:
+        return 1.0 if game_state.winner is players[seat] else 0.0
+    if game_state.game_result != GameResult.ONGOING:
+        return 0.5
+    lead = players[seat].lore - players[1 - seat].lore
+    return min(1.0, max(0.0, 0.5 + lead / (2.0 * LORE_TO_WIN)))
+
+
+def _seat(players, player) -> int:
+    return 0 if player is players[0] else 1
+
+
+class MCTSPolicy(MovePolicy):
+    """Move policy that runs ISMCTS on the game's engine before every real decision.
+
+    The runner hands the policy its engine through ``on_game_start``; decisions
+    with a single legal move are answered without searching.
+
+    Args:
+        time_limit: Seconds of search per decision (None = no time limit)
+        iterations: Playouts per decision and process (None = no limit);
+                    at least one of the two budgets must be set
+        exploration: UCB exploration constant (rewards are in [0, 1])
+        rollout_policy: Policy playing out games from new nodes (default GreedyPolicy)
+        max_rollout_turns: Stop playouts after this many turns and score the
+                           position with ``evaluator`` (None = play to the end)
+        evaluator: Reward for a seat in a finished or cut-off playout
+        reuse_tree: Keep the subtree of the chosen move and continue from the
+                    matching position at the player's next decision
+        workers: Processes searching each decision (root parallelism; needs fork).
+                 The extra processes are started once per game and reused for
+                 every decision; ``close()`` stops them. Inside a daemonic
+                 process (e.g. a MatchFarm worker) the search runs in-process
+        max_steps: Safety limit on engine steps between two decisions
+    """
+
+    name = "mcts"
+
+    def __init__(self, time_limit: Optional[float] = 1.0, iterations: Optional[int] = None,
+                 exploration: float = 0.7, rollout_policy: Optional[MovePolicy] = None,
+                 max_rollout_turns: Optional[int] = None, evaluator: Evaluator = lore_evaluation,
+                 reuse_tree: bool = True, workers: int = 1, max_steps: int = 2000):
+        if time_limit is None and iterations is None:
+            raise ValueError("MCTSPolicy needs a time_limit or an iterations budget")
+        if workers > 1 and not fork_available():
+            raise ValueError("root parallelism needs the 'fork' start method")
+        self.time_limit = time_limit
+        self.iterations = iterations
+        self.exploration = exploration
+        self.rollout_policy = rollout_policy or GreedyPolicy()
+        self.max_rollout_turns = max_rollout_turns
+        self.evaluator = evaluator
+        self.reuse_tree = reuse_tree
+        self.workers = max(1, workers)
+        self.max_steps = max_steps
+        self.engine = None
+        self.stats = SearchStats(workers=self.workers)  # Totals over every search
+        self.last_stats: Optional[SearchStats] = None
+        self._trees: Dict[int, Node] = {}  # id(player) -> subtree of that player's last move
+        self._root_workers: Optional[RootWorkers] = None
+
+    def on_game_start(self, engine: Any) -> None:
+        self.close()
+        self.engine = engine
+        self._trees = {}
+        if self._parallel():
+            # Lets the workers forked later in the game catch up with it
+            engine.message_engine.move_log = []
+
+    def close(self) -> None:
+        """Stop the worker processes of root-parallel search, if any."""
+        if self._root_workers is not None:
+            self._root_workers.close()
+            self._root_workers = None
+
+    def __enter__(self) -> 'MCTSPolicy':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Policies are pickled into pool workers (MatchFarm) without their game
+        state = self.__dict__.copy()
+        state['engine'] = None
+        state['_root_workers'] = None
+        return state
+
+    def choose_action(self, message: ActionRequiredMessage, rng: random.Random) -> Optional[GameMove]:
+        if not message.legal_actions:
+            return None
+        return self._decide(message, message.player, rng)
+
+    def choose_option(self, message: ChoiceRequiredMessage, rng: random.Random) -> ChoiceMove:
+        return self._decide(message, message.choice.player or message.player, rng)
+
+    def _decide(self, message: GameMessage, observer: Any, rng: random.Random) -> GameMove:
+        """Search from the engine's current position and return the most visited move."""
+        if self.engine is None:
+            raise RuntimeError("MCTSPolicy needs the game's engine: call on_game_start(engine) first")
+        moves = self._moves(message)
+        if len(moves) == 1:
+            return next(iter(moves.values()))
+
+        start = time.perf_counter()
+        deadline = start + self.time_limit if self.time_limit is not None else None
+        root = self._reused_root(observer) or Node()
+        parallel = self._parallel()
+        stats = SearchStats(decisions=1, reused_visits=root.visits, workers=self.workers if parallel else 1)
+
+        snapshot = self.engine.snapshot()
+        try:
+            if parallel:
+                if self._root_workers is None:
+                    self._root_workers = RootWorkers(self, message, self.workers - 1)
+                stats.playouts, totals = self._root_workers.search(
+                    self, root, message, observer, snapshot, rng, deadline, self.iterations)
+            else:
+                stats.playouts = self._run_iterations(root, message, observer, snapshot, rng,
+                                                      deadline, self.iterations)
+                totals = root_totals(root)
+        finally:
+            self.engine.restore(snapshot)
+
+        def rank(key: MoveKey) -> Tuple[int, float]:
+            visits, reward = totals.get(key, (0, 0.0))
+            return visits, reward / visits if visits else 0.0
+
+        # Most visited, then best average reward
+        best = max(moves, key=rank)
+        if self.reuse_tree and best in root.children:
+            self._trees[id(observer)] = root.children[best]
+
+        stats.elapsed = time.perf_counter() - start
+        self.last_stats = stats
+        self.stats.add(stats)
+        return moves[best]
+
+    def _parallel(self) -> bool:
+        """Whether to search with worker processes (daemonic processes cannot start any)."""
+        return self.workers > 1 and not in_daemon_process()
+
+    def _run_iterations(self, root: Node, message: GameMessage, observer: Any, snapshot: Any,
+                        rng: random.Random, deadline: Optional[float], iterations: Optional[int]) -> int:
+        """Run playouts from ``snapshot`` until the budget is spent (at least one)."""
+        playouts = 0
+        while True:
+            self._iterate(root, message, observer, snapshot, rng)
+            playouts += 1
+            if iterations is not None and playouts >= iterations:
+                return playouts
+            if deadline is not None and time.perf_counter() >= deadline:
+                return playouts
+
+    def _iterate(self, root: Node, message: GameMessage, observer: Any, snapshot: Any,
+                 rng: random.Random) -> None:
+        """One determinize / select / expand / playout / backpropagate pass."""
+        engine = self.engine
+        game_state = engine.game_state
+        players = game_state.players
+        engine.restore(snapshot)
+        game_state.rng.seed(rng.getrandbits(64))
+        determinize(game_state, observer, rng)
+
+        node, path = root, [root]
+        expanded = False
+        while not expanded:
+            decision = self._decision(message)
+            if decision is None:
+                break
+            actor, moves = decision
+            if len(moves) > 1:
+                if actor is observer and node.public_key is None:
+                    node.public_key = public_state_key(game_state)
+                children = node.children
+                untried = []
+                for key in moves:
+                    child = children.get(key)
+                    if child is None:
+                        untried.append(key)
+                    else:
+                        child.availability += 1
+                if untried:
+                    key = untried[rng.randrange(len(untried))]
+                    node = children[key] = Node(key, _seat(players, actor))
+                    expanded = True
+                else:
+                    node = self._select(children, moves)
+                path.append(node)
+                move = moves[node.key]
+            else:
+                move = next(iter(moves.values()))
+            message = engine.advance_until_decision(move, max_steps=self.max_steps)
+
+        rewards = self._rollout(message, rng)
+        for visited in path:
+            visited.visits += 1
+            if visited.player is not None:
+                visited.reward += rewards[visited.player]
+
+    def _select(self, children: Dict[MoveKey, Node], moves: Dict[MoveKey, GameMove]) -> Node:
+        """UCB1 over the children whose moves are legal in this determinization."""
+        exploration = self.exploration
+        best, best_score = None, -1.0
+        for key in moves:
+            child = children[key]
+            score = (child.reward / child.visits
+                     + exploration * math.sqrt(math.log(child.availability) / child.visits))
+            if score > best_score:
+                best, best_score = child, score
+        return best
+
+    def _rollout(self, message: GameMessage, rng: random.Random) -> Tuple[float, float]:
+        """Play the game out with the rollout policy; rewards for seats 0 and 1."""
+        engine = self.engine
+        game_state = engine.game_state
+        policy = self.rollout_policy
+        last_turn = None
+        if self.max_rollout_turns is not None:
+            last_turn = game_state.turn_number + self.max_rollout_turns
+        for _ in range(self.max_steps):
+            if last_turn is not None and game_state.turn_number >= last_turn:
+                break
+            if isinstance(message, ActionRequiredMessage):
+                move = policy.choose_action(message, rng)
+                if move is None:
+                    break
+            elif isinstance(message, ChoiceRequiredMessage):
+                move = policy.choose_option(message, rng)
+            else:
+                break
+            message = engine.advance_until_decision(move, max_steps=self.max_steps)
+        reward = self.evaluator(game_state, 0)
+        return reward, 1.0 - reward
+
+    def _decision(self, message: GameMessage) -> Optional[Tuple[Any, Dict[MoveKey, GameMove]]]:
+        """The deciding player and their moves by key, or None if nobody is to move."""
+        if isinstance(message, ActionRequiredMessage):
+            if not message.legal_actions:
+                return None
+            return message.player, self._moves(message)
+        elif isinstance(message, ChoiceRequiredMessage):
+            return message.choice.player or message.player, self._moves(message)
+        return None
+
+    @staticmethod
+    def _moves(message: GameMessage) -> Dict[MoveKey, GameMove]:
+        """Distinct moves answering a message, by key, in the message's order."""
+        moves = {}
+        if isinstance(message, ChoiceRequiredMessage):
+            choice = message.choice
+            for option in choice.options:
+                moves.setdefault(('choice', option.id), ChoiceMove(choice_id=choice.choice_id, option=option.id))
+        else:
+            for legal_action in message.legal_actions:
+                move = action_to_move(legal_action)
+                moves.setdefault(move_key(move), move)
+        return moves
+
+    def _reused_root(self, observer: Any) -> Optional[Node]:
+        """The node of the previous tree matching the current public position, if any."""
+        previous = self._trees.pop(id(observer), None)
+        if previous is None:
+            return None
+        key = public_state_key(self.engine.game_state)
+        best, stack, scanned = None, [previous], 0
+        while stack and scanned < REUSE_SCAN_LIMIT:
+            node = stack.pop()
+            scanned += 1
+            if node.public_key == key and (best is None or node.visits > best.visits):
+                best = node
+            stack.extend(node.children.values())
+        if best is not None:
+            best.key, best.player = None, None
+        return best
@@ -0,0 +1,181 @@
+"""Root parallelism for MCTS across forked worker processes.
+
+Engines hold closures and listeners that cannot be pickled, so a game cannot
+be sent to a worker. Instead ``RootWorkers`` forks its workers from the game
+at the first decision searched in parallel, and each worker keeps its own
+copy of the engine. At later decisions the parent sends the moves played
+since (as move keys, with the step each was played at, read from the
+engine's ``move_log``); a worker replays them on its copy, checks that it
+reached the same public position, and searches its own tree from a fresh
+root. Only the root children's statistics come back, and the parent adds
+them to its own.
+
+The workers live as long as the game they were forked from.
+"""
+
+import multiprocessing
+import random
+import traceback
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ..engine.game_messages import GameMessage
+from .determinization import public_state_key
+from .tree import MoveKey, Node
+
+# Root statistics a search sends back: {move key: (visits, reward)}
+RootTotals = Dict[MoveKey, Tuple[int, float]]
+
+
+def fork_available() -> bool:
+    """Whether this platform can fork worker processes."""
+    return 'fork' in multiprocessing.get_all_start_methods()
+
+
+def in_daemon_process() -> bool:
+    """Whether this process is daemonic (e.g. a pool worker), so cannot start processes."""
+    return multiprocessing.current_process().daemon
+
+
+def root_totals(root: Node) -> RootTotals:
+    return {key: (child.visits, child.reward) for key, child in root.children.items()}
+
+
+def _advance_to(engine: Any, message: GameMessage, step: int) -> GameMessage:
+    """Run the engine until it has taken ``step`` steps; the last message it returned."""
+    message_engine = engine.message_engine
+    while message_engine.next_message_calls < step:
+        message = engine.advance_until_decision(max_steps=step - message_engine.next_message_calls)
+    return message
+
+
+def _replay(policy: Any, message: GameMessage, moves: Sequence[Tuple[int, MoveKey]],
+            step: int) -> GameMessage:
+    """Play ``moves`` ((step, move key) pairs) on this copy of the game, then run it to ``step``."""
+    engine = policy.engine
+    for move_step, key in moves:
+        message = _advance_to(engine, message, move_step - 1)
+        move = policy._moves(message).get(key)
+        if move is None:
+            raise RuntimeError(f"cannot replay move {key} at step {move_step}: not legal here")
+        message = engine.advance_until_decision(move, max_steps=1)
+    return _advance_to(engine, message, step)
+
+
+def _worker_main(conn, policy: Any, message: GameMessage) -> None:
+    engine = policy.engine
+    engine.message_engine.move_log = None  # Only the parent's game needs one
+    players = engine.game_state.players
+    try:
+        while True:
+            command, payload = conn.recv()
+            if command == 'close':
+                break
+            try:
+                moves, step, public_key, seat, seed, deadline, iterations = payload
+                message = _replay(policy, message, moves, step)
+                if public_state_key(engine.game_state) != public_key:
+                    raise RuntimeError("worker's copy of the game no longer matches the parent's")
+                snapshot = engine.snapshot()
+                root = Node()
+                try:
+                    playouts = policy._run_iterations(root, message, players[seat], snapshot,
+                                                      random.Random(seed), deadline, iterations)
+                finally:
+                    engine.restore(snapshot)
+                conn.send((playouts, root_totals(root)))
+            except Exception:
+                conn.send(traceback.format_exc())
+    finally:
+        conn.close()
+
+
+class RootWorkers:
+    """Worker processes searching alongside one policy for the rest of a game.
+
+    Must be created at a decision point of the policy's engine, and the
+    engine's ``move_log`` must stay enabled for as long as the workers run.
+
+    Args:
+        policy: The MCTSPolicy whose engine the workers copy
+        message: The decision the engine is waiting on
+        count: Number of worker processes
+    """
+
+    def __init__(self, policy: Any, message: GameMessage, count: int):
+        self.engine = policy.engine
+        if self.engine.message_engine.move_log is None:
+            raise RuntimeError("root parallelism needs the engine's move_log")
+        self._sent = len(self.engine.message_engine.move_log)  # Moves the workers already have
+        context = multiprocessing.get_context('fork')
+        self._connections = []
+        self._processes = []
+        for _ in range(count):
+            parent, child = context.Pipe()
+            process = context.Process(target=_worker_main, daemon=True, args=(child, policy, message))
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._processes.append(process)
+
+    def search(self, policy: Any, root: Node, message: GameMessage, observer: Any, snapshot: Any,
+               rng: random.Random, deadline: Optional[float],
+               iterations: Optional[int]) -> Tuple[int, RootTotals]:
+        """Search in this process and every worker under the same budget.
+
+        This process grows ``root`` as in a serial search; the workers' root
+        statistics are only merged into the returned totals.
+
+        Returns:
+            (playouts across all processes, {move key: (visits, reward)} at the root)
+        """
+        from .mcts import move_key
+
+        engine = self.engine
+        game_state = engine.game_state
+        move_log = engine.message_engine.move_log
+        moves = [(step, move_key(move)) for step, move in move_log[self._sent:]]
+        self._sent = len(move_log)
+        seat = 0 if observer is game_state.players[0] else 1
+        position = (moves, engine.message_engine.next_message_calls, public_state_key(game_state), seat)
+        for connection in self._connections:
+            connection.send(('search', position + (rng.getrandbits(64), deadline, iterations)))
+
+        playouts = policy._run_iterations(root, message, observer, snapshot, rng, deadline, iterations)
+        totals = root_totals(root)
+        for worker_playouts, children in self._wait():
+            playouts += worker_playouts
+            for key, (visits, reward) in children.items():
+                total_visits, total_reward = totals.get(key, (0, 0.0))
+                totals[key] = (total_visits + visits, total_reward + reward)
+        return playouts, totals
+
+    def close(self) -> None:
+        """Stop the workers."""
+        for connection in self._connections:
+            try:
+                connection.send(('close', None))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        for connection in self._connections:
+            connection.close()
+        self._connections, self._processes = [], []
+
+    def _wait(self) -> List[Tuple[int, RootTotals]]:
+        results, errors = [], []
+        for connection in self._connections:
+            try:
+                result = connection.recv()
+            except EOFError:
+                result = "worker exited unexpectedly"
+            if isinstance(result, str):
+                errors.append(result)
+            else:
+                results.append(result)
+        if errors:
+            self.close()
+            raise RuntimeError("MCTS worker failed:\n" + errors[0])
+        return results
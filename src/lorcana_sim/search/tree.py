@@ -0,0 +1,73 @@
+"""Search tree nodes and search statistics."""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+MoveKey = Tuple[Hashable, ...]
+
+
+class Node:
+    """One node of an information-set search tree.
+
+    A node stands for the move ``key`` made by seat ``player`` from its
+    parent, across every determinization in which that move was legal.
+    ``reward`` is summed from ``player``'s point of view, and
+    ``availability`` counts the visits to the parent in which the move was
+    legal (the ISMCTS replacement for the parent's visit count).
+    """
+
+    __slots__ = ('key', 'player', 'children', 'visits', 'reward', 'availability', 'public_key')
+
+    def __init__(self, key: Optional[MoveKey] = None, player: Optional[int] = None):
+        self.key = key
+        self.player = player
+        self.children: Dict[MoveKey, 'Node'] = {}
+        self.visits = 0
+        self.reward = 0.0
+        self.availability = 1
+        self.public_key: Optional[Tuple] = None  # Public position when the searcher decides here
+
+    def size(self) -> int:
+        """Number of nodes in this subtree."""
+        count, stack = 0, [self]
+        while stack:
+            node = stack.pop()
+            count += 1
+            stack.extend(node.children.values())
+        return count
+
+    def __repr__(self) -> str:
+        return f"Node({self.key}, visits={self.visits}, reward={self.reward:.1f})"
+
+
+@dataclass
+class SearchStats:
+    """Counters for one or more searches."""
+    decisions: int = 0
+    playouts: int = 0
+    elapsed: float = 0.0  # Wall time spent searching, in seconds
+    reused_visits: int = 0  # Visits inherited from the previous decision's tree
+    workers: int = 1
+
+    @property
+    def playouts_per_second(self) -> float:
+        return self.playouts / self.elapsed if self.elapsed > 0 else 0.0
+
+    def add(self, other: 'SearchStats') -> None:
+        """Fold another search's counters into these."""
+        self.decisions += other.decisions
+        self.playouts += other.playouts
+        self.elapsed += other.elapsed
+        self.reused_visits += other.reused_visits
+        self.workers = max(self.workers, other.workers)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-data view of the counters."""
+        return {
+            'decisions': self.decisions,
+            'playouts': self.playouts,
+            'elapsed': self.elapsed,
+            'playouts_per_second': self.playouts_per_second,
+            'reused_visits': self.reused_visits,
+            'workers': self.workers,
+        }
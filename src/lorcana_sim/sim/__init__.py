@@ -0,0 +1,19 @@
+"""Headless simulation tools for running many games without a UI."""
+
+from .policies import MovePolicy, RandomPolicy, GreedyPolicy, action_to_move
+from .runner import BatchRunner, GameRecord, SimulationSummary, load_deck_factory
+from .farm import MatchFarm
+from .stats import wilson_interval
+
+__all__ = [
+    "MovePolicy",
+    "RandomPolicy",
+    "GreedyPolicy",
+    "action_to_move",
+    "BatchRunner",
+    "GameRecord",
+    "SimulationSummary",
+    "load_deck_factory",
+    "MatchFarm",
+    "wilson_interval",
+]
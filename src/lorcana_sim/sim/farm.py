@@ -0,0 +1,113 @@
+"""Multiprocess match farm for sharding seeded games across worker processes."""
+
+import multiprocessing
+from typing import Callable, Iterable, Iterator, List, Optional
+
+from .runner import BatchRunner, GameRecord, SimulationSummary
+
+# Per-process runner, built once by the pool initializer so each worker loads
+# its card database and deck lists a single time.
+_worker_runner: Optional[BatchRunner] = None
+
+
+def _init_worker(runner_factory: Callable[[], BatchRunner]) -> None:
+    global _worker_runner
+    _worker_runner = runner_factory()
+
+
+def _play_chunk(seeds: List[int]) -> List[GameRecord]:
+    return [_worker_runner.play_game(seed) for seed in seeds]
+
+
+def _chunked(seeds: Iterable[int], chunk_size: int) -> Iterator[List[int]]:
+    chunk = []
+    for seed in seeds:
+        chunk.append(seed)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class MatchFarm:
+    """Plays seeded games on a process pool and streams the results back.
+
+    Records are yielded in seed order no matter how many workers there are, and
+    every game depends only on its seed, so a farm produces bit-identical
+    results for any worker count (including ``workers=0``, which runs inline).
+
+    Args:
+        runner_factory: Picklable zero-argument callable returning a BatchRunner,
+            e.g. ``functools.partial(BatchRunner, deck_a, deck_b, cards_json_path=...)``
+        workers: Number of worker processes (default: CPU count, 0 = run inline)
+        chunk_size: Seeds handed to a worker per task
+        mp_context: Optional multiprocessing context or start method name
+    """
+
+    def __init__(self, runner_factory: Callable[[], BatchRunner], workers: Optional[int] = None,
+                 chunk_size: int = 4, mp_context=None):
+        self.runner_factory = runner_factory
+        self.workers = multiprocessing.cpu_count() if workers is None else workers
+        self.chunk_size = max(1, chunk_size)
+        if isinstance(mp_context, str) or mp_context is None:
+            mp_context = multiprocessing.get_context(mp_context)
+        self.mp_context = mp_context
+
+    def stream(self, seeds: Iterable[int]) -> Iterator[GameRecord]:
+        """Yield one GameRecord per seed, in seed order, as games finish.
+
+        Closing the generator early terminates outstanding work.
+        """
+        if self.workers <= 0:
+            runner = self.runner_factory()
+            for seed in seeds:
+                yield runner.play_game(seed)
+            return
+
+        pool = self.mp_context.Pool(self.workers, initializer=_init_worker,
+                                    initargs=(self.runner_factory,))
+        try:
+            for records in pool.imap(_play_chunk, _chunked(seeds, self.chunk_size)):
+                yield from records
+            pool.close()
+        finally:
+            pool.terminate()
+            pool.join()
+
+    def run(self, seeds: Iterable[int], ci_half_width: Optional[float] = None,
+            confidence: float = 0.95, min_games: int = 30, player_index: int = 0,
+            keep_records: bool = False,
+            on_game: Optional[Callable[[GameRecord], None]] = None) -> SimulationSummary:
+        """Play the seeds and aggregate, optionally stopping once the result is tight.
+
+        The stopping rule is checked after every game in seed order, so where a
+        run stops depends only on the seeds, never on the worker count.
+
+        Args:
+            seeds: Seeds to play, one game each
+            ci_half_width: Stop once the win-rate confidence interval of
+                ``player_index`` is narrower than +/- this value (None = never)
+            confidence: Confidence level of that interval
+            min_games: Never stop before this many games
+            player_index: Deck whose win rate drives early stopping
+            keep_records: Retain every GameRecord on the summary
+            on_game: Optional callback invoked with each GameRecord
+
+        Returns:
+            SimulationSummary over the games that were played
+        """
+        summary = SimulationSummary(keep_records=keep_records)
+        records = self.stream(seeds)
+        try:
+            for record in records:
+                summary.add(record)
+                if on_game:
+                    on_game(record)
+                if ci_half_width is not None and summary.games >= min_games:
+                    low, high = summary.win_rate_interval(player_index, confidence)
+                    if (high - low) / 2.0 <= ci_half_width:
+                        break
+        finally:
+            records.close()
+        return summary
@@ -0,0 +1,149 @@
+"""Move policies used by the headless simulation runner."""
+
+import random
+from typing import List, Optional
+
+from ..engine.game_messages import ActionRequiredMessage, ChoiceRequiredMessage, LegalAction
+from ..engine.game_moves import (
+    GameMove, InkMove, PlayMove, QuestMove, ChallengeMove, SingMove, ChoiceMove, PassMove
+)
+from ..models.game.game_state import Phase
+
+
+def action_to_move(legal_action: LegalAction) -> GameMove:
+    """Convert a LegalAction from an ActionRequiredMessage into a GameMove."""
+    action = legal_action.action
+    params = legal_action.parameters
+
+    if action == "play_ink":
+        return InkMove(card=params.get('card', legal_action.target))
+    elif action in ("play_character", "play_action", "play_item"):
+        return PlayMove(card=params.get('card', legal_action.target))
+    elif action == "quest_character":
+        return QuestMove(character=params.get('character', legal_action.target))
+    elif action == "challenge_character":
+        return ChallengeMove(attacker=params['attacker'], defender=params['defender'])
+    elif action == "sing_song":
+        return SingMove(singer=params['singer'], song=params['song'])
+    else:
+        # progress, pass_turn and anything unknown
+        return PassMove()
+
+
+class MovePolicy:
+    """Base class for pluggable move policies.
+
+    A policy answers the two message types that need a decision. Policies must
+    draw all randomness from the ``rng`` they are handed so that games are
+    reproducible from their seed.
+    """
+
+    name = "policy"
+
+    def on_game_start(self, engine) -> None:
+        """Called with the game's GameEngine before its first decision.
+
+        Heuristic policies only need the messages; search policies keep the
+        engine to explore from the current position.
+        """
+
+    def choose_action(self, message: ActionRequiredMessage, rng: random.Random) -> Optional[GameMove]:
+        """Pick a move for an ActionRequiredMessage."""
+        raise NotImplementedError
+
+    def choose_option(self, message: ChoiceRequiredMessage, rng: random.Random) -> ChoiceMove:
+        """Pick an option for a ChoiceRequiredMessage.
+
+        Defaults to "yes" for yes/no choices and a random non-"none" option otherwise.
+        """
+        choice = message.choice
+        options = list(choice.options)
+
+        if choice.choice_type.value == "yes_no":
+            option_ids = [opt.id for opt in options]
+            selected = "yes" if "yes" in option_ids else option_ids[0]
+        else:
+            candidates = [opt for opt in options if opt.id != "none"]
+            selected = rng.choice(candidates).id if candidates else "none"
+
+        return ChoiceMove(choice_id=choice.choice_id, option=selected)
+
+
+class RandomPolicy(MovePolicy):
+    """Uniformly random legal moves.
+
+    Args:
+        max_ink: Stop inking once the inkwell reaches this size (None = no limit).
+    """
+
+    name = "random"
+
+    def __init__(self, max_ink: Optional[int] = None):
+        self.max_ink = max_ink
+
+    def choose_action(self, message: ActionRequiredMessage, rng: random.Random) -> Optional[GameMove]:
+        legal_actions = message.legal_actions
+        if not legal_actions:
+            return None
+
+        if self.max_ink is not None and message.player.total_ink >= self.max_ink:
+            legal_actions = [a for a in legal_actions if a.action != "play_ink"] or legal_actions
+
+        return action_to_move(rng.choice(legal_actions))
+
+
+class GreedyPolicy(MovePolicy):
+    """Aggressive heuristic policy, the headless version of the example strategy.
+
+    Inks early, develops characters, then challenges and quests whenever it can.
+    """
+
+    name = "greedy"
+
+    def __init__(self, ink_target: int = 5, max_ink: int = 7):
+        self.ink_target = ink_target
+        self.max_ink = max_ink
+
+    def choose_action(self, message: ActionRequiredMessage, rng: random.Random) -> Optional[GameMove]:
+        legal_actions = message.legal_actions
+        if not legal_actions:
+            return None
+
+        player = message.player
+
+        # Auto-progress non-play phases
+        if message.phase != Phase.PLAY:
+            return PassMove()
+
+        by_type = {}
+        for action in legal_actions:
+            by_type.setdefault(action.action, []).append(action)
+
+        if player.total_ink < self.ink_target and by_type.get("play_ink"):
+            return action_to_move(rng.choice(by_type["play_ink"]))
+
+        affordable = [a for a in by_type.get("play_character", []) if player.can_afford(a.target)]
+        if affordable and rng.random() < 0.8:
+            return action_to_move(rng.choice(affordable))
+
+        if by_type.get("challenge_character") and rng.random() < 0.95:
+            return action_to_move(rng.choice(by_type["challenge_character"]))
+
+        if by_type.get("quest_character") and rng.random() < 0.9:
+            return action_to_move(rng.choice(by_type["quest_character"]))
+
+        if affordable:
+            return action_to_move(rng.choice(affordable))
+
+        others = self._non_pass_actions(legal_actions, player)
+        if others:
+            return action_to_move(rng.choice(others))
+
+        return PassMove()
+
+    def _non_pass_actions(self, legal_actions: List[LegalAction], player) -> List[LegalAction]:
+        """Legal actions other than passing, respecting the ink ceiling."""
+        actions = [a for a in legal_actions if a.action not in ("progress", "pass_turn")]
+        if player.total_ink >= self.max_ink:
+            actions = [a for a in actions if a.action != "play_ink"]
+        return actions
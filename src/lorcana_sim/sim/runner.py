@@ -0,0 +1,329 @@
+"""Headless batch runner for simulating many seeded games."""
+
+import random
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from ..engine.game_engine import GameEngine
+from ..engine.game_messages import ActionRequiredMessage, ChoiceRequiredMessage, GameOverMessage
+from ..models.cards.base_card import Card
+from ..models.game.game_state import GameState, GameResult
+from ..models.game.player import Player
+from ..utils.history import HistoryRetention
+from .policies import MovePolicy, GreedyPolicy
+from .stats import wilson_interval
+
+# A deck factory builds a fresh list of card objects for one game.
+# Card ids must be unique within the game; ``id_offset`` keeps the two decks apart.
+DeckFactory = Callable[[int], List[Card]]
+
+STARTING_HAND_SIZE = 7
+
+# Simulated games only need recent history for debugging; bounding it keeps a
+# worker's memory flat regardless of game length.
+SIM_HISTORY_RETENTION = HistoryRetention.ring(100)
+
+
+def load_deck_factory(deck_file_path: str, card_db) -> DeckFactory:
+    """Build a DeckFactory from a dreamborn deck file.
+
+    Card lookups happen once here; each call to the factory only instantiates
+    fresh card objects for a new game. Cards missing from the database are skipped.
+
+    Args:
+        deck_file_path: Path to a dreamborn format deck file
+        card_db: CardDatabase used to resolve card nicknames
+
+    Returns:
+        A DeckFactory producing the deck's cards in list order
+    """
+    from ..loaders.dreamborn_parser import DreambornParser
+
+    deck_info = DreambornParser(deck_file_path).get_deck_info()
+    resolved = []
+    for deck_card in deck_info.cards:
+        card_data = card_db.find_card(deck_card.nickname)
+        if card_data:
+            resolved.extend([card_data] * deck_card.quantity)
+
+    def factory(id_offset: int) -> List[Card]:
+        return [card_db.create_card_object(card_data, id_offset + i)
+                for i, card_data in enumerate(resolved, start=1)]
+
+    return factory
+
+
+class GameSetup(NamedTuple):
+    """A freshly dealt game, as returned by ``BatchRunner.setup_game``."""
+    engine: GameEngine
+    game_state: GameState
+    players: List[Player]  # In seat order
+    seats: List[int]  # seats[i] = deck index sitting in seat i
+    deck_index_of: Dict[int, int]  # id(player) -> deck index
+    policy_rngs: List[random.Random]  # Per deck index
+
+
+@dataclass
+class GameRecord:
+    """Compact outcome of one simulated game.
+
+    Player indices refer to the decks passed to the runner, not to seats.
+    """
+    seed: int
+    winner: Optional[int]
+    result: GameResult
+    turns: int
+    messages: int
+    final_lore: Tuple[int, int]
+    lore_curve: List[Tuple[int, int]] = field(default_factory=list)  # lore at the end of each turn
+    first_player: int = 0
+
+
+@dataclass
+class SimulationSummary:
+    """Running aggregate over simulated games.
+
+    Only counters and per-turn sums are kept, so memory stays flat no matter how
+    many games are added. Set ``keep_records`` to also retain every GameRecord.
+    """
+    games: int = 0
+    wins: List[int] = field(default_factory=lambda: [0, 0])
+    draws: int = 0
+    incomplete: int = 0
+    total_turns: int = 0
+    total_messages: int = 0
+    results: Counter = field(default_factory=Counter)
+    game_lengths: Counter = field(default_factory=Counter)
+    lore_sums: List[List[int]] = field(default_factory=list)  # per turn: [lore_a, lore_b, games]
+    keep_records: bool = False
+    records: List[GameRecord] = field(default_factory=list)
+
+    def add(self, record: GameRecord) -> None:
+        """Fold one game record into the summary."""
+        self.games += 1
+        if record.winner is None:
+            self.draws += 1
+        else:
+            self.wins[record.winner] += 1
+        if record.result == GameResult.ONGOING:
+            self.incomplete += 1
+        self.results[record.result.value] += 1
+        self.total_turns += record.turns
+        self.total_messages += record.messages
+        self.game_lengths[record.turns] += 1
+
+        for turn_index, (lore_a, lore_b) in enumerate(record.lore_curve):
+            if turn_index == len(self.lore_sums):
+                self.lore_sums.append([0, 0, 0])
+            sums = self.lore_sums[turn_index]
+            sums[0] += lore_a
+            sums[1] += lore_b
+            sums[2] += 1
+
+        if self.keep_records:
+            self.records.append(record)
+
+    def merge(self, other: 'SimulationSummary') -> None:
+        """Fold another summary into this one."""
+        self.games += other.games
+        self.wins = [a + b for a, b in zip(self.wins, other.wins)]
+        self.draws += other.draws
+        self.incomplete += other.incomplete
+        self.total_turns += other.total_turns
+        self.total_messages += other.total_messages
+        self.results.update(other.results)
+        self.game_lengths.update(other.game_lengths)
+        for turn_index, sums in enumerate(other.lore_sums):
+            if turn_index == len(self.lore_sums):
+                self.lore_sums.append([0, 0, 0])
+            for i in range(3):
+                self.lore_sums[turn_index][i] += sums[i]
+        if self.keep_records:
+            self.records.extend(other.records)
+
+    def win_rate(self, player_index: int = 0) -> float:
+        """Fraction of games won by the given deck."""
+        return self.wins[player_index] / self.games if self.games else 0.0
+
+    def win_rate_interval(self, player_index: int = 0, confidence: float = 0.95) -> Tuple[float, float]:
+        """Wilson confidence interval on the given deck's win rate."""
+        return wilson_interval(self.wins[player_index], self.games, confidence)
+
+    @property
+    def mean_game_length(self) -> float:
+        """Average number of turns per game."""
+        return self.total_turns / self.games if self.games else 0.0
+
+    def lore_curve(self) -> List[Tuple[float, float]]:
+        """Mean lore of each deck at the end of each turn, over games that reached it."""
+        return [(lore_a / count, lore_b / count) for lore_a, lore_b, count in self.lore_sums]
+
+    def to_dict(self) -> Dict[str, object]:
+        """Plain-data view of the summary."""
+        return {
+            'games': self.games,
+            'wins': list(self.wins),
+            'win_rates': [self.win_rate(0), self.win_rate(1)],
+            'draws': self.draws,
+            'incomplete': self.incomplete,
+            'results': dict(self.results),
+            'mean_game_length': self.mean_game_length,
+            'game_lengths': dict(sorted(self.game_lengths.items())),
+            'lore_curve': self.lore_curve(),
+        }
+
+
+class BatchRunner:
+    """Plays seeded games between two decks without any console output.
+
+    Each game's ``GameState`` is created with the seed, and its RNG drives the
+    shuffles and both policies, so a seed always reproduces the same game.
+
+    Args:
+        deck_a: DeckFactory or dreamborn deck file path for the first deck
+        deck_b: DeckFactory or dreamborn deck file path for the second deck
+        policy_a: Move policy for deck_a (default GreedyPolicy)
+        policy_b: Move policy for deck_b (default GreedyPolicy)
+        cards_json_path: Card database path, required when decks are file paths
+        card_db: Pre-loaded CardDatabase to use instead of cards_json_path
+        max_messages: Safety limit on engine steps (``next_message`` calls) per game
+        alternate_first_player: Let deck_b go first on odd seeds
+        history_retention: Execution history kept per game (default: the last
+                           100 actions; None keeps everything)
+        lean: Run engines in lean mode (default): no execution history or
+              action descriptions, same games
+    """
+
+    def __init__(self, deck_a: Union[str, DeckFactory], deck_b: Union[str, DeckFactory],
+                 policy_a: Optional[MovePolicy] = None, policy_b: Optional[MovePolicy] = None,
+                 cards_json_path: Optional[str] = None, card_db=None,
+                 max_messages: int = 5000, alternate_first_player: bool = True,
+                 history_retention: Optional[HistoryRetention] = SIM_HISTORY_RETENTION,
+                 lean: bool = True):
+        if card_db is None and cards_json_path is not None:
+            from ..loaders.card_database import CardDatabase
+            card_db = CardDatabase.shared(cards_json_path)
+
+        self.deck_factories = [self._as_factory(deck_a, card_db), self._as_factory(deck_b, card_db)]
+        self.policies = [policy_a or GreedyPolicy(), policy_b or GreedyPolicy()]
+        self.max_messages = max_messages
+        self.alternate_first_player = alternate_first_player
+        self.history_retention = history_retention
+        self.lean = lean
+
+    @staticmethod
+    def _as_factory(deck: Union[str, DeckFactory], card_db) -> DeckFactory:
+        if callable(deck):
+            return deck
+        if card_db is None:
+            raise ValueError("cards_json_path or card_db is required to load deck files")
+        return load_deck_factory(deck, card_db)
+
+    def run(self, seeds: Iterable[int], keep_records: bool = False,
+            on_game: Optional[Callable[[GameRecord], None]] = None) -> SimulationSummary:
+        """Play one game per seed and aggregate the results.
+
+        Args:
+            seeds: Seeds to play, one game each
+            keep_records: Retain every GameRecord on the summary
+            on_game: Optional callback invoked with each finished GameRecord
+
+        Returns:
+            SimulationSummary over all games
+        """
+        summary = SimulationSummary(keep_records=keep_records)
+        for seed in seeds:
+            record = self.play_game(seed)
+            summary.add(record)
+            if on_game:
+                on_game(record)
+        return summary
+
+    def run_games(self, n_games: int, start_seed: int = 0, **kwargs) -> SimulationSummary:
+        """Play ``n_games`` games with consecutive seeds starting at ``start_seed``."""
+        return self.run(range(start_seed, start_seed + n_games), **kwargs)
+
+    def setup_game(self, seed: int) -> GameSetup:
+        """Deal a seeded game and start its engine, ready for the first decision."""
+        first = 1 if (self.alternate_first_player and seed % 2) else 0
+        seats = [first, 1 - first]  # seats[i] = deck index sitting in seat i
+
+        players = [Player(f"Player {deck_index + 1}") for deck_index in seats]
+        game_state = GameState(players, seed=seed)
+        for player, deck_index in zip(players, seats):
+            player.deck = self.deck_factories[deck_index]((deck_index + 1) * 100000)
+            player.deck.shuffle(game_state.rng)
+            for _ in range(STARTING_HAND_SIZE):
+                if player.deck:
+                    player.hand.append(player.deck.pop(0))
+
+        # Separate streams per deck keep policies from perturbing each other
+        policy_rngs = [game_state.spawn_rng(), game_state.spawn_rng()]
+        deck_index_of = {id(players[seat]): deck_index for seat, deck_index in enumerate(seats)}
+
+        engine = GameEngine(game_state, history_retention=self.history_retention, lean=self.lean)
+        engine.start_game()
+        for policy in self.policies:
+            policy.on_game_start(engine)
+        return GameSetup(engine, game_state, players, seats, deck_index_of, policy_rngs)
+
+    def play_game(self, seed: int) -> GameRecord:
+        """Play a single seeded game to completion and return its record."""
+        engine, game_state, players, seats, deck_index_of, policy_rngs = self.setup_game(seed)
+        first = seats[0]
+
+        lore_curve = []
+        last_turn = game_state.turn_number
+        messages = 0
+        move = None
+        first_step = engine.message_engine.next_message_calls
+
+        # Steps between decisions run inside the engine; stopping at each new
+        # turn keeps the lore curve sampled exactly where turns change
+        while messages < self.max_messages:
+            message = engine.advance_until_decision(
+                move, max_steps=self.max_messages - messages, stop_on_new_turn=True)
+            move = None
+            messages = engine.message_engine.next_message_calls - first_step
+
+            if game_state.turn_number != last_turn:
+                lore_curve.append(self._lore_by_deck(players, seats))
+                last_turn = game_state.turn_number
+
+            if isinstance(message, GameOverMessage):
+                break
+            elif isinstance(message, ActionRequiredMessage):
+                deck_index = deck_index_of[id(message.player)]
+                move = self.policies[deck_index].choose_action(message, policy_rngs[deck_index])
+                if move is None:
+                    break
+            elif isinstance(message, ChoiceRequiredMessage):
+                chooser = message.choice.player or message.player
+                deck_index = deck_index_of.get(id(chooser), 0)
+                move = self.policies[deck_index].choose_option(message, policy_rngs[deck_index])
+
+        final_lore = self._lore_by_deck(players, seats)
+        lore_curve.append(final_lore)
+
+        winner = None
+        if game_state.winner is not None:
+            winner = deck_index_of.get(id(game_state.winner))
+
+        return GameRecord(
+            seed=seed,
+            winner=winner,
+            result=game_state.game_result,
+            turns=game_state.turn_number,
+            messages=messages,
+            final_lore=final_lore,
+            lore_curve=lore_curve,
+            first_player=first,
+        )
+
+    @staticmethod
+    def _lore_by_deck(players: List[Player], seats: List[int]) -> Tuple[int, int]:
+        lore = [0, 0]
+        for seat, deck_index in enumerate(seats):
+            lore[deck_index] = players[seat].lore
+        return lore[0], lore[1]
@@ -0,0 +1,32 @@
+"""Small statistics helpers for simulation results."""
+
+import math
+from statistics import NormalDist
+from typing import Tuple
+
+
+def z_score(confidence: float) -> float:
+    """Two-sided z value for a confidence level (e.g. 0.95 -> 1.96)."""
+    return NormalDist().inv_cdf(0.5 + confidence / 2.0)
+
+
+def wilson_interval(successes: int, trials: int, confidence: float = 0.95) -> Tuple[float, float]:
+    """Wilson score interval for a binomial proportion.
+
+    Args:
+        successes: Number of successes (e.g. games won)
+        trials: Number of trials (games played)
+        confidence: Confidence level of the interval
+
+    Returns:
+        (low, high) bounds; (0.0, 1.0) when there are no trials
+    """
+    if trials <= 0:
+        return 0.0, 1.0
+
+    z = z_score(confidence)
+    p = successes / trials
+    denominator = 1.0 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denominator
+    half_width = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, centre - half_width), min(1.0, centre + half_width)
@@ -1,5 +1,18 @@
 """Utility modules for Lorcana simulation."""
 
-from .deck_builder import DeckBuilder
+from importlib import import_module
 
-__all__ = ["DeckBuilder"]
\ No newline at end of file
+from .history import ExecutionHistory, HistoryMode, HistoryRetention
+from .logging_config import DispatchRecord, disable_tracing, enable_tracing
+
+# Imported on first access: DeckBuilder pulls in the card and game models
+_LAZY = {"DeckBuilder": ".deck_builder"}
+
+__all__ = ["DeckBuilder", "ExecutionHistory", "HistoryMode", "HistoryRetention",
+           "DispatchRecord", "enable_tracing", "disable_tracing"]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        return getattr(import_module(_LAZY[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -61,16 +61,25 @@ class DeckBuilder:
                 self._cards_by_type[card.card_type].append(card)
         return self._cards_by_type
     
-    def build_random_deck(self, deck_name: str = "Random Deck", seed: Optional[int] = None) -> Optional[Deck]:
+    @staticmethod
+    def _rng(seed: Optional[int], rng: Optional[random.Random]) -> random.Random:
+        """The RNG a build draws from: the one passed in, else a fresh one from ``seed``.
+        
+        Builds never touch the global ``random`` state, so concurrent builds
+        (or a game running alongside) cannot perturb each other.
+        """
+        return rng if rng is not None else random.Random(seed)
+    
+    def build_random_deck(self, deck_name: str = "Random Deck", seed: Optional[int] = None,
+                          rng: Optional[random.Random] = None) -> Optional[Deck]:
         """Build a completely random legal deck."""
-        if seed is not None:
-            random.seed(seed)
+        rng = self._rng(seed, rng)
         
         if len(self.cards) < 15:
             return None
         
         # Select 15 random unique cards
-        selected_cards = random.sample(self.cards, 15)
+        selected_cards = rng.sample(self.cards, 15)
         
         deck = Deck(deck_name)
         for card in selected_cards:
@@ -79,10 +88,10 @@ class DeckBuilder:
         return deck
     
     def build_mono_color_deck(self, color: CardColor, deck_name: Optional[str] = None, 
-                             seed: Optional[int] = None) -> Optional[Deck]:
+                              seed: Optional[int] = None,
+                              rng: Optional[random.Random] = None) -> Optional[Deck]:
         """Build a deck focusing on a single color."""
-        if seed is not None:
-            random.seed(seed)
+        rng = self._rng(seed, rng)
         
         if deck_name is None:
             deck_name = f"{color.value} Deck"
@@ -92,7 +101,7 @@ class DeckBuilder:
             return None
         
         # Select cards with preference for characters and good curve
-        selected_cards = self._select_balanced_cards(available_cards, 15)
+        selected_cards = self._select_balanced_cards(available_cards, 15, rng)
         
         deck = Deck(deck_name)
         for card in selected_cards:
@@ -101,10 +110,10 @@ class DeckBuilder:
         return deck
     
     def build_aggro_deck(self, primary_color: CardColor, deck_name: Optional[str] = None,
-                        seed: Optional[int] = None) -> Optional[Deck]:
+                         seed: Optional[int] = None,
+                         rng: Optional[random.Random] = None) -> Optional[Deck]:
         """Build an aggressive deck focused on low-cost characters."""
-        if seed is not None:
-            random.seed(seed)
+        rng = self._rng(seed, rng)
         
         if deck_name is None:
             deck_name = f"{primary_color.value} Aggro"
@@ -122,8 +131,8 @@ class DeckBuilder:
         deck = Deck(deck_name)
         
         # Build with aggressive curve: lots of 1-3 cost, some 4-6 cost
-        selected_low = random.sample(low_cost_cards, min(10, len(low_cost_cards)))
-        selected_mid = random.sample(mid_cost_cards, min(5, len(mid_cost_cards)))
+        selected_low = rng.sample(low_cost_cards, min(10, len(low_cost_cards)))
+        selected_mid = rng.sample(mid_cost_cards, min(5, len(mid_cost_cards)))
         
         # Add cards with varying quantities for realistic distribution
         for i, card in enumerate(selected_low):
@@ -134,15 +143,15 @@ class DeckBuilder:
             deck.add_card(card, 2)  # Fewer high-cost cards
         
         # Fill to 60 if needed
-        self._fill_deck_to_60(deck, available_cards)
+        self._fill_deck_to_60(deck, available_cards, rng)
         
         return deck
     
     def build_control_deck(self, primary_color: CardColor, deck_name: Optional[str] = None,
-                          seed: Optional[int] = None) -> Optional[Deck]:
+                           seed: Optional[int] = None,
+                           rng: Optional[random.Random] = None) -> Optional[Deck]:
         """Build a control deck focused on high-value cards and card advantage."""
-        if seed is not None:
-            random.seed(seed)
+        rng = self._rng(seed, rng)
         
         if deck_name is None:
             deck_name = f"{primary_color.value} Control"
@@ -159,8 +168,8 @@ class DeckBuilder:
         deck = Deck(deck_name)
         
         # Control curve: some early game, focus on late game
-        selected_low = random.sample(low_cost_cards, min(5, len(low_cost_cards)))
-        selected_high = random.sample(high_cost_cards, min(8, len(high_cost_cards)))
+        selected_low = rng.sample(low_cost_cards, min(5, len(low_cost_cards)))
+        selected_high = rng.sample(high_cost_cards, min(8, len(high_cost_cards)))
         
         # Add fewer copies of high-cost cards
         for card in selected_low:
@@ -171,15 +180,15 @@ class DeckBuilder:
             deck.add_card(card, quantity)
         
         # Fill to 60
-        self._fill_deck_to_60(deck, available_cards)
+        self._fill_deck_to_60(deck, available_cards, rng)
         
         return deck
     
     def build_character_tribal_deck(self, subtype: str, deck_name: Optional[str] = None,
-                                   seed: Optional[int] = None) -> Optional[Deck]:
+                                    seed: Optional[int] = None,
+                                    rng: Optional[random.Random] = None) -> Optional[Deck]:
         """Build a deck focused on a specific character subtype."""
-        if seed is not None:
-            random.seed(seed)
+        rng = self._rng(seed, rng)
         
         if deck_name is None:
             deck_name = f"{subtype} Tribal"
@@ -196,7 +205,7 @@ class DeckBuilder:
         deck = Deck(deck_name)
         
         # Add tribal characters
-        selected_tribal = random.sample(tribal_characters, min(12, len(tribal_characters)))
+        selected_tribal = rng.sample(tribal_characters, min(12, len(tribal_characters)))
         for i, card in enumerate(selected_tribal):
             quantity = 4 if i < 6 else 3
             deck.add_card(card, quantity)
@@ -208,20 +217,20 @@ class DeckBuilder:
         if support_cards:
             remaining_slots = 60 - deck.total_cards
             if remaining_slots > 0:
-                support_selection = random.sample(support_cards, min(remaining_slots // 2, len(support_cards)))
+                support_selection = rng.sample(support_cards, min(remaining_slots // 2, len(support_cards)))
                 for card in support_selection:
                     deck.add_card(card, 2)
         
         # Fill to 60
-        self._fill_deck_to_60(deck, self.cards)
+        self._fill_deck_to_60(deck, self.cards, rng)
         
         return deck
     
     def build_balanced_deck(self, primary_colors: List[CardColor], deck_name: Optional[str] = None,
-                           seed: Optional[int] = None) -> Optional[Deck]:
+                            seed: Optional[int] = None,
+                            rng: Optional[random.Random] = None) -> Optional[Deck]:
         """Build a balanced deck with good curve and color distribution."""
-        if seed is not None:
-            random.seed(seed)
+        rng = self._rng(seed, rng)
         
         if deck_name is None:
             color_names = "-".join([c.value for c in primary_colors])
@@ -254,16 +263,17 @@ class DeckBuilder:
         
         for card_pool, num_cards, copies in selections:
             if len(card_pool) >= num_cards:
-                selected = random.sample(card_pool, num_cards)
+                selected = rng.sample(card_pool, num_cards)
                 for card in selected:
                     deck.add_card(card, copies)
         
         # Fill remaining slots
-        self._fill_deck_to_60(deck, available_cards)
+        self._fill_deck_to_60(deck, available_cards, rng)
         
         return deck
     
-    def _select_balanced_cards(self, available_cards: List[Card], count: int) -> List[Card]:
+    def _select_balanced_cards(self, available_cards: List[Card], count: int,
+                               rng: random.Random) -> List[Card]:
         """Select cards with balanced cost distribution."""
         if len(available_cards) <= count:
             return available_cards[:count]
@@ -285,18 +295,18 @@ class DeckBuilder:
             
             available_at_cost = by_cost[cost]
             take = min(per_cost, len(available_at_cost), count - len(selected))
-            selected.extend(random.sample(available_at_cost, take))
+            selected.extend(rng.sample(available_at_cost, take))
         
         # Fill remaining slots randomly
         while len(selected) < count:
             remaining = [c for c in available_cards if c not in selected]
             if not remaining:
                 break
-            selected.append(random.choice(remaining))
+            selected.append(rng.choice(remaining))
         
         return selected[:count]
     
-    def _fill_deck_to_60(self, deck: Deck, available_cards: List[Card]) -> None:
+    def _fill_deck_to_60(self, deck: Deck, available_cards: List[Card], rng: random.Random) -> None:
         """Fill a deck to exactly 60 cards."""
         while deck.total_cards < 60:
             # Try to add more copies of existing cards first
@@ -313,7 +323,7 @@ class DeckBuilder:
                 unused_cards = [c for c in available_cards if c.id not in used_ids]
                 
                 if unused_cards:
-                    new_card = random.choice(unused_cards)
+                    new_card = rng.choice(unused_cards)
                     remaining_slots = 60 - deck.total_cards
                     quantity = min(4, remaining_slots)
                     deck.add_card(new_card, quantity)
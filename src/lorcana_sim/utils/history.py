@@ -0,0 +1,141 @@
+"""Retention policies for execution and debugging history.
+
+The action queue records every executed action and the zone manager records
+card transitions. Interactive games and tests like having all of it around,
+but a simulation worker playing thousands of games should not hold every
+effect ever executed. ``HistoryRetention`` says what to keep and
+``ExecutionHistory`` applies it.
+"""
+
+import json
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Iterator, List, Optional
+
+
+class HistoryMode(Enum):
+    """How much history to retain."""
+    KEEP_ALL = "keep_all"  # Unbounded list (legacy behaviour)
+    RING = "ring"          # Only the most recent ``max_entries``
+    OFF = "off"            # Nothing is kept
+    SPILL = "spill"        # Every entry is written to a file; the most recent ``max_entries`` stay in memory
+
+
+@dataclass(frozen=True)
+class HistoryRetention:
+    """Retention policy for an ExecutionHistory."""
+    mode: HistoryMode = HistoryMode.KEEP_ALL
+    max_entries: int = 0
+    spill_path: Optional[str] = None
+
+    def __post_init__(self):
+        if self.max_entries < 0:
+            raise ValueError("max_entries cannot be negative")
+        if self.mode == HistoryMode.SPILL and not self.spill_path:
+            raise ValueError("SPILL retention requires a spill_path")
+
+    @classmethod
+    def keep_all(cls) -> 'HistoryRetention':
+        return cls(HistoryMode.KEEP_ALL)
+
+    @classmethod
+    def ring(cls, max_entries: int) -> 'HistoryRetention':
+        return cls(HistoryMode.RING, max_entries)
+
+    @classmethod
+    def off(cls) -> 'HistoryRetention':
+        return cls(HistoryMode.OFF)
+
+    @classmethod
+    def spill(cls, path: str, max_entries: int = 0) -> 'HistoryRetention':
+        return cls(HistoryMode.SPILL, max_entries, path)
+
+
+def _identity(entry: Any) -> Any:
+    return entry
+
+
+class ExecutionHistory:
+    """Append-only history that keeps only what its retention policy allows.
+
+    Args:
+        retention: What to keep (default: everything)
+        serializer: Converts an entry to JSON-compatible data for SPILL mode
+                    (default: the entry itself; values JSON can't encode are written as ``str``)
+    """
+
+    def __init__(self, retention: Optional[HistoryRetention] = None,
+                 serializer: Optional[Callable[[Any], Any]] = None):
+        self.retention = retention or HistoryRetention.keep_all()
+        self.serializer = serializer or _identity
+        self.recorded = 0  # Entries ever appended, including ones no longer retained
+        self._spill_file = None
+        mode = self.retention.mode
+        if mode == HistoryMode.KEEP_ALL:
+            self._entries = []
+        elif mode == HistoryMode.OFF:
+            self._entries = deque(maxlen=0)
+        else:
+            self._entries = deque(maxlen=self.retention.max_entries)
+
+    def append(self, entry: Any) -> None:
+        """Record an entry."""
+        self.recorded += 1
+        self._entries.append(entry)
+        if self.retention.mode == HistoryMode.SPILL:
+            if self._spill_file is None:
+                self._spill_file = open(self.retention.spill_path, 'a', encoding='utf-8')
+            self._spill_file.write(json.dumps(self.serializer(entry), default=str) + "\n")
+
+    def recent(self, limit: int) -> List[Any]:
+        """The most recent ``limit`` retained entries, oldest first."""
+        if limit <= 0:
+            return []
+        entries = self._entries
+        if isinstance(entries, list):
+            return entries[-limit:]
+        return list(entries)[-limit:]
+
+    def rollback(self, recorded: int) -> None:
+        """Forget retained entries appended after ``recorded`` entries had been recorded.
+
+        Used when a game is restored from a snapshot. Entries already spilled to
+        disk are not rewritten.
+        """
+        for _ in range(min(self.recorded - recorded, len(self._entries))):
+            self._entries.pop()
+        self.recorded = min(self.recorded, recorded)
+
+    def clear(self) -> None:
+        """Drop all retained entries."""
+        self._entries.clear()
+
+    def close(self) -> None:
+        """Close the spill file, if one is open."""
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
+    def copy(self) -> 'ExecutionHistory':
+        """Independent copy of the retained entries, sharing the policy and spill file."""
+        copied = ExecutionHistory.__new__(ExecutionHistory)
+        copied.__dict__.update(self.__dict__)
+        copied._entries = self._entries.copy()
+        return copied
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._entries)
+
+    def __getitem__(self, index):
+        if isinstance(self._entries, list) or not isinstance(index, slice):
+            return self._entries[index]
+        return list(self._entries)[index]
+
+    def __repr__(self) -> str:
+        return (f"ExecutionHistory({self.retention.mode.value}, retained={len(self)}, "
+                f"recorded={self.recorded})")
+
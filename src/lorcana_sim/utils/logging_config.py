@@ -1,18 +1,29 @@
 """Logging configuration for Lorcana Sim."""
 
 import logging
+import os
 import sys
-from typing import Optional
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
 
 
-def setup_logging(level: str = "INFO", format_style: str = "simple") -> None:
+LOG_LEVEL_ENV_VAR = "LORCANA_LOG_LEVEL"
+
+
+def setup_logging(level: Optional[str] = None, format_style: str = "simple") -> None:
     """
     Set up logging configuration for the entire application.
     
+    Importing lorcana_sim does not call this; entry points (scripts, examples)
+    do.
+    
     Args:
-        level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL); defaults
+               to $LORCANA_LOG_LEVEL, else INFO
         format_style: Format style - "simple", "detailed", or "json"
     """
+    if level is None:
+        level = os.getenv(LOG_LEVEL_ENV_VAR, "INFO")
     # Convert string level to logging constant
     numeric_level = getattr(logging, level.upper(), logging.INFO)
     
@@ -70,4 +81,82 @@ def get_game_logger(module_name: str) -> logging.Logger:
     else:
         short_name = module_name
     
-    return logging.getLogger(short_name)
\ No newline at end of file
+    return logging.getLogger(short_name)
+
+# =============================================================================
+# DISPATCH TRACING
+# =============================================================================
+#
+# Structured records of event dispatch (which ability was consulted for which
+# event, from which zone, and whether it triggered). Dispatch only checks
+# ``TRACER`` once per event, so while tracing is off it costs nothing beyond
+# that check - no messages are formatted and no trigger condition is run
+# twice. Set LORCANA_TRACE=1 in the environment to start with tracing on
+# (records go to the "trace" logger at DEBUG), or call ``enable_tracing``.
+
+TRACE_ENV_VAR = "LORCANA_TRACE"
+
+
+@dataclass(frozen=True)
+class DispatchRecord:
+    """One ability consulted while dispatching an event."""
+    event: str
+    ability: str
+    card: Optional[str]
+    zone: Optional[str]
+    triggered: bool
+
+
+class Tracer:
+    """Builds dispatch records and hands them to a sink."""
+
+    def __init__(self, sink: Callable[[DispatchRecord], None]):
+        self.sink = sink
+
+    def dispatch(self, event: Any, ability: Any, zone: Any, triggered: bool) -> None:
+        card = getattr(ability, 'character', None)
+        self.sink(DispatchRecord(
+            event=getattr(event, 'value', str(event)),
+            ability=getattr(ability, 'name', None) or type(ability).__name__,
+            card=str(card) if card is not None else None,
+            zone=getattr(zone, 'value', zone),
+            triggered=triggered,
+        ))
+
+
+def logging_sink(logger: Optional[logging.Logger] = None) -> Callable[[DispatchRecord], None]:
+    """Sink writing each record to ``logger`` (default: the "trace" logger) at DEBUG."""
+    logger = logger or logging.getLogger("trace")
+
+    def sink(record: DispatchRecord) -> None:
+        logger.debug("%s", record)
+
+    return sink
+
+
+TRACER: Optional[Tracer] = None
+
+
+def enable_tracing(sink: Optional[Callable[[DispatchRecord], None]] = None) -> Tracer:
+    """Turn dispatch tracing on.
+
+    Args:
+        sink: Called with every DispatchRecord, e.g. ``records.append``
+              (default: ``logging_sink()``)
+
+    Returns:
+        The active tracer
+    """
+    global TRACER
+    TRACER = Tracer(sink or logging_sink())
+    return TRACER
+
+
+def disable_tracing() -> None:
+    """Turn dispatch tracing off."""
+    global TRACER
+    TRACER = None
+
+
+if os.environ.get(TRACE_ENV_VAR, "").lower() not in ("", "0", "false", "no"):
+    enable_tracing()
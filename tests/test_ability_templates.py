@@ -0,0 +1,126 @@
+"""Tests for compiled ability templates."""
+
+from lorcana_sim.models.abilities.composable.ability_templates import (
+    EMPTY_TEMPLATE, AbilityTemplate, clear_templates, compiled_template_count, template_for
+)
+from lorcana_sim.models.cards.card_factory import CardFactory
+from lorcana_sim.loaders.card_database import CardDatabase
+
+
+def make_card_json(abilities):
+    return {
+        "id": 1,
+        "name": "Template",
+        "version": "Test",
+        "fullName": "Template - Test",
+        "type": "Character",
+        "cost": 3,
+        "color": "Amber",
+        "inkwell": True,
+        "rarity": "Common",
+        "setCode": "1",
+        "number": 1,
+        "story": "",
+        "strength": 2,
+        "willpower": 3,
+        "lore": 1,
+        "abilities": abilities,
+    }
+
+
+def test_copies_share_one_compiled_template():
+    """Cards built from the same ability data compile it only once."""
+    clear_templates()
+    card_json = make_card_json([
+        {"type": "keyword", "keyword": "Evasive"},
+        {"type": "triggered", "name": "A WONDERFUL DREAM"},
+    ])
+
+    copies = [CardFactory.from_json(card_json) for _ in range(4)]
+
+    assert compiled_template_count() == 1
+    for card in copies:
+        assert [a.name for a in card.composable_abilities] == ["Evasive", "A WONDERFUL DREAM"]
+
+
+def test_bound_abilities_belong_to_their_own_card():
+    """Each copy gets its own ability objects, bound to that copy."""
+    card_json = make_card_json([{"type": "keyword", "keyword": "Evasive"}])
+
+    first = CardFactory.from_json(card_json)
+    second = CardFactory.from_json(card_json)
+
+    assert first.composable_abilities[0] is not second.composable_abilities[0]
+    assert first.composable_abilities[0].character is first
+    assert second.composable_abilities[0].character is second
+
+
+def test_keyword_value_is_compiled_into_template():
+    """Keyword values are read from the data, not from the ability dict itself."""
+    card = CardFactory.from_json(make_card_json([
+        {"type": "keyword", "keyword": "Challenger", "keywordValueNumber": 3}
+    ]))
+
+    assert card.composable_abilities[0].name == "Challenger +3"
+
+
+def test_keyword_abilities_list_is_compiled():
+    """Keywords listed only in keywordAbilities are added, once per keyword."""
+    card_json = make_card_json([])
+    del card_json["abilities"]
+    card_json["keywordAbilities"] = ["Rush", "Evasive"]
+
+    card = CardFactory.from_json(card_json)
+
+    assert [a.name for a in card.composable_abilities] == ["Rush", "Evasive"]
+
+    card_json = make_card_json([{"type": "keyword", "keyword": "Evasive"}])
+    card_json["keywordAbilities"] = ["Evasive", "Rush"]
+
+    card = CardFactory.from_json(card_json)
+
+    assert [a.name for a in card.composable_abilities] == ["Evasive", "Rush"]
+
+
+def test_keyword_abilities_list_shares_one_template():
+    clear_templates()
+    card_json = make_card_json([])
+    del card_json["abilities"]
+    card_json["keywordAbilities"] = ["Rush"]
+
+    for _ in range(3):
+        CardFactory.from_json(card_json)
+
+    assert compiled_template_count() == 1
+
+
+def test_database_parses_keyword_value_text():
+    """The database compiler falls back to parsing keywordValue text."""
+    template = CardDatabase._compile_abilities([
+        {"type": "keyword", "keyword": "Challenger", "keywordValue": "+2"}
+    ])
+    card = CardFactory.from_json(make_card_json([]))
+
+    abilities = template.bind(card)
+
+    assert [a.name for a in abilities] == ["Challenger +2"]
+    assert abilities[0].character is card
+
+
+def test_empty_ability_list_uses_empty_template():
+    assert template_for([], CardDatabase._compile_abilities) is EMPTY_TEMPLATE
+    assert EMPTY_TEMPLATE.bind(object()) == []
+
+
+def test_failing_builder_is_skipped():
+    """A builder that raises is logged and skipped; the others still bind."""
+    def broken(card):
+        raise RuntimeError("boom")
+
+    card = CardFactory.from_json(make_card_json([]))
+    template = AbilityTemplate((
+        ("Broken", broken),
+        ("Evasive", CardDatabase._compile_abilities([{"type": "keyword", "keyword": "evasive"}]).builders[0][1]),
+    ))
+
+    assert [a.name for a in template.bind(card)] == ["Evasive"]
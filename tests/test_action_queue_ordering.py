@@ -0,0 +1,67 @@
+"""Tests for ActionQueue execution order."""
+
+from lorcana_sim.engine.action_queue import ActionPriority, ActionQueue
+from lorcana_sim.engine.event_system import GameEventManager
+from lorcana_sim.models.abilities.composable.effects import Effect
+
+
+class RecordEffect(Effect):
+    def __init__(self, label, log):
+        self.label = label
+        self.log = log
+
+    def apply(self, target, context):
+        self.log.append(self.label)
+        return target
+
+
+def drain(queue):
+    while queue.has_pending_actions():
+        queue.process_next_action()
+
+
+def test_priorities_run_in_order_and_fifo_within_a_priority():
+    log = []
+    queue = ActionQueue(GameEventManager(None))
+    for label, priority in [("cleanup", ActionPriority.CLEANUP), ("low", ActionPriority.LOW),
+                            ("normal 1", ActionPriority.NORMAL), ("high 1", ActionPriority.HIGH),
+                            ("normal 2", ActionPriority.NORMAL), ("high 2", ActionPriority.HIGH),
+                            ("immediate 1", ActionPriority.IMMEDIATE), ("immediate 2", ActionPriority.IMMEDIATE)]:
+        queue.enqueue(RecordEffect(label, log), None, {}, priority)
+
+    expected = ["immediate 2", "immediate 1", "high 1", "high 2", "normal 1", "normal 2", "low", "cleanup"]
+    assert [action.effect.label for action in queue.get_pending_actions()] == expected
+    assert queue.peek_next_action().effect.label == "immediate 2"
+    drain(queue)
+    assert log == expected
+
+
+def test_action_ids_are_unique_integers_and_removable():
+    log = []
+    queue = ActionQueue(GameEventManager(None))
+    ids = [queue.enqueue(RecordEffect(i, log), None, {}, ActionPriority.NORMAL) for i in range(5)]
+
+    assert all(isinstance(action_id, int) for action_id in ids)
+    assert len(set(ids)) == 5
+    assert queue.remove_action(ids[2]) and not queue.remove_action(ids[2])
+    assert queue.get_pending_count() == 4
+    drain(queue)
+    assert log == [0, 1, 3, 4]
+
+
+def test_higher_priority_runs_before_a_resumed_action():
+    """A resumed action goes back to the front, but not ahead of higher priorities."""
+    log = []
+    queue = ActionQueue(GameEventManager(None))
+    queue.enqueue(RecordEffect("low", log), None, {}, ActionPriority.LOW)
+    queue.enqueue_waiting_for_choice(RecordEffect("normal-back", log), "choice-1", None, {},
+                                     ActionPriority.NORMAL)
+    queue.resolve_choice_and_continue("choice-1", [])
+    queue.enqueue(RecordEffect("high-new", log), None, {}, ActionPriority.HIGH)
+    queue.enqueue(RecordEffect("normal-new", log), None, {}, ActionPriority.NORMAL)
+    queue.enqueue(RecordEffect("immediate", log), None, {}, ActionPriority.IMMEDIATE)
+
+    expected = ["immediate", "high-new", "normal-back", "normal-new", "low"]
+    assert [action.effect.label for action in queue.get_pending_actions()] == expected
+    drain(queue)
+    assert log == expected
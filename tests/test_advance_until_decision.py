@@ -0,0 +1,128 @@
+"""Tests for GameEngine.advance_until_decision."""
+
+import random
+
+from lorcana_sim.engine.game_engine import GameEngine
+from lorcana_sim.engine.game_messages import (
+    ActionRequiredMessage, ChoiceRequiredMessage, GameOverMessage, StepExecutedMessage
+)
+from lorcana_sim.models.game.game_state import GameState
+from lorcana_sim.models.game.player import Player
+from lorcana_sim.sim import GreedyPolicy
+
+from tests.test_lean_action_queue import ability_deck
+
+
+def new_engine(seed: int, lean: bool = True) -> GameEngine:
+    rng = random.Random(seed)
+    players = []
+    for index in range(2):
+        player = Player(f"Player {index + 1}")
+        player.deck = ability_deck((index + 1) * 1000)
+        player.deck.shuffle(rng)
+        for _ in range(7):
+            player.hand.append(player.deck.pop(0))
+        players.append(player)
+    engine = GameEngine(GameState(players, seed=seed), lean=lean)
+    engine.start_game()
+    return engine
+
+
+def decision_key(message):
+    if isinstance(message, ActionRequiredMessage):
+        return ('action', message.player.name, len(message.legal_actions))
+    if isinstance(message, ChoiceRequiredMessage):
+        return ('choice', message.player.name)
+    return ('game_over', message.winner.name if message.winner else None)
+
+
+def final_state(engine):
+    return [(p.lore, [c.id for c in p.hand], [c.id for c in p.characters_in_play],
+             [c.id for c in p.discard_pile], [c.id for c in p.inkwell], len(p.deck))
+            for p in engine.game_state.players]
+
+
+def record_effects(engine):
+    """Record every effect the engine executes, as (effect class, target, success)."""
+    queue = engine.execution_engine.action_queue
+    effects = []
+    process_next_action = queue.process_next_action
+
+    def recording_process_next_action(*args, **kwargs):
+        result = process_next_action(*args, **kwargs)
+        if result is not None:
+            effects.append((type(result.queued_action.effect), result.queued_action.target, result.success))
+        return result
+
+    queue.process_next_action = recording_process_next_action
+    return effects
+
+
+def play(engine, advance: bool, seed: int, effect_log=None, max_decisions: int = 400):
+    """Play with a seeded greedy policy; returns the decisions that were asked."""
+    rng = random.Random(seed)
+    policy, move, decisions = GreedyPolicy(), None, []
+    while len(decisions) < max_decisions:
+        if advance:
+            message = engine.advance_until_decision(move, effect_log=effect_log)
+        else:
+            message = engine.next_message(move)
+        move = None
+        if isinstance(message, StepExecutedMessage):
+            continue
+        decisions.append(decision_key(message))
+        if isinstance(message, GameOverMessage):
+            break
+        elif isinstance(message, ActionRequiredMessage):
+            move = policy.choose_action(message, rng)
+        else:
+            move = policy.choose_option(message, rng)
+    return decisions
+
+
+def test_advancing_matches_stepping_message_by_message():
+    for seed in range(3):
+        stepped = new_engine(seed)
+        stepped_effects = record_effects(stepped)
+        stepped_decisions = play(stepped, advance=False, seed=seed)
+
+        advanced = new_engine(seed)
+        advanced_effects = record_effects(advanced)
+        effect_log = []
+        advanced_decisions = play(advanced, advance=True, seed=seed, effect_log=effect_log)
+
+        assert advanced_decisions == stepped_decisions
+        assert final_state(advanced) == final_state(stepped)
+        assert advanced.message_engine.next_message_calls == stepped.message_engine.next_message_calls
+        assert [(type(e.effect), e.target, e.success) for e in effect_log] == advanced_effects
+        # Targets are per-engine objects; compare what they are, not which
+        key = lambda effects: [(cls, getattr(target, 'id', getattr(target, 'name', None)), ok)
+                               for cls, target, ok in effects]
+        assert key(advanced_effects) == key(stepped_effects)
+        assert len(effect_log) > 50
+
+
+def test_advance_returns_decisions_only():
+    engine = new_engine(0)
+    message = engine.advance_until_decision()
+    assert isinstance(message, ActionRequiredMessage)
+    assert engine.waiting_for_input
+
+
+def test_max_steps_and_new_turn_stops():
+    engine = new_engine(1)
+    calls = engine.message_engine.next_message_calls
+    message = engine.advance_until_decision(max_steps=1)
+    assert isinstance(message, StepExecutedMessage) and message.step == "step_limit_reached"
+    assert engine.message_engine.next_message_calls == calls + 1
+
+    rng, policy, move = random.Random(1), GreedyPolicy(), None
+    turn = engine.game_state.turn_number
+    while engine.game_state.turn_number == turn:
+        message = engine.advance_until_decision(move, stop_on_new_turn=True)
+        move = None
+        if isinstance(message, ActionRequiredMessage):
+            move = policy.choose_action(message, rng)
+        elif isinstance(message, ChoiceRequiredMessage):
+            move = policy.choose_option(message, rng)
+    assert isinstance(message, StepExecutedMessage) and message.step == "turn_started"
@@ -0,0 +1,83 @@
+"""Tests for the cached, pre-indexed CardDatabase."""
+
+import json
+
+import pytest
+
+from lorcana_sim.loaders import json_cache
+from lorcana_sim.loaders.card_database import CardDatabase
+from lorcana_sim.loaders.lorcana_json_parser import LorcanaJsonParser
+
+
+def card_json(card_id, name, version, color='Amber', cost=2, card_type='Character', keywords=()):
+    return {
+        'id': card_id, 'name': name, 'version': version, 'fullName': f"{name} - {version}",
+        'cost': cost, 'color': color, 'rarity': 'Common', 'type': card_type, 'inkwell': True,
+        'setCode': '1', 'number': card_id, 'story': '', 'strength': 2, 'willpower': 3, 'lore': 1,
+        'abilities': [{'type': 'keyword', 'keyword': keyword} for keyword in keywords],
+    }
+
+
+@pytest.fixture
+def cards_file(tmp_path, monkeypatch):
+    monkeypatch.setenv(json_cache.CACHE_DIR_ENV_VAR, str(tmp_path / 'cache'))
+    json_cache.clear_memo()
+    CardDatabase._shared.clear()
+    path = tmp_path / 'allCards.json'
+    path.write_text(json.dumps({'cards': [
+        card_json(1, "Ariel", "On Human Legs"),
+        card_json(2, "Stitch", "Rock Star", color='Amethyst', cost=6, keywords=['Shift', 'Evasive']),
+        card_json(3, "Let It Go", "", color='Sapphire', cost=5, card_type='Action'),
+    ]}))
+    yield path
+    json_cache.clear_memo()
+    CardDatabase._shared.clear()
+
+
+def test_indexes(cards_file):
+    db = CardDatabase(str(cards_file))
+    stitch = db.cards_by_id[2]
+    assert [card.id for card in db.cards] == [1, 2, 3]
+    assert db.find_card("Stitch - Rock Star!") is stitch
+    assert db.cards_by_set_number[('1', 2)] is stitch
+    assert db.cards_by_color['amethyst'] == [stitch]
+    assert db.cards_by_cost[6] == [stitch]
+    assert [card.id for card in db.cards_by_type['character']] == [1, 2]
+    assert db.cards_by_keyword['evasive'] == db.cards_by_keyword['shift'] == [stitch]
+    assert db.find_card("Stich Rock") is stitch  # Fuzzy fallback
+    assert db.find_card("Completely Unknown Card") is None
+    assert db.match_cards("let it")[0].card.id == 3
+
+
+def test_warm_load_skips_json_parsing(cards_file, monkeypatch):
+    CardDatabase(str(cards_file))
+    assert list((cards_file.parent / 'cache').glob('card-db-*.pickle'))
+
+    json_cache.clear_memo()
+    monkeypatch.setattr(json_cache.json, 'load', lambda f: pytest.fail("parsed JSON on a warm load"))
+    db = CardDatabase(str(cards_file))
+    assert db.find_card("Ariel").id == 1
+    assert LorcanaJsonParser(str(cards_file)).cards[2]['name'] == "Let It Go"
+
+
+def test_shared_instance_follows_file_changes(cards_file):
+    db = CardDatabase.shared(str(cards_file))
+    assert CardDatabase.shared(str(cards_file)) is db
+
+    cards_file.write_text(json.dumps({'cards': [card_json(9, "Moana", "Of Motunui")]}))
+    changed = CardDatabase.shared(str(cards_file))
+    assert changed is not db
+    assert list(changed.cards_by_id) == [9]
+
+
+def test_cache_can_be_disabled_and_survives_corruption(cards_file, monkeypatch):
+    CardDatabase(str(cards_file))
+    for cache_file in (cards_file.parent / 'cache').glob('*.pickle'):
+        cache_file.write_bytes(b'not a pickle')
+    json_cache.clear_memo()
+    assert len(CardDatabase(str(cards_file)).cards) == 3
+
+    monkeypatch.setenv(json_cache.CACHE_DIR_ENV_VAR, 'off')
+    json_cache.clear_memo()
+    assert json_cache.cache_dir() is None
+    assert len(CardDatabase(str(cards_file)).cards) == 3
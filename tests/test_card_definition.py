@@ -0,0 +1,69 @@
+"""Tests for shared card definitions behind the Card API."""
+
+import copy
+import pickle
+from dataclasses import dataclass
+
+from lorcana_sim.models.cards.base_card import CardColor, Rarity
+from lorcana_sim.models.cards.character_card import CharacterCard
+
+
+def make_character(card_id: int, **overrides) -> CharacterCard:
+    values = dict(
+        id=card_id, name="Ariel", version="On Human Legs", full_name="", cost=4, color=CardColor.AMBER,
+        inkwell=True, rarity=Rarity.UNCOMMON, set_code="1", number=1, story="The Little Mermaid",
+        strength=3, willpower=4, lore=2, subtypes=["Storyborn", "Hero", "Princess"], artists=["Someone"]
+    )
+    values.update(overrides)
+    return CharacterCard(**values)
+
+
+def test_copies_share_one_definition():
+    first, second = make_character(1), make_character(2)
+
+    assert first.definition is second.definition
+    assert first.full_name == "Ariel - On Human Legs"
+    assert first.subtypes == ["Storyborn", "Hero", "Princess"]
+    assert 'name' not in first.__dict__ and 'full_text' not in first.__dict__
+    assert make_character(3, cost=5).definition is not first.definition
+
+
+def test_writes_are_per_card_overrides():
+    first, second = make_character(1), make_character(2)
+
+    first.strength += 2
+    first.subtypes.append("Floodborn")
+
+    assert first.strength == 5 and second.strength == 3
+    assert "Floodborn" not in second.subtypes
+    assert first.definition.strength == 3
+    assert first.definition.subtypes == ("Storyborn", "Hero", "Princess")
+
+
+def test_copy_and_pickle_keep_the_interned_definition():
+    card = make_character(1)
+    card.damage = 2
+
+    for clone in (copy.copy(card), copy.deepcopy(card), pickle.loads(pickle.dumps(card))):
+        assert clone.definition is card.definition
+        assert clone == card and clone.damage == 2
+
+
+def test_equality_compares_ids_and_fields():
+    assert make_character(1) == make_character(1)
+    assert make_character(1) != make_character(2)
+    assert make_character(1) != make_character(1, lore=3)
+
+
+def test_undecorated_subclass_falls_back_to_binding_after_init():
+    @dataclass(eq=False)
+    class TestCharacter(CharacterCard):
+        note: str = ""
+
+    card = TestCharacter(id=1, name="Ariel", version="On Human Legs", full_name="", cost=4,
+                         color=CardColor.AMBER, inkwell=True, rarity=Rarity.UNCOMMON, set_code="1", number=1, story="",
+                         strength=3, willpower=4, lore=2, note="custom")
+
+    assert card.name == "Ariel" and card.note == "custom"
+    assert 'name' not in card.__dict__
+    assert card.definition.card_type == "TestCharacter"
@@ -72,7 +72,7 @@ def test_heavily_armed_proper_flow():
         source_description="Manual draw for testing"
     )
     
-    print(f"Actions in queue before: {len(action_queue._queue)}")
+    print(f"Actions in queue before: {action_queue.get_pending_count()}")
     
     # Process the draw
     draw_message = test_base.game_engine.next_message()
@@ -81,15 +81,15 @@ def test_heavily_armed_proper_flow():
     
     # Step 3: Check for ability trigger
     print("\n=== Step 3: Check Ability Trigger ===")
-    print(f"Actions in queue after draw: {len(action_queue._queue)}")
+    print(f"Actions in queue after draw: {action_queue.get_pending_count()}")
     
-    if len(action_queue._queue) > 0:
+    if action_queue.get_pending_count() > 0:
         trigger_message = test_base.game_engine.next_message()
         print(f"Trigger message: {trigger_message.type}")
         print(f"Trigger details: {trigger_message}")
         
         # Check for follow-up effect
-        if len(action_queue._queue) > 0:
+        if action_queue.get_pending_count() > 0:
             effect_message = test_base.game_engine.next_message()
             print(f"Effect message: {effect_message.type}")
             print(f"Effect details: {effect_message}")
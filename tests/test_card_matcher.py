@@ -0,0 +1,50 @@
+"""Tests for ranked fuzzy card name matching."""
+
+from types import SimpleNamespace
+
+from lorcana_sim.loaders.card_matcher import CardMatcher, tokenize
+
+
+def card(full_name, set_code='1', number=1):
+    name, _, version = full_name.partition(' - ')
+    return SimpleNamespace(full_name=full_name, name=name, version=version,
+                           set_code=set_code, number=number)
+
+
+CARDS = [
+    card("Stitch - Rock Star", number=1),
+    card("Stitch - New Dog", number=2),
+    card("Maleficent - Monstrous Dragon", number=3),
+    card("Maleficent - Sorceress", number=4),
+    card("Let It Go", number=5),
+    card("Stitch - Rock Star", set_code='9', number=205),  # Enchanted reprint
+]
+
+
+def test_tokenize_drops_punctuation_and_hyphens():
+    assert tokenize("Stitch - Rock Star!") == ['stitch', 'rock', 'star']
+
+
+def test_ranks_best_match_first():
+    matcher = CardMatcher(CARDS)
+    matches = matcher.match("maleficent monstrous", limit=3)
+    assert matches[0].card is CARDS[2]
+    assert matches[1].card is CARDS[3]
+    assert matches[0].score > matches[1].score
+    assert all(0 < match.score <= 1 for match in matches)
+
+
+def test_tolerates_typos_and_truncation():
+    matcher = CardMatcher(CARDS)
+    assert matcher.match("Malefcent - Monstrus Dragon")[0].card is CARDS[2]
+    assert matcher.match("Stich New")[0].card is CARDS[1]
+    assert matcher.match("zzzz qqqq") == []
+
+
+def test_set_number_hint_picks_the_printing():
+    matcher = CardMatcher(CARDS)
+    assert matcher.match("Stitch - Rock Star")[0].card is CARDS[0]
+    hinted = matcher.match("Stitch - Rock Star", set_code='009', number='205')
+    assert hinted[0].card is CARDS[5] and hinted[0].score == 1.0
+    assert matcher.printing('009', '205') is CARDS[5]
+    assert matcher.printing('9', 'x') is None
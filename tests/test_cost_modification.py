@@ -0,0 +1,172 @@
+"""Tests for the indexed, cached CostModificationManager."""
+
+import random
+
+from lorcana_sim.models.abilities.composable.cost_modification import (
+    CostModificationType, CostModifier, create_ink_reduction_modifier
+)
+from lorcana_sim.models.cards.action_card import ActionCard
+from lorcana_sim.models.cards.base_card import CardColor, Rarity
+from lorcana_sim.models.cards.character_card import CharacterCard
+from lorcana_sim.models.game.game_state import GameState
+from lorcana_sim.models.game.player import Player
+
+SUBTYPES = ["Hero", "Villain", "Princess", "Ally"]
+
+
+def character(card_id: int, cost: int = 4, subtypes=()):
+    return CharacterCard(
+        id=card_id, name=f"Cost {card_id}", version="Test", full_name=f"Cost {card_id} - Test",
+        cost=cost, color=CardColor.AMBER, inkwell=True, rarity=Rarity.COMMON,
+        set_code="TEST", number=card_id, story="", strength=1, willpower=2, lore=1,
+        subtypes=list(subtypes)
+    )
+
+
+def action(card_id: int, cost: int = 3):
+    return ActionCard(
+        id=card_id, name=f"Action {card_id}", version=None, full_name=f"Action {card_id}",
+        cost=cost, color=CardColor.AMBER, inkwell=True, rarity=Rarity.COMMON,
+        set_code="TEST", number=card_id, story=""
+    )
+
+
+def new_game():
+    players = [Player("Alice"), Player("Bob")]
+    game_state = GameState(players)
+    source = character(1)
+    players[0].characters_in_play.append(source)
+    return game_state, players, source
+
+
+def reference_cost(modifiers, card, game_state):
+    """The unindexed computation: every modifier, sorted by priority, folded."""
+    applicable = sorted((m for m in modifiers if m.is_applicable_to_card(card, game_state)),
+                        key=lambda m: m.priority, reverse=True)
+    cost, reductions, increases = card.cost, 0, 0
+    for m in applicable:
+        if m.modification_type == CostModificationType.FREE_PLAY:
+            return 0
+        if m.modification_type == CostModificationType.INK_COST_REDUCTION:
+            if m.stacks_with_others or reductions == 0:
+                cost, reductions = max(0, cost - m.amount), reductions + 1
+        elif m.modification_type == CostModificationType.INK_COST_INCREASE:
+            if m.stacks_with_others or increases == 0:
+                cost, increases = cost + m.amount, increases + 1
+    return max(0, cost)
+
+
+def test_indexed_costs_match_unindexed_computation():
+    rng = random.Random(7)
+    game_state, players, source = new_game()
+    hand = [character(10 + i, cost=2 + i % 5, subtypes=rng.sample(SUBTYPES, 2)) for i in range(8)]
+    hand += [action(30 + i) for i in range(3)]
+    players[0].hand.extend(hand[:6])
+    players[1].hand.extend(hand[6:])
+
+    modifiers = []
+    for i in range(30):
+        scope = rng.choice(['any', 'controller', 'card_type', 'subtype', 'both'])
+        modifier = CostModifier(
+            modifier_id=f"m{i}", source_card=source,
+            modification_type=rng.choice([CostModificationType.INK_COST_REDUCTION,
+                                          CostModificationType.INK_COST_INCREASE]),
+            amount=rng.randint(1, 2), priority=rng.randint(0, 2),
+            stacks_with_others=rng.random() < 0.7,
+            controller=rng.choice(players) if scope in ('controller', 'both') else None,
+            card_type=rng.choice(["Character", "Action"]) if scope == 'card_type' else None,
+            subtypes=tuple(rng.sample(SUBTYPES, rng.randint(1, 2))) if scope in ('subtype', 'both') else (),
+        )
+        # Scoped modifiers keep their filters; the reference sees the scope only through them
+        modifier.applies_to_filter = (lambda m: lambda card, gs: m.in_scope(
+            card, players[0] if card in players[0].hand else players[1]))(modifier)
+        if rng.random() < 0.8:
+            modifier.activate()
+        modifiers.append(modifier)
+        game_state.register_cost_modifier(modifier)
+
+    for card in hand:
+        assert game_state.get_modified_card_cost(card) == reference_cost(modifiers, card, game_state)
+
+    for modifier in modifiers[::3]:
+        modifier.deactivate()
+    game_state.unregister_cost_modifier(modifiers[1])
+    remaining = [m for m in modifiers if m is not modifiers[1]]
+    for card in hand:
+        assert game_state.get_modified_card_cost(card) == reference_cost(remaining, card, game_state)
+
+
+def test_cache_is_dropped_on_modifier_changes():
+    game_state, players, source = new_game()
+    card = character(2, cost=5, subtypes=["Hero"])
+    players[0].hand.append(card)
+    manager = game_state.cost_modification_manager
+    modifier = create_ink_reduction_modifier("hero", source, 2, lambda c, gs: True, subtypes=("Hero",))
+
+    game_state.register_cost_modifier(modifier)
+    assert game_state.get_modified_card_cost(card) == 5
+    modifier.activate()
+    assert game_state.get_modified_card_cost(card) == 3
+    modifier.deactivate()
+    assert game_state.get_modified_card_cost(card) == 5
+    modifier.activate()
+    game_state.unregister_cost_modifier(modifier)
+    assert game_state.get_modified_card_cost(card) == 5
+    assert manager.modifiers_by_scope == {}
+
+    # Registering twice is a no-op
+    game_state.register_cost_modifier(modifier)
+    game_state.register_cost_modifier(modifier)
+    assert len(manager.all_modifiers) == 1
+
+
+def test_cache_is_dropped_on_zone_changes_only():
+    game_state, players, source = new_game()
+    card = character(2, cost=5)
+    players[0].hand.append(card)
+    calls = []
+
+    def in_alices_hand(c, gs):
+        calls.append(c)
+        return c in players[0].hand
+
+    modifier = create_ink_reduction_modifier("hand", source, 1, in_alices_hand)
+    modifier.activate()
+    game_state.register_cost_modifier(modifier)
+
+    assert game_state.get_modified_card_cost(card) == 4
+    assert game_state.get_modified_card_cost(card) == 4
+    assert len(calls) == 1
+
+    players[0].hand.remove(card)
+    players[1].hand.append(card)
+    assert game_state.get_modified_card_cost(card) == 5
+    assert len(calls) == 2
+
+
+def test_controller_scope_uses_the_holding_player():
+    game_state, players, source = new_game()
+    mine, theirs = character(2, cost=3), character(3, cost=3)
+    players[0].hand.append(mine)
+    players[1].hand.append(theirs)
+    modifier = create_ink_reduction_modifier("mine", source, 1, lambda c, gs: True, controller=players[0])
+    modifier.activate()
+    game_state.register_cost_modifier(modifier)
+
+    assert game_state.get_modified_card_cost(mine) == 2
+    assert game_state.get_modified_card_cost(theirs) == 3
+
+
+def test_snapshot_restore_drops_cached_costs():
+    game_state, players, source = new_game()
+    card = character(2, cost=5)
+    players[0].hand.append(card)
+    snapshot = game_state.snapshot()
+
+    modifier = create_ink_reduction_modifier("later", source, 2, lambda c, gs: True)
+    modifier.activate()
+    game_state.register_cost_modifier(modifier)
+    assert game_state.get_modified_card_cost(card) == 3
+
+    game_state.restore(snapshot)
+    assert game_state.get_modified_card_cost(card) == 5
@@ -0,0 +1,84 @@
+"""Tests for the deque-backed deck zone."""
+
+import copy
+import pickle
+import random
+
+import pytest
+
+from lorcana_sim.models.game.player import Player
+from lorcana_sim.models.game.zones import DeckZone
+
+from .test_player_zone_index import assert_index_matches, make_card
+
+
+def player_with_deck(size: int = 10) -> Player:
+    player = Player("Alice")
+    player.deck = [make_card(i) for i in range(size)]
+    return player
+
+
+def test_deck_operations_keep_order_and_index():
+    player = player_with_deck()
+    cards = list(player.deck)
+    assert isinstance(player.deck, DeckZone)
+
+    assert player.deck.peek(3) == cards[:3]
+    assert player.draw_card() is cards[0]
+    assert player.deck.draw() is cards[1]
+    player.hand.remove(cards[0])
+
+    player.deck.put_on_bottom(cards[1])
+    player.deck.put_on_top(cards[0])
+    assert player.deck[0] is cards[0] and player.deck[-1] is cards[1]
+    assert player.get_card_zone(cards[0]) == 'deck'
+    assert_index_matches(player)
+
+    player.deck.clear()
+    assert player.deck.draw() is None and player.draw_card() is None
+    assert not player.deck
+    assert_index_matches(player)
+
+
+def test_list_operations_still_work():
+    player = player_with_deck()
+    cards = list(player.deck)
+
+    assert player.deck == cards and player.deck[2:4] == cards[2:4]
+    assert player.deck.pop(0) is cards[0]
+    assert player.deck.pop() is cards[-1]
+    del player.deck[0]
+    player.deck.insert(1, cards[0])
+    player.deck[0] = cards[-1]
+    player.deck[:2] = [cards[1], cards[2]]
+    player.deck.remove(cards[5])
+    assert cards[5] not in player.deck and player.deck.index(cards[6]) == 4
+    assert_index_matches(player)
+
+    random.Random(1).shuffle(player.deck)  # Works on any mutable sequence
+    assert_index_matches(player)
+    with pytest.raises(IndexError):
+        Player("Bob").deck.pop(0)
+
+
+def test_seeded_shuffle_is_reproducible_and_restamps():
+    first, second = player_with_deck(20), player_with_deck(20)
+    stamp = first.zone_stamp('deck')
+
+    first.deck.shuffle(random.Random(7))
+    second.deck.shuffle(random.Random(7))
+    assert [card.id for card in first.deck] == [card.id for card in second.deck]
+    assert sorted(card.id for card in first.deck) == list(range(20))
+    assert first.zone_stamp('deck') != stamp
+    assert_index_matches(first)
+
+
+def test_pickle_and_copy_round_trip():
+    player = player_with_deck()
+    clone = pickle.loads(pickle.dumps(player))
+    assert isinstance(clone.deck, DeckZone)
+    assert [card.id for card in clone.deck] == list(range(10))
+    assert_index_matches(clone)
+
+    assert copy.copy(player.deck) == list(player.deck)
+    assert type(copy.deepcopy(player.deck)) is list
@@ -0,0 +1,73 @@
+"""Tests for structured dispatch tracing."""
+
+import pytest
+
+from lorcana_sim.engine.event_system import EventContext, GameEvent
+from lorcana_sim.engine.game_engine import GameEngine
+from lorcana_sim.models.abilities.composable.keyword_abilities import create_keyword_ability
+from lorcana_sim.models.game.game_state import GameState
+from lorcana_sim.models.game.player import Player
+from lorcana_sim.utils.logging_config import DispatchRecord, disable_tracing, enable_tracing
+
+from .test_event_listener_registry import make_character
+
+
+@pytest.fixture
+def engine():
+    players = [Player("Alice"), Player("Bob")]
+    for index, player in enumerate(players):
+        for i in range(3):
+            card = make_character(index * 10 + i)
+            card.composable_abilities.append(create_keyword_ability('Support', card))
+            card.controller = player
+            player.characters_in_play.append(card)
+    yield GameEngine(GameState(players))
+    disable_tracing()
+
+
+def dispatch(engine, event=GameEvent.CHARACTER_QUESTS):
+    player = engine.game_state.players[0]
+    context = EventContext(event_type=event, source=player.characters_in_play[0],
+                           player=player, game_state=engine.game_state)
+    engine.event_manager.trigger_event(context)
+
+
+def test_tracing_records_each_consulted_ability(engine):
+    records = []
+    enable_tracing(records.append)
+    listeners = engine.event_manager.get_active_listeners(GameEvent.CHARACTER_QUESTS)
+
+    dispatch(engine)
+
+    assert len(records) == len(listeners) > 0
+    assert all(isinstance(record, DispatchRecord) for record in records)
+    assert {record.event for record in records} == {GameEvent.CHARACTER_QUESTS.value}
+    assert {record.zone for record in records} == {'play'}
+    assert records[0].ability == listeners[0].name
+
+
+def test_tracing_off_records_nothing_and_checks_conditions_once(engine):
+    records = []
+    enable_tracing(records.append)
+    disable_tracing()
+    calls = []
+    abilities = engine.event_manager.get_active_listeners(GameEvent.CHARACTER_QUESTS)
+    listeners = [listener for ability in abilities for listener in ability.listeners]
+    quester = engine.game_state.players[0].characters_in_play[0]
+    own = [listener for ability in abilities if ability.character is quester
+           for listener in ability.listeners]
+    for listener in listeners:
+        original = listener.should_trigger
+        listener.should_trigger = lambda context, listener=listener, original=original: \
+            calls.append(listener) or original(context)
+
+    dispatch(engine)
+
+    assert records == []
+    # Support's trigger predicate ties it to its own character's quests, so
+    # dispatch skips the other characters' Support without checking it; the
+    # quester's condition is checked once by dispatch and once more by its
+    # ability's handle_event
+    assert len(own) == 1
+    assert calls.count(own[0]) == 2
+    assert all(calls.count(listener) == 0 for listener in listeners if listener is not own[0])
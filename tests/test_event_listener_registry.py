@@ -0,0 +1,141 @@
+"""Tests for the zone-partitioned listener registry in GameEventManager."""
+
+import random
+
+from lorcana_sim.engine.event_system import GameEvent, get_card_current_zone
+from lorcana_sim.engine.game_engine import GameEngine
+from lorcana_sim.models.abilities.composable.activation_zones import ActivationZone
+from lorcana_sim.models.abilities.composable.named_abilities import NamedAbilityRegistry
+from lorcana_sim.models.cards.character_card import CharacterCard
+from lorcana_sim.models.cards.base_card import CardColor, Rarity
+from lorcana_sim.models.game.game_state import GameState
+from lorcana_sim.models.game.player import Player, ZONE_ATTRIBUTES
+
+
+def make_character(card_id: int, ability_name: str = None) -> CharacterCard:
+    character = CharacterCard(
+        id=card_id, name=f"Card {card_id}", version="Test", full_name=f"Card {card_id} - Test",
+        cost=2, color=CardColor.AMBER, inkwell=True, rarity=Rarity.COMMON,
+        set_code="TEST", number=1, story="", strength=2, willpower=3, lore=1
+    )
+    if ability_name:
+        ability = NamedAbilityRegistry.create_ability(ability_name, character, {'name': ability_name})
+        if ability is not None and hasattr(ability, 'activation_zones'):
+            character.composable_abilities.append(ability)
+    return character
+
+
+def legacy_dispatch_list(event_manager, event):
+    """The abilities the old linear scan would have consulted for an event."""
+    game_state = event_manager.game_state
+    result = []
+    for ability in event_manager._composable_listeners.get(event, []):
+        source_card = getattr(ability, 'character', None)
+        if source_card and get_card_current_zone(source_card, game_state) not in ability.activation_zones:
+            continue
+        result.append(ability)
+    return result
+
+
+def assert_registry_matches_legacy(event_manager):
+    for event in GameEvent:
+        assert event_manager.get_active_listeners(event) == legacy_dispatch_list(event_manager, event)
+
+
+def build_game(seed: int):
+    rng = random.Random(seed)
+    names = sorted(NamedAbilityRegistry.get_registered_abilities())
+    players = [Player("Alice"), Player("Bob")]
+    card_id = 0
+    for player in players:
+        for _ in range(30):
+            card_id += 1
+            zone = rng.choice(ZONE_ATTRIBUTES[:5])
+            getattr(player, zone).append(make_character(card_id, rng.choice(names)))
+    game_state = GameState(players)
+    engine = GameEngine(game_state)
+    return rng, game_state, engine
+
+
+def test_registry_matches_linear_scan_after_random_moves():
+    rng, game_state, engine = build_game(seed=3)
+    event_manager = engine.event_manager
+    assert_registry_matches_legacy(event_manager)
+
+    for _ in range(300):
+        player = rng.choice(game_state.players)
+        source = getattr(player, rng.choice(ZONE_ATTRIBUTES[:5]))
+        if not source:
+            continue
+        card = source.pop(rng.randrange(len(source)))
+        destination = rng.choice(game_state.players)
+        getattr(destination, rng.choice(ZONE_ATTRIBUTES[:5])).append(card)
+    assert_registry_matches_legacy(event_manager)
+
+
+def test_dormant_abilities_are_not_dispatched():
+    alice, bob = Player("Alice"), Player("Bob")
+    character = make_character(1, "LOYAL")
+    alice.deck.append(character)
+    engine = GameEngine(GameState([alice, bob]))
+    event_manager = engine.event_manager
+    ability = character.composable_abilities[0]
+    events = event_manager._ability_events[ability]
+
+    assert ability in event_manager._registered_abilities
+    assert all(ability not in event_manager.get_active_listeners(e) for e in events)
+
+    alice.deck.remove(character)
+    alice.characters_in_play.append(character)
+    assert all(ability in event_manager.get_active_listeners(e) for e in events)
+
+    alice.characters_in_play.remove(character)
+    alice.discard_pile.append(character)
+    assert all(ability not in event_manager.get_active_listeners(e) for e in events)
+
+
+def test_dispatch_keeps_registration_order():
+    alice, bob = Player("Alice"), Player("Bob")
+    first = make_character(1, "LOYAL")
+    second = make_character(2, "LOYAL")
+    alice.characters_in_play.extend([second, first])
+    engine = GameEngine(GameState([alice, bob]))
+    event_manager = engine.event_manager
+
+    # Move the earlier-registered card out of play and back in
+    alice.characters_in_play.remove(second)
+    alice.characters_in_play.append(second)
+    assert_registry_matches_legacy(event_manager)
+
+
+def test_unregister_and_clear_update_registry():
+    rng, game_state, engine = build_game(seed=5)
+    event_manager = engine.event_manager
+    abilities = list(event_manager._registered_abilities)
+
+    for ability in abilities[:10]:
+        event_manager.unregister_composable_ability(ability)
+    assert_registry_matches_legacy(event_manager)
+
+    event_manager.clear_all_registrations()
+    assert all(event_manager.get_active_listeners(e) == [] for e in GameEvent)
+    event_manager.register_all_abilities()
+    assert_registry_matches_legacy(event_manager)
+
+
+def test_abilities_without_source_card_are_always_active():
+    alice, bob = Player("Alice"), Player("Bob")
+    engine = GameEngine(GameState([alice, bob]))
+    event_manager = engine.event_manager
+
+    class GlobalAbility:
+        name = "global"
+        character = None
+        activation_zones = {ActivationZone.PLAY}
+
+        def get_relevant_events(self):
+            return [GameEvent.TURN_BEGINS]
+
+    ability = GlobalAbility()
+    event_manager.register_composable_ability(ability)
+    assert event_manager.get_active_listeners(GameEvent.TURN_BEGINS) == [ability]
@@ -0,0 +1,69 @@
+"""Tests for the per-game RNG owned by GameState."""
+
+import random
+
+from lorcana_sim.models.game.deck import Deck
+from lorcana_sim.models.game.game_state import GameState
+from lorcana_sim.models.game.player import Player
+from lorcana_sim.utils.deck_builder import DeckBuilder
+
+from .test_card_definition import make_character
+from .test_game_snapshot import build_engine
+from .test_sim_runner import make_runner
+
+
+def make_game(seed=None, **kwargs) -> GameState:
+    return GameState([Player("Alice"), Player("Bob")], seed=seed, **kwargs)
+
+
+def test_seed_determines_the_game_rng():
+    first, second = make_game(seed=5), make_game(seed=5)
+    assert [first.rng.random() for _ in range(3)] == [second.rng.random() for _ in range(3)]
+    assert first.spawn_rng().random() == second.spawn_rng().random()
+
+    rng = random.Random(1)
+    assert make_game(rng=rng).rng is rng
+
+
+def test_shuffles_draw_from_the_game_rng():
+    deck = Deck("Test")
+    for i in range(10):
+        deck.add_card(make_character(i), 2)
+    orders = []
+    for _ in range(2):
+        game = make_game(seed=3)
+        random.seed(99)  # Global state must not matter
+        cards = deck.shuffle(game.rng)
+        game.players[0].deck = cards
+        game.players[0].deck.shuffle(game.rng)
+        orders.append([card.id for card in game.players[0].deck])
+    assert orders[0] == orders[1]
+
+
+def test_deck_builder_leaves_global_random_alone():
+    builder = DeckBuilder([])
+    builder._cards_cache = [make_character(i) for i in range(20)]
+    state = random.getstate()
+    deck = builder.build_random_deck(seed=4)
+    assert random.getstate() == state
+    assert [c.card.id for c in deck.cards] == [c.card.id for c in builder.build_random_deck(seed=4).cards]
+
+
+def test_snapshot_restore_rewinds_the_rng():
+    engine = build_engine(2)
+    rng = engine.game_state.rng
+    snapshot = engine.snapshot()
+    drawn = [rng.random() for _ in range(3)]
+
+    engine.restore(snapshot)
+    assert engine.game_state.rng is rng
+    assert [rng.random() for _ in range(3)] == drawn
+
+
+def test_runner_games_depend_only_on_seed():
+    runner = make_runner()
+    random.seed(1)
+    first = runner.play_game(11)
+    random.seed(2)
+    second = runner.play_game(11)
+    assert (first.winner, first.turns, first.lore_curve) == (second.winner, second.turns, second.lore_curve)
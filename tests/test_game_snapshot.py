@@ -0,0 +1,166 @@
+"""Tests for GameState/GameEngine snapshot and restore."""
+
+import random
+
+import pytest
+
+from lorcana_sim.engine.game_engine import GameEngine
+from lorcana_sim.engine.game_messages import ActionRequiredMessage, ChoiceRequiredMessage, GameOverMessage
+from lorcana_sim.models.abilities.composable.named_abilities import NamedAbilityRegistry
+from lorcana_sim.models.cards.character_card import CharacterCard
+from lorcana_sim.models.cards.base_card import CardColor, Rarity
+from lorcana_sim.models.game.game_state import GameState
+from lorcana_sim.models.game.player import Player, ZONE_ATTRIBUTES
+from lorcana_sim.sim import RandomPolicy
+
+
+def make_character(card_id: int, cost: int, ability_name: str = None) -> CharacterCard:
+    character = CharacterCard(
+        id=card_id, name=f"Card {card_id}", version="Test", full_name=f"Card {card_id} - Test",
+        cost=cost, color=CardColor.AMBER, inkwell=card_id % 4 != 0, rarity=Rarity.COMMON,
+        set_code="TEST", number=1, story="", strength=1 + card_id % 3, willpower=2 + card_id % 3, lore=1
+    )
+    if ability_name:
+        ability = NamedAbilityRegistry.create_ability(ability_name, character, {'name': ability_name})
+        if ability is not None and hasattr(ability, 'activation_zones'):
+            character.composable_abilities.append(ability)
+    return character
+
+
+def build_engine(seed: int) -> GameEngine:
+    rng = random.Random(seed)
+    names = ['LOYAL', 'BODYGUARD', 'EVASIVE', 'RUSH', 'WARD', None, None, None]
+    players = []
+    for offset, name in ((1000, "Alice"), (2000, "Bob")):
+        player = Player(name)
+        player.deck = [make_character(offset + i, 1 + i % 5, rng.choice(names)) for i in range(30)]
+        for _ in range(7):
+            player.hand.append(player.deck.pop(0))
+        players.append(player)
+    engine = GameEngine(GameState(players))
+    engine.start_game()
+    return engine
+
+
+def fingerprint(engine: GameEngine):
+    """Everything observable about a game that play can change."""
+    game_state = engine.game_state
+    players = []
+    for player in game_state.players:
+        zones = []
+        for zone in ZONE_ATTRIBUTES:
+            zones.append(tuple(
+                (id(card), card.exerted, getattr(card, 'damage', 0), getattr(card, 'is_dry', None),
+                 getattr(card, 'strength', None), getattr(card, 'lore', None),
+                 tuple(sorted(getattr(card, 'metadata', {}))),
+                 tuple(id(a) for a in getattr(card, 'composable_abilities', [])))
+                for card in getattr(player, zone)
+            ))
+        players.append((player.lore, tuple(zones)))
+    action_queue = engine.execution_engine.action_queue
+    return (
+        tuple(players),
+        game_state.turn_number, game_state.current_phase, game_state.current_player_index,
+        game_state.ink_played_this_turn, game_state.card_drawn_this_turn,
+        tuple(game_state.characters_acted_this_turn), game_state.game_result,
+        tuple(str(a.effect) for a in action_queue.get_pending_actions()),
+        len(engine.choice_manager.pending_choices),
+        tuple(id(a) for a in engine.event_manager._ability_seq),
+    )
+
+
+def play(engine: GameEngine, rng: random.Random, steps: int, move=None, trace=None):
+    """Advance the engine by up to ``steps`` messages; return the pending move."""
+    policy = RandomPolicy()
+    for _ in range(steps):
+        message = engine.next_message(move)
+        move = None
+        if trace is not None:
+            trace.append((type(message).__name__, fingerprint(engine)))
+        if isinstance(message, GameOverMessage):
+            break
+        elif isinstance(message, ActionRequiredMessage):
+            move = policy.choose_action(message, rng)
+        elif isinstance(message, ChoiceRequiredMessage):
+            move = policy.choose_option(message, rng)
+    return move
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_restore_returns_to_snapshot_state(seed):
+    engine = build_engine(seed)
+    move = play(engine, random.Random(seed), 150)
+    before = fingerprint(engine)
+    snapshot = engine.snapshot()
+
+    play(engine, random.Random(seed + 100), 200, move)
+    assert fingerprint(engine) != before
+
+    engine.restore(snapshot)
+    assert fingerprint(engine) == before
+
+
+def test_replaying_from_a_restored_snapshot_is_identical():
+    engine = build_engine(7)
+    move = play(engine, random.Random(7), 120)
+    snapshot = engine.snapshot()
+
+    first, second = [], []
+    play(engine, random.Random(99), 200, move, trace=first)
+    engine.restore(snapshot)
+    play(engine, random.Random(99), 200, move, trace=second)
+    assert first == second
+
+    # The same snapshot can be restored repeatedly
+    engine.restore(snapshot)
+    third = []
+    play(engine, random.Random(99), 200, move, trace=third)
+    assert third == first
+
+
+def test_game_state_snapshot_shares_card_definitions():
+    engine = build_engine(3)
+    play(engine, random.Random(3), 100)
+    game_state = engine.game_state
+    card = game_state.players[0].deck[0]
+    snapshot = game_state.snapshot()
+
+    card.exerted = not card.exerted
+    card.metadata['marked'] = True
+    game_state.players[0].lore += 5
+    game_state.turn_number += 3
+    moved = game_state.players[0].deck.pop(0)
+    game_state.players[1].discard_pile.append(moved)
+
+    game_state.restore(snapshot)
+    assert moved in game_state.players[0].deck and game_state.players[0].deck[0] is card
+    assert game_state.players[1].get_card_zone(card) is None
+    assert 'marked' not in card.metadata
+    assert game_state.players[0].lore == snapshot.players[0].attributes['lore']
+
+    saved_state = next(state for saved, state in snapshot.cards if saved is card)
+    assert saved_state['_definition'] is card.definition
+    assert saved_state['metadata'] is not card.metadata
+
+
+def test_restore_rolls_back_move_log():
+    engine = build_engine(3)
+    engine.message_engine.move_log = log = []
+    move = play(engine, random.Random(3), 120)
+    recorded = list(log)
+    snapshot = engine.snapshot()
+
+    play(engine, random.Random(4), 200, move)
+    assert len(log) > len(recorded)
+
+    engine.restore(snapshot)
+    assert log == recorded
+    assert all(step <= engine.message_engine.next_message_calls for step, _ in log)
+
+
+def test_restore_rejects_foreign_snapshot():
+    first, second = build_engine(1), build_engine(2)
+    with pytest.raises(ValueError):
+        second.restore(first.snapshot())
+    with pytest.raises(ValueError):
+        second.game_state.restore(first.game_state.snapshot())
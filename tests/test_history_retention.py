@@ -0,0 +1,104 @@
+"""Tests for execution history retention policies."""
+
+import gc
+import json
+import random
+
+import pytest
+
+from lorcana_sim.engine.action_queue import ActionResult
+from lorcana_sim.engine.game_engine import GameEngine
+from lorcana_sim.engine.game_messages import ActionRequiredMessage, ChoiceRequiredMessage, GameOverMessage
+from lorcana_sim.models.game.game_state import GameState
+from lorcana_sim.models.game.player import Player
+from lorcana_sim.sim import BatchRunner, GreedyPolicy
+from lorcana_sim.utils.history import ExecutionHistory, HistoryRetention
+
+from .test_sim_runner import vanilla_deck
+
+
+def play_engine(history_retention, seed=0):
+    players = []
+    for index in range(2):
+        player = Player(f"Player {index + 1}")
+        player.deck = vanilla_deck((index + 1) * 1000)
+        for _ in range(7):
+            player.hand.append(player.deck.pop(0))
+        players.append(player)
+    engine = GameEngine(GameState(players), history_retention=history_retention)
+    engine.start_game()
+
+    rng, policy, move = random.Random(seed), GreedyPolicy(), None
+    for _ in range(2000):
+        message = engine.next_message(move)
+        move = None
+        if isinstance(message, GameOverMessage):
+            break
+        elif isinstance(message, ActionRequiredMessage):
+            move = policy.choose_action(message, rng)
+        elif isinstance(message, ChoiceRequiredMessage):
+            move = policy.choose_option(message, rng)
+    return engine
+
+
+def test_default_engine_keeps_all_history():
+    history = play_engine(None).execution_engine.action_queue._execution_history
+    assert history.recorded > 100
+    assert len(history) == history.recorded
+
+
+def test_ring_retention_keeps_most_recent_entries():
+    queue = play_engine(HistoryRetention.ring(25)).execution_engine.action_queue
+    history = queue._execution_history
+
+    assert history.recorded > 100
+    assert len(history) == 25
+    assert [r.action_id for r in queue.get_execution_history(5)] == [r.action_id for r in list(history)[-5:]]
+
+
+def test_off_retention_keeps_nothing():
+    queue = play_engine(HistoryRetention.off()).execution_engine.action_queue
+    assert queue._execution_history.recorded > 100
+    assert queue.get_execution_history() == []
+
+
+def test_spill_retention_writes_every_entry(tmp_path):
+    path = tmp_path / "history.jsonl"
+    queue = play_engine(HistoryRetention.spill(str(path), max_entries=3)).execution_engine.action_queue
+    queue._execution_history.close()
+
+    lines = path.read_text().splitlines()
+    assert len(lines) == queue._execution_history.recorded
+    assert len(queue.get_execution_history()) == 3
+    assert {'action_id', 'effect_type', 'source'} <= set(json.loads(lines[0]))
+
+
+def test_rollback_forgets_entries_after_a_point():
+    history = ExecutionHistory(HistoryRetention.ring(4))
+    for i in range(6):
+        history.append(i)
+    history.rollback(5)
+    assert list(history) == [2, 3, 4] and history.recorded == 5
+
+    with pytest.raises(ValueError):
+        HistoryRetention.spill("")
+
+
+def test_memory_stays_flat_over_1000_games():
+    runner = BatchRunner(lambda offset: vanilla_deck(offset, 20), lambda offset: vanilla_deck(offset, 20))
+    live_objects = []
+    gc.collect()
+    results_before = sum(isinstance(obj, ActionResult) for obj in gc.get_objects())
+
+    def sample(record):
+        if record.seed in (99, 999):
+            gc.collect()
+            live_objects.append(len(gc.get_objects()))
+
+    summary = runner.run_games(1000, on_game=sample)
+
+    assert summary.games == 1000
+    gc.collect()
+    assert sum(isinstance(obj, ActionResult) for obj in gc.get_objects()) == results_before
+    # Nothing accumulates from game to game
+    assert live_objects[1] - live_objects[0] < 1000
@@ -0,0 +1,98 @@
+"""Tests for the running ink counters on Player."""
+
+import copy
+import pickle
+
+import pytest
+
+from lorcana_sim.models.abilities.composable.effects import ReadyInk
+from lorcana_sim.models.cards.base_card import CardColor
+from lorcana_sim.models.game import player as player_module
+from lorcana_sim.models.game.player import Player
+
+from .test_card_definition import make_character
+from .test_game_snapshot import build_engine
+
+
+@pytest.fixture(autouse=True)
+def check_ink_counters(monkeypatch):
+    # Every counter read is checked against a recount of the inkwell
+    monkeypatch.setattr(player_module, 'CHECK_INK_COUNTERS', True)
+
+
+def inked_player(colors=(CardColor.AMBER, CardColor.AMBER, CardColor.RUBY)) -> Player:
+    player = Player("Alice")
+    player.hand = [make_character(i, color=color) for i, color in enumerate(colors)]
+    for card in list(player.hand):
+        player.play_ink(card)
+    return player
+
+
+def test_counters_follow_inking_spending_and_readying():
+    player = inked_player()
+    assert player.available_ink == 3 and player.exerted_ink == 0
+    assert player.ink_by_color == {CardColor.AMBER: 2, CardColor.RUBY: 1}
+
+    assert len(player.spend_ink(2)) == 2
+    assert player.available_ink == 1 and player.exerted_ink == 2
+    assert player.spend_ink(2) == []
+    assert not player.can_afford(make_character(10, cost=2))
+
+    ReadyInk().apply(player, {})
+    assert player.available_ink == 3
+    assert player.can_afford(make_character(10, cost=3))
+
+
+def test_direct_writes_and_zone_moves_update_counters():
+    player = inked_player()
+    player.inkwell[0].exerted = True
+    player.inkwell[0].exerted = True  # Unchanged value
+    assert player.available_ink == 2
+
+    exerted = player.inkwell.pop(0)
+    assert player.available_ink == 2
+    assert player.ink_by_color == {CardColor.AMBER: 1, CardColor.RUBY: 1}
+    exerted.exerted = False  # No longer in the inkwell
+    assert player.available_ink == 2
+
+    player.inkwell = [exerted, exerted]  # Same object twice
+    assert player.available_ink == 2
+    exerted.exerted = True
+    assert player.available_ink == 0
+
+
+def test_card_shared_between_inkwells_updates_both_players():
+    alice, bob = Player("Alice"), Player("Bob")
+    card = make_character(1)
+    alice.inkwell.append(card)
+    bob.inkwell.append(card)
+
+    card.exerted = True
+    assert alice.available_ink == bob.available_ink == 0
+
+    bob.inkwell.clear()
+    card.exerted = False
+    assert alice.available_ink == 1 and bob.available_ink == 0
+
+
+def test_counters_survive_snapshot_restore_and_copies():
+    engine = build_engine(3)
+    player = engine.game_state.players[0]
+    player.play_ink(next(card for card in player.hand if card.can_be_inked()))
+    snapshot = engine.snapshot()
+
+    player.spend_ink(1)
+    player.play_ink(next(card for card in player.hand if card.can_be_inked()))
+    engine.restore(snapshot)
+    assert player.available_ink == 1 and len(player.inkwell) == 1
+
+    player.inkwell[0].exerted = True
+    assert player.available_ink == 0
+
+    clone = pickle.loads(pickle.dumps(inked_player()))
+    clone.inkwell[0].exerted = True
+    assert clone.available_ink == 2
+
+    card_copy = copy.copy(clone.inkwell[1])
+    card_copy.exerted = True
+    assert clone.available_ink == 2
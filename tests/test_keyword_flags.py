@@ -0,0 +1,74 @@
+"""Tests for precomputed keyword flags on characters."""
+
+import copy
+
+from lorcana_sim.models.abilities.composable.effects import GrantProperty, RemoveProperty
+from lorcana_sim.models.abilities.composable.keyword_abilities import create_keyword_ability
+from lorcana_sim.models.cards.keywords import AbilityList, CardMetadata, Keyword, keyword_names, parse_keyword
+
+from .test_card_definition import make_character
+from .test_game_snapshot import build_engine
+
+
+def test_parse_keyword_reads_bits_and_values():
+    assert parse_keyword("Evasive") == (Keyword.EVASIVE, 0)
+    assert parse_keyword("Singer 5") == (Keyword.SINGER, 5)
+    assert parse_keyword("Challenger +2") == (Keyword.CHALLENGER, 2)
+    assert parse_keyword("Shift 4 (Puppy)") == (Keyword.SHIFT, 4)
+    # Whole words only: no Rush in CRUSHING, no Ward in TOWARD
+    assert parse_keyword("CRUSHING BLOW") == (0, 0)
+    assert parse_keyword("TOWARD THE SEA") == (0, 0)
+    assert parse_keyword("Sing Together 6") == (0, 0)
+
+
+def test_keywords_follow_ability_list_changes():
+    character = make_character(1)
+    assert character.keywords == 0
+
+    character.composable_abilities.append(create_keyword_ability('Singer', character, 5))
+    character.composable_abilities.append(create_keyword_ability('Evasive', character))
+    assert keyword_names(character.keywords) == ['EVASIVE', 'SINGER']
+    assert character.keyword_value(Keyword.SINGER) == 5
+
+    character.composable_abilities.pop()
+    assert not character.has_evasive_ability()
+
+    character.composable_abilities = [create_keyword_ability('Resist', character, 2)]
+    assert isinstance(character.composable_abilities, AbilityList)
+    assert character.keywords == Keyword.RESIST and character.keyword_value(Keyword.RESIST) == 2
+
+
+def test_granted_properties_update_keywords():
+    character = make_character(1)
+    context = {}
+
+    GrantProperty('has_evasive').apply(character, context)
+    GrantProperty('can_challenge_with_wet_ink').apply(character, context)
+    assert character.has_evasive_ability() and character.has_rush_ability()
+
+    RemoveProperty('has_evasive').apply(character, context)
+    assert character.keywords == Keyword.RUSH
+
+    character.metadata = {'has_bodyguard': True}
+    assert isinstance(character.metadata, CardMetadata)
+    assert character.has_keyword(Keyword.BODYGUARD)
+
+
+def test_keywords_survive_copies_and_snapshots():
+    character = make_character(1)
+    character.composable_abilities.append(create_keyword_ability('Challenger', character, 3))
+    character.metadata['has_ward'] = True
+
+    clone = copy.copy(character.composable_abilities)
+    assert clone.keyword_mask == Keyword.CHALLENGER and clone.keyword_values[1] == 3
+    assert character.metadata.copy().keyword_mask == Keyword.WARD
+
+    engine = build_engine(3)
+    board_character = next(card for player in engine.game_state.players
+                           for card in player.deck if hasattr(card, 'metadata'))
+    snapshot = engine.snapshot()
+    board_character.metadata['has_evasive'] = True
+    engine.restore(snapshot)
+    assert not board_character.has_evasive_ability()
+    board_character.metadata['has_evasive'] = True
+    assert board_character.has_evasive_ability()
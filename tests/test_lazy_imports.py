@@ -0,0 +1,69 @@
+"""Tests for lazy package imports and the named ability manifest."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from lorcana_sim.models.abilities.composable.named_abilities import NamedAbilityRegistry, build_manifest
+from lorcana_sim.models.abilities.composable.named_abilities.manifest import NAMED_ABILITIES
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+
+def run_fresh(code: str) -> dict:
+    """Run ``code`` in a new interpreter; it prints one JSON value, returned here."""
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    output = subprocess.run([sys.executable, "-c", code], env=env, check=True,
+                            capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_manifest_is_up_to_date():
+    entries = build_manifest.scan_named_abilities()
+    manifest_path = build_manifest.PACKAGE_DIR / build_manifest.MANIFEST_FILE
+    assert manifest_path.read_text(encoding="utf-8") == build_manifest.render_manifest(entries), \
+        "named ability manifest is stale: run named_abilities/build_manifest.py"
+
+
+def test_manifest_matches_registered_abilities():
+    registered = NamedAbilityRegistry.get_registered_abilities()
+
+    assert set(registered) == set(NAMED_ABILITIES)
+    for name, (module, creator) in NAMED_ABILITIES.items():
+        assert registered[name].__name__ == creator
+        assert registered[name].__module__.endswith(f"named_abilities.{module}")
+
+
+def test_import_is_side_effect_free():
+    state = run_fresh(
+        "import json, logging, sys\n"
+        "import lorcana_sim\n"
+        "print(json.dumps({'handlers': len(logging.getLogger().handlers),\n"
+        "                  'engine': 'lorcana_sim.engine' in sys.modules}))"
+    )
+    assert state == {'handlers': 0, 'engine': False}
+
+
+def test_named_ability_modules_load_on_first_use():
+    state = run_fresh(
+        "import json, sys\n"
+        "from lorcana_sim.models.abilities.composable.named_abilities import NamedAbilityRegistry\n"
+        "loaded = lambda: sorted(m.rsplit('.', 1)[-1] for m in sys.modules\n"
+        "                        if '.named_abilities.' in m and m.count('.') == 6)\n"
+        "before = loaded()\n"
+        "implemented = NamedAbilityRegistry.is_ability_implemented('DANCE-OFF')\n"
+        "after_check = loaded()\n"
+        "NamedAbilityRegistry.create_ability('DANCE-OFF', None, {})\n"
+        "print(json.dumps([before, implemented, after_check, loaded()]))"
+    )
+    assert state == [[], True, [], ["dance_off"]]
+
+
+def test_category_packages_resolve_creators_on_access():
+    from lorcana_sim.models.abilities.composable.named_abilities import triggered
+    from lorcana_sim.models.abilities.composable.named_abilities.triggered.dance_off import create_dance_off
+
+    assert triggered.create_dance_off is create_dance_off
+    assert set(triggered.__all__) <= {creator for _, creator in NAMED_ABILITIES.values()}
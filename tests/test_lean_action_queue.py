@@ -0,0 +1,141 @@
+"""Tests for the action queue's lean (headless) execution mode."""
+
+import random
+
+from lorcana_sim.engine.action_queue import ActionPriority, ActionQueue
+from lorcana_sim.engine.event_system import GameEvent, GameEventManager
+from lorcana_sim.engine.game_engine import GameEngine
+from lorcana_sim.engine.game_messages import ActionRequiredMessage, ChoiceRequiredMessage, GameOverMessage
+from lorcana_sim.models.abilities.composable.effects import Effect
+from lorcana_sim.models.abilities.composable.named_abilities import NamedAbilityRegistry
+from lorcana_sim.models.cards.base_card import CardColor, Rarity
+from lorcana_sim.models.cards.character_card import CharacterCard
+from lorcana_sim.models.game.game_state import GameState
+from lorcana_sim.models.game.player import Player
+from lorcana_sim.sim import BatchRunner, GreedyPolicy, RandomPolicy
+
+# Triggered abilities that need no choices, so games stay fully automatic
+ABILITY_NAMES = ["DANCE-OFF", "HEAVILY ARMED", "THAT'S BETTER", "GRASPING TRUNK"]
+
+
+def ability_deck(id_offset: int, size: int = 40):
+    """Deck factory of characters, half of them with triggered named abilities."""
+    cards = []
+    for i in range(size):
+        card = CharacterCard(
+            id=id_offset + i, name=f"Lean {i % 8}", version="Test", full_name=f"Lean {i % 8} - Test",
+            cost=1 + i % 4, color=CardColor.AMBER, inkwell=True, rarity=Rarity.COMMON,
+            set_code="TEST", number=i % 8, story="", strength=1 + i % 3, willpower=2 + i % 3,
+            lore=1 + i % 2
+        )
+        if i % 2:
+            name = ABILITY_NAMES[i % len(ABILITY_NAMES)]
+            ability = NamedAbilityRegistry.create_ability(name, card, {'name': name})
+            if ability is not None:
+                card.composable_abilities.append(ability)
+        cards.append(card)
+    return cards
+
+
+def play_trace(lean: bool, seed: int):
+    """Play a seeded game and return the executed effects and the final state."""
+    rng = random.Random(seed)
+    players = []
+    for index in range(2):
+        player = Player(f"Player {index + 1}")
+        player.deck = ability_deck((index + 1) * 1000)
+        player.deck.shuffle(rng)
+        for _ in range(7):
+            player.hand.append(player.deck.pop(0))
+        players.append(player)
+    engine = GameEngine(GameState(players, seed=seed), lean=lean)
+    queue = engine.execution_engine.action_queue
+    effects = []
+    process_next_action = queue.process_next_action
+
+    def recording_process_next_action(*args, **kwargs):
+        result = process_next_action(*args, **kwargs)
+        if result is not None:
+            action = result.queued_action
+            effects.append((type(action.effect).__name__, getattr(action.target, 'id', None),
+                            [event['type'] for event in result.events_emitted]))
+        return result
+
+    queue.process_next_action = recording_process_next_action
+    engine.start_game()
+
+    policy, move = GreedyPolicy(), None
+    for _ in range(3000):
+        message = engine.next_message(move)
+        move = None
+        if isinstance(message, GameOverMessage):
+            break
+        elif isinstance(message, ActionRequiredMessage):
+            move = policy.choose_action(message, rng)
+        elif isinstance(message, ChoiceRequiredMessage):
+            move = policy.choose_option(message, rng)
+
+    state = [(p.lore, [c.id for c in p.hand], [c.id for c in p.characters_in_play],
+              [c.id for c in p.discard_pile], len(p.deck)) for p in players]
+    return effects, state, engine
+
+
+def test_lean_mode_executes_the_same_effects():
+    for seed in range(3):
+        full_effects, full_state, _ = play_trace(lean=False, seed=seed)
+        lean_effects, lean_state, engine = play_trace(lean=True, seed=seed)
+
+        assert lean_effects == full_effects
+        assert lean_state == full_state
+        assert len(lean_effects) > 50
+
+
+def test_lean_mode_keeps_no_history_or_descriptions():
+    _, _, engine = play_trace(lean=True, seed=0)
+    queue = engine.execution_engine.action_queue
+
+    assert queue.lean and not queue.describe
+    assert queue.get_execution_history() == []
+    assert getattr(engine.game_state, 'choice_events', []) == []
+
+
+def test_runner_results_match_full_mode():
+    kwargs = dict(policy_a=GreedyPolicy(), policy_b=RandomPolicy(max_ink=6))
+    lean = BatchRunner(ability_deck, ability_deck, **kwargs)
+    full = BatchRunner(ability_deck, ability_deck, lean=False, **kwargs)
+
+    assert lean.lean
+    for seed in range(4):
+        assert lean.play_game(seed) == full.play_game(seed)
+
+
+class EmitEffect(Effect):
+    """Effect declaring one event per apply."""
+
+    def __init__(self, event):
+        self.event = event
+
+    def apply(self, target, context):
+        return target
+
+    def get_events(self, target, context, result):
+        return [{'type': self.event, 'source': target}]
+
+
+def test_unobserved_events_are_not_dispatched():
+    event_manager = GameEventManager(None)
+    dispatched = []
+    event_manager.trigger_event = lambda context: dispatched.append(context.event_type) or []
+    queue = ActionQueue(event_manager, lean=True)
+    event_manager.execution_engine = type('Engine', (), {'action_queue': queue})()
+
+    queue.enqueue(EmitEffect(GameEvent.CHARACTER_QUESTS), None, {}, ActionPriority.NORMAL)
+    result = queue.process_next_action()
+    assert dispatched == []
+    assert [event['type'] for event in result.events_emitted] == [GameEvent.CHARACTER_QUESTS]
+
+    # A queued effect waiting for the event makes it observed
+    queue.enqueue_for_event(EmitEffect(GameEvent.TURN_ENDS), None, {}, GameEvent.CHARACTER_QUESTS)
+    queue.enqueue(EmitEffect(GameEvent.CHARACTER_QUESTS), None, {}, ActionPriority.NORMAL)
+    queue.process_next_action()
+    assert dispatched == [GameEvent.CHARACTER_QUESTS]
@@ -0,0 +1,97 @@
+"""Differential tests: incremental legal-move generation versus brute force."""
+
+import random
+
+import pytest
+
+from lorcana_sim.engine.game_messages import ActionRequiredMessage, ChoiceRequiredMessage, GameOverMessage
+from lorcana_sim.sim import GreedyPolicy, RandomPolicy
+
+from .test_game_snapshot import build_engine
+
+
+def move_identity(legal_actions):
+    return [(action, tuple((key, id(value)) for key, value in params.items()))
+            for action, params in legal_actions]
+
+
+def incremental_engine(seed):
+    engine = build_engine(seed)
+    engine.validator.incremental = True
+    return engine
+
+
+def brute_force_actions(validator):
+    validator.incremental = False
+    try:
+        return validator.get_all_legal_actions()
+    finally:
+        validator.incremental = True
+
+
+def assert_matches_brute_force(engine):
+    validator = engine.validator
+    assert move_identity(validator.get_all_legal_actions()) == move_identity(brute_force_actions(validator))
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_incremental_moves_match_brute_force_over_seeded_games(seed):
+    engine = incremental_engine(seed)
+    rng = random.Random(seed)
+    policy = GreedyPolicy() if seed % 2 else RandomPolicy()
+    move = None
+    for _ in range(1500):
+        message = engine.next_message(move)
+        move = None
+        assert_matches_brute_force(engine)
+        if isinstance(message, GameOverMessage):
+            break
+        elif isinstance(message, ActionRequiredMessage):
+            move = policy.choose_action(message, rng)
+        elif isinstance(message, ChoiceRequiredMessage):
+            move = policy.choose_option(message, rng)
+
+
+def test_incremental_moves_match_after_snapshot_restore():
+    engine = incremental_engine(11)
+    rng = random.Random(11)
+    policy = RandomPolicy()
+    move = None
+    snapshot = snapshot_move = None
+    for step in range(600):
+        if step % 40 == 0:
+            snapshot, snapshot_move = engine.snapshot(), move
+        elif step % 40 == 25:
+            engine.restore(snapshot)
+            move = snapshot_move
+            assert_matches_brute_force(engine)
+        message = engine.next_message(move)
+        move = None
+        assert_matches_brute_force(engine)
+        if isinstance(message, GameOverMessage):
+            break
+        elif isinstance(message, ActionRequiredMessage):
+            move = policy.choose_action(message, rng)
+        elif isinstance(message, ChoiceRequiredMessage):
+            move = policy.choose_option(message, rng)
+
+
+def test_direct_card_changes_invalidate_cached_moves():
+    engine = incremental_engine(5)
+    game_state = engine.game_state
+    rng = random.Random(5)
+    policy = GreedyPolicy()
+    move = None
+    while not game_state.current_player.characters_in_play:
+        message = engine.next_message(move)
+        move = policy.choose_action(message, rng) if isinstance(message, ActionRequiredMessage) else None
+    validator = engine.validator
+    validator.get_all_legal_actions()
+
+    character = game_state.current_player.characters_in_play[0]
+    character.exerted = not character.exerted
+    for card in game_state.current_player.hand:
+        card.cost += 5
+    game_state.current_player.hand.reverse()
+
+    assert_matches_brute_force(engine)
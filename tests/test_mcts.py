@@ -0,0 +1,200 @@
+"""Tests for the ISMCTS search policy."""
+
+import random
+from collections import Counter
+from functools import partial
+
+import pytest
+
+from lorcana_sim.engine.game_engine import GameEngine
+from lorcana_sim.engine.game_messages import ActionRequiredMessage, ChoiceRequiredMessage, GameOverMessage
+from lorcana_sim.engine.game_moves import PassMove
+from lorcana_sim.models.game.game_state import GameState
+from lorcana_sim.models.game.player import Player
+from lorcana_sim.search import MCTSPolicy, determinize, move_key, public_state_key
+from lorcana_sim.search import mcts
+from lorcana_sim.search.parallel import RootWorkers, fork_available
+from lorcana_sim.sim import BatchRunner, GreedyPolicy, MatchFarm, action_to_move
+
+from .test_game_snapshot import fingerprint
+from .test_sim_runner import vanilla_deck
+
+
+def new_engine(seed=0):
+    players = []
+    for index in range(2):
+        player = Player(f"Player {index + 1}")
+        player.deck = vanilla_deck((index + 1) * 1000)
+        for _ in range(7):
+            player.hand.append(player.deck.pop(0))
+        players.append(player)
+    engine = GameEngine(GameState(players, seed=seed), lean=True)
+    engine.start_game()
+    return engine
+
+
+def advance_to_branching_decision(engine, rng, skip=0, until=None):
+    """Play greedily until the ``skip``-th action message offering more than passing
+    (and satisfying ``until``, when given)."""
+    policy, move = GreedyPolicy(), None
+    while True:
+        message = engine.advance_until_decision(move)
+        if isinstance(message, ActionRequiredMessage):
+            if {a.action for a in message.legal_actions} - {'progress', 'pass_turn'}:
+                if until is None or until(message):
+                    if skip == 0:
+                        return message
+                    skip -= 1
+            move = policy.choose_action(message, rng)
+        elif isinstance(message, ChoiceRequiredMessage):
+            move = policy.choose_option(message, rng)
+        else:
+            raise AssertionError(f"game ended before a decision: {message}")
+
+
+def searching_policy(**kwargs):
+    kwargs.setdefault('time_limit', None)
+    kwargs.setdefault('iterations', 12)
+    kwargs.setdefault('max_rollout_turns', 2)
+    return MCTSPolicy(**kwargs)
+
+
+def test_search_leaves_the_game_untouched():
+    engine = new_engine()
+    message = advance_to_branching_decision(engine, random.Random(0), skip=3)
+    before = fingerprint(engine)
+    rng_state = engine.game_state.rng.getstate()
+
+    policy = searching_policy()
+    policy.on_game_start(engine)
+    move = policy.choose_action(message, random.Random(1))
+
+    assert fingerprint(engine) == before
+    assert engine.game_state.rng.getstate() == rng_state
+    assert policy.last_stats.playouts == 12
+    assert move_key(move) in {move_key(action_to_move(a)) for a in message.legal_actions}
+
+
+def test_determinize_redeals_only_hidden_cards():
+    engine = new_engine()
+    advance_to_branching_decision(engine, random.Random(0), skip=2)
+    game_state = engine.game_state
+    observer, opponent = game_state.players
+    hand, public = list(observer.hand), public_state_key(game_state)
+    opponent_cards = Counter(id(card) for card in list(opponent.hand) + list(opponent.deck))
+    opponent_hand = list(opponent.hand)
+
+    redealt = False
+    for seed in range(5):
+        determinize(game_state, observer, random.Random(seed))
+        assert list(observer.hand) == hand
+        assert public_state_key(game_state) == public
+        assert Counter(id(card) for card in list(opponent.hand) + list(opponent.deck)) == opponent_cards
+        redealt |= list(opponent.hand) != opponent_hand
+    assert redealt
+
+
+def test_search_closes_out_a_lore_race():
+    engine = new_engine(seed=3)
+    message = advance_to_branching_decision(
+        engine, random.Random(0), until=lambda m: any(a.action == 'quest_character' for a in m.legal_actions))
+    game_state = engine.game_state
+    me, opponent = message.player, game_state.opponent
+    me.lore, opponent.lore = 19, 19
+
+    policy = searching_policy(iterations=30)
+    policy.on_game_start(engine)
+    move = policy.choose_action(message, random.Random(2))
+
+    assert not isinstance(move, PassMove)
+    while not isinstance(message, GameOverMessage):
+        message = engine.advance_until_decision(move)
+        if isinstance(message, ActionRequiredMessage):
+            move = policy.choose_action(message, random.Random(2))
+        elif isinstance(message, ChoiceRequiredMessage):
+            move = policy.choose_option(message, random.Random(2))
+    assert game_state.winner is me
+
+
+def test_runner_games_are_reproducible_and_reuse_the_tree():
+    def play():
+        policy = searching_policy(iterations=6)
+        runner = BatchRunner(vanilla_deck, vanilla_deck, policy, GreedyPolicy(), max_messages=400)
+        return runner.play_game(5), policy.stats
+
+    (record, stats), (again, _) = play(), play()
+
+    assert record == again
+    assert stats.decisions > 0
+    assert stats.playouts == 6 * stats.decisions
+    assert stats.reused_visits > 0
+
+
+def test_budget_and_engine_are_required():
+    with pytest.raises(ValueError):
+        MCTSPolicy(time_limit=None, iterations=None)
+
+    engine = new_engine()
+    message = advance_to_branching_decision(engine, random.Random(0))
+    with pytest.raises(RuntimeError):
+        searching_policy().choose_action(message, random.Random(0))
+
+
+def test_time_budget_is_respected():
+    engine = new_engine()
+    message = advance_to_branching_decision(engine, random.Random(0), skip=2)
+    policy = MCTSPolicy(time_limit=0.2, max_rollout_turns=2)
+    policy.on_game_start(engine)
+    policy.choose_action(message, random.Random(0))
+
+    assert policy.last_stats.playouts >= 1
+    assert policy.last_stats.elapsed < 1.0
+
+
+@pytest.mark.skipif(not fork_available(), reason="root parallelism needs fork")
+def test_root_parallel_search_merges_workers():
+    engine = new_engine()
+    message = advance_to_branching_decision(engine, random.Random(0), skip=2)
+    before = fingerprint(engine)
+    policy = searching_policy(iterations=5, workers=3)
+    policy.on_game_start(engine)
+
+    move = policy.choose_action(message, random.Random(0))
+
+    assert policy.last_stats.playouts == 15
+    assert fingerprint(engine) == before
+    assert move is not None
+
+
+@pytest.mark.skipif(not fork_available(), reason="root parallelism needs fork")
+def test_root_parallel_workers_last_the_whole_game(monkeypatch):
+    forked = []
+
+    class CountingWorkers(RootWorkers):
+        def __init__(self, *args):
+            super().__init__(*args)
+            forked.append(self)
+
+    monkeypatch.setattr(mcts, 'RootWorkers', CountingWorkers)
+    with searching_policy(iterations=4, workers=3, reuse_tree=False) as policy:
+        runner = BatchRunner(vanilla_deck, vanilla_deck, policy, GreedyPolicy(), max_messages=400)
+        runner.play_game(5)
+        processes = list(forked[0]._processes)
+
+        assert len(forked) == 1
+        assert policy.stats.decisions > 1
+        assert policy.stats.playouts == 3 * 4 * policy.stats.decisions
+        assert all(process.is_alive() for process in processes)
+    assert not any(process.is_alive() for process in processes)
+
+
+@pytest.mark.skipif(not fork_available(), reason="root parallelism needs fork")
+def test_parallel_policy_searches_in_process_inside_match_farm():
+    parallel = partial(BatchRunner, vanilla_deck, vanilla_deck,
+                       searching_policy(iterations=4, workers=3), GreedyPolicy(), max_messages=400)
+    serial = BatchRunner(vanilla_deck, vanilla_deck, searching_policy(iterations=4), GreedyPolicy(),
+                         max_messages=400)
+
+    records = list(MatchFarm(parallel, workers=1).stream(range(2)))
+
+    assert records == [serial.play_game(seed) for seed in range(2)]
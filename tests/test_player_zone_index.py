@@ -0,0 +1,185 @@
+"""Tests that the player's card -> zone index never drifts from the zone lists."""
+
+import copy
+import pickle
+import random
+
+from lorcana_sim.engine.event_system import get_card_current_zone
+from lorcana_sim.models.abilities.composable.activation_zones import ActivationZone
+from lorcana_sim.models.cards.character_card import CharacterCard
+from lorcana_sim.models.cards.base_card import CardColor, Rarity
+from lorcana_sim.models.game.game_state import GameState
+from lorcana_sim.models.game.player import Player, ZONE_ATTRIBUTES
+from lorcana_sim.sim import BatchRunner, GreedyPolicy, RandomPolicy
+
+from .test_sim_runner import vanilla_deck
+
+
+def make_card(card_id: int, cost: int = 1) -> CharacterCard:
+    return CharacterCard(
+        id=card_id, name=f"Card {card_id}", version="Test", full_name=f"Card {card_id} - Test",
+        cost=cost, color=CardColor.AMBER, inkwell=True, rarity=Rarity.COMMON,
+        set_code="TEST", number=1, story="", strength=1, willpower=2, lore=1
+    )
+
+
+def expected_index(player: Player):
+    """Rebuild the index the slow way from the zone lists."""
+    expected = {}
+    for zone in ZONE_ATTRIBUTES:
+        for card in getattr(player, zone):
+            expected.setdefault(id(card), []).append(zone)
+    return {key: sorted(zones) for key, zones in expected.items()}
+
+
+def assert_index_matches(player: Player):
+    actual = {key: sorted(zones) for key, zones in player._zone_index.items()}
+    assert actual == expected_index(player)
+    for zone in ZONE_ATTRIBUTES:
+        for card in getattr(player, zone):
+            assert player.get_card_zone(card) is not None
+
+
+def test_player_methods_keep_index_in_sync():
+    player = Player("Alice")
+    cards = [make_card(i) for i in range(12)]
+    player.deck = cards
+    assert_index_matches(player)
+
+    for _ in range(6):
+        player.draw_card()
+    assert player.get_card_zone(cards[0]) == 'hand'
+    assert player.get_card_zone(cards[8]) == 'deck'
+
+    player.play_ink(cards[0])
+    player.play_ink(cards[1])
+    assert player.get_card_zone(cards[0]) == 'inkwell'
+
+    player.play_character(cards[2], 1)
+    assert player.get_card_zone(cards[2]) == 'characters_in_play'
+
+    player.banish_character(cards[2])
+    assert player.get_card_zone(cards[2]) == 'discard_pile'
+
+    player.inkwell[0].exerted = False
+    player.play_character(cards[3], 1)
+    player.return_to_hand(cards[3])
+    assert player.get_card_zone(cards[3]) == 'hand'
+
+    player.discard_card(cards[4])
+    assert player.get_card_zone(cards[4]) == 'discard_pile'
+    assert_index_matches(player)
+
+
+def test_direct_list_mutation_keeps_index_in_sync():
+    player = Player("Bob")
+    cards = [make_card(i) for i in range(10)]
+
+    player.hand.extend(cards[:5])
+    player.deck += cards[5:]
+    player.deck.insert(0, player.hand.pop())
+    player.hand[0] = player.deck.pop()
+    del player.deck[0]
+    player.discard_pile[:] = cards[8:10]
+    player.inkwell.append(cards[0])
+    player.hand.remove(cards[1])
+    assert_index_matches(player)
+
+    player.inkwell.clear()
+    assert player.get_card_zone(cards[0]) is None
+    assert_index_matches(player)
+
+
+def test_reassigning_a_zone_reindexes_without_touching_old_list():
+    player = Player("Carol")
+    old_hand = [make_card(1), make_card(2)]
+    player.hand = old_hand
+    detached = player.hand
+
+    player.hand = [make_card(3)]
+    assert player.get_card_zone(old_hand[0]) is None
+    assert len(detached) == 2
+
+    # Mutating a replaced zone list must not affect the index
+    detached.pop()
+    player.hand = player.hand  # self-assignment keeps the cards
+    assert len(player.hand) == 1
+    assert_index_matches(player)
+
+
+def test_random_operations_never_drift():
+    rng = random.Random(1234)
+    player = Player("Fuzz")
+    pool = [make_card(i) for i in range(30)]
+    player.deck = pool[:]
+
+    for _ in range(2000):
+        source = getattr(player, rng.choice(ZONE_ATTRIBUTES))
+        target = getattr(player, rng.choice(ZONE_ATTRIBUTES))
+        op = rng.randrange(5)
+        if op == 0 and source:
+            target.append(source.pop(rng.randrange(len(source))))
+        elif op == 1 and source:
+            card = rng.choice(source)
+            source.remove(card)
+            target.insert(rng.randrange(len(target) + 1), card)
+        elif op == 2 and source:
+            moved = source[:2]
+            del source[:2]
+            target.extend(moved)
+        elif op == 3:
+            rng.shuffle(source)
+        elif op == 4 and source:
+            setattr(player, source.zone, list(source))
+    assert_index_matches(player)
+    assert sum(len(getattr(player, z)) for z in ZONE_ATTRIBUTES) == len(pool)
+
+
+def test_get_card_current_zone_uses_index():
+    alice, bob = Player("Alice"), Player("Bob")
+    card = make_card(1)
+    game_state = GameState([alice, bob])
+
+    assert get_card_current_zone(card, game_state) is None
+    bob.hand.append(card)
+    assert get_card_current_zone(card, game_state) == ActivationZone.HAND
+    bob.hand.remove(card)
+    bob.characters_in_play.append(card)
+    assert get_card_current_zone(card, game_state) == ActivationZone.PLAY
+    bob.characters_in_play.remove(card)
+    bob.discard_pile.append(card)
+    assert get_card_current_zone(card, game_state) == ActivationZone.DISCARD
+
+
+def test_index_survives_copy_and_pickle():
+    player = Player("Dana")
+    player.hand = [make_card(1), make_card(2)]
+    player.deck = [make_card(3)]
+
+    for clone in (copy.deepcopy(player), pickle.loads(pickle.dumps(player))):
+        assert clone.get_card_zone(clone.hand[0]) == 'hand'
+        assert clone.get_card_zone(player.hand[0]) is None
+        assert_index_matches(clone)
+
+
+class IndexCheckingPolicy(GreedyPolicy):
+    """Greedy policy that verifies the deciding player's index at every decision."""
+
+    def __init__(self):
+        super().__init__()
+        self.checks = 0
+
+    def choose_action(self, message, rng):
+        assert_index_matches(message.player)
+        self.checks += 1
+        return super().choose_action(message, rng)
+
+
+def test_index_matches_lists_throughout_full_games():
+    policy_a, policy_b = IndexCheckingPolicy(), IndexCheckingPolicy()
+    runner = BatchRunner(vanilla_deck, vanilla_deck, policy_a, policy_b)
+
+    for seed in range(3):
+        runner.play_game(seed)
+
+    assert policy_a.checks > 0 and policy_b.checks > 0
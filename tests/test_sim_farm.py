@@ -0,0 +1,57 @@
+"""Tests for the multiprocess match farm."""
+
+from functools import partial
+
+from lorcana_sim.sim import BatchRunner, GreedyPolicy, MatchFarm, RandomPolicy, wilson_interval
+
+from .test_sim_runner import vanilla_deck
+
+RUNNER_FACTORY = partial(BatchRunner, vanilla_deck, vanilla_deck,
+                         policy_a=GreedyPolicy(), policy_b=RandomPolicy(max_ink=6))
+
+
+def test_results_identical_across_worker_counts():
+    seeds = range(12)
+    inline = list(MatchFarm(RUNNER_FACTORY, workers=0).stream(seeds))
+    one = list(MatchFarm(RUNNER_FACTORY, workers=1, chunk_size=5).stream(seeds))
+    three = list(MatchFarm(RUNNER_FACTORY, workers=3, chunk_size=2).stream(seeds))
+
+    assert [r.seed for r in inline] == list(seeds)
+    assert inline == one == three
+
+
+def test_farm_matches_batch_runner():
+    seeds = range(6)
+    expected = RUNNER_FACTORY().run(seeds)
+    summary = MatchFarm(RUNNER_FACTORY, workers=2).run(seeds)
+
+    assert summary.to_dict() == expected.to_dict()
+
+
+def test_early_stopping_is_deterministic():
+    farm_inline = MatchFarm(RUNNER_FACTORY, workers=0)
+    farm_pool = MatchFarm(RUNNER_FACTORY, workers=2, chunk_size=3)
+
+    stopped = farm_inline.run(range(1000), ci_half_width=0.2, min_games=10)
+    stopped_pool = farm_pool.run(range(1000), ci_half_width=0.2, min_games=10)
+
+    assert 10 <= stopped.games < 1000
+    assert stopped.to_dict() == stopped_pool.to_dict()
+    low, high = stopped.win_rate_interval(0)
+    assert (high - low) / 2 <= 0.2
+
+
+def test_streaming_callback_sees_every_game():
+    seen = []
+    summary = MatchFarm(RUNNER_FACTORY, workers=2).run(range(5), on_game=seen.append)
+
+    assert [r.seed for r in seen] == [0, 1, 2, 3, 4]
+    assert summary.games == 5
+
+
+def test_wilson_interval():
+    assert wilson_interval(0, 0) == (0.0, 1.0)
+    low, high = wilson_interval(50, 100)
+    assert low < 0.5 < high
+    assert abs((low + high) / 2 - 0.5) < 1e-9
+    assert abs(high - 0.5966) < 1e-3
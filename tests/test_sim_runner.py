@@ -0,0 +1,97 @@
+"""Tests for the headless batch simulation runner."""
+
+from lorcana_sim.models.cards.character_card import CharacterCard
+from lorcana_sim.models.cards.base_card import CardColor, Rarity
+from lorcana_sim.models.game.game_state import GameResult
+from lorcana_sim.sim import BatchRunner, GreedyPolicy, RandomPolicy, SimulationSummary, GameRecord
+
+
+def vanilla_deck(id_offset: int, size: int = 40):
+    """Deck factory building a deck of vanilla characters."""
+    cards = []
+    for i in range(size):
+        cards.append(CharacterCard(
+            id=id_offset + i,
+            name=f"Vanilla {i % 8}",
+            version="Test",
+            full_name=f"Vanilla {i % 8} - Test",
+            cost=1 + i % 4,
+            color=CardColor.AMBER,
+            inkwell=True,
+            rarity=Rarity.COMMON,
+            set_code="TEST",
+            number=i % 8,
+            story="",
+            strength=1 + i % 3,
+            willpower=2 + i % 3,
+            lore=1 + i % 2
+        ))
+    return cards
+
+
+def make_runner(**kwargs):
+    return BatchRunner(vanilla_deck, vanilla_deck,
+                       policy_a=kwargs.pop('policy_a', GreedyPolicy()),
+                       policy_b=kwargs.pop('policy_b', RandomPolicy(max_ink=6)),
+                       **kwargs)
+
+
+def test_game_runs_to_completion():
+    record = make_runner().play_game(seed=1)
+
+    assert record.result != GameResult.ONGOING
+    assert record.turns >= 1
+    assert record.lore_curve[-1] == record.final_lore
+    if record.result == GameResult.LORE_VICTORY:
+        assert record.final_lore[record.winner] >= 20
+
+
+def test_same_seed_reproduces_game():
+    runner = make_runner()
+    first = runner.play_game(seed=7)
+    second = runner.play_game(seed=7)
+
+    assert first == second
+
+
+def test_alternating_first_player():
+    runner = make_runner()
+    assert runner.play_game(seed=2).first_player == 0
+    assert runner.play_game(seed=3).first_player == 1
+
+    fixed = make_runner(alternate_first_player=False)
+    assert fixed.play_game(seed=3).first_player == 0
+
+
+def test_summary_aggregates_without_records():
+    seen = []
+    summary = make_runner().run_games(6, start_seed=10, on_game=seen.append)
+
+    assert summary.games == 6
+    assert summary.records == []
+    assert sum(summary.wins) + summary.draws == 6
+    assert summary.total_turns == sum(r.turns for r in seen)
+    assert abs(summary.win_rate(0) + summary.win_rate(1) + summary.draws / 6 - 1.0) < 1e-9
+    assert len(summary.lore_curve()) == max(len(r.lore_curve) for r in seen)
+
+
+def test_summary_merge_matches_single_run():
+    runner = make_runner()
+    whole = runner.run(range(4))
+    part = runner.run(range(2))
+    part.merge(runner.run(range(2, 4)))
+
+    assert part.to_dict() == whole.to_dict()
+
+
+def test_lore_curve_is_mean_over_games_reaching_turn():
+    summary = SimulationSummary()
+    summary.add(GameRecord(seed=0, winner=0, result=GameResult.LORE_VICTORY, turns=2,
+                           messages=1, final_lore=(20, 3), lore_curve=[(2, 1), (20, 3)]))
+    summary.add(GameRecord(seed=1, winner=None, result=GameResult.STALEMATE, turns=1,
+                           messages=1, final_lore=(4, 5), lore_curve=[(4, 5)]))
+
+    assert summary.lore_curve() == [(3.0, 3.0), (20.0, 3.0)]
+    assert summary.wins == [1, 0]
+    assert summary.draws == 1
+    assert summary.mean_game_length == 1.5
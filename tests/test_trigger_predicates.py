@@ -0,0 +1,121 @@
+"""Tests for declarative trigger predicates and keyed event dispatch."""
+
+from lorcana_sim.engine.event_system import EventContext, GameEvent, ability_dispatch_keys
+from lorcana_sim.engine.game_engine import GameEngine
+from lorcana_sim.models.abilities.composable.keyword_abilities import create_keyword_ability
+from lorcana_sim.models.abilities.composable.triggers import (
+    when_banished, when_character_type_enters_play, when_enters_play, when_quests, when_event,
+    when_takes_damage
+)
+from lorcana_sim.models.game.game_state import GameState
+from lorcana_sim.models.game.player import Player
+
+from .test_event_listener_registry import build_game, make_character
+
+
+def test_self_trigger_declares_source():
+    character = make_character(1)
+    other = make_character(2)
+    condition = when_quests(character)
+
+    assert condition.predicate.event is GameEvent.CHARACTER_QUESTS
+    assert condition.predicate.dispatch_key() == ('source', id(character))
+    assert condition(EventContext(GameEvent.CHARACTER_QUESTS, source=character))
+    assert not condition(EventContext(GameEvent.CHARACTER_QUESTS, source=other))
+    assert not condition(EventContext(GameEvent.CHARACTER_CHALLENGES, source=character))
+
+
+def test_target_trigger_declares_target():
+    character = make_character(1)
+    condition = when_takes_damage(character)
+
+    assert condition.predicate.dispatch_key() == ('target', id(character))
+    assert condition(EventContext(GameEvent.CHARACTER_TAKES_DAMAGE, target=character))
+    assert not condition(EventContext(GameEvent.CHARACTER_TAKES_DAMAGE, target=make_character(2)))
+
+
+def test_any_source_trigger_is_unkeyed():
+    condition = when_banished(None)
+
+    assert condition.predicate.dispatch_key() is None
+    assert condition(EventContext(GameEvent.CHARACTER_BANISHED, source=make_character(1)))
+
+
+def test_explicit_none_source_only_matches_missing_source():
+    """A None source (as passed by some abilities) still means "no source"."""
+    condition = when_enters_play(None)
+
+    assert not condition(EventContext(GameEvent.CHARACTER_ENTERS_PLAY, source=make_character(1)))
+    assert condition(EventContext(GameEvent.CHARACTER_ENTERS_PLAY, source=None))
+
+
+def test_subtype_and_controller_filters():
+    alice, bob = Player("Alice"), Player("Bob")
+    hero = make_character(1)
+    hero.subtypes = ["Hero"]
+    hero.controller = alice
+    condition = when_character_type_enters_play("Hero", controller=alice)
+
+    assert condition(EventContext(GameEvent.CHARACTER_ENTERS_PLAY, source=hero))
+    hero.controller = bob
+    assert not condition(EventContext(GameEvent.CHARACTER_ENTERS_PLAY, source=hero))
+    assert not condition(EventContext(GameEvent.CHARACTER_ENTERS_PLAY, source=make_character(2)))
+
+
+def test_residual_filters_still_run():
+    character = make_character(1)
+    condition = when_event(GameEvent.CHARACTER_QUESTS, source=character,
+                           metadata_filter=lambda meta, ctx: meta.get('ok', False))
+
+    assert not condition(EventContext(GameEvent.CHARACTER_QUESTS, source=character))
+    assert condition(EventContext(GameEvent.CHARACTER_QUESTS, source=character,
+                                  additional_data={'ok': True}))
+
+
+def test_ability_dispatch_keys():
+    character = make_character(1)
+    support = create_keyword_ability('Support', character)
+
+    keys = ability_dispatch_keys(support, {GameEvent.CHARACTER_QUESTS})
+
+    assert keys == {GameEvent.CHARACTER_QUESTS: ('source', id(character))}
+
+
+def test_candidates_skip_other_cards_self_triggers():
+    players = [Player("Alice"), Player("Bob")]
+    cards = []
+    for index, player in enumerate(players):
+        for i in range(3):
+            card = make_character(index * 10 + i)
+            card.composable_abilities.append(create_keyword_ability('Support', card))
+            card.controller = player
+            player.characters_in_play.append(card)
+            cards.append(card)
+    engine = GameEngine(GameState(players))
+    event_manager = engine.event_manager
+
+    context = EventContext(GameEvent.CHARACTER_QUESTS, source=cards[4], game_state=engine.game_state)
+    candidates = event_manager.get_candidate_listeners(context)
+
+    assert [ability.character for ability in candidates] == [cards[4]]
+    assert len(event_manager.get_active_listeners(GameEvent.CHARACTER_QUESTS)) == len(cards)
+
+
+def test_candidates_keep_every_ability_that_would_trigger():
+    """Pre-filtering never drops an ability whose condition holds."""
+    for seed in range(3):
+        rng, game_state, engine = build_game(seed)
+        event_manager = engine.event_manager
+        cards = [card for player in game_state.players for card in player.characters_in_play]
+        for _ in range(200):
+            event = rng.choice(list(GameEvent))
+            context = EventContext(event, source=rng.choice(cards + [None]),
+                                   target=rng.choice(cards + [None]), player=rng.choice(game_state.players),
+                                   game_state=game_state)
+            active = event_manager.get_active_listeners(event)
+            candidates = event_manager.get_candidate_listeners(context)
+            triggered = [ability for ability in active
+                         if any(listener.should_trigger(context) for listener in ability.listeners)]
+
+            assert set(triggered) <= set(candidates) <= set(active)
+            assert candidates == [ability for ability in active if ability in candidates]
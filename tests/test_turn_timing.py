@@ -0,0 +1,127 @@
+"""Tests for heap-scheduled effect expiry and compacted turn history in TurnTimingComponent."""
+
+import random
+
+from lorcana_sim.engine.turn_timing import EffectDuration, TurnTimingComponent
+from lorcana_sim.utils.history import HistoryRetention
+
+PHASES = ['ready', 'set', 'draw', 'play']
+
+
+class Marker:
+    def __init__(self, index):
+        self.index = index
+
+    def __repr__(self):
+        return f"Marker({self.index})"
+
+
+def linear_expired(tracking, timing, current_turn, current_phase):
+    """The unscheduled check: every tracked effect through _should_expire, in registration order."""
+    expired = [effect_id for effect_id, info in tracking.items()
+               if timing._should_expire(info, current_turn, current_phase)]
+    return [tracking.pop(effect_id).effect for effect_id in expired]
+
+
+def test_heap_expiry_matches_linear_scan():
+    rng = random.Random(3)
+    timing = TurnTimingComponent()
+    reference = {}
+    flags = {}
+    effects = []
+
+    for turn in range(1, 41):
+        timing.start_turn(turn, f"Player {turn % 2}")
+        for phase in PHASES:
+            timing.start_phase(phase)
+            for _ in range(rng.randint(0, 4)):
+                effect = Marker(len(effects))
+                effects.append(effect)
+                kind = rng.choice(['until_end_of_turn', 'turns', 'phases', 'until_condition', 'permanent'])
+                value = rng.randint(1, 4) if kind == 'turns' else 1
+                condition = None
+                if kind == 'until_condition':
+                    flags[effect.index] = False
+                    condition = (lambda i: lambda: flags[i])(effect.index)
+                effect_id = timing.register_temporary_effect(effect, kind, value, condition)
+                reference[effect_id] = EffectDuration(effect, kind, value, timing.get_turn_count(), phase,
+                                                      condition)
+            if effects and rng.random() < 0.3:
+                victim = id(rng.choice(effects))
+                assert timing.unregister_temporary_effect(victim) == (reference.pop(victim, None) is not None)
+            for index in rng.sample(sorted(flags), min(2, len(flags))):
+                flags[index] = rng.random() < 0.5
+
+            expected = linear_expired(reference, timing, timing.get_turn_count(), phase)
+            assert timing.get_expired_effects() == expected
+            assert timing.duration_tracking.keys() == reference.keys()
+            timing.end_phase(phase)
+
+
+def test_expiry_check_ignores_effects_that_are_not_due():
+    timing = TurnTimingComponent()
+    timing.start_turn(1, "Alice")
+    timing.start_phase('play')
+    buff, lasting = Marker(0), Marker(1)
+    timing.register_temporary_effect(buff, 'until_end_of_turn', 1)
+    timing.register_temporary_effect(lasting, 'turns', 3)
+
+    assert timing.get_expired_effects() == []
+    timing.start_turn(2, "Bob")
+    assert timing.get_expired_effects() == [buff]
+    assert timing.get_expired_effects() == []
+    timing.start_turn(3, "Alice")
+    timing.start_turn(4, "Bob")
+    assert timing.get_expired_effects() == [lasting]
+    assert timing.duration_tracking == {}
+
+
+def test_unregistered_effects_do_not_expire_and_heap_stays_bounded():
+    timing = TurnTimingComponent()
+    timing.start_turn(1, "Alice")
+    kept = Marker(-1)
+    timing.register_temporary_effect(kept, 'until_end_of_turn', 1)
+    for index in range(1000):
+        effect_id = timing.register_temporary_effect(Marker(index), 'until_end_of_turn', 1)
+        timing.unregister_temporary_effect(effect_id)
+
+    assert len(timing._expiry_heap) < 100
+    timing.start_turn(2, "Bob")
+    assert timing.get_expired_effects() == [kept]
+
+
+def test_turn_history_is_compacted_by_default():
+    timing = TurnTimingComponent()
+    for turn in range(1, 101):
+        timing.start_turn(turn, "Alice" if turn % 2 else "Bob")
+        timing.start_phase('play')
+        timing.record_event('quest', {'lore': 1})
+        timing.end_phase('play')
+
+    assert len(timing.turn_history) == 0
+    assert timing.get_turn_count() == 100
+    assert timing.get_turn_info(100) is timing.current_turn_info
+    assert timing.get_turn_info(50) is None
+    assert timing.get_recent_turns(3) == [timing.current_turn_info]
+    stats = timing.get_statistics()
+    assert stats['turns'] == 100 and stats['completed_turns'] == 99 and stats['events'] == 100
+    assert timing.summary.events_by_type == {'quest': 100}
+
+
+def test_full_history_mode_keeps_every_turn():
+    compact, full = TurnTimingComponent(), TurnTimingComponent(HistoryRetention.keep_all())
+    for timing in (compact, full):
+        for turn in range(1, 11):
+            timing.start_turn(turn, "Alice")
+            timing.record_event('draw', {})
+        timing.end_turn()
+
+    assert [info.turn_number for info in full.turn_history] == list(range(1, 11))
+    assert full.get_turn_info(4).events[0]['type'] == 'draw'
+    assert [info.turn_number for info in full.get_recent_turns(3)] == [8, 9, 10]
+    assert full.get_statistics() == compact.get_statistics()
+
+    ring = TurnTimingComponent(HistoryRetention.ring(2))
+    for turn in range(1, 6):
+        ring.start_turn(turn, "Alice")
+    assert [info.turn_number for info in ring.get_recent_turns(5)] == [4, 5]
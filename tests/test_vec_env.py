@@ -0,0 +1,96 @@
+"""Tests for the vectorized RL environment."""
+
+from functools import partial
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from lorcana_sim.rl import ActionLayout, VecGameEnv
+from lorcana_sim.sim import BatchRunner
+
+from .test_sim_runner import vanilla_deck
+
+RUNNER = partial(BatchRunner, vanilla_deck, vanilla_deck)
+
+
+def random_legal(masks, rng):
+    scores = rng.random(masks.shape)
+    scores[~masks] = -1.0
+    return scores.argmax(axis=1)
+
+
+def play(env, steps, seed=0):
+    """Step with random legal actions; return copies of everything the env produced."""
+    rng = np.random.default_rng(seed)
+    observations, masks = env.reset(range(100, 100 + env.num_envs))
+    trace = [(observations.copy(), masks.copy())]
+    for _ in range(steps):
+        observations, rewards, dones, masks = env.step(random_legal(masks, rng))
+        trace.append((observations.copy(), rewards.copy(), dones.copy(), masks.copy()))
+    return trace
+
+
+def test_reset_returns_batched_arrays():
+    layout = ActionLayout()
+    with VecGameEnv(RUNNER, 3) as env:
+        observations, masks = env.reset([7, 8, 9])
+
+        assert observations.shape == (3, layout.observation_size) and observations.dtype == np.float32
+        assert masks.shape == (3, layout.num_actions) and masks.dtype == np.bool_
+        assert masks.any(axis=1).all()
+        assert (env.to_play == 0).all()
+        with pytest.raises(ValueError):
+            env.reset([1, 2])
+
+
+def test_finished_games_reset_to_their_next_seed():
+    with VecGameEnv(RUNNER, 4) as env:
+        trace = play(env, 400)
+        finished = sum(step[2].sum() for step in trace[1:])
+        seeds = [game.setup.game_state.seed for game in env._batch.envs]
+
+    assert finished > 0
+    assert all((seed - 100) % 4 == i for i, seed in enumerate(seeds))
+    assert any(seed >= 104 for seed in seeds)
+    terminal_rewards = np.concatenate([step[1][step[2]] for step in trace[1:]])
+    assert set(terminal_rewards.tolist()) <= {-1.0, 0.0, 1.0}
+
+
+def test_lore_reward_shapes_non_terminal_steps():
+    with VecGameEnv(RUNNER, 2, lore_reward=0.1) as env:
+        trace = play(env, 150)
+    rewards = np.concatenate([step[1][~step[2]] for step in trace[1:]])
+    assert (rewards != 0).any()
+
+
+def test_illegal_action_is_rejected():
+    with VecGameEnv(RUNNER, 1) as env:
+        _, masks = env.reset([0])
+        with pytest.raises(ValueError):
+            env.step([int(np.flatnonzero(~masks[0])[0])])
+
+
+def test_self_play_hands_both_decks_to_the_agent():
+    with VecGameEnv(RUNNER, 2, self_play=True) as env:
+        rng = np.random.default_rng(1)
+        _, masks = env.reset()
+        seen = set()
+        for _ in range(100):
+            _, _, _, masks = env.step(random_legal(masks, rng))
+            seen.update(env.to_play.tolist())
+    assert seen == {0, 1}
+
+
+def test_workers_match_in_process_stepping():
+    with VecGameEnv(RUNNER, 5) as env:
+        expected = play(env, 120)
+    with VecGameEnv(RUNNER, 5, workers=2) as env:
+        actual = play(env, 120)
+        _, masks = env.reset()
+        with pytest.raises(RuntimeError):
+            env.step(np.where(masks[:, 0], env.num_actions - 1, 0))
+
+    for expected_step, actual_step in zip(expected, actual):
+        for expected_array, actual_array in zip(expected_step, actual_step):
+            np.testing.assert_array_equal(expected_array, actual_array)